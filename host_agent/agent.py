@@ -22,6 +22,8 @@ No external dependencies — uses only Python standard library.
 """
 
 import argparse
+import base64
+import hashlib
 import json
 import logging
 import os
@@ -31,9 +33,12 @@ import signal
 import socket
 import subprocess
 import sys
+import tempfile
+import threading
 import time
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from typing import List, Tuple
+from urllib.parse import parse_qs, urlparse
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -44,6 +49,13 @@ DEFAULT_TOKEN = "lancelot-host-agent"
 MAX_STDOUT_CHARS = 100_000
 MAX_STDERR_CHARS = 50_000
 DEFAULT_TIMEOUT_S = 300
+DEFAULT_WORKERS = 16
+MAX_JSON_BODY = 1_000_000       # /execute and /files/* JSON bodies
+MAX_READ_BYTES = 1_000_000      # /files/read inline content; larger files use /files/download
+MAX_UPLOAD_BYTES = 2 * 1024 ** 3
+MAX_BATCH_OPS = 256
+TRANSFER_CHUNK = 64 * 1024
+IDLE_CONNECTION_TIMEOUT_S = 60
 
 # Dangerous command patterns (blocked regardless of allowlist)
 COMMAND_DENYLIST = [
@@ -173,6 +185,213 @@ def execute_command(
         }
 
 
+# ---------------------------------------------------------------------------
+# File Operations
+# ---------------------------------------------------------------------------
+
+
+class FileOpError(Exception):
+    """A file operation failed; ``status`` is the HTTP status to report."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _resolve_path(path) -> str:
+    if not path or not isinstance(path, str):
+        raise FileOpError(400, "Missing or invalid 'path' field")
+    return os.path.abspath(os.path.expanduser(path))
+
+
+def _int_field(body: dict, name: str, default: int) -> int:
+    value = body.get(name, default)
+    if value is None:
+        return default
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        raise FileOpError(400, f"Invalid '{name}' field: expected an integer")
+    if value < 0:
+        raise FileOpError(400, f"Invalid '{name}' field: must not be negative")
+    return value
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(TRANSFER_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _file_error(exc: OSError) -> FileOpError:
+    if isinstance(exc, FileNotFoundError):
+        return FileOpError(404, f"Not found: {exc.filename}")
+    if isinstance(exc, PermissionError):
+        return FileOpError(403, f"Permission denied: {exc.filename}")
+    return FileOpError(400, str(exc)[:500])
+
+
+def file_stat(body: dict) -> dict:
+    """Stat a path. Missing paths report ``exists: false`` rather than failing."""
+    path = _resolve_path(body.get("path"))
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return {"path": path, "exists": False}
+    except OSError as e:
+        raise _file_error(e)
+    result = {
+        "path": path,
+        "exists": True,
+        "is_dir": os.path.isdir(path),
+        "size": st.st_size,
+        "mtime": st.st_mtime,
+    }
+    if body.get("hash") and not result["is_dir"]:
+        result["sha256"] = _sha256(path)
+    return result
+
+
+def file_read(body: dict) -> dict:
+    """Read up to ``length`` bytes (capped at MAX_READ_BYTES) from ``offset``."""
+    path = _resolve_path(body.get("path"))
+    encoding = body.get("encoding", "utf-8")
+    offset = _int_field(body, "offset", 0)
+    length = min(_int_field(body, "length", MAX_READ_BYTES) or MAX_READ_BYTES, MAX_READ_BYTES)
+    try:
+        size = os.path.getsize(path)
+        with open(path, "rb") as f:
+            f.seek(offset)
+            data = f.read(length)
+    except OSError as e:
+        raise _file_error(e)
+    if encoding == "base64":
+        content = base64.b64encode(data).decode("ascii")
+    else:
+        try:
+            content = data.decode(encoding, errors="replace")
+        except (LookupError, TypeError) as e:
+            raise FileOpError(400, f"Invalid 'encoding' field: {e}")
+    return {
+        "path": path,
+        "content": content,
+        "encoding": encoding,
+        "size": size,
+        "offset": offset,
+        "eof": offset + len(data) >= size,
+    }
+
+
+def _replace_file(path: str, write_chunks, atomic: bool = True, append: bool = False) -> dict:
+    """Write a file from an iterable of byte chunks; returns before/after metadata."""
+    existed = os.path.isfile(path)
+    try:
+        before = {"hash_before": _sha256(path), "size_before": os.path.getsize(path)} if existed else {}
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        if atomic and not append:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".host-agent-")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    for chunk in write_chunks:
+                        f.write(chunk)
+                os.replace(tmp_path, path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+        else:
+            with open(path, "ab" if append else "wb") as f:
+                for chunk in write_chunks:
+                    f.write(chunk)
+        return {
+            "path": path,
+            "action": "modified" if existed else "created",
+            **before,
+            "hash_after": _sha256(path),
+            "size_after": os.path.getsize(path),
+        }
+    except OSError as e:
+        raise _file_error(e)
+
+
+def file_write(body: dict) -> dict:
+    path = _resolve_path(body.get("path"))
+    content = body.get("content")
+    if not isinstance(content, str):
+        raise FileOpError(400, "Missing or invalid 'content' field")
+    encoding = body.get("encoding", "utf-8")
+    try:
+        data = base64.b64decode(content) if encoding == "base64" else content.encode(encoding)
+    except (ValueError, LookupError, TypeError) as e:
+        raise FileOpError(400, f"Cannot decode content: {e}")
+    return _replace_file(
+        path, [data], atomic=body.get("atomic", True), append=body.get("append", False),
+    )
+
+
+def file_list(body: dict) -> dict:
+    path = _resolve_path(body.get("path"))
+    try:
+        if body.get("recursive"):
+            if not os.path.isdir(path):
+                raise FileNotFoundError(2, "No such directory", path)
+            entries = sorted(
+                os.path.relpath(os.path.join(root, name), path)
+                for root, _dirs, files in os.walk(path)
+                for name in files
+            )
+        else:
+            entries = sorted(os.listdir(path))
+    except OSError as e:
+        raise _file_error(e)
+    return {"path": path, "entries": entries}
+
+
+def file_delete(body: dict) -> dict:
+    """Delete a single file. Directories are refused (no recursive delete)."""
+    path = _resolve_path(body.get("path"))
+    try:
+        if os.path.isdir(path):
+            raise FileOpError(400, f"Is a directory: {path}")
+        size = os.path.getsize(path)
+        digest = _sha256(path)
+        os.remove(path)
+    except OSError as e:
+        raise _file_error(e)
+    return {"path": path, "action": "deleted", "hash_before": digest, "size_before": size}
+
+
+FILE_OPS = {
+    "stat": file_stat,
+    "read": file_read,
+    "write": file_write,
+    "list": file_list,
+    "delete": file_delete,
+}
+
+
+def run_batch(body: dict) -> dict:
+    """Run many small file ops in one request; each op succeeds or fails on its own."""
+    ops = body.get("ops")
+    if not isinstance(ops, list):
+        raise FileOpError(400, "Missing or invalid 'ops' field")
+    if len(ops) > MAX_BATCH_OPS:
+        raise FileOpError(413, f"Too many ops (max {MAX_BATCH_OPS})")
+    results = []
+    for op in ops:
+        handler = FILE_OPS.get(op.get("op")) if isinstance(op, dict) else None
+        if handler is None:
+            results.append({"ok": False, "status": 400, "error": f"Unknown op: {op!r}"[:200]})
+            continue
+        try:
+            results.append({"ok": True, **handler(op)})
+        except FileOpError as e:
+            results.append({"ok": False, "status": e.status, "error": str(e)})
+    return {"results": results}
+
+
 # ---------------------------------------------------------------------------
 # HTTP Handler
 # ---------------------------------------------------------------------------
@@ -181,7 +400,9 @@ def execute_command(
 class HostAgentHandler(BaseHTTPRequestHandler):
     """HTTP request handler for the host agent."""
 
-    server_version = "LancelotHostAgent/1.0"
+    server_version = "LancelotHostAgent/1.1"
+    protocol_version = "HTTP/1.1"  # keep-alive: the bridge reuses one connection
+    timeout = IDLE_CONNECTION_TIMEOUT_S
     auth_token = DEFAULT_TOKEN
 
     def log_message(self, format, *args):
@@ -207,6 +428,8 @@ class HostAgentHandler(BaseHTTPRequestHandler):
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(body)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
         self.end_headers()
         self.wfile.write(body)
 
@@ -214,6 +437,97 @@ class HostAgentHandler(BaseHTTPRequestHandler):
         """Send an error response."""
         self._send_json({"error": message}, status=status)
 
+    def _read_json(self):
+        """Read a bounded JSON body. Sends the error response and returns None on failure."""
+        content_length = int(self.headers.get("Content-Length", 0))
+        if content_length == 0:
+            self._send_error(400, "Empty request body")
+            return None
+        if content_length > MAX_JSON_BODY:
+            self.close_connection = True  # body left unread
+            self._send_error(413, "Request body too large")
+            return None
+        try:
+            body = json.loads(self.rfile.read(content_length))
+        except json.JSONDecodeError:
+            self._send_error(400, "Invalid JSON")
+            return None
+        if not isinstance(body, dict):
+            self._send_error(400, "Invalid JSON")
+            return None
+        return body
+
+    def _query_path(self):
+        """The ``path`` query parameter of a streaming transfer request."""
+        values = parse_qs(urlparse(self.path).query).get("path")
+        return values[0] if values else None
+
+    def _handle_file_op(self, handler):
+        body = self._read_json()
+        if body is None:
+            return
+        try:
+            self._send_json(handler(body))
+        except FileOpError as e:
+            self._send_error(e.status, str(e))
+
+    def _handle_download(self):
+        """Stream a file back in TRANSFER_CHUNK blocks."""
+        try:
+            path = _resolve_path(self._query_path())
+            f = open(path, "rb")
+        except FileOpError as e:
+            self._send_error(e.status, str(e))
+            return
+        except OSError as e:
+            err = _file_error(e)
+            self._send_error(err.status, str(err))
+            return
+        with f:
+            size = os.fstat(f.fileno()).st_size
+            self.send_response(200)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", str(size))
+            self.end_headers()
+            remaining = size
+            while remaining > 0:
+                chunk = f.read(min(TRANSFER_CHUNK, remaining))
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                remaining -= len(chunk)
+        logger.info("DOWNLOAD: %s (%d bytes)", path, size)
+
+    def _handle_upload(self):
+        """Stream the request body to a file without buffering it in memory."""
+        content_length = int(self.headers.get("Content-Length", 0))
+        if content_length > MAX_UPLOAD_BYTES:
+            self.close_connection = True
+            self._send_error(413, "Upload too large")
+            return
+        query = parse_qs(urlparse(self.path).query)
+        atomic = query.get("atomic", ["1"])[0] != "0"
+        append = query.get("append", ["0"])[0] == "1"
+
+        def chunks():
+            remaining = content_length
+            while remaining > 0:
+                chunk = self.rfile.read(min(TRANSFER_CHUNK, remaining))
+                if not chunk:
+                    raise FileOpError(400, "Upload body ended early")
+                remaining -= len(chunk)
+                yield chunk
+
+        try:
+            path = _resolve_path(self._query_path())
+            result = _replace_file(path, chunks(), atomic=atomic, append=append)
+        except FileOpError as e:
+            self.close_connection = True  # body may be partially unread
+            self._send_error(e.status, str(e))
+            return
+        logger.info("UPLOAD: %s (%d bytes)", path, content_length)
+        self._send_json(result)
+
     def do_GET(self):
         """Handle GET requests."""
         if self.path == "/health":
@@ -223,7 +537,7 @@ class HostAgentHandler(BaseHTTPRequestHandler):
                 "platform_version": platform.version(),
                 "hostname": socket.gethostname(),
                 "python_version": platform.python_version(),
-                "agent_version": "1.0.0",
+                "agent_version": "1.1.0",
             })
             return
 
@@ -244,28 +558,52 @@ class HostAgentHandler(BaseHTTPRequestHandler):
             })
             return
 
+        if urlparse(self.path).path == "/files/download":
+            if not self._check_auth():
+                self._send_error(401, "Unauthorized")
+                return
+            self._handle_download()
+            return
+
+        self._send_error(404, f"Not found: {self.path}")
+
+    def do_PUT(self):
+        """Handle PUT requests (streaming upload)."""
+        if urlparse(self.path).path == "/files/upload":
+            if not self._check_auth():
+                self.close_connection = True
+                self._send_error(401, "Unauthorized")
+                return
+            self._handle_upload()
+            return
+
+        self.close_connection = True
         self._send_error(404, f"Not found: {self.path}")
 
     def do_POST(self):
         """Handle POST requests."""
-        if self.path == "/execute":
+        if self.path.startswith("/files/"):
             if not self._check_auth():
+                self.close_connection = True
                 self._send_error(401, "Unauthorized")
                 return
-
-            # Parse body
-            content_length = int(self.headers.get("Content-Length", 0))
-            if content_length == 0:
-                self._send_error(400, "Empty request body")
+            op = self.path[len("/files/"):]
+            handler = run_batch if op == "batch" else FILE_OPS.get(op)
+            if handler is None:
+                self.close_connection = True
+                self._send_error(404, f"Not found: {self.path}")
                 return
-            if content_length > 1_000_000:  # 1MB limit
-                self._send_error(413, "Request body too large")
+            self._handle_file_op(handler)
+            return
+
+        if self.path == "/execute":
+            if not self._check_auth():
+                self.close_connection = True
+                self._send_error(401, "Unauthorized")
                 return
 
-            try:
-                body = json.loads(self.rfile.read(content_length))
-            except json.JSONDecodeError:
-                self._send_error(400, "Invalid JSON")
+            body = self._read_json()
+            if body is None:
                 return
 
             command = body.get("command")
@@ -298,6 +636,7 @@ class HostAgentHandler(BaseHTTPRequestHandler):
 
         if self.path == "/shutdown":
             if not self._check_auth():
+                self.close_connection = True
                 self._send_error(401, "Unauthorized")
                 return
 
@@ -305,12 +644,12 @@ class HostAgentHandler(BaseHTTPRequestHandler):
             self._send_json({"status": "shutting_down"})
 
             # Shut down in a separate thread so the response can be sent first
-            import threading
             threading.Thread(
                 target=self.server.shutdown, daemon=True
             ).start()
             return
 
+        self.close_connection = True
         self._send_error(404, f"Not found: {self.path}")
 
 
@@ -319,25 +658,59 @@ class HostAgentHandler(BaseHTTPRequestHandler):
 # ---------------------------------------------------------------------------
 
 
-def run_server(port: int = DEFAULT_PORT, token: str = DEFAULT_TOKEN):
+class BoundedThreadingHTTPServer(ThreadingHTTPServer):
+    """Thread-per-connection server capped at ``max_workers`` live connections.
+
+    When every worker is busy the accept loop waits for a slot, so excess
+    clients queue in the listen backlog instead of spawning unbounded threads.
+    A long /execute call no longer blocks health checks or file operations.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, server_address, handler_class, max_workers: int = DEFAULT_WORKERS):
+        self._slots = threading.BoundedSemaphore(max_workers)
+        super().__init__(server_address, handler_class)
+
+    def process_request(self, request, client_address):
+        self._slots.acquire()
+        try:
+            super().process_request(request, client_address)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def process_request_thread(self, request, client_address):
+        try:
+            super().process_request_thread(request, client_address)
+        finally:
+            self._slots.release()
+
+
+def run_server(port: int = DEFAULT_PORT, token: str = DEFAULT_TOKEN, workers: int = DEFAULT_WORKERS):
     """Start the host agent HTTP server."""
     HostAgentHandler.auth_token = token
 
-    server = HTTPServer(("127.0.0.1", port), HostAgentHandler)
+    server = BoundedThreadingHTTPServer(("127.0.0.1", port), HostAgentHandler, max_workers=workers)
 
     logger.info("=" * 60)
-    logger.info("Lancelot Host Agent v1.0.0")
+    logger.info("Lancelot Host Agent v1.1.0")
     logger.info("=" * 60)
     logger.info("Listening on: http://127.0.0.1:%d", port)
     logger.info("Platform:     %s %s", platform.system(), platform.release())
     logger.info("Hostname:     %s", socket.gethostname())
     logger.info("Auth token:   %s...%s", token[:4], token[-4:] if len(token) > 8 else "****")
+    logger.info("Workers:      %d", workers)
     logger.info("=" * 60)
     logger.info("Endpoints:")
-    logger.info("  GET  /health   — Health check (no auth)")
-    logger.info("  GET  /info     — Host info (auth required)")
-    logger.info("  POST /execute  — Run command (auth required)")
-    logger.info("  POST /shutdown — Stop agent (auth required)")
+    logger.info("  GET  /health         — Health check (no auth)")
+    logger.info("  GET  /info           — Host info (auth required)")
+    logger.info("  POST /execute        — Run command (auth required)")
+    logger.info("  POST /files/<op>     — stat/read/write/list/delete (auth required)")
+    logger.info("  POST /files/batch    — Many file ops in one request (auth required)")
+    logger.info("  GET  /files/download — Stream a file (auth required)")
+    logger.info("  PUT  /files/upload   — Stream a file (auth required)")
+    logger.info("  POST /shutdown       — Stop agent (auth required)")
     logger.info("=" * 60)
     logger.info("Press Ctrl+C to stop.")
     logger.info("")
@@ -374,6 +747,10 @@ if __name__ == "__main__":
         "--token", type=str, default=os.environ.get("HOST_AGENT_TOKEN", DEFAULT_TOKEN),
         help="Authentication token (default: from HOST_AGENT_TOKEN env var)",
     )
+    parser.add_argument(
+        "--workers", type=int, default=int(os.environ.get("HOST_AGENT_WORKERS", DEFAULT_WORKERS)),
+        help=f"Maximum concurrent connections (default: {DEFAULT_WORKERS})",
+    )
     args = parser.parse_args()
 
-    run_server(port=args.port, token=args.token)
+    run_server(port=args.port, token=args.token, workers=args.workers)
@@ -0,0 +1,105 @@
+"""
+Prompt-prefix KV-cache for the local-llm server.
+
+Every utility task renders a fixed template from ``prompts/`` whose text
+up to the first ``{placeholder}`` never changes. PrefixCache evaluates
+that constant prefix once, snapshots the llama.cpp state with
+``save_state()``, and restores it with ``load_state()`` before each
+matching request. llama-cpp-python's ``generate()`` then reuses the
+longest token prefix shared with the restored state and evaluates only
+the variable suffix.
+
+llama.cpp already reuses a prefix shared with the *previous* request; the
+snapshots keep that benefit when requests alternate between templates.
+Snapshots are kept in an LRU of ``capacity`` templates.
+
+Not thread-safe: call it from the inference worker that owns the model.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger("local-llm")
+
+
+def template_prefix(template: str) -> str:
+    """The constant text of a template before its first placeholder."""
+    idx = template.find("{")
+    return template if idx < 0 else template[:idx]
+
+
+class PrefixCache:
+    """LRU of evaluated template-prefix states for one Llama instance."""
+
+    def __init__(self, llm: Any, templates: Dict[str, str], capacity: int = 6, min_prefix_tokens: int = 16):
+        self.llm = llm
+        self.capacity = capacity
+        self._states: "OrderedDict[str, Any]" = OrderedDict()
+        self._prefixes: Dict[str, str] = {}
+        self._prefix_tokens: Dict[str, int] = {}
+        for name, template in templates.items():
+            prefix = template_prefix(template)
+            n_tokens = len(llm.tokenize(prefix.encode("utf-8")))
+            if n_tokens >= min_prefix_tokens:
+                self._prefixes[name] = prefix
+                self._prefix_tokens[name] = n_tokens
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "bypassed": 0, "tokens_reused": 0}
+        self._build_ms = 0.0
+
+    def prepare(self, prompt: str) -> Optional[str]:
+        """Restore the cached state for ``prompt``'s template, if any.
+
+        Returns the template name, or None when the prompt matches no
+        cached template (the model state is left as-is).
+        """
+        name = self._match(prompt)
+        if name is None or self.capacity <= 0:
+            self._stats["bypassed"] += 1
+            return None
+        state = self._states.get(name)
+        if state is None:
+            self._stats["misses"] += 1
+            state = self._build(name)
+            self._states[name] = state
+            while len(self._states) > self.capacity:
+                evicted, _ = self._states.popitem(last=False)
+                self._stats["evictions"] += 1
+                logger.debug("Prefix cache evicted %s", evicted)
+        else:
+            self._stats["hits"] += 1
+            self._stats["tokens_reused"] += self._prefix_tokens[name]
+            self._states.move_to_end(name)
+        self.llm.load_state(state)
+        return name
+
+    def clear(self) -> None:
+        self._states.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            "templates": sorted(self._prefixes),
+            "entries": len(self._states),
+            "capacity": self.capacity,
+            **self._stats,
+            "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else 0.0,
+            "build_ms": round(self._build_ms, 1),
+        }
+
+    def _match(self, prompt: str) -> Optional[str]:
+        best = None
+        for name, prefix in self._prefixes.items():
+            if prompt.startswith(prefix) and (best is None or len(prefix) > len(self._prefixes[best])):
+                best = name
+        return best
+
+    def _build(self, name: str) -> Any:
+        start = time.monotonic()
+        tokens = self.llm.tokenize(self._prefixes[name].encode("utf-8"))
+        self.llm.reset()
+        self.llm.eval(tokens)
+        state = self.llm.save_state()
+        self._build_ms += (time.monotonic() - start) * 1000
+        return state
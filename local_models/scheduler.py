@@ -0,0 +1,210 @@
+"""
+Inference scheduler for the local-llm server.
+
+The server owns a single llama.cpp context, which decodes one sequence at
+a time. Instead of letting concurrent requests race for it in FastAPI's
+threadpool, every inference goes through this scheduler:
+
+    - Bounded priority queue: ``high`` (classify/verify) runs ahead of
+      ``normal`` (redact/extract/chat) and ``low`` (summarize/rewrite);
+      FIFO within a priority. A full queue rejects with QueueFull.
+    - Streaming jobs yield chunks as they decode; the consumer reads them
+      with ``Job.next_chunk``.
+    - Cancellation: queued jobs are dropped, streaming jobs stop decoding
+      at the next token. A running non-streaming call cannot be interrupted.
+    - Metrics: queue depth, wait times and tokens/s for ``/health``.
+
+``workers`` > 1 only makes sense with a backend that can decode several
+sequences concurrently.
+"""
+
+import heapq
+import itertools
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterator, Optional
+
+PRIORITIES = {"high": 0, "normal": 1, "low": 2}
+
+PENDING = object()
+END = object()
+
+
+class QueueFull(Exception):
+    """The inference queue is at capacity."""
+
+
+class JobCancelled(Exception):
+    """The job was cancelled before it finished."""
+
+
+class Job:
+    """One queued inference.
+
+    The callable receives the Job (to report tokens via ``add_tokens``).
+    Non-streaming jobs resolve ``future`` with its return value; streaming
+    jobs push each item of the returned iterator to a chunk queue.
+    """
+
+    def __init__(self, fn: Callable[["Job"], Any], priority: str, stream: bool):
+        self.fn = fn
+        self.priority = priority
+        self.stream = stream
+        self.future: Future = Future()
+        self.enqueued_at = time.monotonic()
+        self.started_at: Optional[float] = None
+        self.tokens = 0
+        self._cancel = threading.Event()
+        self._chunks: "queue.Queue[Any]" = queue.Queue()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def cancel(self) -> None:
+        """Drop the job if queued; stop decoding at the next chunk if streaming."""
+        self._cancel.set()
+
+    def add_tokens(self, n: int) -> None:
+        """Report generated tokens (for non-streaming jobs; streaming counts chunks)."""
+        self.tokens += n
+
+    def next_chunk(self, timeout: float) -> Any:
+        """Next streamed item, ``PENDING`` on timeout or ``END`` when complete.
+
+        Raises the exception the backend raised (JobCancelled if cancelled).
+        """
+        try:
+            item = self._chunks.get(timeout=timeout)
+        except queue.Empty:
+            return PENDING
+        if isinstance(item, BaseException):
+            raise item
+        return item
+
+
+class InferenceScheduler:
+    """Runs inference jobs from a bounded priority queue on worker threads."""
+
+    def __init__(self, max_queue: int = 64, workers: int = 1, window: int = 200):
+        self.max_queue = max_queue
+        self.workers = workers
+        self._heap: list = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._threads: list = []
+        self._running = 0
+        self._counters = {"completed": 0, "failed": 0, "cancelled": 0, "rejected": 0}
+        self._waits_ms: deque = deque(maxlen=window)
+        self._decode: deque = deque(maxlen=window)  # (tokens, seconds)
+
+    # ── Submission ───────────────────────────────────────────────
+
+    def submit(self, fn: Callable[[Job], Any], priority: str = "normal", stream: bool = False) -> Job:
+        """Queue ``fn``. Raises QueueFull when ``max_queue`` jobs are waiting."""
+        if priority not in PRIORITIES:
+            priority = "normal"
+        job = Job(fn, priority, stream)
+        with self._cond:
+            if len(self._heap) >= self.max_queue:
+                self._counters["rejected"] += 1
+                raise QueueFull(f"Inference queue full ({self.max_queue} waiting)")
+            self._ensure_workers_locked()
+            heapq.heappush(self._heap, (PRIORITIES[priority], next(self._seq), job))
+            self._cond.notify()
+        return job
+
+    def run(self, fn: Callable[[Job], Any], priority: str = "normal", timeout: Optional[float] = None) -> Any:
+        """Submit and block for the result."""
+        return self.submit(fn, priority).future.result(timeout=timeout)
+
+    # ── Metrics ──────────────────────────────────────────────────
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._cond:
+            waiting = [entry[2].priority for entry in self._heap]
+            waits = sorted(self._waits_ms)
+            tokens = sum(t for t, _ in self._decode)
+            seconds = sum(s for _, s in self._decode)
+            return {
+                "queue_depth": len(waiting),
+                "queue_max": self.max_queue,
+                "queued_by_priority": {p: waiting.count(p) for p in PRIORITIES},
+                "running": self._running,
+                "workers": self.workers,
+                **self._counters,
+                "wait_ms_avg": round(sum(waits) / len(waits), 1) if waits else 0.0,
+                "wait_ms_p95": round(waits[int(0.95 * (len(waits) - 1))], 1) if waits else 0.0,
+                "tokens_per_s": round(tokens / seconds, 2) if seconds > 0 else 0.0,
+            }
+
+    # ── Workers ──────────────────────────────────────────────────
+
+    def _ensure_workers_locked(self) -> None:
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(
+                target=self._worker, name=f"inference-{len(self._threads)}", daemon=True,
+            )
+            self._threads.append(thread)
+            thread.start()
+
+    def _next_job(self) -> Job:
+        with self._cond:
+            while True:
+                while not self._heap:
+                    self._cond.wait()
+                job = heapq.heappop(self._heap)[2]
+                if job.cancelled:
+                    self._finish_locked(job, "cancelled")
+                    continue
+                self._running += 1
+                job.started_at = time.monotonic()
+                self._waits_ms.append((job.started_at - job.enqueued_at) * 1000)
+                return job
+
+    def _worker(self) -> None:
+        while True:
+            job = self._next_job()
+            outcome = "completed"
+            try:
+                if job.stream:
+                    outcome = self._run_stream(job)
+                else:
+                    job.future.set_result(job.fn(job))
+            except BaseException as exc:  # noqa: BLE001 — report every failure to the waiter
+                outcome = "failed"
+                if job.stream:
+                    job._chunks.put(exc)
+                else:
+                    job.future.set_exception(exc)
+            with self._cond:
+                self._running -= 1
+                if outcome != "failed" and job.tokens:
+                    self._decode.append((job.tokens, time.monotonic() - job.started_at))
+                self._finish_locked(job, outcome)
+
+    def _run_stream(self, job: Job) -> str:
+        iterator: Iterator[Any] = iter(job.fn(job))
+        try:
+            for item in iterator:
+                if job.cancelled:
+                    return "cancelled"
+                job.tokens += 1
+                job._chunks.put(item)
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+        job._chunks.put(END)
+        return "completed"
+
+    def _finish_locked(self, job: Job, outcome: str) -> None:
+        self._counters[outcome] += 1
+        if outcome == "cancelled":
+            if job.stream:
+                job._chunks.put(JobCancelled())
+            elif not job.future.done():
+                job.future.set_exception(JobCancelled())
@@ -2,13 +2,20 @@
 local-llm HTTP server — exposes the local GGUF model via FastAPI.
 
 Endpoints:
-    GET  /health               — liveness + readiness probe
+    GET  /health               — liveness + readiness probe, queue metrics
     POST /v1/completions       — text completion (llama.cpp compatible)
     POST /v1/chat/completions  — OpenAI-compatible chat completions with tool support
 
 The model is loaded once at startup from the path specified by
 LOCAL_MODEL_PATH env var or from the lockfile default.
 
+All inference goes through an InferenceScheduler (scheduler.py): requests
+carry a ``priority`` (high/normal/low), wait in a bounded queue, can stream
+tokens as server-sent events (``"stream": true``) and are cancelled when
+the client disconnects. Completions built from the prompts/ templates
+restore a cached KV state for the template prefix (prefix_cache.py), so
+only the variable part of the prompt is evaluated.
+
 Fix Pack V8: Added chat completions endpoint with function calling support.
 """
 
@@ -17,12 +24,22 @@ import re
 import json
 import time
 import uuid
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal
+
+try:
+    from local_models.prefix_cache import PrefixCache
+    from local_models.scheduler import END, InferenceScheduler, JobCancelled, PENDING, QueueFull
+except ImportError:  # flat layout inside the local-llm container
+    from prefix_cache import PrefixCache
+    from scheduler import END, InferenceScheduler, JobCancelled, PENDING, QueueFull
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("local-llm")
@@ -33,6 +50,13 @@ logger = logging.getLogger("local-llm")
 _llm = None
 _model_name = ""
 _loaded_at = None
+_prefix_cache = None
+
+_scheduler = InferenceScheduler(
+    max_queue=int(os.environ.get("LOCAL_MODEL_QUEUE_MAX", "64")),
+)
+
+Priority = Literal["high", "normal", "low"]
 
 
 class CompletionRequest(BaseModel):
@@ -40,6 +64,8 @@ class CompletionRequest(BaseModel):
     max_tokens: int = Field(default=128, ge=1, le=4096)
     temperature: float = Field(default=0.1, ge=0.0, le=2.0)
     stop: Optional[list] = None
+    priority: Priority = "normal"
+    stream: bool = False
 
 
 class CompletionResponse(BaseModel):
@@ -73,6 +99,8 @@ class ChatCompletionRequest(BaseModel):
     max_tokens: int = Field(default=512, ge=1, le=8192)
     temperature: float = Field(default=0.1, ge=0.0, le=2.0)
     tool_choice: Optional[str] = None
+    priority: Priority = "normal"
+    stream: bool = False
 
 
 # ---------------------------------------------------------------------------
@@ -81,7 +109,7 @@ class ChatCompletionRequest(BaseModel):
 
 def _do_load_model():
     """Load the GGUF model into memory."""
-    global _llm, _model_name, _loaded_at
+    global _llm, _model_name, _loaded_at, _prefix_cache
 
     try:
         from llama_cpp import Llama
@@ -124,6 +152,24 @@ def _do_load_model():
     _loaded_at = time.time()
     logger.info(f"Model loaded: {_model_name or model_path}")
 
+    capacity = int(os.environ.get("LOCAL_MODEL_PREFIX_CACHE", "6"))
+    if capacity > 0:
+        try:
+            try:
+                from lockfile import load_all_prompts
+            except ImportError:
+                from local_models.lockfile import load_all_prompts
+            _prefix_cache = PrefixCache(_llm, load_all_prompts(), capacity=capacity)
+            logger.info("Prefix cache: %s", ", ".join(_prefix_cache.metrics()["templates"]))
+        except Exception as exc:
+            logger.warning("Prefix cache disabled: %s", exc)
+
+
+def _prepare_prompt(prompt: str) -> None:
+    """Restore the cached template prefix state before evaluating ``prompt``."""
+    if _prefix_cache is not None and _prefix_cache.llm is _llm:
+        _prefix_cache.prepare(prompt)
+
 
 @asynccontextmanager
 async def lifespan(a):
@@ -148,32 +194,110 @@ def health():
         "status": "ok",
         "model": _model_name,
         "uptime_seconds": round(uptime, 1),
-        "capabilities": ["completions", "chat_completions", "tool_calling"],
+        "capabilities": ["completions", "chat_completions", "tool_calling", "streaming"],
+        "scheduler": _scheduler.metrics(),
+        "prefix_cache": _prefix_cache.metrics() if _prefix_cache is not None else None,
     }
 
 
+# ---------------------------------------------------------------------------
+# Scheduling helpers
+# ---------------------------------------------------------------------------
+
+_POLL_S = 0.25
+
+
+def _submit(fn, priority: str, stream: bool = False):
+    try:
+        return _scheduler.submit(fn, priority=priority, stream=stream)
+    except QueueFull as exc:
+        raise HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": "1"})
+
+
+async def _await_job(request: Request, job):
+    """Wait for a non-streaming job, cancelling it if the client goes away."""
+    fut = asyncio.wrap_future(job.future)
+    while True:
+        done, _ = await asyncio.wait({fut}, timeout=_POLL_S)
+        if done:
+            return fut.result()
+        if await request.is_disconnected():
+            job.cancel()
+            raise JobCancelled()
+
+
+async def _sse(request: Request, job, render):
+    """Relay a streaming job as server-sent events; disconnect cancels it."""
+    try:
+        while True:
+            try:
+                item = await run_in_threadpool(job.next_chunk, _POLL_S)
+            except Exception as exc:
+                logger.error("Streaming inference error: %s", exc)
+                yield f"data: {json.dumps({'error': str(exc)[:200]})}\n\n"
+                return
+            if item is END:
+                break
+            if item is PENDING:
+                if await request.is_disconnected():
+                    return
+                continue
+            for event in render(item):
+                yield f"data: {json.dumps(event)}\n\n"
+        for event in render(None):
+            yield f"data: {json.dumps(event)}\n\n"
+        yield "data: [DONE]\n\n"
+    finally:
+        job.cancel()
+
+
 @app.post("/v1/completions", response_model=CompletionResponse)
-def completions(req: CompletionRequest):
+async def completions(req: CompletionRequest, request: Request):
     """Run text completion against the local model."""
     if _llm is None:
         raise HTTPException(status_code=503, detail="Model not loaded")
 
     start = time.monotonic()
+    kwargs = {
+        "max_tokens": req.max_tokens,
+        "temperature": req.temperature,
+        "stop": req.stop or ["\n\n"],
+        "echo": False,
+    }
+
+    if req.stream:
+        def run_stream(job):
+            _prepare_prompt(req.prompt)
+            return _llm(req.prompt, stream=True, **kwargs)
+
+        job = _submit(run_stream, req.priority, stream=True)
+
+        def render(chunk):
+            if chunk is None:
+                return [{"text": "", "model": _model_name, "finish_reason": "stop",
+                         "elapsed_ms": round((time.monotonic() - start) * 1000, 1)}]
+            return [{"text": chunk["choices"][0].get("text", ""), "model": _model_name}]
+
+        return StreamingResponse(_sse(request, job, render), media_type="text/event-stream")
+
+    def run(job):
+        _prepare_prompt(req.prompt)
+        result = _llm(req.prompt, **kwargs)
+        text = result["choices"][0]["text"]
+        tokens = result.get("usage", {}).get("completion_tokens", len(text.split()))
+        job.add_tokens(tokens)
+        return text, tokens
+
+    job = _submit(run, req.priority)
     try:
-        result = _llm(
-            req.prompt,
-            max_tokens=req.max_tokens,
-            temperature=req.temperature,
-            stop=req.stop or ["\n\n"],
-            echo=False,
-        )
+        text, tokens = await _await_job(request, job)
+    except JobCancelled:
+        raise HTTPException(status_code=499, detail="Client disconnected")
     except Exception as exc:
         logger.error("Inference error: %s", exc)
         raise HTTPException(status_code=500, detail="Model inference failed")
 
-    text = result["choices"][0]["text"]
     elapsed = (time.monotonic() - start) * 1000
-    tokens = result.get("usage", {}).get("completion_tokens", len(text.split()))
 
     return CompletionResponse(
         text=text,
@@ -251,8 +375,88 @@ def _postprocess_chat_result(result: dict) -> dict:
     return result
 
 
+class _ChatStreamFilter:
+    """Incremental version of _postprocess_chat_result for streamed content.
+
+    Drops <think> blocks, turns each complete <tool_call> block into an
+    OpenAI ``tool_calls`` delta, and passes other text through as content.
+    Text that could be the start of a tag is held back until it resolves.
+    """
+
+    _OPEN = {"<think>": "think", "<tool_call>": "tool_call"}
+
+    def __init__(self):
+        self._buf = ""
+        self._mode = None
+        self._strip = False
+        self.tool_calls = 0
+
+    def feed(self, text: str) -> List[Dict[str, Any]]:
+        self._buf += text
+        deltas = []
+        while True:
+            if self._strip:
+                self._buf = self._buf.lstrip()
+                if not self._buf:
+                    break
+                self._strip = False
+            if self._mode is None:
+                hits = [(self._buf.find(tag), tag) for tag in self._OPEN if tag in self._buf]
+                if hits:
+                    idx, tag = min(hits)
+                    self._emit_content(self._buf[:idx], deltas)
+                    self._buf = self._buf[idx + len(tag):]
+                    self._mode = self._OPEN[tag]
+                    continue
+                keep = self._partial_tag_len()
+                self._emit_content(self._buf[:len(self._buf) - keep], deltas)
+                self._buf = self._buf[len(self._buf) - keep:]
+                break
+            close = f"</{self._mode}>"
+            idx = self._buf.find(close)
+            if idx < 0:
+                break
+            inner, self._buf = self._buf[:idx], self._buf[idx + len(close):]
+            if self._mode == "tool_call":
+                _, calls = _extract_tool_calls(f"<tool_call>{inner}</tool_call>")
+                for call in calls or []:
+                    deltas.append({"tool_calls": [{"index": self.tool_calls, **call}]})
+                    self.tool_calls += 1
+            self._mode = None
+            self._strip = True
+        return deltas
+
+    def finish(self) -> List[Dict[str, Any]]:
+        deltas = []
+        if self._mode is None:
+            self._emit_content(self._buf, deltas)
+        self._buf = ""
+        return deltas
+
+    def _partial_tag_len(self) -> int:
+        for n in range(min(len(self._buf), max(map(len, self._OPEN))), 0, -1):
+            if any(tag.startswith(self._buf[-n:]) for tag in self._OPEN):
+                return n
+        return 0
+
+    @staticmethod
+    def _emit_content(text: str, deltas: list) -> None:
+        if text:
+            deltas.append({"content": text})
+
+
+def _chat_chunk(chunk_id: str, created: int, delta: dict, finish_reason=None) -> dict:
+    return {
+        "id": chunk_id,
+        "object": "chat.completion.chunk",
+        "created": created,
+        "model": _model_name,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+
+
 @app.post("/v1/chat/completions")
-def chat_completions(req: ChatCompletionRequest):
+async def chat_completions(req: ChatCompletionRequest, request: Request):
     """OpenAI-compatible chat completions with tool/function calling support.
 
     Fix Pack V8: Qwen3-8B outputs tool calls as <tool_call> XML tags and
@@ -294,8 +498,20 @@ def chat_completions(req: ChatCompletionRequest):
     if req.tool_choice:
         kwargs["tool_choice"] = req.tool_choice
 
-    try:
+    if req.stream:
+        return _stream_chat(request, kwargs, req.priority)
+
+    def run(job):
         result = _llm.create_chat_completion(**kwargs)
+        if isinstance(result, dict):
+            job.add_tokens(result.get("usage", {}).get("completion_tokens", 0) or 0)
+        return result
+
+    job = _submit(run, req.priority)
+    try:
+        result = await _await_job(request, job)
+    except JobCancelled:
+        raise HTTPException(status_code=499, detail="Client disconnected")
     except Exception as exc:
         logger.error("Chat completion error: %s", exc)
         raise HTTPException(
@@ -323,6 +539,36 @@ def chat_completions(req: ChatCompletionRequest):
     return result
 
 
+def _stream_chat(request: Request, kwargs: dict, priority: str) -> StreamingResponse:
+    """Stream a chat completion as OpenAI ``chat.completion.chunk`` events."""
+    job = _submit(lambda job: _llm.create_chat_completion(stream=True, **kwargs), priority, stream=True)
+    chunk_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+    created = int(time.time())
+    stream_filter = _ChatStreamFilter()
+    finish = {"reason": "stop"}
+
+    def render(chunk):
+        if chunk is None:
+            events = [_chat_chunk(chunk_id, created, d) for d in stream_filter.finish()]
+            reason = "tool_calls" if stream_filter.tool_calls else finish["reason"]
+            events.append(_chat_chunk(chunk_id, created, {}, reason))
+            return events
+        choice = (chunk.get("choices") or [{}])[0]
+        delta = choice.get("delta") or {}
+        if choice.get("finish_reason"):
+            finish["reason"] = choice["finish_reason"]
+        events = []
+        if delta.get("role"):
+            events.append(_chat_chunk(chunk_id, created, {"role": delta["role"]}))
+        if delta.get("tool_calls"):
+            events.append(_chat_chunk(chunk_id, created, {"tool_calls": delta["tool_calls"]}))
+        if delta.get("content"):
+            events.extend(_chat_chunk(chunk_id, created, d) for d in stream_filter.feed(delta["content"]))
+        return events
+
+    return StreamingResponse(_sse(request, job, render), media_type="text/event-stream")
+
+
 # ---------------------------------------------------------------------------
 # Standalone entry point
 # ---------------------------------------------------------------------------
@@ -330,4 +576,7 @@ def chat_completions(req: ChatCompletionRequest):
 if __name__ == "__main__":
     import uvicorn
     port = int(os.environ.get("LOCAL_LLM_PORT", "8080"))
-    uvicorn.run(app, host="0.0.0.0", port=port, log_level="info")
+    # Keep idle client connections open longer than the client pool's
+    # 50 s idle timeout (uvicorn's default is 5 s).
+    keep_alive = int(os.environ.get("LOCAL_LLM_KEEP_ALIVE_S", "75"))
+    uvicorn.run(app, host="0.0.0.0", port=port, log_level="info", timeout_keep_alive=keep_alive)
@@ -0,0 +1,632 @@
+"""
+IMAP Sync — incremental UID-based mailbox sync into a local header index.
+
+Instead of running ``SEARCH ALL`` and fetching whole messages on every
+call, the ProtocolAdapter keeps a SQLite index of message headers per
+(account, mailbox) and brings it up to date with one round trip — a
+``STATUS``, or for the mailbox the connection already has selected (which
+RFC 3501 §6.3.10 says STATUS must not be used for) a fresh ``SELECT`` —
+plus, when needed:
+
+- ``UID FETCH <uids> (UID FLAGS ENVELOPE BODYSTRUCTURE RFC822.SIZE)`` for
+  the UIDs the index has not seen yet (below ``UIDNEXT``); a range that
+  spans more than one batch is first narrowed to the UIDs that exist with
+  ``UID SEARCH UID lo:*``, so a sparse mailbox is not walked range by range;
+- ``UID SEARCH ALL`` only when the server's message count no longer
+  matches the index (something was expunged elsewhere);
+- ``UID SEARCH UNSEEN`` when flags may have changed elsewhere: the unseen
+  count differs, the mailbox's ``HIGHESTMODSEQ`` moved (servers with
+  CONDSTORE), or — since one message read and another marked unread
+  leave the count alone — the last reconciliation is older than the
+  flag check interval.
+
+A changed ``UIDVALIDITY`` invalidates every cached UID, so the mailbox is
+dropped and re-synced from scratch. List and search are answered from the
+index; message bodies are fetched lazily and cached on first read. The
+index lives under the data dir (``default_index_path``), so a restart
+resumes from the last checkpoint instead of re-syncing.
+
+No external dependencies — Python stdlib only.
+"""
+
+from __future__ import annotations
+
+import email.header
+import email.utils
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# UIDs per FETCH command during sync
+DEFAULT_SYNC_BATCH = 500
+
+_HEADER_ITEMS = "(UID FLAGS ENVELOPE BODYSTRUCTURE RFC822.SIZE)"
+_STATUS_ITEMS = "(MESSAGES UIDNEXT UIDVALIDITY UNSEEN)"
+_CONDSTORE_STATUS_ITEMS = "(MESSAGES UIDNEXT UIDVALIDITY UNSEEN HIGHESTMODSEQ)"
+
+# Seconds between unseen-set reconciliations when the server can't tell
+# us whether flags changed (no CONDSTORE)
+DEFAULT_FLAG_CHECK_INTERVAL = 300.0
+
+
+
+def default_index_path() -> str:
+    """Where the adapter keeps its header index unless given one."""
+    return os.path.join(os.getenv("LANCELOT_DATA_DIR", "lancelot_data"), "connectors", "mail_index.db")
+
+
+def _uid_set(uids: Sequence[int]) -> str:
+    """Compact IMAP sequence set for sorted UIDs (``1:3,7,9:10``)."""
+    parts = []
+    run_start = prev = uids[0]
+    for uid in list(uids[1:]) + [None]:
+        if uid is not None and uid == prev + 1:
+            prev = uid
+            continue
+        parts.append(str(run_start) if run_start == prev else f"{run_start}:{prev}")
+        run_start = prev = uid
+    return ",".join(parts)
+
+
+# ── Response parsing ─────────────────────────────────────────────
+
+_TOKEN_RE = re.compile(
+    rb'\s*(?:(\()|(\))|"((?:[^"\\]|\\.)*)"|\{(\d+)\}'
+    rb'|([^\s()"\[]+(?:\[[^\]]*\][^\s()"]*)?))'
+)
+
+
+def _lex(data: bytes) -> Iterator[Tuple[str, Any]]:
+    pos = 0
+    while pos < len(data):
+        match = _TOKEN_RE.match(data, pos)
+        if not match or match.end() == pos:
+            break
+        pos = match.end()
+        opened, closed, quoted, literal, atom = match.groups()
+        if opened:
+            yield "(", None
+        elif closed:
+            yield ")", None
+        elif quoted is not None:
+            yield "str", re.sub(rb"\\(.)", rb"\1", quoted).decode("utf-8", errors="replace")
+        elif literal is not None:
+            continue  # imaplib delivers the literal as the next tuple element
+        elif atom is not None:
+            yield "atom", atom.decode("utf-8", errors="replace")
+
+
+def parse_response(data: Sequence[Any]) -> List[Any]:
+    """Parse imaplib response data into nested lists.
+
+    ``data`` is what imaplib returns for a command: a list of ``bytes``
+    lines and ``(head, literal)`` tuples. Atoms and quoted strings become
+    ``str``, ``NIL`` becomes ``None``, literals stay ``bytes``.
+    """
+    stack: List[List[Any]] = [[]]
+    for item in data:
+        if isinstance(item, tuple):
+            tokens = list(_lex(item[0])) + [("literal", item[1])]
+        elif isinstance(item, (bytes, bytearray)):
+            tokens = list(_lex(bytes(item)))
+        else:
+            continue
+        for kind, value in tokens:
+            if kind == "(":
+                stack.append([])
+            elif kind == ")":
+                if len(stack) > 1:
+                    closed = stack.pop()
+                    stack[-1].append(closed)
+            elif kind == "atom" and value.upper() == "NIL":
+                stack[-1].append(None)
+            else:
+                stack[-1].append(value)
+    while len(stack) > 1:
+        closed = stack.pop()
+        stack[-1].append(closed)
+    return stack[0]
+
+
+def parse_fetch(data: Sequence[Any]) -> List[Dict[str, Any]]:
+    """Turn a FETCH response into one ``{ITEM: value}`` dict per message."""
+    messages = []
+    for item in parse_response(data):
+        if isinstance(item, list):
+            attrs = {}
+            for i in range(0, len(item) - 1, 2):
+                if isinstance(item[i], str):
+                    attrs[item[i].upper()] = item[i + 1]
+            messages.append(attrs)
+    return messages
+
+
+def _decode_words(value: Optional[Any]) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bytes):
+        value = value.decode("utf-8", errors="replace")
+    try:
+        return str(email.header.make_header(email.header.decode_header(value)))
+    except Exception:
+        return value
+
+
+def _format_addresses(addresses: Optional[List[Any]]) -> str:
+    if not isinstance(addresses, list):
+        return ""
+    formatted = []
+    for addr in addresses:
+        if not isinstance(addr, list) or len(addr) < 4 or addr[2] is None:
+            continue
+        mailbox = _decode_words(addr[2])
+        address = f"{mailbox}@{_decode_words(addr[3])}" if addr[3] else mailbox
+        formatted.append(email.utils.formataddr((_decode_words(addr[0]), address)))
+    return ", ".join(formatted)
+
+
+def _content_type(structure: Any) -> str:
+    if not isinstance(structure, list) or not structure:
+        return ""
+    if isinstance(structure[0], list):
+        subtype = next((p for p in structure if isinstance(p, str)), "mixed")
+        return f"multipart/{subtype}".lower()
+    if len(structure) > 1 and isinstance(structure[0], str) and isinstance(structure[1], str):
+        return f"{structure[0]}/{structure[1]}".lower()
+    return ""
+
+
+def _has_attachments(structure: Any) -> bool:
+    if not isinstance(structure, list) or not structure:
+        return False
+    if isinstance(structure[0], list):
+        return any(_has_attachments(part) for part in structure if isinstance(part, list))
+    params = structure[2] if len(structure) > 2 and isinstance(structure[2], list) else []
+    if any(isinstance(p, str) and p.lower() == "name" for p in params[::2]):
+        return True
+    return any(
+        isinstance(ext, list) and ext and isinstance(ext[0], str) and ext[0].lower() == "attachment"
+        for ext in structure[7:]
+    )
+
+
+def header_row(attrs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Index row for one parsed FETCH item, or None if it carries no UID."""
+    try:
+        uid = int(attrs["UID"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    envelope = attrs.get("ENVELOPE")
+    envelope = envelope if isinstance(envelope, list) and len(envelope) >= 10 else [None] * 10
+    flags = attrs.get("FLAGS") if isinstance(attrs.get("FLAGS"), list) else []
+    structure = attrs.get("BODYSTRUCTURE")
+    date = _decode_words(envelope[0])
+    try:
+        date = email.utils.parsedate_to_datetime(date).isoformat()
+    except (TypeError, ValueError, IndexError):
+        pass
+    try:
+        size = int(attrs.get("RFC822.SIZE") or 0)
+    except (TypeError, ValueError):
+        size = 0
+    return {
+        "uid": uid,
+        "message_id": _decode_words(envelope[9]),
+        "subject": _decode_words(envelope[1]),
+        "sender": _format_addresses(envelope[2]),
+        "recipients": _format_addresses(envelope[5]),
+        "date": date,
+        "flags": " ".join(f for f in flags if isinstance(f, str)),
+        "seen": any(isinstance(f, str) and f.lower() == "\\seen" for f in flags),
+        "size": size,
+        "has_attachments": _has_attachments(structure),
+        "content_type": _content_type(structure),
+    }
+
+
+# ── Header index ─────────────────────────────────────────────────
+
+@dataclass
+class MailboxState:
+    """Sync checkpoint for one mailbox."""
+    uidvalidity: int
+    uidnext: int
+    synced_at: float
+
+
+class MailIndex:
+    """SQLite index of message headers keyed by (account, mailbox, uid).
+
+    Defaults to an in-memory database; pass a file path (the adapter uses
+    ``default_index_path()``) to keep the index across restarts.
+    """
+
+    CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS mailboxes (
+        account TEXT NOT NULL,
+        mailbox TEXT NOT NULL,
+        uidvalidity INTEGER NOT NULL,
+        uidnext INTEGER NOT NULL,
+        synced_at REAL NOT NULL,
+        PRIMARY KEY (account, mailbox)
+    );
+
+    CREATE TABLE IF NOT EXISTS messages (
+        account TEXT NOT NULL,
+        mailbox TEXT NOT NULL,
+        uid INTEGER NOT NULL,
+        message_id TEXT NOT NULL DEFAULT '',
+        subject TEXT NOT NULL DEFAULT '',
+        sender TEXT NOT NULL DEFAULT '',
+        recipients TEXT NOT NULL DEFAULT '',
+        date TEXT NOT NULL DEFAULT '',
+        flags TEXT NOT NULL DEFAULT '',
+        seen INTEGER NOT NULL DEFAULT 0,
+        size INTEGER NOT NULL DEFAULT 0,
+        has_attachments INTEGER NOT NULL DEFAULT 0,
+        content_type TEXT NOT NULL DEFAULT '',
+        body BLOB,
+        PRIMARY KEY (account, mailbox, uid)
+    );
+    """
+
+    _SUMMARY_COLUMNS = (
+        "uid, message_id, subject, sender, recipients, date, flags, seen, "
+        "size, has_attachments, content_type"
+    )
+
+    def __init__(self, db_path: str = ":memory:") -> None:
+        self.db_path = db_path
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.executescript(self.CREATE_TABLE_SQL)
+
+    # ── Sync state ────────────────────────────────────────────────
+
+    def state(self, account: str, mailbox: str) -> Optional[MailboxState]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT uidvalidity, uidnext, synced_at FROM mailboxes WHERE account = ? AND mailbox = ?",
+                (account, mailbox),
+            ).fetchone()
+        return MailboxState(row["uidvalidity"], row["uidnext"], row["synced_at"]) if row else None
+
+    def set_state(self, account: str, mailbox: str, uidvalidity: int, uidnext: int) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO mailboxes (account, mailbox, uidvalidity, uidnext, synced_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (account, mailbox, uidvalidity, uidnext, time.time()),
+            )
+
+    def reset(self, account: str, mailbox: str) -> None:
+        """Forget every cached message of a mailbox (UIDVALIDITY changed)."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM messages WHERE account = ? AND mailbox = ?", (account, mailbox),
+            )
+            self._conn.execute(
+                "DELETE FROM mailboxes WHERE account = ? AND mailbox = ?", (account, mailbox),
+            )
+
+    # ── Headers ───────────────────────────────────────────────────
+
+    def upsert(self, account: str, mailbox: str, rows: Iterable[Dict[str, Any]]) -> int:
+        params = [
+            (account, mailbox, r["uid"], r["message_id"], r["subject"], r["sender"],
+             r["recipients"], r["date"], r["flags"], int(r["seen"]), r["size"],
+             int(r["has_attachments"]), r["content_type"])
+            for r in rows
+        ]
+        if not params:
+            return 0
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO messages (account, mailbox, uid, message_id, subject, sender, "
+                "recipients, date, flags, seen, size, has_attachments, content_type) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (account, mailbox, uid) DO UPDATE SET "
+                "message_id = excluded.message_id, subject = excluded.subject, "
+                "sender = excluded.sender, recipients = excluded.recipients, "
+                "date = excluded.date, flags = excluded.flags, seen = excluded.seen, "
+                "size = excluded.size, has_attachments = excluded.has_attachments, "
+                "content_type = excluded.content_type",
+                params,
+            )
+        return len(params)
+
+    def count(self, account: str, mailbox: str, unseen_only: bool = False) -> int:
+        sql = "SELECT COUNT(*) FROM messages WHERE account = ? AND mailbox = ?"
+        if unseen_only:
+            sql += " AND seen = 0"
+        with self._lock:
+            return self._conn.execute(sql, (account, mailbox)).fetchone()[0]
+
+    def retain(self, account: str, mailbox: str, uids: Iterable[int]) -> int:
+        """Drop indexed messages whose UID is not in ``uids``. Returns the number removed."""
+        keep = set(uids)
+        with self._lock, self._conn:
+            indexed = [r[0] for r in self._conn.execute(
+                "SELECT uid FROM messages WHERE account = ? AND mailbox = ?", (account, mailbox),
+            )]
+            gone = [(account, mailbox, uid) for uid in indexed if uid not in keep]
+            self._conn.executemany(
+                "DELETE FROM messages WHERE account = ? AND mailbox = ? AND uid = ?", gone,
+            )
+        return len(gone)
+
+    def remove(self, account: str, mailbox: str, uids: Iterable[int]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM messages WHERE account = ? AND mailbox = ? AND uid = ?",
+                [(account, mailbox, uid) for uid in uids],
+            )
+
+    def mark_unseen(self, account: str, mailbox: str, unseen_uids: Iterable[int]) -> None:
+        """Set ``seen`` from the server's UNSEEN set: listed UIDs unseen, all others seen."""
+        unseen = set(unseen_uids)
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                "SELECT uid, seen FROM messages WHERE account = ? AND mailbox = ?", (account, mailbox),
+            ).fetchall()
+            changes = [
+                (0 if row["uid"] in unseen else 1, account, mailbox, row["uid"])
+                for row in rows if bool(row["seen"]) == (row["uid"] in unseen)
+            ]
+            self._conn.executemany(
+                "UPDATE messages SET seen = ? WHERE account = ? AND mailbox = ? AND uid = ?", changes,
+            )
+
+    def set_seen(self, account: str, mailbox: str, uid: int) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE messages SET seen = 1 WHERE account = ? AND mailbox = ? AND uid = ?",
+                (account, mailbox, uid),
+            )
+
+    def recent(self, account: str, mailbox: str, limit: int) -> List[Dict[str, Any]]:
+        """The ``limit`` highest-UID messages, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {self._SUMMARY_COLUMNS} FROM messages WHERE account = ? AND mailbox = ? "
+                "ORDER BY uid DESC LIMIT ?",
+                (account, mailbox, limit),
+            ).fetchall()
+        return [self._summary(r) for r in reversed(rows)]
+
+    def search(self, account: str, mailbox: str, query: str, limit: int) -> List[Dict[str, Any]]:
+        """Messages whose subject or sender contains ``query`` (case-insensitive), oldest first."""
+        pattern = "%" + query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {self._SUMMARY_COLUMNS} FROM messages WHERE account = ? AND mailbox = ? "
+                "AND (subject LIKE ? ESCAPE '\\' OR sender LIKE ? ESCAPE '\\') "
+                "ORDER BY uid DESC LIMIT ?",
+                (account, mailbox, pattern, pattern, limit),
+            ).fetchall()
+        return [self._summary(r) for r in reversed(rows)]
+
+    # ── Bodies ────────────────────────────────────────────────────
+
+    def body(self, account: str, mailbox: str, uid: int) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body FROM messages WHERE account = ? AND mailbox = ? AND uid = ?",
+                (account, mailbox, uid),
+            ).fetchone()
+        return row["body"] if row and row["body"] is not None else None
+
+    def set_body(self, account: str, mailbox: str, uid: int, raw: bytes) -> None:
+        """Cache a fetched body (no-op if the message is not indexed)."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE messages SET body = ? WHERE account = ? AND mailbox = ? AND uid = ?",
+                (raw, account, mailbox, uid),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _summary(row: sqlite3.Row) -> Dict[str, Any]:
+        summary = dict(row)
+        summary["seen"] = bool(summary["seen"])
+        summary["has_attachments"] = bool(summary["has_attachments"])
+        return summary
+
+
+# ── Sync engine ──────────────────────────────────────────────────
+
+@dataclass
+class SyncResult:
+    """What one ``MailboxSync.sync`` call did."""
+    mailbox: str
+    total: int
+    fetched: int = 0
+    removed: int = 0
+    full_resync: bool = False
+
+
+class MailboxSync:
+    """Brings a MailIndex up to date with a mailbox on a live imaplib connection."""
+
+    def __init__(
+        self,
+        index: MailIndex,
+        batch_size: int = DEFAULT_SYNC_BATCH,
+        flag_check_interval: float = DEFAULT_FLAG_CHECK_INTERVAL,
+    ) -> None:
+        self._index = index
+        self._batch_size = max(1, batch_size)
+        self._flag_check_interval = flag_check_interval
+        # (account, mailbox) → (monotonic time, HIGHESTMODSEQ or None) of
+        # the last unseen-set reconciliation in this process
+        self._flag_checks: Dict[Tuple[str, str], Tuple[float, Optional[int]]] = {}
+
+    def sync(self, conn, account: str, mailbox: str, select=None, is_selected: bool = False) -> SyncResult:
+        """Sync ``mailbox`` incrementally.
+
+        ``select(refresh)`` selects the mailbox and returns the SELECT
+        response data; it is called before the first UID command. The
+        adapter passes its cached SELECT so an unchanged mailbox costs one
+        round trip. ``refresh`` forces the SELECT to be re-issued. With
+        ``is_selected`` the connection already has ``mailbox`` selected, so
+        its counts come from a fresh SELECT instead of STATUS.
+        """
+        if select is None:
+            def select(refresh=False):
+                typ, data = conn.select(mailbox)
+                if typ != "OK":
+                    raise RuntimeError(f"SELECT {mailbox} failed: {data}")
+                return data
+
+        if is_selected:
+            status = self.reselect(conn, select)
+        else:
+            status = self.status(conn, mailbox)
+        uidvalidity = status.get("UIDVALIDITY", 0)
+        uidnext = status.get("UIDNEXT")
+        messages = status.get("MESSAGES", 0)
+
+        state = self._index.state(account, mailbox)
+        result = SyncResult(mailbox=mailbox, total=messages)
+        if state is None or state.uidvalidity != uidvalidity:
+            if state is not None:
+                logger.info("IMAP sync: UIDVALIDITY changed for %s, re-syncing", mailbox)
+            self._index.reset(account, mailbox)
+            result.full_resync = True
+            start = 1
+        else:
+            start = state.uidnext
+
+        selected = is_selected
+        if uidnext is None or uidnext > start:
+            select(result.full_resync)
+            selected = True
+            result.fetched, highest = self._fetch_headers(conn, account, mailbox, start, uidnext)
+            if uidnext is None:
+                uidnext = max(start, highest + 1)
+        self._index.set_state(account, mailbox, uidvalidity, uidnext)
+
+        # Expunged (or moved) elsewhere: reconcile the UID set
+        if self._index.count(account, mailbox) != messages:
+            if not selected:
+                select()
+                selected = True
+            result.removed = self._index.retain(account, mailbox, self._uid_search(conn, "ALL"))
+
+        # Read/unread changed elsewhere: reconcile the unseen set
+        modseq = status.get("HIGHESTMODSEQ")
+        if result.full_resync:
+            # Every header (and its flags) was just fetched
+            self._flag_checks[(account, mailbox)] = (time.monotonic(), modseq)
+        elif self._flags_may_have_changed(account, mailbox, status):
+            if not selected:
+                select()
+            self._index.mark_unseen(account, mailbox, self._uid_search(conn, "UNSEEN"))
+            self._flag_checks[(account, mailbox)] = (time.monotonic(), modseq)
+
+        if result.fetched or result.removed:
+            logger.info(
+                "IMAP sync %s: +%d -%d (total=%d)", mailbox, result.fetched, result.removed, messages,
+            )
+        return result
+
+    def _flags_may_have_changed(self, account: str, mailbox: str, status: Dict[str, int]) -> bool:
+        if "UNSEEN" in status and self._index.count(account, mailbox, unseen_only=True) != status["UNSEEN"]:
+            return True
+        last = self._flag_checks.get((account, mailbox))
+        if last is None:
+            return True
+        checked_at, modseq = last
+        if "HIGHESTMODSEQ" in status and modseq is not None:
+            # CONDSTORE: every flag change bumps the mod-sequence
+            return status["HIGHESTMODSEQ"] != modseq
+        return time.monotonic() - checked_at >= self._flag_check_interval
+
+    @staticmethod
+    def reselect(conn, select) -> Dict[str, int]:
+        """Counts for the selected mailbox from the untagged responses of a fresh SELECT."""
+        data = select(True)
+        status = {}
+        try:
+            status["MESSAGES"] = int(data[0])
+        except (IndexError, TypeError, ValueError):
+            pass
+        for code in ("UIDVALIDITY", "UIDNEXT", "HIGHESTMODSEQ"):
+            _, values = conn.response(code)
+            try:
+                status[code] = int(values[-1])
+            except (IndexError, TypeError, ValueError):
+                continue
+        return status
+
+    @staticmethod
+    def status(conn, mailbox: str) -> Dict[str, int]:
+        items = _CONDSTORE_STATUS_ITEMS if "CONDSTORE" in getattr(conn, "capabilities", ()) else _STATUS_ITEMS
+        typ, data = conn.status(mailbox, items)
+        if typ != "OK":
+            raise RuntimeError(f"STATUS {mailbox} failed: {data}")
+        parsed = parse_response(data)
+        items = next((p for p in reversed(parsed) if isinstance(p, list)), [])
+        status = {}
+        for i in range(0, len(items) - 1, 2):
+            try:
+                status[str(items[i]).upper()] = int(items[i + 1])
+            except (TypeError, ValueError):
+                continue
+        return status
+
+    def _fetch_headers(self, conn, account: str, mailbox: str,
+                       start: int, uidnext: Optional[int]) -> Tuple[int, int]:
+        """Fetch headers for UIDs in [start, uidnext) in batches. Returns (count, highest uid).
+
+        A range that fits in one batch is fetched directly. A wider one (an
+        initial sync, or a sparse mailbox whose UIDNEXT is far past its
+        message count) is narrowed to the UIDs that exist first, so empty
+        stretches of the range cost no round trips.
+        """
+        if uidnext is not None and uidnext - start <= self._batch_size:
+            batches = [(f"{start}:{uidnext - 1}", start, uidnext - 1)]
+        else:
+            uids = sorted(
+                uid for uid in self._uid_search(conn, f"UID {start}:*")
+                # "n:*" always matches the last message, even when its UID < n
+                if uid >= start and (uidnext is None or uid < uidnext)
+            )
+            batches = [
+                (_uid_set(chunk), chunk[0], chunk[-1])
+                for chunk in (uids[i:i + self._batch_size] for i in range(0, len(uids), self._batch_size))
+            ]
+        fetched = 0
+        highest = start - 1
+        for uid_set, lo, hi in batches:
+            typ, data = conn.uid("FETCH", uid_set, _HEADER_ITEMS)
+            if typ != "OK":
+                raise RuntimeError(f"UID FETCH {uid_set} failed: {data}")
+            rows = [
+                row for row in (header_row(attrs) for attrs in parse_fetch(data))
+                if row and lo <= row["uid"] <= hi
+            ]
+            fetched += self._index.upsert(account, mailbox, rows)
+            highest = max([highest] + [row["uid"] for row in rows])
+        return fetched, highest
+
+    @staticmethod
+    def _uid_search(conn, criteria: str) -> List[int]:
+        typ, data = conn.uid("SEARCH", criteria)
+        if typ != "OK":
+            raise RuntimeError(f"UID SEARCH {criteria} failed: {data}")
+        return [int(uid) for line in data if line for uid in line.split()]
@@ -9,6 +9,10 @@ The adapter is injected into ConnectorProxy and called when the URL
 starts with ``protocol://``.  In production it holds a live connection;
 in tests it can be replaced with a mock.
 
+IMAP messages are addressed by UID. List and search are answered from a
+local header index that is synced incrementally before each call (see
+``imap_sync``); bodies are fetched on demand and cached.
+
 No external dependencies — Python stdlib only.
 """
 
@@ -21,8 +25,9 @@ import logging
 import smtplib
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
+from src.connectors.imap_sync import MailboxSync, MailIndex, default_index_path, parse_fetch
 from src.connectors.models import ConnectorResponse, ConnectorResult
 
 logger = logging.getLogger(__name__)
@@ -61,12 +66,16 @@ class ProtocolAdapter:
         smtp_config: Optional[SMTPConfig] = None,
         imap_config: Optional[IMAPConfig] = None,
         credentials: Optional[Dict[str, str]] = None,
+        mail_index: Optional[MailIndex] = None,
     ) -> None:
         self._smtp_config = smtp_config or SMTPConfig()
         self._imap_config = imap_config or IMAPConfig()
         self._credentials = credentials or {}
         self._smtp_conn: Optional[smtplib.SMTP] = None
-        self._imap_conn: Optional[imaplib.IMAP4_SSL] = None
+        self._imap_conn: Optional[imaplib.IMAP4] = None
+        self._imap_selected: Optional[str] = None
+        self._mail_index = mail_index or MailIndex(default_index_path())
+        self._mailbox_sync = MailboxSync(self._mail_index)
 
     # ── Public API ────────────────────────────────────────────────
 
@@ -190,64 +199,116 @@ class ProtocolAdapter:
             raise ValueError(f"Unknown IMAP action: {action}")
 
     def _imap_list(self, body: Dict[str, Any]) -> Dict[str, Any]:
-        """List messages in a folder."""
-        conn = self._get_imap_connection()
+        """List the most recent messages in a folder from the header index."""
         folder = body.get("folder", "INBOX")
-        conn.select(folder)
-        _, data = conn.search(None, "ALL")
-        message_ids = data[0].split() if data[0] else []
+        sync = self._imap_sync(folder)
         limit = body.get("max_results", 50)
+        messages = self._mail_index.recent(self._imap_account(), folder, limit)
         return {
             "folder": folder,
-            "message_ids": [mid.decode() for mid in message_ids[-limit:]],
-            "total": len(message_ids),
+            "message_ids": [str(m["uid"]) for m in messages],
+            "messages": messages,
+            "total": sync.total,
         }
 
     def _imap_fetch(self, body: Dict[str, Any]) -> Dict[str, Any]:
-        """Fetch a single message by ID."""
-        conn = self._get_imap_connection()
-        conn.select("INBOX")
-        message_id = body.get("message_id", "")
-        _, data = conn.fetch(message_id, "(RFC822)")
-        if data and data[0]:
-            raw = data[0][1] if isinstance(data[0], tuple) else data[0]
-            return {"message_id": message_id, "raw": raw.decode("utf-8", errors="replace")}
-        return {"message_id": message_id, "raw": ""}
+        """Fetch a single message body by UID (cached after the first read)."""
+        folder = body.get("folder", "INBOX")
+        message_id = str(body.get("message_id", ""))
+        account = self._imap_account()
+        uid = int(message_id)
+        raw = self._mail_index.body(account, folder, uid)
+        if raw is None:
+            conn = self._get_imap_connection()
+            self._imap_select(folder)
+            _, data = conn.uid("FETCH", message_id, "(RFC822)")
+            raw = next(
+                (v for attrs in parse_fetch(data) for k, v in attrs.items()
+                 if k == "RFC822" and isinstance(v, bytes)),
+                b"",
+            )
+            if raw:
+                # RFC822 (unlike BODY.PEEK) sets \Seen on the server
+                self._mail_index.set_body(account, folder, uid, raw)
+                self._mail_index.set_seen(account, folder, uid)
+        return {"message_id": message_id, "raw": raw.decode("utf-8", errors="replace")}
 
     def _imap_search(self, body: Dict[str, Any]) -> Dict[str, Any]:
-        """Search messages by query."""
-        conn = self._get_imap_connection()
-        conn.select("INBOX")
+        """Search subject and sender in the header index."""
+        folder = body.get("folder", "INBOX")
+        self._imap_sync(folder)
         query = body.get("query", "")
-        _, data = conn.search(None, f'SUBJECT "{query}"')
-        message_ids = data[0].split() if data[0] else []
-        return {"query": query, "message_ids": [mid.decode() for mid in message_ids]}
+        limit = body.get("max_results", 50)
+        messages = self._mail_index.search(self._imap_account(), folder, query, limit)
+        return {
+            "query": query,
+            "message_ids": [str(m["uid"]) for m in messages],
+            "messages": messages,
+        }
 
     def _imap_delete(self, body: Dict[str, Any]) -> Dict[str, Any]:
         """Delete a message by marking it as \\Deleted and expunging."""
+        folder = body.get("folder", "INBOX")
         conn = self._get_imap_connection()
-        conn.select("INBOX")
-        message_id = body.get("message_id", "")
-        conn.store(message_id, "+FLAGS", "\\Deleted")
+        self._imap_select(folder)
+        message_id = str(body.get("message_id", ""))
+        conn.uid("STORE", message_id, "+FLAGS", "(\\Deleted)")
         conn.expunge()
+        self._mail_index.remove(self._imap_account(), folder, [int(message_id)])
         return {"deleted": message_id}
 
     def _imap_move(self, body: Dict[str, Any]) -> Dict[str, Any]:
         """Move a message to a different folder."""
+        folder = body.get("folder", "INBOX")
         conn = self._get_imap_connection()
-        conn.select("INBOX")
-        message_id = body.get("message_id", "")
+        self._imap_select(folder)
+        message_id = str(body.get("message_id", ""))
         destination = body.get("destination", "")
-        conn.copy(message_id, destination)
-        conn.store(message_id, "+FLAGS", "\\Deleted")
+        conn.uid("COPY", message_id, destination)
+        conn.uid("STORE", message_id, "+FLAGS", "(\\Deleted)")
         conn.expunge()
+        # The copy gets a new UID in the destination; its next sync picks it up
+        self._mail_index.remove(self._imap_account(), folder, [int(message_id)])
         return {"moved": message_id, "destination": destination}
 
-    def _get_imap_connection(self) -> imaplib.IMAP4_SSL:
+    def _imap_sync(self, folder: str):
+        """Bring the header index for ``folder`` up to date."""
+        conn = self._get_imap_connection()
+        return self._mailbox_sync.sync(
+            conn, self._imap_account(), folder,
+            select=lambda refresh=False: self._imap_select(folder, refresh),
+            is_selected=self._imap_selected == folder,
+        )
+
+    def _imap_select(self, folder: str, refresh: bool = False) -> Optional[List[Any]]:
+        """SELECT ``folder`` unless it is already the selected mailbox.
+
+        Returns the SELECT response data, or None if nothing was sent.
+        """
+        if refresh or self._imap_selected != folder:
+            # A failed SELECT leaves no mailbox selected
+            self._imap_selected = None
+            typ, data = self._get_imap_connection().select(folder)
+            if typ != "OK":
+                raise RuntimeError(f"SELECT {folder} failed: {data}")
+            self._imap_selected = folder
+            return data
+        return None
+
+    def _imap_account(self) -> str:
+        """Index key for the configured mailbox account."""
+        cfg = self._imap_config
+        return f"{self._credentials.get('username', '')}@{cfg.host}:{cfg.port}"
+
+    def _get_imap_connection(self) -> imaplib.IMAP4:
         """Get or create IMAP connection."""
         if self._imap_conn is None:
             cfg = self._imap_config
-            self._imap_conn = imaplib.IMAP4_SSL(cfg.host, cfg.port)
+            if cfg.use_ssl:
+                self._imap_conn = imaplib.IMAP4_SSL(cfg.host, cfg.port)
+            else:
+                self._imap_conn = imaplib.IMAP4(cfg.host, cfg.port)
+            self._imap_selected = None
             if self._credentials.get("username"):
                 self._imap_conn.login(
                     self._credentials["username"],
@@ -271,3 +332,4 @@ class ProtocolAdapter:
             except Exception:
                 pass
             self._imap_conn = None
+            self._imap_selected = None
@@ -0,0 +1,283 @@
+"""
+Chat Execution Engine — runs blocking chat turns off the event loop.
+
+``LancelotOrchestrator.chat()`` is synchronous and an agentic turn can take
+tens of seconds. Calling it inline from an ``async`` FastAPI route freezes
+every other route, the War Room WebSocket broadcasts and the health probes.
+
+This engine hands each turn to a bounded thread pool while keeping two
+guarantees:
+
+    1. Messages from the same session run strictly in submission order
+       (at most one turn per session is in flight at any time).
+    2. Admission is bounded — a per-session queue limit (surfaced as 429)
+       and a global pending limit (surfaced as 503) provide backpressure
+       instead of unbounded thread growth.
+
+Queue depth, wait time and run time are tracked for ``/health``.
+
+The gateway's turns all run on one shared orchestrator, which serializes
+them on its ``turn_lock``; extra workers would only wait on that lock, so
+the default is a single worker.
+
+Environment variables:
+    LANCELOT_CHAT_WORKERS              — worker threads (default: 1)
+    LANCELOT_CHAT_MAX_PENDING          — global queued-turn limit (default: 64)
+    LANCELOT_CHAT_MAX_PENDING_SESSION  — per-session queued-turn limit (default: 8)
+
+Public API:
+    ChatExecutionEngine(max_workers, max_pending, max_pending_per_session)
+    engine.submit(session_key, fn, *args, **kwargs)  → concurrent.futures.Future
+    await engine.run(session_key, fn, *args, **kwargs) → result
+    engine.stats()                                   → dict
+    engine.shutdown(wait=True)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict
+
+logger = logging.getLogger("lancelot.chat_engine")
+
+# Number of recent samples kept for wait/run time statistics.
+_SAMPLE_WINDOW = 256
+
+
+class ChatEngineError(Exception):
+    """Base class for chat admission failures."""
+
+    status_code = 503
+
+
+class SessionQueueFullError(ChatEngineError):
+    """Raised when a single session has too many turns queued (HTTP 429)."""
+
+    status_code = 429
+
+
+class EngineOverloadedError(ChatEngineError):
+    """Raised when the global queue is full or the engine is stopped (HTTP 503)."""
+
+    status_code = 503
+
+
+@dataclass
+class _Job:
+    fn: Callable[..., Any]
+    args: tuple
+    kwargs: dict
+    future: Future
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _Session:
+    pending: Deque[_Job] = field(default_factory=deque)
+    active: bool = False
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.getenv(name, str(default))))
+    except ValueError:
+        return default
+
+
+class ChatExecutionEngine:
+    """Bounded, per-session ordered executor for blocking chat turns."""
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_pending: int = 64,
+        max_pending_per_session: int = 8,
+    ):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.max_pending_per_session = max_pending_per_session
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="lancelot-chat",
+        )
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, _Session] = {}
+        self._pending = 0
+        self._running = 0
+        self._stopped = False
+        # Counters
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected_session = 0
+        self._rejected_overload = 0
+        self._wait_samples: Deque[float] = deque(maxlen=_SAMPLE_WINDOW)
+        self._run_samples: Deque[float] = deque(maxlen=_SAMPLE_WINDOW)
+
+    @classmethod
+    def from_env(cls) -> "ChatExecutionEngine":
+        """Build an engine from LANCELOT_CHAT_* environment variables."""
+        return cls(
+            max_workers=_env_int("LANCELOT_CHAT_WORKERS", 1),
+            max_pending=_env_int("LANCELOT_CHAT_MAX_PENDING", 64),
+            max_pending_per_session=_env_int("LANCELOT_CHAT_MAX_PENDING_SESSION", 8),
+        )
+
+    # ── Submission ────────────────────────────────────────────────
+
+    def submit(self, session_key: str, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """Queue ``fn(*args, **kwargs)`` behind earlier turns of the same session.
+
+        Raises:
+            SessionQueueFullError: The session already has too many queued turns.
+            EngineOverloadedError: The global queue is full or the engine is stopped.
+        """
+        job = _Job(fn=fn, args=args, kwargs=kwargs, future=Future())
+        key = session_key or "default"
+        with self._lock:
+            if self._stopped:
+                self._rejected_overload += 1
+                raise EngineOverloadedError("Chat engine is shutting down")
+            if self._pending >= self.max_pending:
+                self._rejected_overload += 1
+                raise EngineOverloadedError(
+                    f"Chat queue full ({self._pending} turns pending)"
+                )
+            session = self._sessions.setdefault(key, _Session())
+            if len(session.pending) >= self.max_pending_per_session:
+                self._rejected_session += 1
+                raise SessionQueueFullError(
+                    f"Session '{key}' has {len(session.pending)} turns queued"
+                )
+            session.pending.append(job)
+            self._pending += 1
+            self._submitted += 1
+            schedule = not session.active
+            if schedule:
+                session.active = True
+        if schedule:
+            self._pool.submit(self._drain_one, key)
+        return job.future
+
+    async def run(self, session_key: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Await a chat turn without blocking the event loop."""
+        future = self.submit(session_key, fn, *args, **kwargs)
+        return await asyncio.wrap_future(future)
+
+    # ── Worker ────────────────────────────────────────────────────
+
+    def _drain_one(self, key: str) -> None:
+        """Run the next job for ``key`` then reschedule the session if needed.
+
+        Rescheduling (rather than looping) lets other sessions interleave
+        on the pool so a chatty session cannot starve the rest.
+        """
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None or not session.pending:
+                if session is not None:
+                    session.active = False
+                    self._sessions.pop(key, None)
+                return
+            job = session.pending.popleft()
+            self._pending -= 1
+            self._running += 1
+            self._wait_samples.append(time.monotonic() - job.enqueued_at)
+
+        started = time.monotonic()
+        if job.future.set_running_or_notify_cancel():
+            try:
+                result = job.fn(*job.args, **job.kwargs)
+            except BaseException as exc:
+                job.future.set_exception(exc)
+                ok = False
+            else:
+                job.future.set_result(result)
+                ok = True
+        else:
+            ok = None  # cancelled by the caller before it started
+
+        with self._lock:
+            self._running -= 1
+            if ok is not None:
+                self._run_samples.append(time.monotonic() - started)
+            if ok:
+                self._completed += 1
+            elif ok is False:
+                self._failed += 1
+            if session.pending:
+                reschedule = True
+            else:
+                reschedule = False
+                session.active = False
+                self._sessions.pop(key, None)
+
+        if reschedule:
+            try:
+                self._pool.submit(self._drain_one, key)
+            except RuntimeError:
+                # Pool already shut down — fail the leftovers rather than hang callers.
+                self._abandon(key)
+
+    def _abandon(self, key: str) -> None:
+        with self._lock:
+            session = self._sessions.pop(key, None)
+            jobs = list(session.pending) if session else []
+            if session:
+                session.pending.clear()
+                session.active = False
+            self._pending -= len(jobs)
+        for job in jobs:
+            if not job.future.done():
+                job.future.set_exception(EngineOverloadedError("Chat engine stopped"))
+
+    # ── Telemetry ─────────────────────────────────────────────────
+
+    @staticmethod
+    def _summarize(samples: Deque[float]) -> dict:
+        if not samples:
+            return {"avg_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+        ordered = sorted(samples)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        return {
+            "avg_ms": round(sum(ordered) / len(ordered) * 1000, 1),
+            "p95_ms": round(p95 * 1000, 1),
+            "max_ms": round(ordered[-1] * 1000, 1),
+        }
+
+    def stats(self) -> dict:
+        """Snapshot of queue depth, throughput counters and latency."""
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "queue_depth": self._pending,
+                "running": self._running,
+                "active_sessions": len(self._sessions),
+                "max_pending": self.max_pending,
+                "max_pending_per_session": self.max_pending_per_session,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected_session_limit": self._rejected_session,
+                "rejected_overload": self._rejected_overload,
+                "wait_time": self._summarize(self._wait_samples),
+                "run_time": self._summarize(self._run_samples),
+                "stopped": self._stopped,
+            }
+
+    # ── Lifecycle ─────────────────────────────────────────────────
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting turns. Queued turns that never started are failed."""
+        with self._lock:
+            self._stopped = True
+            keys = list(self._sessions.keys())
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+        for key in keys:
+            self._abandon(key)
@@ -6,6 +6,10 @@ and the WebSocket connection manager subscribes to broadcast them to connected
 War Room clients.
 
 Thread-safe: publishers may run on background threads.
+
+With a journal attached (see event_journal.py) each published event is
+stamped with a sequence number and retained, so War Room clients can
+resume from the last event they saw.
 """
 
 import asyncio
@@ -23,13 +27,17 @@ class Event:
     type: str
     payload: dict = field(default_factory=dict)
     timestamp: float = field(default_factory=time.time)
+    seq: int = 0  # assigned by the journal on publish; 0 = not journaled
 
     def to_dict(self) -> dict:
-        return {
+        d = {
             "type": self.type,
             "payload": self.payload,
             "timestamp": self.timestamp,
         }
+        if self.seq:
+            d["seq"] = self.seq
+        return d
 
 
 # Type alias for async subscriber callbacks
@@ -43,11 +51,20 @@ class EventBus:
         self._subscribers: dict[str, list[Subscriber]] = {}
         self._global_subscribers: list[Subscriber] = []
         self._loop: asyncio.AbstractEventLoop | None = None
+        self._journal = None
 
     def set_loop(self, loop: asyncio.AbstractEventLoop) -> None:
         """Capture the main asyncio event loop for cross-thread publishing."""
         self._loop = loop
 
+    def set_journal(self, journal) -> None:
+        """Attach an EventJournal that numbers and retains published events."""
+        self._journal = journal
+
+    @property
+    def journal(self):
+        return self._journal
+
     def subscribe(self, event_type: str, callback: Subscriber) -> None:
         """Subscribe to a specific event type."""
         self._subscribers.setdefault(event_type, []).append(callback)
@@ -57,15 +74,27 @@ class EventBus:
         self._global_subscribers.append(callback)
 
     async def publish(self, event: Event) -> None:
-        """Publish an event to all matching subscribers."""
+        """Publish an event to all matching subscribers.
+
+        Subscribers run concurrently, so one slow subscriber (e.g. a
+        Telegram bridge waiting on HTTP) does not hold up the others.
+        """
+        if self._journal is not None:
+            self._journal.record(event)
+
         callbacks = list(self._global_subscribers)
         callbacks.extend(self._subscribers.get(event.type, []))
+        if not callbacks:
+            return
 
-        for cb in callbacks:
-            try:
-                await cb(event)
-            except Exception as exc:
-                logger.error("Event subscriber error for %s: %s", event.type, exc)
+        await asyncio.gather(*(self._deliver(cb, event) for cb in callbacks))
+
+    @staticmethod
+    async def _deliver(callback: Subscriber, event: Event) -> None:
+        try:
+            await callback(event)
+        except Exception as exc:
+            logger.error("Event subscriber error for %s: %s", event.type, exc)
 
     def publish_sync(self, event: Event) -> None:
         """Publish from a synchronous context (thread-safe).
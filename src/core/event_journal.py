@@ -0,0 +1,226 @@
+"""
+Event Journal — bounded, sequence-numbered history of EventBus events.
+
+The EventBus itself is fire-and-forget. When a journal is attached, every
+published event is stamped with a monotonically increasing ``seq`` and
+kept in an in-memory ring buffer, so a War Room client that reconnects
+(or a freshly opened tab) can ask for everything after the last seq it
+saw and rebuild in-flight state from the catch-up batch.
+
+Events evicted from the ring can optionally spill to an on-disk segment
+(compact JSON lines). The segment rotates once at ``spill_max_bytes``, so
+disk use stays bounded at roughly twice that. Spill writes run on a
+background thread; ``record`` never touches the disk.
+
+Sequence numbers restart with the process; ``epoch`` identifies one run
+so clients can tell that their last seq belongs to an earlier one.
+
+Environment variables:
+    LANCELOT_EVENT_JOURNAL_SIZE     — events kept in memory (default: 2000, 0 disables)
+    LANCELOT_EVENT_JOURNAL_SPILL    — spill evicted events to disk (default: false)
+    LANCELOT_EVENT_JOURNAL_SPILL_MB — segment size before rotation (default: 8)
+"""
+
+import json
+import logging
+import os
+import threading
+import uuid
+from collections import deque
+from pathlib import Path
+from typing import Deque, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_SIZE = 2000
+_DEFAULT_SPILL_MB = 8
+
+# Evicted events are written to the segment in batches of this many
+_SPILL_BATCH = 64
+
+
+class EventJournal:
+    """Ring buffer of serialized events keyed by sequence number.
+
+    ``record`` runs on the event loop (from EventBus.publish) and only
+    hands evicted events to the spill writer thread; ``since`` and
+    ``read_spill`` may be called from any thread.
+    """
+
+    def __init__(self, capacity: int = _DEFAULT_SIZE,
+                 spill_path: Optional[str] = None,
+                 spill_max_bytes: int = _DEFAULT_SPILL_MB * 1024 * 1024) -> None:
+        self.capacity = capacity
+        self.epoch = uuid.uuid4().hex[:12]
+        self._events: Deque[dict] = deque(maxlen=capacity)
+        self._seq = 0
+        self._lock = threading.Lock()
+        # Sequence number of the oldest event still retrievable (memory or disk)
+        self._first_seq = 1
+
+        self._spill_path = Path(spill_path) if spill_path else None
+        self._spill_max_bytes = spill_max_bytes
+        self._spill_pending: List[dict] = []
+        self._spill_lock = threading.Lock()  # serializes segment writes and reads
+        self._spill_ready = threading.Condition(self._lock)
+        self._closed = False
+        self._writer: Optional[threading.Thread] = None
+        if self._spill_path:
+            self._spill_path.parent.mkdir(parents=True, exist_ok=True)
+            # Segments from a previous run use another epoch's seq numbers
+            for path in (self._spill_path, self._rotated_path):
+                path.unlink(missing_ok=True)
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="event-journal-spill", daemon=True,
+            )
+            self._writer.start()
+
+    @classmethod
+    def from_env(cls, data_dir: str) -> Optional["EventJournal"]:
+        """Build a journal from LANCELOT_EVENT_JOURNAL_* settings (None if disabled)."""
+        capacity = int(os.getenv("LANCELOT_EVENT_JOURNAL_SIZE", str(_DEFAULT_SIZE)))
+        if capacity <= 0:
+            return None
+        spill = os.getenv("LANCELOT_EVENT_JOURNAL_SPILL", "false").lower() in ("true", "1", "yes")
+        spill_mb = float(os.getenv("LANCELOT_EVENT_JOURNAL_SPILL_MB", str(_DEFAULT_SPILL_MB)))
+        spill_path = os.path.join(data_dir, "event_journal", "events.jsonl") if spill else None
+        return cls(capacity=capacity, spill_path=spill_path,
+                   spill_max_bytes=int(spill_mb * 1024 * 1024))
+
+    @property
+    def last_seq(self) -> int:
+        return self._seq
+
+    @property
+    def _rotated_path(self) -> Path:
+        return self._spill_path.with_suffix(self._spill_path.suffix + ".1")
+
+    # ── Recording ────────────────────────────────────────────────
+
+    def record(self, event) -> int:
+        """Stamp ``event.seq`` and retain its serialized form. Returns the seq."""
+        with self._lock:
+            self._seq += 1
+            event.seq = self._seq
+            if len(self._events) == self.capacity:
+                evicted = self._events[0]
+                if self._spill_path:
+                    self._spill_pending.append(evicted)
+                else:
+                    self._first_seq = evicted["seq"] + 1
+            self._events.append(event.to_dict())
+            if len(self._spill_pending) >= _SPILL_BATCH:
+                self._spill_ready.notify()
+        return event.seq
+
+    # ── Replay ───────────────────────────────────────────────────
+
+    def since(self, seq: int, upto: Optional[int] = None) -> Tuple[List[dict], bool]:
+        """In-memory events with ``seq < event.seq <= upto``.
+
+        Returns ``(events, complete)``; ``complete`` is False when older
+        events the caller asked for have left memory (they may still be
+        on disk, see ``read_spill``).
+        """
+        upto = self._seq if upto is None else upto
+        with self._lock:
+            events = [e for e in self._events if seq < e["seq"] <= upto]
+            oldest = self._events[0]["seq"] if self._events else self._seq + 1
+        return events, seq + 1 >= oldest
+
+    def read_spill(self, seq: int, before: int) -> Tuple[List[dict], bool]:
+        """Spilled events with ``seq < event.seq < before``, read from disk.
+
+        Blocking file IO — call from a worker thread. ``complete`` is False
+        when the segments no longer reach back to ``seq``.
+        """
+        if not self._spill_path:
+            return [], seq + 1 >= self._first_seq
+        self.flush()
+        events: List[dict] = []
+        with self._spill_lock:
+            for path in (self._rotated_path, self._spill_path):
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        for line in f:
+                            try:
+                                event = json.loads(line)
+                            except json.JSONDecodeError:
+                                continue
+                            if seq < event.get("seq", 0) < before:
+                                events.append(event)
+                except FileNotFoundError:
+                    continue
+            first_seq = self._first_seq
+        return events, seq + 1 >= first_seq
+
+    # ── Spill segment ────────────────────────────────────────────
+
+    def _writer_loop(self) -> None:
+        while True:
+            with self._lock:
+                while len(self._spill_pending) < _SPILL_BATCH and not self._closed:
+                    self._spill_ready.wait()
+                closed = self._closed
+            self.flush()
+            if closed:
+                return
+
+    def close(self) -> None:
+        """Write out pending evicted events and stop the spill writer."""
+        with self._lock:
+            self._closed = True
+            self._spill_ready.notify()
+        if self._writer is not None:
+            self._writer.join(timeout=5.0)
+        self.flush()
+
+    def flush(self) -> None:
+        """Append pending evicted events to the segment, rotating when full.
+
+        Blocking file IO — runs on the spill writer thread, or on a worker
+        thread via ``read_spill``.
+        """
+        if not self._spill_path:
+            return
+        with self._spill_lock:
+            # Drained under the spill lock so batches land in seq order
+            with self._lock:
+                pending, self._spill_pending = self._spill_pending, []
+            if not pending:
+                return
+            data = "".join(json.dumps(e, separators=(",", ":")) + "\n" for e in pending)
+            try:
+                size = self._spill_path.stat().st_size if self._spill_path.exists() else 0
+                if size and size + len(data) > self._spill_max_bytes:
+                    rotated = self._rotated_path
+                    if rotated.exists():
+                        # The oldest retrievable event is now the first one
+                        # left in the segment that is about to be rotated
+                        self._first_seq = self._first_seq_in(self._spill_path)
+                    os.replace(self._spill_path, rotated)
+                with open(self._spill_path, "a", encoding="utf-8") as f:
+                    f.write(data)
+            except OSError as exc:
+                logger.warning("Event journal spill failed: %s", exc)
+                self._first_seq = pending[-1]["seq"] + 1
+
+    @staticmethod
+    def _first_seq_in(path: Path) -> int:
+        with open(path, "r", encoding="utf-8") as f:
+            first = f.readline()
+        try:
+            return json.loads(first)["seq"]
+        except (json.JSONDecodeError, KeyError):
+            return 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            retained = len(self._events)
+        return {
+            "epoch": self.epoch,
+            "last_seq": self._seq,
+            "retained": retained,
+            "capacity": self.capacity,
+            "spill": bool(self._spill_path),
+        }
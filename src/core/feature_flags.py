@@ -184,6 +184,7 @@ FEATURE_GOOGLE_OAUTH: bool = _env_bool("FEATURE_GOOGLE_OAUTH", default=False)  #
 # Tool Flow Streaming + ActionCards (V31) — real-time progress + interactive buttons
 FEATURE_TOOL_FLOW_STREAMING: bool = _env_bool("FEATURE_TOOL_FLOW_STREAMING", default=False)  # Real-time tool execution progress events via EventBus
 FEATURE_ACTION_CARDS: bool = _env_bool("FEATURE_ACTION_CARDS", default=False)  # Channel-agnostic interactive buttons for approvals and actions
+FEATURE_RESPONSE_STREAMING: bool = _env_bool("FEATURE_RESPONSE_STREAMING", default=False)  # Stream LLM text deltas to War Room and Telegram as they are generated
 
 # HIVE Agent Mesh — ephemeral sub-agent architecture
 FEATURE_HIVE: bool = _env_bool("FEATURE_HIVE", default=False)  # Master switch for HIVE Agent Mesh subsystem
@@ -254,7 +255,7 @@ def reload_flags() -> None:
     global FEATURE_GITHUB_SEARCH, FEATURE_COMPETITIVE_SCAN
     global FEATURE_DEEP_REASONING_LOOP
     global FEATURE_GOOGLE_OAUTH
-    global FEATURE_TOOL_FLOW_STREAMING, FEATURE_ACTION_CARDS
+    global FEATURE_TOOL_FLOW_STREAMING, FEATURE_ACTION_CARDS, FEATURE_RESPONSE_STREAMING
     global FEATURE_HIVE, FEATURE_HIVE_UAB
     global FEATURE_VAULT_SECRETS
 
@@ -324,6 +325,7 @@ def reload_flags() -> None:
     # Tool Flow Streaming + ActionCards (V31)
     FEATURE_TOOL_FLOW_STREAMING = _env_bool("FEATURE_TOOL_FLOW_STREAMING", default=False)
     FEATURE_ACTION_CARDS = _env_bool("FEATURE_ACTION_CARDS", default=False)
+    FEATURE_RESPONSE_STREAMING = _env_bool("FEATURE_RESPONSE_STREAMING", default=False)
 
     # HIVE Agent Mesh
     FEATURE_HIVE = _env_bool("FEATURE_HIVE", default=False)
@@ -406,8 +408,8 @@ def log_feature_flags() -> None:
         FEATURE_GOOGLE_OAUTH,
     )
     logger.info(
-        "Tool Flow + ActionCards flags: TOOL_FLOW_STREAMING=%s, ACTION_CARDS=%s",
-        FEATURE_TOOL_FLOW_STREAMING, FEATURE_ACTION_CARDS,
+        "Tool Flow + ActionCards flags: TOOL_FLOW_STREAMING=%s, ACTION_CARDS=%s, RESPONSE_STREAMING=%s",
+        FEATURE_TOOL_FLOW_STREAMING, FEATURE_ACTION_CARDS, FEATURE_RESPONSE_STREAMING,
     )
     logger.info(
         "HIVE Agent Mesh flags: HIVE=%s, HIVE_UAB=%s",
@@ -20,6 +20,7 @@ from post_dispatcher import PostDispatcher
 from chat_poller import ChatPoller
 from telegram_bot import TelegramBot
 from crusader import CrusaderMode, CrusaderAdapter
+from chat_engine import ChatExecutionEngine, ChatEngineError
 import threading
 import hmac
 import time
@@ -230,6 +231,10 @@ def make_request_id() -> str:
 # S11: Rate limiter instance
 rate_limiter = RateLimiter()
 
+# Chat turns run on a bounded, per-session ordered worker pool so a long
+# agentic turn never blocks the event loop (other routes, War Room WS, probes).
+chat_engine = ChatExecutionEngine.from_env()
+
 # [NEW] Initialize Production Modules
 main_orchestrator = LancelotOrchestrator(data_dir="/home/lancelot/data")
 onboarding_orch = OnboardingOrchestrator(data_dir="/home/lancelot/data")
@@ -309,16 +314,13 @@ def _shutdown_memory(objects):
     logger.info("Memory vNext shut down.")
 
 
-def _init_soul():
-    """Initialize Soul subsystem."""
-    from soul.store import load_active_soul, SoulStoreError
-    from soul.api import router as soul_router
+def _load_soul_with_overlays():
+    """Load the active soul and apply composable overlays (BAL)."""
+    from soul.store import load_active_soul
 
     active_soul = load_active_soul()
     if active_soul is None:
-        logger.warning("No active soul found — Soul subsystem starting without a soul document")
-        main_orchestrator.soul = None
-        return {"soul": None}
+        return None
 
     # Apply composable soul overlays if BAL is enabled
     try:
@@ -331,8 +333,36 @@ def _init_soul():
                 logger.info("Soul overlays applied: %s", [o.overlay_name for o in overlays])
     except Exception as exc:
         logger.warning("Soul overlay loading failed: %s — using base soul", exc)
+    return active_soul
+
 
+def _on_soul_version_changed(version: str):
+    """Soul amendment activated — reload the soul and drop cached prompts."""
+    try:
+        reloaded = _load_soul_with_overlays()
+        if reloaded is not None:
+            main_orchestrator.soul = reloaded
+            logger.info("Soul reloaded after activation: version=%s", reloaded.version)
+    except Exception as exc:
+        logger.warning("Soul reload after activation of %s failed: %s", version, exc)
+    main_orchestrator.invalidate_prompt_cache()
+
+
+def _init_soul():
+    """Initialize Soul subsystem."""
+    from soul.api import router as soul_router
+    # soul.api imports the store as src.core.soul.store — hook that module instance
+    from src.core.soul.store import add_change_listener as _add_soul_listener
+
+    active_soul = _load_soul_with_overlays()
+    if active_soul is None:
+        logger.warning("No active soul found — Soul subsystem starting without a soul document")
+        main_orchestrator.soul = None
+        return {"soul": None}
+
+    _add_soul_listener(_on_soul_version_changed)
     main_orchestrator.soul = active_soul
+    main_orchestrator.invalidate_prompt_cache()
     logger.info("Soul loaded: version=%s", active_soul.version)
     return {"soul": active_soul}
 
@@ -368,6 +398,11 @@ def _init_skills():
     main_orchestrator.skill_registry = skill_registry
     if main_orchestrator.task_runner:
         main_orchestrator.task_runner.skill_executor = executor
+    # Installed/enabled skills feed the tool declarations — drop cached copies
+    skill_registry.add_change_listener(
+        lambda event, name: main_orchestrator.invalidate_prompt_cache()
+    )
+    main_orchestrator.invalidate_prompt_cache()
     logger.info("Skills initialized: %d skills (factory enabled)", len(skill_registry.list_skills()))
     return {"registry": skill_registry, "executor": executor, "factory": skill_factory}
 
@@ -377,6 +412,7 @@ def _shutdown_skills(objects):
     main_orchestrator.skill_executor = None
     if main_orchestrator.task_runner:
         main_orchestrator.task_runner.skill_executor = None
+    main_orchestrator.invalidate_prompt_cache()
     logger.info("Skills shut down.")
 
 
@@ -399,9 +435,13 @@ def _init_scheduler():
     skill_executor = main_orchestrator.skill_executor
     if skill_executor:
         from scheduler.executor import JobExecutor
+        soul = getattr(main_orchestrator, "soul", None)
         job_exec = JobExecutor(
             scheduler_service=service,
             skill_execute_fn=lambda name, inputs: skill_executor.run(name, inputs),
+            max_concurrent_jobs=(
+                soul.scheduling_boundaries.max_concurrent_jobs if soul else 5
+            ),
         )
         main_orchestrator.job_executor = job_exec
         job_exec.start_tick_loop()
@@ -801,6 +841,14 @@ async def startup_event():
     except Exception:
         pass
 
+    # Event journal — lets War Room clients resume after a reconnect
+    try:
+        from event_bus import event_bus as _eb
+        from event_journal import EventJournal
+        _eb.set_journal(EventJournal.from_env(os.environ.get("LANCELOT_DATA_DIR", "lancelot_data")))
+    except Exception as e:
+        logger.warning(f"Event journal initialization failed: {e}")
+
     # F8: Validate environment on startup
     _provider = os.getenv("LANCELOT_PROVIDER", "gemini")
     _key_vars = {"gemini": "GEMINI_API_KEY", "openai": "OPENAI_API_KEY", "anthropic": "ANTHROPIC_API_KEY", "xai": "XAI_API_KEY"}
@@ -1065,6 +1113,13 @@ async def startup_event():
         else:
             logger.info("ToolFlow streaming disabled by feature flag")
 
+        # Response streaming — LLM text deltas to War Room / Telegram
+        from feature_flags import FEATURE_RESPONSE_STREAMING
+        if FEATURE_RESPONSE_STREAMING:
+            from toolflow.response_stream import ResponseStreamEmitter
+            main_orchestrator.response_streamer = ResponseStreamEmitter(event_bus=_event_bus, enabled=True)
+            logger.info("Response streaming enabled — emitter injected into orchestrator")
+
         # ActionCards — store, factory, resolver, API
         if FEATURE_ACTION_CARDS:
             from actioncard.store import ActionCardStore
@@ -1387,6 +1442,14 @@ async def startup_event():
             _tg_event_bus.subscribe_all(_tg_bridge.on_toolflow_event)
             logger.info("Telegram ToolFlow progress bridge enabled")
 
+        # Wire streamed response text to a live Telegram preview
+        from feature_flags import FEATURE_RESPONSE_STREAMING
+        if FEATURE_RESPONSE_STREAMING and telegram_bot:
+            from toolflow.telegram_stream import TelegramStreamBridge
+            _tg_stream_bridge = TelegramStreamBridge(telegram_bot)
+            _tg_event_bus.subscribe_all(_tg_stream_bridge.on_stream_event)
+            logger.info("Telegram response stream bridge enabled")
+
         # Wire ActionCard events to Telegram
         if FEATURE_ACTION_CARDS and telegram_bot:
             _tg_event_bus.subscribe("actioncard_presented", telegram_bot._on_actioncard_event)
@@ -1456,6 +1519,12 @@ async def shutdown_event():
             telegram_bot.stop_polling()
         if chat_poller:
             chat_poller.stop_polling()
+        chat_engine.shutdown(wait=False)
+        # Flush write-behind receipts to disk
+        try:
+            main_orchestrator.receipt_service.close()
+        except Exception:
+            pass
         # Flush usage persistence to disk
         try:
             if hasattr(main_orchestrator, 'usage_tracker') and main_orchestrator.usage_tracker:
@@ -1464,6 +1533,29 @@ async def shutdown_event():
                     persistence.flush()
         except Exception:
             pass
+        # Checkpoint in-memory governor counters
+        try:
+            main_orchestrator.governor.close()
+        except Exception:
+            pass
+        # Remove warm skill sandbox containers
+        try:
+            from skills.executor import close_shared_pool
+            close_shared_pool()
+        except Exception:
+            pass
+        # Write out evicted events still queued for the journal spill segment
+        try:
+            if _event_bus_singleton.journal:
+                _event_bus_singleton.journal.close()
+        except Exception:
+            pass
+        # Close pooled keep-alive connections to internal services
+        try:
+            from src.core import http_transport
+            http_transport.close()
+        except Exception:
+            pass
         # V28: Stop OAuth background refresh
         try:
             from oauth_token_manager import get_oauth_manager
@@ -1508,6 +1600,81 @@ async def chat_history(request: Request, limit: int = 50):
     return {"messages": messages, "total": len(history)}
 
 
+def _chat_session_key(data: dict, user: str) -> str:
+    """Ordering key for the chat engine: explicit session id, else the user."""
+    return str(data.get("session_id") or user or "default")
+
+
+def _chat_backpressure_response(exc: ChatEngineError, request_id: str) -> JSONResponse:
+    """Map chat engine admission errors to 429/503 with a Retry-After hint."""
+    if exc.status_code == 429:
+        resp = error_response(429, "Too many queued messages for this session.",
+                              detail=str(exc), request_id=request_id)
+    else:
+        resp = error_response(503, "Chat engine is busy. Try again shortly.",
+                              detail=str(exc), request_id=request_id)
+    resp.headers["Retry-After"] = "5"
+    return resp
+
+
+def _route_chat_message(message: str, user: str, channel: str, attachments=None) -> str:
+    """Blocking chat routing: onboarding → Crusader intercept → orchestrator.
+
+    Runs on a chat engine worker thread, never on the event loop. The whole
+    turn holds the orchestrator's turn lock: orchestrator and onboarding
+    state are shared, so turns from different sessions must not interleave.
+    """
+    with main_orchestrator.turn_lock:
+        return _route_chat_message_locked(message, user, channel, attachments)
+
+
+def _route_chat_message_locked(message: str, user: str, channel: str, attachments=None) -> str:
+    # Check Onboarding State
+    onboarding_orch.state = onboarding_orch._determine_state()
+
+    if onboarding_orch.state != "READY":
+        return onboarding_orch.process(user, message)
+
+    # --- CRUSADER MODE INTERCEPT ---
+    is_trigger, action = crusader_mode.should_intercept(message)
+
+    if is_trigger:
+        if action == "activate":
+            response_text = crusader_mode.activate()
+            main_orchestrator.audit_logger.log_event(
+                "CRUSADER_MODE_ACTIVATED",
+                "User activated Crusader Mode",
+                user
+            )
+        else:
+            response_text = crusader_mode.deactivate()
+            main_orchestrator.audit_logger.log_event(
+                "CRUSADER_MODE_DEACTIVATED",
+                "User deactivated Crusader Mode",
+                user
+            )
+        return response_text
+
+    if crusader_mode.is_active:
+        if crusader_adapter.check_auto_pause(message):
+            main_orchestrator.audit_logger.log_event(
+                "CRUSADER_AUTO_PAUSE",
+                f"Blocked: {message}",
+                user
+            )
+            return (
+                "Authority required.\n"
+                "This operation is restricted even in Crusader Mode."
+            )
+        response_text = main_orchestrator.chat(
+            message, crusader_mode=True, attachments=attachments, channel=channel
+        )
+        return crusader_adapter.format_response(response_text)
+
+    # Standard mode
+    return main_orchestrator.chat(message, attachments=attachments, channel=channel)
+
+
 @app.post("/chat")
 async def chat_webhook(request: Request):
     """
@@ -1539,57 +1706,19 @@ async def chat_webhook(request: Request):
 
         logger.info(f"[{request_id}] Message from {user}: {message[:50]}...")
 
-        # Check Onboarding State
-        onboarding_orch.state = onboarding_orch._determine_state()
-
-        if onboarding_orch.state != "READY":
-            response_text = onboarding_orch.process(user, message)
-        else:
-            # --- CRUSADER MODE INTERCEPT ---
-            is_trigger, action = crusader_mode.should_intercept(message)
-
-            if is_trigger:
-                if action == "activate":
-                    response_text = crusader_mode.activate()
-                    main_orchestrator.audit_logger.log_event(
-                        "CRUSADER_MODE_ACTIVATED",
-                        "User activated Crusader Mode",
-                        user
-                    )
-                else:
-                    response_text = crusader_mode.deactivate()
-                    main_orchestrator.audit_logger.log_event(
-                        "CRUSADER_MODE_DEACTIVATED",
-                        "User deactivated Crusader Mode",
-                        user
-                    )
-            elif crusader_mode.is_active:
-                if crusader_adapter.check_auto_pause(message):
-                    response_text = (
-                        "Authority required.\n"
-                        "This operation is restricted even in Crusader Mode."
-                    )
-                    main_orchestrator.audit_logger.log_event(
-                        "CRUSADER_AUTO_PAUSE",
-                        f"Blocked: {message}",
-                        user
-                    )
-                else:
-                    response_text = main_orchestrator.chat(
-                        message, crusader_mode=True, channel=req_channel
-                    )
-                    response_text = crusader_adapter.format_response(
-                        response_text
-                    )
-            else:
-                # Standard mode
-                response_text = main_orchestrator.chat(message, channel=req_channel)
+        response_text = await chat_engine.run(
+            _chat_session_key(data, user), _route_chat_message,
+            message, user, req_channel,
+        )
 
         return {
             "response": response_text,
             "crusader_mode": crusader_mode.is_active,
             "request_id": request_id,
         }
+    except ChatEngineError as e:
+        logger.warning(f"[{request_id}] Chat rejected: {e}")
+        return _chat_backpressure_response(e, request_id)
     except Exception as e:
         logger.error(f"[{request_id}] Chat error: {e}")
         return error_response(500, "Internal server error", request_id=request_id)
@@ -1602,6 +1731,7 @@ async def chat_with_files(
     user: str = Form("Commander"),
     files: list[UploadFile] = File(default=[]),
     save_to_workspace: bool = Form(default=False),
+    session_id: str = Form(""),
 ):
     """
     Chat endpoint with file/image upload support.
@@ -1644,25 +1774,11 @@ async def chat_with_files(
 
         logger.info(f"[{request_id}] Upload from {user}: text={text[:50]}... files={len(attachments)}")
 
-        # Route through onboarding/crusader/orchestrator
-        onboarding_orch.state = onboarding_orch._determine_state()
-        if onboarding_orch.state != "READY":
-            response_text = onboarding_orch.process(user, text)
-        else:
-            is_trigger, action = crusader_mode.should_intercept(text)
-            if is_trigger:
-                if action == "activate":
-                    response_text = crusader_mode.activate()
-                else:
-                    response_text = crusader_mode.deactivate()
-            elif crusader_mode.is_active:
-                if crusader_adapter.check_auto_pause(text):
-                    response_text = "Authority required.\nThis operation is restricted even in Crusader Mode."
-                else:
-                    response_text = main_orchestrator.chat(text, crusader_mode=True, attachments=attachments, channel="warroom")
-                    response_text = crusader_adapter.format_response(response_text)
-            else:
-                response_text = main_orchestrator.chat(text, attachments=attachments, channel="warroom")
+        # Route through onboarding/crusader/orchestrator on the chat engine
+        response_text = await chat_engine.run(
+            _chat_session_key({"session_id": session_id}, user), _route_chat_message,
+            text, user, "warroom", attachments,
+        )
 
         return {
             "response": response_text,
@@ -1670,6 +1786,9 @@ async def chat_with_files(
             "request_id": request_id,
             "files_received": len(attachments),
         }
+    except ChatEngineError as e:
+        logger.warning(f"[{request_id}] Upload chat rejected: {e}")
+        return _chat_backpressure_response(e, request_id)
     except Exception as e:
         logger.error(f"[{request_id}] Upload chat error: {e}")
         return error_response(500, "Internal server error", request_id=request_id)
@@ -1766,6 +1885,9 @@ def health_check():
             "error_count": _error_count,
             "total_requests": _total_requests,
             "error_rate": round(_error_count / max(_total_requests, 1) * 100, 2),
+            "chat_engine": chat_engine.stats(),
+            "warroom_ws": _warroom_connections.stats(),
+            "event_journal": _event_bus_singleton.journal.stats() if _event_bus_singleton.journal else None,
         }
     except Exception as exc:
         logger.error("Health check error: %s", exc)
@@ -1927,7 +2049,8 @@ async def forge_dispatch(request: Request):
 
 # --- War Room WebSocket ---
 
-from warroom_ws import warroom_websocket
+from warroom_ws import warroom_websocket, connection_manager as _warroom_connections
+from event_bus import event_bus as _event_bus_singleton
 
 
 @app.websocket("/ws/warroom")
@@ -4,12 +4,20 @@ Lancelot vNext4: Async Verification Queue
 Processes verification jobs for T1 actions in the background.
 Supports sync fallback when queue is full, drain for tier boundaries,
 and rollback wiring for verification failures.
+
+Once started, a thread pool (AsyncVerificationConfig.max_workers)
+verifies jobs concurrently while execution continues; drain() honors
+its timeout and reports jobs still pending as stragglers.
 """
 
 from __future__ import annotations
 
 import logging
+import threading
+import time
 import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Callable, Optional
@@ -55,6 +63,7 @@ class DrainResult:
     passed: int
     failed: int
     timed_out: bool
+    stragglers: list[str] = field(default_factory=list)  # job IDs still unverified
 
 
 class AsyncVerificationQueue:
@@ -63,6 +72,13 @@ class AsyncVerificationQueue:
     Runs verification asynchronously, one step behind execution.
     Supports sync fallback when queue is full, and drain before
     T2/T3 actions.
+
+    Until ``start()`` is called, jobs wait in the queue and are verified
+    serially by ``process_pending``/``drain`` on the caller's thread.
+    After ``start()``, a pool of ``max_workers`` threads verifies jobs as
+    soon as they are submitted and ``drain`` only waits for stragglers.
+    Either way, ``drain`` reports every result completed since the
+    previous drain, so failures found in the background are not missed.
     """
 
     def __init__(
@@ -80,10 +96,58 @@ class AsyncVerificationQueue:
         self._verify_fn = verify_fn
         self._config = config
         self._on_failure = on_failure
-        self._queue: list[VerificationJob] = []
+        self._queue: deque[VerificationJob] = deque()
         self._results: list[VerificationResult] = []
         self._max_depth = config.queue_max_depth if config else 10
         self._fallback_to_sync = config.fallback_to_sync_on_full if config else True
+        self._max_workers = config.max_workers if config else 2
+        self._drain_timeout = float(config.drain_timeout_seconds) if config else 30.0
+
+        self._lock = threading.Lock()
+        self._done = threading.Condition(self._lock)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        # job_id -> job, for jobs handed to the pool and not yet verified
+        self._in_flight: dict[str, VerificationJob] = {}
+        # Results completed since the last drain/process_pending
+        self._unreported: list[VerificationResult] = []
+        self._submit_times: dict[str, float] = {}  # job_id -> monotonic submit time
+
+        # Metrics
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._sync_fallbacks = 0
+        self._stragglers = 0
+        self._lag_total_s = 0.0
+        self._lag_max_s = 0.0
+        self._verify_total_s = 0.0
+
+    # ── Worker pool ──────────────────────────────────────────────
+
+    def start(self) -> None:
+        """Start background workers; queued jobs are handed to them."""
+        with self._lock:
+            if self._pool is not None:
+                return
+            self._pool = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="async-verify",
+            )
+            queued = list(self._queue)
+            self._queue.clear()
+        for job in queued:
+            self._dispatch(job)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop background workers. Jobs not yet started are dropped."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+    @property
+    def running(self) -> bool:
+        return self._pool is not None
 
     def submit(self, job: VerificationJob) -> str:
         """Submit a verification job.
@@ -93,49 +157,129 @@ class AsyncVerificationQueue:
         Returns:
             The job_id.
         """
-        if len(self._queue) >= self._max_depth:
+        if self.depth >= self._max_depth:
             if self._fallback_to_sync:
                 result = self._verify_sync(job)
-                self._results.append(result)
+                with self._lock:
+                    self._sync_fallbacks += 1
+                    self._results.append(result)
                 if not result.passed and self._on_failure:
                     self._on_failure(job, result)
                 return job.job_id
             else:
                 raise RuntimeError(f"Verification queue full ({self._max_depth})")
 
-        self._queue.append(job)
+        with self._lock:
+            self._submitted += 1
+            self._submit_times[job.job_id] = time.monotonic()
+            if self._pool is None:
+                self._queue.append(job)
+                return job.job_id
+        self._dispatch(job)
         return job.job_id
 
+    def _dispatch(self, job: VerificationJob) -> None:
+        with self._lock:
+            self._in_flight[job.job_id] = job
+            pool = self._pool
+        try:
+            pool.submit(self._run_job, job)
+        except (RuntimeError, AttributeError):
+            # Pool shut down meanwhile — fall back to verifying inline
+            self._run_job(job)
+
+    def _run_job(self, job: VerificationJob) -> VerificationResult:
+        """Verify one job and record the outcome (worker or caller thread)."""
+        started = time.monotonic()
+        result = self._verify_sync(job)
+        finished = time.monotonic()
+        with self._lock:
+            self._in_flight.pop(job.job_id, None)
+            self._results.append(result)
+            self._unreported.append(result)
+            self._completed += 1
+            if not result.passed:
+                self._failed += 1
+            lag = finished - self._submit_times.pop(job.job_id, started)
+            self._lag_total_s += lag
+            self._lag_max_s = max(self._lag_max_s, lag)
+            self._verify_total_s += finished - started
+            self._done.notify_all()
+        if not result.passed and self._on_failure:
+            try:
+                self._on_failure(job, result)
+            except Exception as exc:
+                logger.error("on_failure callback error for job %s: %s", job.job_id, exc)
+        return result
+
+    # ── Draining ─────────────────────────────────────────────────
+
     def process_pending(self) -> list[VerificationResult]:
         """Process all pending jobs in the queue.
 
         Returns list of VerificationResults.
         """
-        results = []
-        while self._queue:
-            job = self._queue.pop(0)
-            result = self._verify_sync(job)
-            results.append(result)
-            self._results.append(result)
-            if not result.passed and self._on_failure:
-                self._on_failure(job, result)
-        return results
+        self._wait_for_pending(deadline=None)
+        return self._take_unreported()
 
-    def drain(self, timeout_seconds: float = 30.0) -> DrainResult:
+    def drain(self, timeout_seconds: Optional[float] = None) -> DrainResult:
         """Process ALL pending jobs. Used before T2/T3 actions and at shutdown.
 
+        Waits at most ``timeout_seconds`` (default: the configured
+        drain_timeout_seconds). Jobs still unverified at the deadline are
+        reported as stragglers and ``timed_out`` is set; they stay queued
+        or in flight and are reported by a later drain.
+
         Returns DrainResult summarizing outcomes.
         """
-        results = self.process_pending()
+        if timeout_seconds is None:
+            timeout_seconds = self._drain_timeout
+        stragglers = self._wait_for_pending(deadline=time.monotonic() + timeout_seconds)
+        if stragglers:
+            with self._lock:
+                self._stragglers += len(stragglers)
+            logger.warning(
+                "Async verification drain timed out after %.1fs with %d job(s) pending",
+                timeout_seconds, len(stragglers),
+            )
+        results = self._take_unreported()
         passed = sum(1 for r in results if r.passed)
         failed = sum(1 for r in results if not r.passed)
         return DrainResult(
             drained_count=len(results),
             passed=passed,
             failed=failed,
-            timed_out=False,
+            timed_out=bool(stragglers),
+            stragglers=stragglers,
         )
 
+    def _wait_for_pending(self, deadline: Optional[float]) -> list[str]:
+        """Verify (or wait for) jobs pending now. Returns IDs still unverified."""
+        if self._pool is None:
+            # Serial mode: verify on this thread until done or out of time
+            while True:
+                with self._lock:
+                    if not self._queue:
+                        return []
+                    if deadline is not None and time.monotonic() >= deadline:
+                        return [job.job_id for job in self._queue]
+                    job = self._queue.popleft()
+                self._run_job(job)
+
+        with self._lock:
+            waiting = set(self._in_flight)
+            while waiting & self._in_flight.keys():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._done.wait(remaining)
+            return [job_id for job_id in self._in_flight if job_id in waiting]
+
+    def _take_unreported(self) -> list[VerificationResult]:
+        with self._lock:
+            results, self._unreported = self._unreported, []
+        return results
+
     def _verify_sync(self, job: VerificationJob) -> VerificationResult:
         """Run verification synchronously for a single job."""
         try:
@@ -171,27 +315,50 @@ class AsyncVerificationQueue:
 
     @property
     def depth(self) -> int:
-        """Current queue depth."""
-        return len(self._queue)
+        """Current queue depth (queued plus being verified)."""
+        with self._lock:
+            return len(self._queue) + len(self._in_flight)
 
     @property
     def pending_jobs(self) -> list[str]:
-        """Job IDs currently in the queue."""
-        return [job.job_id for job in self._queue]
+        """Job IDs not yet verified."""
+        with self._lock:
+            return [job.job_id for job in self._queue] + list(self._in_flight)
 
     @property
     def results(self) -> list[VerificationResult]:
         """All verification results (completed)."""
-        return list(self._results)
+        with self._lock:
+            return list(self._results)
 
     def get_failed_results(self) -> list[VerificationResult]:
         """Get only failed verification results."""
-        return [r for r in self._results if not r.passed]
+        return [r for r in self.results if not r.passed]
 
     def has_failures(self) -> bool:
         """Check if any verification has failed."""
-        return any(not r.passed for r in self._results)
+        return any(not r.passed for r in self.results)
 
     def clear_results(self) -> None:
         """Clear completed results."""
-        self._results.clear()
+        with self._lock:
+            self._results.clear()
+
+    def stats(self) -> dict:
+        """Queue depth, throughput and latency metrics."""
+        with self._lock:
+            completed = self._completed
+            return {
+                "running": self._pool is not None,
+                "workers": self._max_workers if self._pool is not None else 0,
+                "depth": len(self._queue) + len(self._in_flight),
+                "in_flight": len(self._in_flight),
+                "submitted": self._submitted,
+                "completed": completed,
+                "failed": self._failed,
+                "sync_fallbacks": self._sync_fallbacks,
+                "drain_stragglers": self._stragglers,
+                "avg_latency_ms": round(self._lag_total_s / completed * 1000, 1) if completed else 0.0,
+                "max_latency_ms": round(self._lag_max_s * 1000, 1),
+                "avg_verify_ms": round(self._verify_total_s / completed * 1000, 1) if completed else 0.0,
+            }
@@ -0,0 +1,507 @@
+"""
+HTTP Transport — shared keep-alive connection pools for internal callers
+========================================================================
+
+``urllib.request.urlopen`` opens a new TCP connection for every request
+and sends ``Connection: close``. For chatty internal services (the
+local-llm server, the host agent, the UAB daemon) connection setup is a
+measurable share of every call. This module provides a drop-in
+``urlopen`` that keeps connections alive and reuses them.
+
+It plugs into urllib as an opener, so callers keep using ``Request``,
+``HTTPError`` and ``URLError``, redirects and proxies behave as before,
+and existing error handling is unchanged.
+
+Per target (``scheme://host:port``):
+- Keep-alive pool: up to ``max_idle`` idle connections, each closed after
+  ``idle_timeout_s``. A connection goes back to the pool once its
+  response body has been read to the end; closing a response early
+  discards the connection.
+- Timeouts: ``connect_timeout_s`` bounds connection setup; the ``timeout``
+  passed to ``urlopen`` bounds each read.
+- Retry: a request that fails with a connection reset is retried up to
+  ``retries`` times, after a random delay of up to ``backoff_s * 2**n``
+  (at once when a reused connection had gone stale). Idempotent methods
+  are retried whenever the reset happens; other methods only when it
+  happens while the request is being sent. A reset while waiting for the
+  response is ambiguous (the server may already have acted), so it is
+  not retried for POST and friends.
+- Request queue: with ``max_connections`` set, at most that many requests
+  are in flight to the target, one per connection, and the rest wait in
+  FIFO order (up to ``queue_timeout_s``). This gives the throughput of
+  HTTP/1.1 pipelining without its head-of-line and replay hazards.
+- Metrics: request, retry and connection counters plus a latency
+  histogram (time to response headers), reported by ``stats()``.
+
+Public API:
+    urlopen(url_or_request, data=None, timeout=...)  — via the shared transport
+    configure(base_url, **settings)                  — per-target settings
+    stats(base_url=None)                             — per-target metrics
+    close(base_url=None)                             — close idle connections
+    HTTPTransport(**defaults)                        — a separate instance
+"""
+
+from __future__ import annotations
+
+import http.client
+import logging
+import os
+import random
+import select
+import socket
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import deque
+from dataclasses import dataclass, replace
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (ms) of the latency histogram buckets; the last is open-ended.
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+_RESET_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+)
+
+
+@dataclass(frozen=True)
+class TargetConfig:
+    """Connection settings for one target."""
+
+    connect_timeout_s: float = 5.0
+    max_idle: int = 4
+    idle_timeout_s: float = 50.0
+    retries: int = 2
+    backoff_s: float = 0.05
+    max_connections: Optional[int] = None
+    queue_timeout_s: float = 30.0
+    blocksize: int = 64 * 1024
+
+
+def _env_defaults() -> TargetConfig:
+    return TargetConfig(
+        connect_timeout_s=float(os.environ.get("HTTP_TRANSPORT_CONNECT_TIMEOUT_S", "5")),
+        max_idle=int(os.environ.get("HTTP_TRANSPORT_MAX_IDLE", "4")),
+        idle_timeout_s=float(os.environ.get("HTTP_TRANSPORT_IDLE_TIMEOUT_S", "50")),
+        retries=int(os.environ.get("HTTP_TRANSPORT_RETRIES", "2")),
+    )
+
+
+def target_key(url: str) -> str:
+    """``scheme://host:port`` for a URL or base URL."""
+    parts = urlsplit(url)
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+
+# =============================================================================
+# Pooled response
+# =============================================================================
+
+
+class _PooledResponse(http.client.HTTPResponse):
+    """HTTPResponse that returns its connection to the pool when the body is done."""
+
+    _on_release = None
+    _early_close = False
+
+    def close(self) -> None:
+        if self.fp is not None and (self.chunked or self.length != 0):
+            self._early_close = True
+        super().close()
+
+    def _close_conn(self) -> None:
+        had_fp = self.fp is not None
+        super()._close_conn()
+        release, self._on_release = self._on_release, None
+        if had_fp and release is not None:
+            release(reusable=not self.will_close and not self._early_close)
+
+
+# =============================================================================
+# Per-target pool
+# =============================================================================
+
+
+class _Histogram:
+    def __init__(self) -> None:
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        idx = 0
+        while idx < len(LATENCY_BUCKETS_MS) and ms > LATENCY_BUCKETS_MS[idx]:
+            idx += 1
+        self.buckets[idx] += 1
+        self.count += 1
+        self.total_ms += ms
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-quantile (None if open-ended)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for idx, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                return float(LATENCY_BUCKETS_MS[idx]) if idx < len(LATENCY_BUCKETS_MS) else None
+        return None
+
+    def snapshot(self) -> Dict[str, Any]:
+        labels = [f"le_{b}" for b in LATENCY_BUCKETS_MS] + ["inf"]
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 1) if self.count else 0.0,
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "buckets": dict(zip(labels, self.buckets)),
+        }
+
+
+class _TargetPool:
+    """Idle connections, in-flight slots and metrics for one target."""
+
+    def __init__(self, key: str, config: TargetConfig):
+        self.key = key
+        self.config = config
+        self.idle: List[Tuple[http.client.HTTPConnection, float]] = []
+        self.in_use = 0
+        self.waiters: Deque[object] = deque()
+        self.cond = threading.Condition()
+        self.latency = _Histogram()
+        self.counters = {
+            "requests": 0, "errors": 0, "retries": 0, "connections_opened": 0,
+            "reused": 0, "stale_dropped": 0, "queued": 0, "queue_timeouts": 0,
+        }
+        self.queue_wait_ms = 0.0
+
+    # ── Slots (request queue) ────────────────────────────────────
+
+    def acquire_slot(self) -> None:
+        with self.cond:
+            limit = self.config.max_connections
+            if limit is None or (not self.waiters and self.in_use < limit):
+                self.in_use += 1
+                return
+            token = object()
+            self.waiters.append(token)
+            self.counters["queued"] += 1
+            start = time.monotonic()
+            deadline = start + self.config.queue_timeout_s
+            try:
+                while self.waiters[0] is not token or self.in_use >= limit:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.counters["queue_timeouts"] += 1
+                        raise urllib.error.URLError(
+                            f"timed out waiting for a connection to {self.key}"
+                        )
+                    self.cond.wait(remaining)
+            finally:
+                self.waiters.remove(token)
+                self.cond.notify_all()
+            self.in_use += 1
+            self.queue_wait_ms += (time.monotonic() - start) * 1000
+
+    def release_slot(self) -> None:
+        with self.cond:
+            self.in_use -= 1
+            self.cond.notify_all()
+
+    # ── Connections ──────────────────────────────────────────────
+
+    def checkout(self) -> Optional[http.client.HTTPConnection]:
+        """Most recently used live idle connection, or None."""
+        now = time.monotonic()
+        with self.cond:
+            while self.idle:
+                conn, idle_since = self.idle.pop()
+                if now - idle_since > self.config.idle_timeout_s or _is_dropped(conn):
+                    self.counters["stale_dropped"] += 1
+                    conn.close()
+                    continue
+                return conn
+        return None
+
+    def checkin(self, conn: http.client.HTTPConnection) -> None:
+        with self.cond:
+            if conn.sock is not None and len(self.idle) < self.config.max_idle:
+                self.idle.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def evict_expired(self) -> None:
+        now = time.monotonic()
+        with self.cond:
+            keep = []
+            for conn, idle_since in self.idle:
+                if now - idle_since > self.config.idle_timeout_s:
+                    conn.close()
+                else:
+                    keep.append((conn, idle_since))
+            self.idle = keep
+
+    def close_idle(self) -> None:
+        with self.cond:
+            idle, self.idle = self.idle, []
+        for conn, _ in idle:
+            conn.close()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self.cond:
+            queued = self.counters["queued"]
+            return {
+                **self.counters,
+                "idle": len(self.idle),
+                "in_use": self.in_use,
+                "waiting": len(self.waiters),
+                "max_connections": self.config.max_connections,
+                "queue_wait_ms_avg": round(self.queue_wait_ms / queued, 1) if queued else 0.0,
+                "latency": self.latency.snapshot(),
+            }
+
+
+def _is_dropped(conn: http.client.HTTPConnection) -> bool:
+    """True if an idle connection was closed by the server (readable = EOF)."""
+    sock = conn.sock
+    if sock is None:
+        return True
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+# =============================================================================
+# urllib handlers
+# =============================================================================
+
+
+class _PooledHTTPHandler(urllib.request.HTTPHandler):
+    def __init__(self, transport: "HTTPTransport"):
+        super().__init__()
+        self._transport = transport
+
+    def http_open(self, req: urllib.request.Request) -> http.client.HTTPResponse:
+        return self._transport._open(req, http.client.HTTPConnection)
+
+
+class _PooledHTTPSHandler(urllib.request.HTTPSHandler):
+    def __init__(self, transport: "HTTPTransport"):
+        super().__init__()
+        self._transport = transport
+
+    def https_open(self, req: urllib.request.Request) -> http.client.HTTPResponse:
+        if req._tunnel_host:
+            # CONNECT tunnels through a proxy are not pooled.
+            return super().https_open(req)
+        return self._transport._open(req, http.client.HTTPSConnection, context=self._context)
+
+
+# =============================================================================
+# Transport
+# =============================================================================
+
+
+class HTTPTransport:
+    """Keep-alive connection pools, one per target, behind a urllib opener."""
+
+    def __init__(self, **defaults: Any):
+        self._defaults = replace(_env_defaults(), **defaults)
+        self._configs: Dict[str, TargetConfig] = {}
+        self._pools: Dict[str, _TargetPool] = {}
+        self._lock = threading.Lock()
+        self._opener = urllib.request.build_opener(
+            _PooledHTTPHandler(self), _PooledHTTPSHandler(self),
+        )
+        self._last_sweep = time.monotonic()
+
+    def configure(self, base_url: str, **settings: Any) -> TargetConfig:
+        """Override settings (see TargetConfig) for requests to ``base_url``."""
+        key = target_key(base_url)
+        with self._lock:
+            config = replace(self._configs.get(key, self._defaults), **settings)
+            self._configs[key] = config
+            pool = self._pools.get(key)
+            if pool is not None:
+                with pool.cond:
+                    pool.config = config
+                    pool.cond.notify_all()
+        return config
+
+    def urlopen(
+        self,
+        url: Any,
+        data: Optional[bytes] = None,
+        timeout: Any = socket._GLOBAL_DEFAULT_TIMEOUT,
+    ) -> http.client.HTTPResponse:
+        """Same contract as ``urllib.request.urlopen``, over pooled connections."""
+        return self._opener.open(url, data, timeout)
+
+    def stats(self, base_url: Optional[str] = None) -> Dict[str, Any]:
+        """Metrics per target, or for ``base_url``'s target only."""
+        with self._lock:
+            pools = dict(self._pools)
+        if base_url is not None:
+            pool = pools.get(target_key(base_url))
+            return pool.snapshot() if pool else {}
+        return {key: pool.snapshot() for key, pool in pools.items()}
+
+    def close(self, base_url: Optional[str] = None) -> None:
+        """Close idle connections (for every target, or ``base_url``'s)."""
+        with self._lock:
+            pools = list(self._pools.values())
+        for pool in pools:
+            if base_url is None or pool.key == target_key(base_url):
+                pool.close_idle()
+
+    # ── Internals ────────────────────────────────────────────────
+
+    def _pool(self, key: str) -> _TargetPool:
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = _TargetPool(key, self._configs.get(key, self._defaults))
+                self._pools[key] = pool
+            sweep = time.monotonic() - self._last_sweep > self._defaults.idle_timeout_s
+            if sweep:
+                self._last_sweep = time.monotonic()
+                others = [p for p in self._pools.values() if p is not pool]
+        if sweep:
+            for other in others:
+                other.evict_expired()
+        return pool
+
+    def _open(self, req: urllib.request.Request, conn_cls: type, **conn_args: Any) -> http.client.HTTPResponse:
+        if not req.host:
+            raise urllib.error.URLError("no host given")
+        pool = self._pool(f"{req.type}://{req.host.lower()}")
+        config = pool.config
+
+        headers = dict(req.unredirected_hdrs)
+        headers.update({k: v for k, v in req.headers.items() if k not in headers})
+        headers = {name.title(): val for name, val in headers.items()}
+        method = req.get_method()
+        body = req.data
+        body_start = body.tell() if hasattr(body, "seek") else None
+        replayable = body is None or isinstance(body, (bytes, bytearray)) or body_start is not None
+        read_timeout = req.timeout if isinstance(req.timeout, (int, float)) else socket.getdefaulttimeout()
+
+        pool.acquire_slot()
+        start = time.monotonic()
+        try:
+            for attempt in range(config.retries + 1):
+                conn = pool.checkout()
+                reused = conn is not None
+                sent = False
+                if conn is None:
+                    connect_timeout = config.connect_timeout_s
+                    if read_timeout is not None:
+                        connect_timeout = min(connect_timeout, read_timeout)
+                    conn = conn_cls(req.host, timeout=connect_timeout, blocksize=config.blocksize, **conn_args)
+                    conn.response_class = _PooledResponse
+                try:
+                    if conn.sock is None:
+                        conn.connect()
+                        with pool.cond:
+                            pool.counters["connections_opened"] += 1
+                    conn.sock.settimeout(read_timeout)
+                    conn.request(method, req.selector, body, headers,
+                                 encode_chunked=req.has_header("Transfer-encoding"))
+                    sent = True
+                    resp = conn.getresponse()
+                except _RESET_ERRORS as exc:
+                    conn.close()
+                    retry = attempt < config.retries and replayable and (
+                        method in _IDEMPOTENT_METHODS or not sent
+                    )
+                    if not retry:
+                        raise urllib.error.URLError(exc) from exc
+                    with pool.cond:
+                        pool.counters["retries"] += 1
+                    if body_start is not None:
+                        body.seek(body_start)
+                    if not (reused and not sent):
+                        time.sleep(random.uniform(0, config.backoff_s * (2 ** attempt)))
+                    logger.debug("Retrying %s %s after %s", method, req.full_url, exc)
+                    continue
+                except (OSError, http.client.HTTPException) as exc:
+                    conn.close()
+                    raise urllib.error.URLError(exc) from exc
+                break
+        except BaseException:
+            with pool.cond:
+                pool.counters["requests"] += 1
+                pool.counters["errors"] += 1
+            pool.release_slot()
+            raise
+
+        with pool.cond:
+            pool.counters["requests"] += 1
+            if reused:
+                pool.counters["reused"] += 1
+            pool.latency.observe((time.monotonic() - start) * 1000)
+
+        def release(reusable: bool) -> None:
+            if reusable:
+                pool.checkin(conn)
+            else:
+                conn.close()
+            pool.release_slot()
+
+        resp._on_release = release
+        if resp.will_close:
+            # getresponse() already handed the socket to the response.
+            resp._early_close = True
+        elif method == "HEAD" or (not resp.chunked and resp.length == 0):
+            resp._close_conn()  # no body: hand the connection back now
+        # urllib clients expect the URL here and the reason in .msg.
+        resp.url = req.get_full_url()
+        resp.msg = resp.reason
+        return resp
+
+
+# =============================================================================
+# Shared transport
+# =============================================================================
+
+_shared: Optional[HTTPTransport] = None
+_shared_lock = threading.Lock()
+
+
+def get_transport() -> HTTPTransport:
+    """The process-wide transport shared by internal HTTP callers."""
+    global _shared
+    if _shared is None:
+        with _shared_lock:
+            if _shared is None:
+                _shared = HTTPTransport()
+    return _shared
+
+
+def urlopen(url: Any, data: Optional[bytes] = None, timeout: Any = socket._GLOBAL_DEFAULT_TIMEOUT) -> http.client.HTTPResponse:
+    """``urllib.request.urlopen`` over the shared keep-alive transport."""
+    return get_transport().urlopen(url, data, timeout)
+
+
+def configure(base_url: str, **settings: Any) -> TargetConfig:
+    return get_transport().configure(base_url, **settings)
+
+
+def stats(base_url: Optional[str] = None) -> Dict[str, Any]:
+    return get_transport().stats(base_url)
+
+
+def close(base_url: Optional[str] = None) -> None:
+    if _shared is not None:
+        _shared.close(base_url)
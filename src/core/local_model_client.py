@@ -16,6 +16,12 @@ Public API:
     client.summarize(text)              → str
     client.redact(text)                 → str
     client.rag_rewrite(query)           → str
+    client.chat_with_tools(messages, **)        → dict
+    client.chat_with_tools_stream(messages, **) → Iterator[dict]
+    client.transport_stats()            → dict
+
+Requests go through the shared keep-alive transport (src.core.http_transport),
+so classification calls on the chat path reuse an open connection.
 """
 
 import json
@@ -23,9 +29,10 @@ import logging
 import os
 import urllib.request
 import urllib.error
-from typing import Optional
+from typing import Iterator, Optional
 
 from local_models.lockfile import load_all_prompts
+from src.core import http_transport
 
 logger = logging.getLogger(__name__)
 
@@ -75,7 +82,7 @@ class LocalModelClient:
             headers={"Content-Type": "application/json"},
         )
         try:
-            with urllib.request.urlopen(req, timeout=timeout) as resp:
+            with http_transport.urlopen(req, timeout=timeout) as resp:
                 return json.loads(resp.read().decode("utf-8"))
         except urllib.error.HTTPError as exc:
             body = ""
@@ -98,7 +105,7 @@ class LocalModelClient:
         url = f"{self._base_url}{path}"
         req = urllib.request.Request(url)
         try:
-            with urllib.request.urlopen(req, timeout=timeout) as resp:
+            with http_transport.urlopen(req, timeout=timeout) as resp:
                 return json.loads(resp.read().decode("utf-8"))
         except urllib.error.HTTPError as exc:
             body = ""
@@ -136,6 +143,10 @@ class LocalModelClient:
         except LocalModelError:
             return False
 
+    def transport_stats(self) -> dict:
+        """Client-side connection reuse and latency metrics for this service."""
+        return http_transport.stats(self._base_url)
+
     # ------------------------------------------------------------------
     # Raw completion
     # ------------------------------------------------------------------
@@ -147,15 +158,20 @@ class LocalModelClient:
         temperature: float = 0.1,
         stop: Optional[list] = None,
         timeout: float = 30.0,
+        priority: str = "normal",
     ) -> str:
         """Run a raw text completion against the local model.
 
+        ``priority`` ("high", "normal" or "low") orders the request in the
+        server's inference queue.
+
         Returns the generated text string.
         """
         payload = {
             "prompt": prompt,
             "max_tokens": max_tokens,
             "temperature": temperature,
+            "priority": priority,
         }
         if stop is not None:
             payload["stop"] = stop
@@ -174,7 +190,7 @@ class LocalModelClient:
         feedback, unclear.
         """
         prompt = self._render("classify_intent", input=text)
-        raw = self.complete(prompt, max_tokens=16, temperature=0.0)
+        raw = self.complete(prompt, max_tokens=16, temperature=0.0, priority="high")
         return raw.strip().lower()
 
     def extract_json(self, text: str, schema: str) -> dict:
@@ -208,7 +224,7 @@ class LocalModelClient:
     def summarize(self, text: str) -> str:
         """Summarize text in 2-3 concise sentences."""
         prompt = self._render("summarize_internal", input=text)
-        raw = self.complete(prompt, max_tokens=256, temperature=0.1)
+        raw = self.complete(prompt, max_tokens=256, temperature=0.1, priority="low")
         return raw.strip()
 
     def redact(self, text: str) -> str:
@@ -220,7 +236,7 @@ class LocalModelClient:
     def rag_rewrite(self, query: str) -> str:
         """Rewrite a query for improved vector database retrieval."""
         prompt = self._render("rag_rewrite", input=query)
-        raw = self.complete(prompt, max_tokens=128, temperature=0.1)
+        raw = self.complete(prompt, max_tokens=128, temperature=0.1, priority="low")
         return raw.strip()
 
     def verify_routing_intent(self, text: str) -> str:
@@ -234,7 +250,7 @@ class LocalModelClient:
         Returns one of: plan, action, question
         """
         prompt = self._render("verify_intent", input=text)
-        raw = self.complete(prompt, max_tokens=16, temperature=0.0, timeout=10.0)
+        raw = self.complete(prompt, max_tokens=16, temperature=0.0, timeout=10.0, priority="high")
         # Extract first valid label from potentially noisy output
         valid_labels = {"plan", "action", "question"}
         for word in raw.lower().split():
@@ -282,3 +298,70 @@ class LocalModelClient:
             payload["tool_choice"] = tool_choice
 
         return self._post("/v1/chat/completions", payload, timeout=timeout)
+
+    def chat_with_tools_stream(
+        self,
+        messages: list,
+        tools: Optional[list] = None,
+        max_tokens: int = 512,
+        temperature: float = 0.1,
+        tool_choice: Optional[str] = None,
+        timeout: float = 60.0,
+    ) -> Iterator[dict]:
+        """Streaming variant of chat_with_tools.
+
+        Sends the request with ``"stream": true`` and yields each
+        server-sent chunk (OpenAI ``chat.completion.chunk`` dicts) as it
+        arrives; ``providers.streaming.iter_openai_stream`` assembles them.
+
+        Raises:
+            LocalModelError: If the request fails before streaming starts.
+        """
+        payload = {
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stream": True,
+        }
+        if tools:
+            payload["tools"] = tools
+        if tool_choice:
+            payload["tool_choice"] = tool_choice
+
+        url = f"{self._base_url}/v1/chat/completions"
+        req = urllib.request.Request(
+            url,
+            data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json", "Accept": "text/event-stream"},
+        )
+        try:
+            resp = http_transport.urlopen(req, timeout=timeout)
+        except urllib.error.HTTPError as exc:
+            body = ""
+            try:
+                body = exc.read().decode("utf-8", errors="replace")
+            except Exception:
+                pass
+            raise LocalModelError(
+                f"HTTP {exc.code} from {url}: {body}"
+            ) from exc
+        except urllib.error.URLError as exc:
+            raise LocalModelError(
+                f"Connection failed to {url}: {exc.reason}"
+            ) from exc
+        except Exception as exc:
+            raise LocalModelError(f"Request failed: {exc}") from exc
+
+        with resp:
+            for raw_line in resp:
+                line = raw_line.decode("utf-8", errors="replace").strip()
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    resp.read()  # drain the stream end so the connection is reused
+                    return
+                try:
+                    yield json.loads(data)
+                except json.JSONDecodeError:
+                    logger.debug("Skipping malformed stream chunk: %.200s", data)
@@ -117,6 +117,11 @@ from .sqlite_store import (
     MemoryStoreManager,
 )
 
+from .vectors import (
+    HashingEmbedder,
+    VectorIndex,
+)
+
 from .compiler import (
     ContextCompiler,
     ContextCompilerService,
@@ -176,6 +181,9 @@ __all__ = [
     # SQLite Stores
     "MemoryItemStore",
     "MemoryStoreManager",
+    # Vectors
+    "HashingEmbedder",
+    "VectorIndex",
     # Compiler
     "ContextCompiler",
     "ContextCompilerService",
@@ -30,6 +30,20 @@ MINIMUM_CONFIDENCE_FOR_CORE: float = 0.8
 MINIMUM_CONFIDENCE_FOR_ARCHIVAL: float = 0.3
 DEFAULT_CONFIDENCE: float = 0.5
 
+# Cross-tier search weights (working memory gets a slight boost for recency)
+TIER_SEARCH_WEIGHTS: Dict[str, float] = {
+    "working": 1.2,
+    "episodic": 1.0,
+    "archival": 0.9,
+}
+
+# Hybrid search: share of the fused score taken by vector similarity
+# (the rest is BM25 relevance)
+HYBRID_VECTOR_WEIGHT: float = 0.5
+
+# Dimension of the hashing-trick fallback embedder
+HASHING_EMBEDDING_DIM: int = 384
+
 # TTL defaults (in hours)
 DEFAULT_WORKING_MEMORY_TTL_HOURS: int = 24
 DEFAULT_ARCHIVAL_DECAY_HALF_LIFE_DAYS: int = 30
@@ -2,26 +2,30 @@
 Memory vNext Index — Unified search interface across memory tiers.
 
 This module provides the MemoryIndex class that offers:
-- Unified search across working, episodic, and archival memory
-- Relevance ranking with confidence weighting
+- Unified search across working, episodic, and archival memory, with the
+  tiers queried concurrently
+- Relevance ranking from normalized BM25 scores with tier and confidence
+  weighting
+- Hybrid mode fusing vector similarity with BM25 for paraphrase recall
 - Namespace and tag filtering
 - Result aggregation and deduplication
 """
 
 from __future__ import annotations
 
+import heapq
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
 
-from .config import MemoryConfig, default_config
+from .config import TIER_SEARCH_WEIGHTS, MemoryConfig, default_config
 from .schemas import (
     MemoryItem,
     MemoryStatus,
     MemoryTier,
 )
-from .sqlite_store import MemoryItemStore, MemoryStoreManager
+from .sqlite_store import MemoryStoreManager, bm25_relevance
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +36,7 @@ class SearchResult:
     item: MemoryItem
     score: float = 0.0
     source_tier: MemoryTier = MemoryTier.archival
+    bm25: Optional[float] = None
 
     def weighted_score(self) -> float:
         """
@@ -39,12 +44,7 @@ class SearchResult:
 
         Working memory gets a slight boost for recency.
         """
-        tier_weights = {
-            MemoryTier.working: 1.2,
-            MemoryTier.episodic: 1.0,
-            MemoryTier.archival: 0.9,
-        }
-        weight = tier_weights.get(self.source_tier, 1.0)
+        weight = TIER_SEARCH_WEIGHTS.get(self.source_tier.value, 1.0)
         return self.score * weight * self.item.confidence
 
 
@@ -63,6 +63,7 @@ class SearchQuery:
     limit: int = 20
     include_quarantined: bool = False
     include_expired: bool = False
+    mode: str = "lexical"
 
 
 class MemoryIndex:
@@ -100,6 +101,7 @@ class MemoryIndex:
         min_confidence: float = 0.3,
         limit: int = 20,
         include_quarantined: bool = False,
+        mode: str = "lexical",
     ) -> list[SearchResult]:
         """
         Search across memory tiers.
@@ -112,6 +114,8 @@ class MemoryIndex:
             min_confidence: Minimum confidence threshold
             limit: Maximum results per tier
             include_quarantined: Include quarantined items
+            mode: "lexical" (FTS5 phrase match, BM25 ranked) or "hybrid"
+                (vector similarity fused with any-term BM25)
 
         Returns:
             List of SearchResult objects ranked by relevance
@@ -125,71 +129,58 @@ class MemoryIndex:
         if not tiers:
             return []
 
-        all_results: list[SearchResult] = []
-
-        for tier in tiers:
-            try:
-                store = self.store_manager.get_store(tier)
-                tier_results = self._search_tier(
-                    store=store,
-                    tier=tier,
-                    query=query,
-                    namespace=namespace,
-                    limit=limit,
-                    include_quarantined=include_quarantined,
-                )
-                all_results.extend(tier_results)
-            except Exception as e:
-                logger.warning("Search failed for tier %s: %s", tier.value, e)
-
-        # Filter by confidence
-        all_results = [
-            r for r in all_results
-            if r.item.confidence >= min_confidence
-        ]
-
-        # Filter by tags if specified
-        if tags:
-            all_results = [
-                r for r in all_results
-                if any(tag in r.item.tags for tag in tags)
-            ]
-
-        # Sort by weighted score
-        all_results.sort(key=lambda r: r.weighted_score(), reverse=True)
-
-        # Limit total results
-        return all_results[:limit]
-
-    def _search_tier(
-        self,
-        store: MemoryItemStore,
-        tier: MemoryTier,
-        query: str,
-        namespace: Optional[str],
-        limit: int,
-        include_quarantined: bool,
-    ) -> list[SearchResult]:
-        """Search a single tier and return results with scores."""
-        # Use basic search which supports all filters
-        items = store.search(
-            query=query,
+        # Tiers are queried concurrently, each on its own connection
+        tier_hits = self.store_manager.search_tiers(
+            query,
+            tiers=tiers,
             namespace=namespace,
             limit=limit,
             include_quarantined=include_quarantined,
+            mode=mode,
         )
 
-        results = []
-        for i, item in enumerate(items):
-            # Use inverse position as score (first results are most relevant)
-            score = 1.0 / (i + 1)
-            results.append(SearchResult(
+        best: dict[str, SearchResult] = {}
+        for tier, hits in tier_hits.items():
+            for result in self._to_results(tier, hits, fused=mode == "hybrid"):
+                # Filter by confidence
+                if result.item.confidence < min_confidence:
+                    continue
+                # Filter by tags if specified
+                if tags and not any(tag in result.item.tags for tag in tags):
+                    continue
+                # An item seen in several tiers keeps its best showing
+                seen = best.get(result.item.id)
+                if seen is None or result.weighted_score() > seen.weighted_score():
+                    best[result.item.id] = result
+
+        # Top results by weighted score
+        return heapq.nlargest(limit, best.values(), key=lambda r: r.weighted_score())
+
+    @staticmethod
+    def _to_results(
+        tier: MemoryTier,
+        hits: list[tuple[MemoryItem, float]],
+        fused: bool = False,
+    ) -> list[SearchResult]:
+        """
+        Wrap scored hits, normalizing BM25 so tiers can be compared.
+
+        Hybrid hits already carry a fused score in [0, 1] and are kept as is.
+        """
+        if fused:
+            return [
+                SearchResult(item=item, score=score, source_tier=tier)
+                for item, score in hits
+            ]
+        return [
+            SearchResult(
                 item=item,
-                score=score,
+                score=bm25_relevance(score),
                 source_tier=tier,
-            ))
-
-        return results
+                bm25=score,
+            )
+            for item, score in hits
+        ]
 
     def search_by_query(self, query: SearchQuery) -> list[SearchResult]:
         """
@@ -209,6 +200,7 @@ class MemoryIndex:
             min_confidence=query.min_confidence,
             limit=query.limit,
             include_quarantined=query.include_quarantined,
+            mode=query.mode,
         )
 
     def get_recent(
@@ -8,6 +8,7 @@ This module provides SQLite-backed storage for:
 
 Features:
 - Full-text search via FTS5
+- Optional vector index per tier for hybrid semantic + lexical search
 - Thread-safe connection handling
 - Automatic schema migration
 - TTL/expiration management
@@ -20,6 +21,7 @@ import json
 import logging
 import sqlite3
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
@@ -30,6 +32,8 @@ from .config import (
     WORKING_MEMORY_DB,
     EPISODIC_DB,
     ARCHIVAL_DB,
+    HYBRID_VECTOR_WEIGHT,
+    TIER_SEARCH_WEIGHTS,
 )
 from .schemas import (
     MemoryItem,
@@ -37,10 +41,23 @@ from .schemas import (
     MemoryTier,
     Provenance,
 )
+from .vectors import VectorIndex, get_default_embedder, vectors_available
 
 logger = logging.getLogger(__name__)
 
 
+def bm25_relevance(score: float) -> float:
+    """
+    Map an FTS5 bm25() score onto (0, 1).
+
+    bm25() is negative with larger magnitude meaning more relevant. The
+    map is monotonic and saturating, so scores stay comparable across
+    tiers instead of being reduced to per-tier positions.
+    """
+    magnitude = -score
+    return magnitude / (1.0 + magnitude) if magnitude > 0 else 0.0
+
+
 class MemoryItemStore:
     """
     SQLite-backed store for tiered memory items with FTS5 full-text search.
@@ -146,24 +163,37 @@ class MemoryItemStore:
         }
         self.db_file = self.memory_dir / db_files.get(tier, "memory.sqlite")
 
-        # Thread-local connections
+        # Thread-local connections, also registered so close_all_connections()
+        # can close those opened by other threads (e.g. search workers)
         self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._generation = 0
         self._initialized = False
         self._init_lock = threading.Lock()
+        # Embeddings for hybrid search; None when vectors are unavailable
+        self.vector_index: Optional[VectorIndex] = None
 
     @contextmanager
     def _get_connection(self) -> Iterator[sqlite3.Connection]:
         """Get a thread-local database connection."""
-        if not hasattr(self._local, "connection") or self._local.connection is None:
-            self._local.connection = sqlite3.connect(
+        if (
+            getattr(self._local, "connection", None) is None
+            or getattr(self._local, "generation", None) != self._generation
+        ):
+            connection = sqlite3.connect(
                 str(self.db_file),
                 timeout=30.0,
                 check_same_thread=False,
             )
-            self._local.connection.row_factory = sqlite3.Row
+            connection.row_factory = sqlite3.Row
             # Enable WAL mode for better concurrency
-            self._local.connection.execute("PRAGMA journal_mode=WAL")
-            self._local.connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            with self._connections_lock:
+                self._connections.append(connection)
+                self._local.generation = self._generation
+            self._local.connection = connection
 
         try:
             yield self._local.connection
@@ -198,18 +228,69 @@ class MemoryItemStore:
 
                 conn.commit()
 
+                self._init_vectors(conn)
+
             self._initialized = True
             logger.info(
                 "MemoryItemStore initialized for tier=%s at %s",
                 self.tier.value, self.db_file
             )
 
+    def _init_vectors(self, conn: sqlite3.Connection) -> None:
+        """Open the tier's vector index, rebuilding it if it is out of step."""
+        if not vectors_available():
+            return
+        try:
+            index = VectorIndex.shared(self.db_file, get_default_embedder())
+            count = conn.execute("SELECT COUNT(*) FROM memory_items").fetchone()[0]
+            if index.needs_rebuild or len(index) != count:
+                rows = conn.execute(
+                    "SELECT id, title, content, tags FROM memory_items"
+                ).fetchall()
+                index.rebuild(
+                    (row["id"], self._embedding_text(row["title"], row["content"],
+                                                     json.loads(row["tags"])))
+                    for row in rows
+                )
+                logger.info(
+                    "Rebuilt vector index for tier=%s (%d items)", self.tier.value, len(rows)
+                )
+            self.vector_index = index
+        except Exception as e:
+            logger.warning("Vector index unavailable for tier=%s: %s", self.tier.value, e)
+
+    @staticmethod
+    def _embedding_text(title: str, content: str, tags: list[str]) -> str:
+        """Text embedded for an item: title, content and tags."""
+        return "\n".join([title, content, " ".join(tags)])
+
+    def _index_vectors(self, items: list[MemoryItem]) -> None:
+        """Embed items into the vector index. Failures never fail the write."""
+        if self.vector_index is None:
+            return
+        try:
+            self.vector_index.upsert([
+                (item.id, self._embedding_text(item.title, item.content, item.tags))
+                for item in items
+            ])
+        except Exception as e:
+            logger.warning("Vector indexing failed for tier=%s: %s", self.tier.value, e)
+
+    def _unindex_vectors(self, item_ids: list[str]) -> None:
+        """Drop items from the vector index."""
+        if self.vector_index is None or not item_ids:
+            return
+        try:
+            self.vector_index.delete(item_ids)
+        except Exception as e:
+            logger.warning("Vector delete failed for tier=%s: %s", self.tier.value, e)
+
     def _ensure_initialized(self) -> None:
         """Ensure the store is initialized."""
         if not self._initialized:
             self.initialize()
 
-    def _escape_fts5_query(self, query: str) -> str:
+    def _escape_fts5_query(self, query: str, match_any: bool = False) -> str:
         """
         Escape a query string for safe use with FTS5 MATCH.
 
@@ -221,6 +302,8 @@ class MemoryItemStore:
 
         Args:
             query: Raw search query
+            match_any: Quote each term and OR them instead of matching
+                the whole query as one phrase
 
         Returns:
             Escaped query safe for FTS5 MATCH
@@ -241,6 +324,9 @@ class MemoryItemStore:
         if not escaped.strip():
             return '""'
 
+        if match_any:
+            return " OR ".join(f'"{term}"' for term in escaped.split())
+
         return f'"{escaped}"'
 
     def _item_to_row(self, item: MemoryItem) -> dict[str, Any]:
@@ -318,10 +404,12 @@ class MemoryItemStore:
                 )
                 conn.commit()
                 logger.debug("Inserted memory item %s", item.id)
-                return item.id
             except sqlite3.IntegrityError as e:
                 raise ValueError(f"Item with ID {item.id} already exists") from e
 
+        self._index_vectors([item])
+        return item.id
+
     def get(self, item_id: str) -> Optional[MemoryItem]:
         """
         Get a memory item by ID.
@@ -377,7 +465,10 @@ class MemoryItemStore:
             updated = cursor.rowcount > 0
             if updated:
                 logger.debug("Updated memory item %s", item.id)
-            return updated
+
+        if updated:
+            self._index_vectors([item])
+        return updated
 
     def delete(self, item_id: str) -> bool:
         """
@@ -401,7 +492,10 @@ class MemoryItemStore:
             deleted = cursor.rowcount > 0
             if deleted:
                 logger.debug("Deleted memory item %s", item_id)
-            return deleted
+
+        if deleted:
+            self._unindex_vectors([item_id])
+        return deleted
 
     def list_items(
         self,
@@ -490,32 +584,80 @@ class MemoryItemStore:
         Returns:
             List of matching MemoryItem objects ranked by relevance
         """
-        self._ensure_initialized()
-
-        # Build the search query
-        # FTS5 requires special handling for the query
-        # Escape special characters and wrap in quotes for phrase matching
-        safe_query = self._escape_fts5_query(query)
+        return [
+            item for item, _ in self.search_scored(
+                query,
+                namespace=namespace,
+                status=status,
+                limit=limit,
+                include_expired=include_expired,
+                include_quarantined=include_quarantined,
+            )
+        ]
 
-        conditions = ["mi.tier = ?"]
+    def _filter_conditions(
+        self,
+        namespace: Optional[str],
+        status: Optional[MemoryStatus],
+        include_expired: bool,
+        include_quarantined: bool,
+        alias: str = "mi",
+    ) -> tuple[list[str], list[Any]]:
+        """Build the WHERE conditions shared by the search methods."""
+        conditions = [f"{alias}.tier = ?"]
         params: list[Any] = [self.tier.value]
 
         if namespace is not None:
-            conditions.append("mi.namespace = ?")
+            conditions.append(f"{alias}.namespace = ?")
             params.append(namespace)
 
         if status is not None:
-            conditions.append("mi.status = ?")
+            conditions.append(f"{alias}.status = ?")
             params.append(status.value)
         elif not include_quarantined:
             # Exclude quarantined items by default
-            conditions.append("mi.status != ?")
+            conditions.append(f"{alias}.status != ?")
             params.append(MemoryStatus.quarantined.value)
 
         if not include_expired:
-            conditions.append("(mi.expires_at IS NULL OR mi.expires_at > ?)")
+            conditions.append(f"({alias}.expires_at IS NULL OR {alias}.expires_at > ?)")
             params.append(datetime.utcnow().isoformat())
 
+        return conditions, params
+
+    def search_scored(
+        self,
+        query: str,
+        namespace: Optional[str] = None,
+        status: Optional[MemoryStatus] = None,
+        limit: int = 20,
+        include_expired: bool = False,
+        include_quarantined: bool = False,
+        match_any: bool = False,
+    ) -> list[tuple[MemoryItem, float]]:
+        """
+        Full-text search returning each item with its BM25 score.
+
+        Takes the same filters as search(). Scores are raw bm25() values:
+        negative, more negative is more relevant.
+
+        Args:
+            match_any: Match items containing any query term rather than
+                the whole query as a phrase
+
+        Returns:
+            List of (MemoryItem, score) tuples, best first
+        """
+        self._ensure_initialized()
+
+        # Build the search query
+        # FTS5 requires special handling for the query
+        # Escape special characters and wrap in quotes for phrase matching
+        safe_query = self._escape_fts5_query(query, match_any=match_any)
+
+        conditions, params = self._filter_conditions(
+            namespace, status, include_expired, include_quarantined,
+        )
         where_clause = " AND ".join(conditions)
         params.append(limit)
 
@@ -523,16 +665,112 @@ class MemoryItemStore:
             cursor = conn.cursor()
             cursor.execute(
                 f"""
-                SELECT mi.* FROM memory_items mi
-                JOIN memory_items_fts fts ON mi.id = fts.id
+                SELECT mi.*, bm25(memory_items_fts) AS score FROM memory_items mi
+                JOIN memory_items_fts fts ON fts.rowid = mi.rowid
                 WHERE fts.memory_items_fts MATCH ?
                 AND {where_clause}
-                ORDER BY rank
+                ORDER BY score
                 LIMIT ?
                 """,
                 [safe_query, *params],
             )
-            return [self._row_to_item(row) for row in cursor.fetchall()]
+            return [(self._row_to_item(row), row["score"]) for row in cursor.fetchall()]
+
+    def search_vector(
+        self,
+        query: str,
+        namespace: Optional[str] = None,
+        status: Optional[MemoryStatus] = None,
+        limit: int = 20,
+        include_expired: bool = False,
+        include_quarantined: bool = False,
+    ) -> list[tuple[MemoryItem, float]]:
+        """
+        Semantic search over the tier's vector index.
+
+        Takes the same filters as search(). Nearest neighbours are
+        over-fetched and then filtered in SQL, so heavily filtered
+        queries may return fewer than limit items.
+
+        Returns:
+            List of (MemoryItem, cosine similarity) tuples, best first;
+            empty when the vector index is unavailable
+        """
+        self._ensure_initialized()
+        if self.vector_index is None:
+            return []
+
+        hits = self.vector_index.search(query, limit * 4)
+        if not hits:
+            return []
+
+        conditions, params = self._filter_conditions(
+            namespace, status, include_expired, include_quarantined,
+        )
+        placeholders = ",".join("?" * len(hits))
+        where_clause = " AND ".join(conditions)
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"""
+                SELECT mi.* FROM memory_items mi
+                WHERE mi.id IN ({placeholders})
+                AND {where_clause}
+                """,
+                [item_id for item_id, _ in hits] + params,
+            )
+            items = {row["id"]: self._row_to_item(row) for row in cursor.fetchall()}
+
+        return [
+            (items[item_id], similarity)
+            for item_id, similarity in hits
+            if item_id in items
+        ][:limit]
+
+    def search_hybrid(
+        self,
+        query: str,
+        namespace: Optional[str] = None,
+        status: Optional[MemoryStatus] = None,
+        limit: int = 20,
+        include_expired: bool = False,
+        include_quarantined: bool = False,
+        vector_weight: float = HYBRID_VECTOR_WEIGHT,
+    ) -> list[tuple[MemoryItem, float]]:
+        """
+        Fuse vector similarity with BM25 relevance.
+
+        The lexical leg matches any query term, so paraphrases that share
+        only some words still score. Each item's score is
+        vector_weight * similarity + (1 - vector_weight) * bm25_relevance,
+        with a missing leg counting as 0. Without a vector index this is
+        BM25 relevance alone.
+
+        Returns:
+            List of (MemoryItem, fused score in [0, 1]) tuples, best first
+        """
+        filters = dict(
+            namespace=namespace,
+            status=status,
+            limit=limit * 2,
+            include_expired=include_expired,
+            include_quarantined=include_quarantined,
+        )
+        lexical = self.search_scored(query, match_any=True, **filters)
+        semantic = self.search_vector(query, **filters)
+        if self.vector_index is None:
+            vector_weight = 0.0
+
+        fused: dict[str, list] = {}
+        for item, score in lexical:
+            fused[item.id] = [item, (1.0 - vector_weight) * bm25_relevance(score)]
+        for item, similarity in semantic:
+            entry = fused.setdefault(item.id, [item, 0.0])
+            entry[1] += vector_weight * max(similarity, 0.0)
+
+        ranked = sorted(fused.values(), key=lambda entry: entry[1], reverse=True)
+        return [(item, score) for item, score in ranked[:limit] if score > 0]
 
     def search_similar(
         self,
@@ -558,7 +796,7 @@ class MemoryItemStore:
                 """
                 SELECT mi.*, bm25(memory_items_fts) as score
                 FROM memory_items mi
-                JOIN memory_items_fts fts ON mi.id = fts.id
+                JOIN memory_items_fts fts ON fts.rowid = mi.rowid
                 WHERE fts.memory_items_fts MATCH ?
                 AND mi.status = 'active'
                 ORDER BY score
@@ -585,18 +823,26 @@ class MemoryItemStore:
 
         with self._get_connection() as conn:
             cursor = conn.cursor()
+            # Collect ids first so the vector index can drop the same rows
             cursor.execute(
                 """
-                DELETE FROM memory_items
+                SELECT id FROM memory_items
                 WHERE tier = ? AND expires_at IS NOT NULL AND expires_at <= ?
                 """,
                 [self.tier.value, now],
             )
+            expired = [row["id"] for row in cursor.fetchall()]
+            cursor.executemany(
+                "DELETE FROM memory_items WHERE id = ?",
+                [(item_id,) for item_id in expired],
+            )
             conn.commit()
-            count = cursor.rowcount
+            count = len(expired)
             if count > 0:
                 logger.info("Deleted %d expired items from %s", count, self.tier.value)
-            return count
+
+        self._unindex_vectors(expired)
+        return count
 
     def update_status(
         self,
@@ -728,10 +974,24 @@ class MemoryItemStore:
 
     def close(self) -> None:
         """Close the database connection for this thread."""
-        if hasattr(self._local, "connection") and self._local.connection:
-            self._local.connection.close()
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            with self._connections_lock:
+                if connection in self._connections:
+                    self._connections.remove(connection)
+            connection.close()
             self._local.connection = None
 
+    def close_all_connections(self) -> None:
+        """Close the connections of every thread that used this store."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            # Threads still holding a closed connection reopen on next use
+            self._generation += 1
+        for connection in connections:
+            connection.close()
+        self._local.connection = None
+
 
 class MemoryStoreManager:
     """
@@ -750,6 +1010,9 @@ class MemoryStoreManager:
         self.data_dir = Path(data_dir)
         self._stores: dict[MemoryTier, MemoryItemStore] = {}
         self._lock = threading.Lock()
+        # Tier searches fan out here; each worker keeps its own
+        # thread-local connection per tier database
+        self._search_pool: Optional[ThreadPoolExecutor] = None
         atexit.register(self.close_all)
 
     def get_store(self, tier: MemoryTier) -> MemoryItemStore:
@@ -788,39 +1051,107 @@ class MemoryStoreManager:
         """Get the archival memory store."""
         return self.get_store(MemoryTier.archival)
 
-    def search_all(
+    def search_tiers(
         self,
         query: str,
         tiers: Optional[list[MemoryTier]] = None,
         namespace: Optional[str] = None,
         limit: int = 20,
-    ) -> list[MemoryItem]:
+        include_quarantined: bool = False,
+        mode: str = "lexical",
+    ) -> dict[MemoryTier, list[tuple[MemoryItem, float]]]:
         """
-        Search across multiple tiers.
+        Run a scored search on several tiers concurrently.
+
+        Each tier database is queried from its own worker thread. A tier
+        whose search fails is logged and left out.
 
         Args:
             query: Search query
             tiers: Tiers to search (default: all non-core)
             namespace: Filter by namespace
             limit: Maximum results per tier
+            include_quarantined: Include quarantined items
+            mode: "lexical" for raw bm25 scores, "hybrid" for fused
+                vector + BM25 scores in [0, 1]
 
         Returns:
-            Combined list of matching items
+            Mapping of tier to (MemoryItem, score) tuples, best first
         """
+        if mode not in ("lexical", "hybrid"):
+            raise ValueError(f"Unknown search mode: {mode}")
         if tiers is None:
             tiers = [MemoryTier.working, MemoryTier.episodic, MemoryTier.archival]
+        # Resolve stores up front so workers never race on initialization
+        stores = {tier: self.get_store(tier) for tier in tiers if tier != MemoryTier.core}
+
+        def run(store: MemoryItemStore) -> list[tuple[MemoryItem, float]]:
+            search = store.search_hybrid if mode == "hybrid" else store.search_scored
+            return search(
+                query,
+                namespace=namespace,
+                limit=limit,
+                include_quarantined=include_quarantined,
+            )
 
-        results = []
-        for tier in tiers:
-            if tier == MemoryTier.core:
-                continue
-            store = self.get_store(tier)
-            results.extend(store.search(query, namespace=namespace, limit=limit))
+        if len(stores) == 1:
+            pending = {tier: None for tier in stores}
+        else:
+            with self._lock:
+                if self._search_pool is None:
+                    self._search_pool = ThreadPoolExecutor(
+                        max_workers=3, thread_name_prefix="memory-search",
+                    )
+                pool = self._search_pool
+            pending = {tier: pool.submit(run, store) for tier, store in stores.items()}
 
+        results: dict[MemoryTier, list[tuple[MemoryItem, float]]] = {}
+        for tier, future in pending.items():
+            try:
+                results[tier] = future.result() if future is not None else run(stores[tier])
+            except Exception as e:
+                logger.warning("Search failed for tier %s: %s", tier.value, e)
         return results
 
+    def search_all(
+        self,
+        query: str,
+        tiers: Optional[list[MemoryTier]] = None,
+        namespace: Optional[str] = None,
+        limit: int = 20,
+    ) -> list[MemoryItem]:
+        """
+        Search across multiple tiers.
+
+        Args:
+            query: Search query
+            tiers: Tiers to search (default: all non-core)
+            namespace: Filter by namespace
+            limit: Maximum results per tier
+
+        Returns:
+            Combined list of matching items, most relevant first (BM25
+            relevance weighted by tier and confidence)
+        """
+        scored: dict[str, tuple[float, MemoryItem]] = {}
+        for tier, hits in self.search_tiers(query, tiers, namespace=namespace, limit=limit).items():
+            weight = TIER_SEARCH_WEIGHTS.get(tier.value, 1.0)
+            for item, score in hits:
+                ranked = bm25_relevance(score) * weight * item.confidence
+                if item.id not in scored or ranked > scored[item.id][0]:
+                    scored[item.id] = (ranked, item)
+
+        ranked_items = sorted(scored.values(), key=lambda entry: entry[0], reverse=True)
+        return [item for _, item in ranked_items]
+
     def close_all(self) -> None:
         """Close all store connections."""
+        if self._search_pool is not None:
+            # Let in-flight searches finish before their connections close
+            self._search_pool.shutdown(wait=True)
+            self._search_pool = None
         for store in self._stores.values():
-            store.close()
+            store.close_all_connections()
+            if store.vector_index is not None:
+                store.vector_index.close()
         self._stores.clear()
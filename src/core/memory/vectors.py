@@ -0,0 +1,463 @@
+"""
+Memory vNext Vector Index — On-disk embeddings for semantic retrieval.
+
+Each MemoryItemStore tier keeps a vector index next to its SQLite file:
+- <tier>.vectors.f32: memory-mapped float32 matrix, one L2-normalized row per slot
+- <tier>.vectors.json: embedder name, dimension, and a snapshot of the
+  item-id → slot map
+- <tier>.vectors.log: slot assignments made since that snapshot, one JSON
+  line each, folded into the snapshot once it outgrows the map
+
+Rows are written on insert/update and freed on delete, so the index is
+maintained incrementally; freed slots are reused before the matrix grows.
+Every store on the same tier file in a process shares one index
+(``VectorIndex.shared``), so several MemoryStoreManagers on one data_dir
+never overwrite each other's rows.
+
+Embeddings come from a sentence-transformers model when
+LANCELOT_MEMORY_EMBEDDING_MODEL names one and the package is installed,
+otherwise from a hashing-trick embedder that needs nothing beyond numpy.
+Without numpy (or with LANCELOT_MEMORY_VECTORS=false) no index is built
+and hybrid search degrades to BM25 alone.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable, Optional, Protocol
+
+from .config import HASHING_EMBEDDING_DIM
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy arrives with chromadb
+    np = None
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_MODEL_ENV = "LANCELOT_MEMORY_EMBEDDING_MODEL"
+VECTORS_ENABLED_ENV = "LANCELOT_MEMORY_VECTORS"
+
+# Texts embedded per batch when (re)building an index
+EMBED_BATCH_SIZE = 64
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def vectors_available() -> bool:
+    """True when numpy is importable and vectors are not switched off."""
+    if np is None:
+        return False
+    return os.getenv(VECTORS_ENABLED_ENV, "true").lower() not in ("0", "false", "no")
+
+
+class Embedder(Protocol):
+    """Turns texts into L2-normalized float32 rows."""
+
+    name: str
+    dim: int
+
+    def embed(self, texts: list[str]) -> Any:
+        """Return an array of shape (len(texts), dim)."""
+        ...
+
+
+@lru_cache(maxsize=65536)
+def _bucket(feature: str, dim: int) -> int:
+    """Signed bucket for a feature: index in the low bits, sign in the top bit."""
+    h = int.from_bytes(
+        hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little"
+    )
+    index = h % dim
+    return -(index + 1) if h >> 63 else index + 1
+
+
+class HashingEmbedder:
+    """
+    Feature-hashing embedder.
+
+    Word unigrams, word bigrams and character trigrams are hashed into
+    signed buckets, so texts sharing vocabulary or word stems
+    ("deploy" / "deployment") land close together without a model.
+    """
+
+    def __init__(self, dim: int = HASHING_EMBEDDING_DIM):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    @staticmethod
+    def _features(text: str) -> Iterable[tuple[str, float]]:
+        words = _WORD_RE.findall(text.lower())
+        for word in words:
+            yield word, 1.0
+            padded = f"<{word}>"
+            for i in range(len(padded) - 2):
+                yield padded[i:i + 3], 0.5
+        for first, second in zip(words, words[1:]):
+            yield f"{first} {second}", 0.5
+
+    def embed(self, texts: list[str]) -> Any:
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature, weight in self._features(text):
+                bucket = _bucket(feature, self.dim)
+                if bucket > 0:
+                    out[row, bucket - 1] += weight
+                else:
+                    out[row, -bucket - 1] -= weight
+        # Sublinear term frequency, then unit length for cosine via dot product
+        np.copysign(np.log1p(np.abs(out)), out, out=out)
+        norms = np.linalg.norm(out, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        out /= norms
+        return out
+
+
+class SentenceTransformerEmbedder:
+    """Embedder backed by a local sentence-transformers model, run on CPU."""
+
+    def __init__(self, model_name: str):
+        from sentence_transformers import SentenceTransformer
+
+        self._model = SentenceTransformer(model_name, device="cpu")
+        self.dim = int(self._model.get_sentence_embedding_dimension())
+        self.name = f"st:{model_name}"
+
+    def embed(self, texts: list[str]) -> Any:
+        vectors = self._model.encode(
+            texts,
+            batch_size=EMBED_BATCH_SIZE,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        return vectors.astype(np.float32, copy=False)
+
+
+_default_embedder: Optional[Embedder] = None
+_embedder_lock = threading.Lock()
+
+
+def get_default_embedder() -> Embedder:
+    """
+    Get the process-wide embedder, shared by all tiers.
+
+    Uses the model named by LANCELOT_MEMORY_EMBEDDING_MODEL when it loads,
+    else the hashing embedder.
+    """
+    global _default_embedder
+    with _embedder_lock:
+        if _default_embedder is None:
+            model_name = os.getenv(EMBEDDING_MODEL_ENV, "").strip()
+            if model_name:
+                try:
+                    _default_embedder = SentenceTransformerEmbedder(model_name)
+                except Exception as e:
+                    logger.warning(
+                        "Embedding model %s unavailable (%s); using hashing embedder",
+                        model_name, e,
+                    )
+            if _default_embedder is None:
+                _default_embedder = HashingEmbedder()
+        return _default_embedder
+
+
+_shared_indexes: dict[Path, "VectorIndex"] = {}
+_shared_lock = threading.Lock()
+
+
+class VectorIndex:
+    """
+    Memory-mapped embedding matrix with an id → row map.
+
+    The map (snapshot plus log) is authoritative: a row is live only once
+    the log line naming it has been written, so a crash mid-update leaves
+    at worst an unused row. Writes and searches serialize on one lock;
+    embedding runs outside it.
+    """
+
+    INITIAL_CAPACITY = 256
+
+    @classmethod
+    def shared(cls, base_path: str | Path, embedder: Embedder) -> "VectorIndex":
+        """
+        Open the process-wide index for a tier database.
+
+        Each call takes a reference that ``close()`` gives back; the files
+        are unmapped when the last one is closed.
+        """
+        key = Path(base_path).resolve()
+        with _shared_lock:
+            index = _shared_indexes.get(key)
+            if index is None:
+                index = _shared_indexes[key] = cls(base_path, embedder)
+                index._shared_key = key
+            else:
+                index._refs += 1
+            return index
+
+    def __init__(self, base_path: str | Path, embedder: Embedder):
+        """
+        Open (or create) the index for a tier database.
+
+        Args:
+            base_path: The tier's SQLite file; index files sit beside it
+            embedder: Embedder producing the rows
+        """
+        base_path = Path(base_path)
+        self.embedder = embedder
+        self.matrix_path = base_path.with_suffix(".vectors.f32")
+        self.map_path = base_path.with_suffix(".vectors.json")
+        self.log_path = base_path.with_suffix(".vectors.log")
+        self._lock = threading.RLock()
+        self._refs = 1
+        self._shared_key: Optional[Path] = None
+        # Snapshot generation; a log whose header names another one
+        # predates the snapshot and is ignored
+        self._epoch = 0
+        self._log_entries = 0
+        self._slots: dict[str, int] = {}
+        self._ids: list[Optional[str]] = []
+        self._free: list[int] = []
+        self._matrix = None
+        self._valid = None
+        # Set when existing files could not be used and the caller
+        # must repopulate the index from the store
+        self.needs_rebuild = False
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._slots
+
+    # ---- persistence ----
+
+    def _open_matrix(self, capacity: int) -> None:
+        self._matrix = np.memmap(
+            self.matrix_path, dtype=np.float32, mode="r+",
+            shape=(capacity, self.embedder.dim),
+        )
+        valid = np.zeros(capacity, dtype=bool)
+        if self._valid is not None:
+            valid[:len(self._valid)] = self._valid
+        self._valid = valid
+
+    def _reset(self) -> None:
+        self._close_matrix()
+        self._slots, self._ids, self._free, self._valid = {}, [], [], None
+        with open(self.matrix_path, "wb") as f:
+            f.truncate(self.INITIAL_CAPACITY * self.embedder.dim * 4)
+        self._open_matrix(self.INITIAL_CAPACITY)
+        self._write_map()
+
+    def _replay_log(self) -> None:
+        """Apply log lines written since the snapshot; stops at a torn last line."""
+        try:
+            lines = self.log_path.read_text().splitlines()
+        except OSError:
+            return
+        if not lines or lines[0] != json.dumps({"epoch": self._epoch}):
+            return
+        holders = {slot: item_id for item_id, slot in self._slots.items()}
+        for line in lines[1:]:
+            try:
+                item_id, slot = json.loads(line)
+            except ValueError:
+                break
+            self._log_entries += 1
+            old = self._slots.pop(item_id, None)
+            if old is not None:
+                holders.pop(old, None)
+            if slot is None:
+                continue
+            # A slot freed and reused since the snapshot changes hands
+            previous = holders.get(slot)
+            if previous is not None:
+                del self._slots[previous]
+            holders[slot] = item_id
+            self._slots[item_id] = slot
+
+    def _load(self) -> None:
+        try:
+            meta = json.loads(self.map_path.read_text())
+            capacity = self.matrix_path.stat().st_size // (self.embedder.dim * 4)
+            usable = (
+                meta.get("embedder") == self.embedder.name
+                and meta.get("dim") == self.embedder.dim
+                and capacity > 0
+                and 0 <= meta.get("size", -1) <= capacity
+            )
+        except (OSError, ValueError):
+            usable = False
+
+        if not usable:
+            self.needs_rebuild = True
+            self._reset()
+            return
+
+        self._slots = dict(meta["slots"])
+        self._epoch = meta.get("epoch", 0)
+        self._replay_log()
+        size = max([meta["size"], *(slot + 1 for slot in self._slots.values())])
+        if size > capacity:
+            self.needs_rebuild = True
+            self._reset()
+            return
+        self._ids = [None] * size
+        for item_id, slot in self._slots.items():
+            self._ids[slot] = item_id
+        self._free = [slot for slot, item_id in enumerate(self._ids) if item_id is None]
+        self._open_matrix(capacity)
+        self._valid[list(self._slots.values())] = True
+
+    def _write_map(self) -> None:
+        """Snapshot the whole map and start a fresh log."""
+        self._matrix.flush()
+        self._epoch += 1
+        tmp = self.map_path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps({
+            "embedder": self.embedder.name,
+            "dim": self.embedder.dim,
+            "size": len(self._ids),
+            "epoch": self._epoch,
+            "slots": self._slots,
+        }))
+        os.replace(tmp, self.map_path)
+        self.log_path.write_text(json.dumps({"epoch": self._epoch}) + "\n")
+        self._log_entries = 0
+
+    def _log(self, changes: list[tuple[str, Optional[int]]]) -> None:
+        """Persist slot assignments (None frees the id's slot).
+
+        Appends to the log, costing only the changed ids; the map is
+        re-snapshotted once the log grows longer than the map itself.
+        """
+        self._log_entries += len(changes)
+        if self._log_entries > len(self._slots) + self.INITIAL_CAPACITY:
+            self._write_map()
+            return
+        self._matrix.flush()
+        with open(self.log_path, "a") as f:
+            f.write("".join(json.dumps([item_id, slot]) + "\n" for item_id, slot in changes))
+
+    def _grow(self) -> None:
+        capacity = max(self.INITIAL_CAPACITY, len(self._matrix) * 2)
+        self._close_matrix()
+        with open(self.matrix_path, "r+b") as f:
+            f.truncate(capacity * self.embedder.dim * 4)
+        self._open_matrix(capacity)
+
+    def _close_matrix(self) -> None:
+        if self._matrix is not None:
+            self._matrix.flush()
+            self._matrix = None
+
+    def _allocate(self, item_id: str) -> int:
+        if self._free:
+            slot = self._free.pop()
+            self._ids[slot] = item_id
+        else:
+            if len(self._ids) == len(self._matrix):
+                self._grow()
+            slot = len(self._ids)
+            self._ids.append(item_id)
+        self._slots[item_id] = slot
+        self._valid[slot] = True
+        return slot
+
+    # ---- mutation ----
+
+    def upsert(self, entries: list[tuple[str, str]]) -> None:
+        """
+        Embed and store rows, replacing any existing row per id.
+
+        Args:
+            entries: (item_id, text) pairs
+        """
+        if not entries:
+            return
+        vectors = self.embedder.embed([text for _, text in entries])
+        with self._lock:
+            changes = []
+            for (item_id, _), vector in zip(entries, vectors):
+                slot = self._slots.get(item_id)
+                if slot is None:
+                    slot = self._allocate(item_id)
+                    changes.append((item_id, slot))
+                self._matrix[slot] = vector
+            if changes:
+                self._log(changes)
+            else:
+                # Rows rewritten in place; no map change to record
+                self._matrix.flush()
+
+    def delete(self, item_ids: Iterable[str]) -> int:
+        """Free the rows for the given ids. Returns the number removed."""
+        removed = []
+        with self._lock:
+            for item_id in item_ids:
+                slot = self._slots.pop(item_id, None)
+                if slot is None:
+                    continue
+                self._matrix[slot] = 0.0
+                self._ids[slot] = None
+                self._valid[slot] = False
+                self._free.append(slot)
+                removed.append((item_id, None))
+            if removed:
+                self._log(removed)
+        return len(removed)
+
+    def rebuild(self, entries: Iterable[tuple[str, str]]) -> None:
+        """Discard all rows and re-embed the given (item_id, text) pairs in batches."""
+        with self._lock:
+            self._reset()
+            batch: list[tuple[str, str]] = []
+            for entry in entries:
+                batch.append(entry)
+                if len(batch) >= EMBED_BATCH_SIZE:
+                    self.upsert(batch)
+                    batch = []
+            self.upsert(batch)
+            self.needs_rebuild = False
+
+    # ---- search ----
+
+    def search(self, query: str, limit: int) -> list[tuple[str, float]]:
+        """
+        Cosine top-k over all live rows.
+
+        Returns:
+            (item_id, similarity) pairs with positive similarity, best first
+        """
+        if not self._slots or limit <= 0:
+            return []
+        query_vector = self.embedder.embed([query])[0]
+        with self._lock:
+            size = len(self._ids)
+            sims = np.asarray(self._matrix[:size] @ query_vector)
+            sims[~self._valid[:size]] = -np.inf
+            k = min(limit, len(self._slots))
+            top = np.argpartition(-sims, k - 1)[:k]
+            top = top[np.argsort(-sims[top])]
+            return [(self._ids[i], float(sims[i])) for i in top if sims[i] > 0]
+
+    def close(self) -> None:
+        """Give back a reference; the last one flushes and unmaps the matrix."""
+        with _shared_lock:
+            self._refs -= 1
+            if self._refs > 0:
+                return
+            if self._shared_key is not None:
+                _shared_indexes.pop(self._shared_key, None)
+        with self._lock:
+            self._close_matrix()
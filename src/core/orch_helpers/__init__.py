@@ -20,3 +20,7 @@ from orch_helpers.response_helpers import (
     format_tool_receipts,
     append_download_links,
 )
+from orch_helpers.tool_dispatch import (
+    ParallelToolDispatcher,
+    is_parallel_safe_tool_call,
+)
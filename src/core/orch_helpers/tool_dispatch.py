@@ -0,0 +1,126 @@
+# Concurrent dispatch for read-only tool calls emitted in one LLM response.
+# The agentic loop still walks tool calls in order (receipts, tool_results and
+# toolflow events stay deterministic); this helper only lets a run of
+# consecutive read-only calls execute together while the loop waits on each.
+
+import os
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from orch_helpers.safety_helpers import classify_tool_call_safety
+
+# Per-turn cap on concurrently executing tool calls (1 disables fan-out).
+DEFAULT_MAX_PARALLEL_TOOLS = int(os.getenv("LANCELOT_MAX_PARALLEL_TOOLS", "4"))
+
+# Shell operators (and line breaks, which separate commands) that turn an
+# otherwise read-only command into a write or a compound command — those keep
+# serial execution.
+_SHELL_SIDE_EFFECTS = re.compile(r"[>;&|`\n\r]|\$\(")
+
+
+def is_parallel_safe_tool_call(skill_name: str, inputs: dict) -> bool:
+    """True when a tool call is read-only and may run alongside its neighbours.
+
+    Stricter than ``classify_tool_call_safety``: that function also returns
+    'auto' for T1 workspace writes (repo_writer, document_creator,
+    schedule_job, ...), which must keep their serial ordering.
+    """
+    inputs = inputs or {}
+    if classify_tool_call_safety(skill_name, inputs) != "auto":
+        return False
+
+    if skill_name == "network_client":
+        return True  # 'auto' only for GET/HEAD
+    if skill_name == "github_search":
+        return True
+    if skill_name == "command_runner":
+        return not _SHELL_SIDE_EFFECTS.search(inputs.get("command", ""))
+    if skill_name == "skill_manager":
+        return inputs.get("action", "").lower() in ("list_proposals", "list_skills")
+    return False
+
+
+class ParallelToolDispatcher:
+    """Runs consecutive read-only tool calls of one response concurrently.
+
+    Usage inside the agentic loop::
+
+        with ParallelToolDispatcher(run_fn, calls, declared) as dispatch:
+            for i, (name, inputs) in enumerate(calls):
+                ...
+                exec_result = dispatch.run(i)   # instead of run_fn(name, inputs)
+
+    ``run(i)`` returns exactly what ``run_fn(name, inputs)`` would return (or
+    raises what it would raise). When call ``i`` starts a run of two or more
+    parallel-safe calls, the whole run is submitted to a bounded pool on
+    first access and later indices just collect their futures — so anything
+    the loop does between calls (safety gates, receipts, events) still
+    happens in the original order.
+    """
+
+    def __init__(
+        self,
+        run_fn: Callable[[str, dict], Any],
+        calls: Sequence[Tuple[str, dict]],
+        declared: Optional[set] = None,
+        max_workers: int = DEFAULT_MAX_PARALLEL_TOOLS,
+    ):
+        self._run_fn = run_fn
+        self._calls = list(calls)
+        self._max_workers = max(1, max_workers)
+        self._futures: Dict[int, Future] = {}
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._segment_of: Dict[int, List[int]] = {}
+
+        if self._max_workers > 1:
+            run: List[int] = []
+            for i, (name, inputs) in enumerate(self._calls):
+                ok = (declared is None or name in declared) and is_parallel_safe_tool_call(name, inputs)
+                if ok:
+                    run.append(i)
+                    continue
+                self._close_segment(run)
+                run = []
+            self._close_segment(run)
+
+    def _close_segment(self, run: List[int]) -> None:
+        if len(run) >= 2:
+            for i in run:
+                self._segment_of[i] = run
+
+    @property
+    def parallel_indices(self) -> List[int]:
+        """Indices that will execute concurrently with a neighbour."""
+        return sorted(self._segment_of)
+
+    def run(self, index: int) -> Any:
+        """Execute (or collect) tool call ``index``."""
+        segment = self._segment_of.get(index)
+        if segment is None:
+            name, inputs = self._calls[index]
+            return self._run_fn(name, inputs)
+
+        if index not in self._futures:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=min(self._max_workers, len(self._calls)),
+                    thread_name_prefix="lancelot-tool",
+                )
+            for i in segment:
+                name, inputs = self._calls[i]
+                self._futures[i] = self._pool.submit(self._run_fn, name, inputs)
+        return self._futures.pop(index).result()
+
+    def close(self) -> None:
+        """Wait for any submitted call the loop did not collect, then stop the pool."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        self._futures.clear()
+
+    def __enter__(self) -> "ParallelToolDispatcher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,95 @@
+"""
+PromptCache — versioned memo for tool declarations and system instructions.
+
+The orchestrator rebuilds several hundred lines of tool declarations and a
+multi-KB system instruction on every agentic call. Their inputs change
+rarely (provider switch, skill install/enable, soul amendment, Crusader
+toggle), so the built artifacts are memoized under a caller-supplied key
+that captures every input they depend on.
+
+Two invalidation paths exist:
+    1. Implicit — any input change yields a new key (e.g. the skill
+       registry revision or soul version is part of the key).
+    2. Explicit — ``invalidate(namespace)`` drops entries when a change
+       hook fires (SkillRegistry / soul store listeners).
+
+Reusing the exact same object across turns also gives providers a
+byte-identical prefix, which is what provider-side prompt caching needs.
+
+Public API:
+    PromptCache(max_entries=64)
+    cache.get_or_build(namespace, key, builder) → cached value
+    cache.invalidate(namespace=None)
+    cache.stats()                               → dict
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PromptCache:
+    """Thread-safe, bounded LRU of built prompt artifacts."""
+
+    def __init__(self, max_entries: int = 64):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def get_or_build(self, namespace: str, key: Hashable, builder: Callable[[], Any]) -> Any:
+        """Return the cached value for ``(namespace, key)``, building it on a miss.
+
+        The builder runs outside the lock; if two threads miss at once both
+        build and the last writer wins — the values are equivalent.
+        """
+        full_key = (namespace, key)
+        with self._lock:
+            if full_key in self._entries:
+                self._entries.move_to_end(full_key)
+                self._hits += 1
+                return self._entries[full_key]
+            self._misses += 1
+
+        value = builder()
+
+        with self._lock:
+            self._entries[full_key] = value
+            self._entries.move_to_end(full_key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, namespace: Optional[str] = None) -> int:
+        """Drop all entries (or those in ``namespace``). Returns the count dropped."""
+        with self._lock:
+            if namespace is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+            else:
+                stale = [k for k in self._entries if k[0] == namespace]
+                for k in stale:
+                    del self._entries[k]
+                dropped = len(stale)
+            self._invalidations += 1
+        if dropped:
+            logger.debug("PromptCache: invalidated %d entries (namespace=%s)", dropped, namespace)
+        return dropped
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / total, 3) if total else 0.0,
+                "invalidations": self._invalidations,
+            }
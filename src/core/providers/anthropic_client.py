@@ -12,10 +12,11 @@ Public API:
 import json
 import logging
 import time
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
-from providers.base import ProviderClient, GenerateResult, ToolCall, ModelInfo, ProviderAuthError, _is_auth_error
+from providers.base import ProviderClient, GenerateResult, ToolCall, ModelInfo, ProviderAuthError, StreamDelta, _is_auth_error
 from providers.tool_schema import NormalizedToolDeclaration, to_anthropic_tools
+from providers.prompt_caching import anthropic_cache_request, extract_anthropic_cache_usage
 
 logger = logging.getLogger(__name__)
 
@@ -68,29 +69,7 @@ class AnthropicProviderClient(ProviderClient):
         system_instruction: str = "",
         config: Optional[dict] = None,
     ) -> GenerateResult:
-        kwargs = {
-            "model": model,
-            "messages": messages,
-            "max_tokens": 8192,
-        }
-        # V29: Allow config-driven max_tokens override (for synthesis calls etc.)
-        if config and config.get("max_tokens"):
-            kwargs["max_tokens"] = config["max_tokens"]
-
-        if system_instruction:
-            kwargs["system"] = system_instruction
-
-        # V27: Extended thinking support (SDK mode only)
-        if self._mode == "sdk" and config and config.get("thinking"):
-            thinking_cfg = config["thinking"]
-            budget = thinking_cfg.get("budget_tokens", 10000)
-            kwargs["thinking"] = {
-                "type": "enabled",
-                "budget_tokens": budget,
-            }
-            # Extended thinking needs higher max_tokens
-            kwargs["max_tokens"] = max(kwargs["max_tokens"], 16384)
-            logger.info("Anthropic extended thinking enabled (budget=%d)", budget)
+        kwargs = self._build_request(model, messages, system_instruction, None, None, config)
 
         response = self._call_with_retry(
             lambda: self._client.messages.create(**kwargs)
@@ -111,47 +90,7 @@ class AnthropicProviderClient(ProviderClient):
         tool_config: Optional[dict] = None,
         config: Optional[dict] = None,
     ) -> GenerateResult:
-        # Convert normalized declarations to Anthropic format
-        if tools and isinstance(tools[0], NormalizedToolDeclaration):
-            anthropic_tools = to_anthropic_tools(tools)
-        else:
-            anthropic_tools = tools
-
-        kwargs = {
-            "model": model,
-            "messages": messages,
-            "max_tokens": 8192,
-            "tools": anthropic_tools,
-        }
-        # V29: Allow config-driven max_tokens override
-        if config and config.get("max_tokens"):
-            kwargs["max_tokens"] = config["max_tokens"]
-
-        if system_instruction:
-            kwargs["system"] = system_instruction
-
-        # Map tool_config mode
-        if tool_config:
-            tc_mode = tool_config.get("mode", "AUTO")
-            if tc_mode == "ANY":
-                kwargs["tool_choice"] = {"type": "any"}
-            elif tc_mode == "NONE":
-                # Don't pass tools at all for NONE mode
-                del kwargs["tools"]
-            # AUTO is the default
-
-        # V27: Extended thinking support (SDK mode only)
-        if self._mode == "sdk" and config and config.get("thinking"):
-            thinking_cfg = config["thinking"]
-            budget = thinking_cfg.get("budget_tokens", 10000)
-            kwargs["thinking"] = {
-                "type": "enabled",
-                "budget_tokens": budget,
-            }
-            kwargs["max_tokens"] = max(kwargs["max_tokens"], 16384)
-            # Anthropic: thinking cannot be combined with forced tool_choice
-            if "tool_choice" in kwargs:
-                del kwargs["tool_choice"]
+        kwargs = self._build_request(model, messages, system_instruction, tools, tool_config, config)
 
         response = self._call_with_retry(
             lambda: self._client.messages.create(**kwargs)
@@ -159,6 +98,56 @@ class AnthropicProviderClient(ProviderClient):
 
         return self._parse_response(response)
 
+    # ------------------------------------------------------------------
+    # Streaming
+    # ------------------------------------------------------------------
+
+    def stream(
+        self,
+        model: str,
+        messages: list,
+        system_instruction: str = "",
+        tools: Optional[list] = None,
+        tool_config: Optional[dict] = None,
+        config: Optional[dict] = None,
+    ) -> Iterator[StreamDelta]:
+        kwargs = self._build_request(model, messages, system_instruction, tools or None, tool_config, config)
+
+        # Entering the stream context sends the request, so connection and
+        # rate-limit errors surface inside the retry wrapper.
+        stream = self._call_with_retry(
+            lambda: self._client.messages.stream(**kwargs).__enter__()
+        )
+        try:
+            # content block index → position among the tool_use blocks
+            tool_index: dict[int, int] = {}
+            for event in stream:
+                if event.type == "content_block_start":
+                    block = event.content_block
+                    if block.type == "tool_use":
+                        tool_index[event.index] = len(tool_index)
+                        yield StreamDelta(
+                            kind="tool_call",
+                            index=tool_index[event.index],
+                            tool_call_id=block.id,
+                            tool_name=block.name,
+                        )
+                elif event.type == "content_block_delta":
+                    delta = event.delta
+                    if delta.type == "text_delta" and delta.text:
+                        yield StreamDelta(kind="text", text=delta.text)
+                    elif delta.type == "input_json_delta" and event.index in tool_index:
+                        yield StreamDelta(
+                            kind="tool_call",
+                            index=tool_index[event.index],
+                            args_fragment=delta.partial_json,
+                        )
+            final = stream.get_final_message()
+        finally:
+            stream.close()
+
+        yield StreamDelta(kind="done", result=self._parse_response(final))
+
     # ------------------------------------------------------------------
     # Message builders
     # ------------------------------------------------------------------
@@ -284,6 +273,71 @@ class AnthropicProviderClient(ProviderClient):
                     raise
         raise last_exc
 
+    def _build_request(
+        self,
+        model: str,
+        messages: list,
+        system_instruction: str,
+        tools: Optional[list],
+        tool_config: Optional[dict],
+        config: Optional[dict],
+    ) -> dict:
+        """Build messages.create kwargs; tools=None builds a text-only request."""
+        anthropic_tools = None
+        if tools is not None:
+            # Convert normalized declarations to Anthropic format
+            if tools and isinstance(tools[0], NormalizedToolDeclaration):
+                anthropic_tools = to_anthropic_tools(tools)
+            else:
+                anthropic_tools = tools
+
+        # Prompt-prefix caching: tools + system are stable across agentic
+        # iterations, so a breakpoint there (and on the newest message)
+        # lets each iteration reuse the previous iteration's prefix.
+        system, anthropic_tools, messages = anthropic_cache_request(
+            system_instruction, anthropic_tools, messages,
+        )
+
+        kwargs = {
+            "model": model,
+            "messages": messages,
+            "max_tokens": 8192,
+        }
+        if anthropic_tools is not None:
+            kwargs["tools"] = anthropic_tools
+        # V29: Allow config-driven max_tokens override (for synthesis calls etc.)
+        if config and config.get("max_tokens"):
+            kwargs["max_tokens"] = config["max_tokens"]
+
+        if system:
+            kwargs["system"] = system
+
+        # Map tool_config mode
+        if anthropic_tools is not None and tool_config:
+            tc_mode = tool_config.get("mode", "AUTO")
+            if tc_mode == "ANY":
+                kwargs["tool_choice"] = {"type": "any"}
+            elif tc_mode == "NONE":
+                # Don't pass tools at all for NONE mode
+                del kwargs["tools"]
+            # AUTO is the default
+
+        # V27: Extended thinking support (SDK mode only)
+        if self._mode == "sdk" and config and config.get("thinking"):
+            thinking_cfg = config["thinking"]
+            budget = thinking_cfg.get("budget_tokens", 10000)
+            kwargs["thinking"] = {
+                "type": "enabled",
+                "budget_tokens": budget,
+            }
+            # Extended thinking needs higher max_tokens
+            kwargs["max_tokens"] = max(kwargs["max_tokens"], 16384)
+            logger.info("Anthropic extended thinking enabled (budget=%d)", budget)
+            # Anthropic: thinking cannot be combined with forced tool_choice
+            kwargs.pop("tool_choice", None)
+
+        return kwargs
+
     def _try_oauth_refresh(self) -> bool:
         """Attempt to refresh the OAuth token via the global manager."""
         try:
@@ -325,6 +379,7 @@ class AnthropicProviderClient(ProviderClient):
         if hasattr(response, "usage") and response.usage:
             usage["input_tokens"] = getattr(response.usage, "input_tokens", 0) or 0
             usage["output_tokens"] = getattr(response.usage, "output_tokens", 0) or 0
+            usage.update(extract_anthropic_cache_usage(response.usage))
 
         # raw = the response content blocks for conversation continuity
         # Anthropic needs the assistant message appended as-is
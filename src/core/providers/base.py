@@ -8,14 +8,17 @@ Public API:
     ToolCall          — normalized tool/function call from any provider
     GenerateResult    — normalized generation result
     ModelInfo         — discovered model metadata
+    StreamDelta       — one increment of a streamed generation
     ProviderClient    — abstract base class
 """
 
+import asyncio
+import threading
 import uuid
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Iterator, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +85,29 @@ class GenerateResult:
         return len(self.tool_calls) > 0
 
 
+@dataclass
+class StreamDelta:
+    """One increment of a streamed generation.
+
+    Attributes:
+        kind: "text" (a text fragment), "tool_call" (a tool-call fragment)
+            or "done" (end of stream; ``result`` holds the full response).
+        text: Text fragment for kind="text".
+        index: Position of the tool call within the response.
+        tool_call_id: Provider-assigned call ID (first fragment only).
+        tool_name: Function name (first fragment only).
+        args_fragment: Partial JSON of the call arguments.
+        result: The assembled GenerateResult, set on the final "done" delta.
+    """
+    kind: str
+    text: str = ""
+    index: int = 0
+    tool_call_id: str = ""
+    tool_name: str = ""
+    args_fragment: str = ""
+    result: Optional[GenerateResult] = None
+
+
 @dataclass
 class ModelInfo:
     """Discovered model metadata from a provider API."""
@@ -168,6 +194,75 @@ class ProviderClient(ABC):
         """
         ...
 
+    def stream(
+        self,
+        model: str,
+        messages: list,
+        system_instruction: str = "",
+        tools: Optional[list] = None,
+        tool_config: Optional[dict] = None,
+        config: Optional[dict] = None,
+    ) -> Iterator[StreamDelta]:
+        """Stream a generation as text and tool-call deltas.
+
+        Calls ``generate_with_tools`` when tools are given, ``generate``
+        otherwise. The last delta is always kind="done" and carries the
+        same GenerateResult the non-streaming call would have returned, so
+        callers can append ``result.raw`` to the conversation unchanged.
+
+        The default implementation makes the blocking call and yields the
+        whole response at once; providers override it to stream natively.
+        """
+        if tools:
+            result = self.generate_with_tools(
+                model=model,
+                messages=messages,
+                system_instruction=system_instruction,
+                tools=tools,
+                tool_config=tool_config,
+                config=config,
+            )
+        else:
+            result = self.generate(
+                model=model,
+                messages=messages,
+                system_instruction=system_instruction,
+                config=config,
+            )
+        if result.text:
+            yield StreamDelta(kind="text", text=result.text)
+        for i, tc in enumerate(result.tool_calls):
+            yield StreamDelta(kind="tool_call", index=i, tool_call_id=tc.id, tool_name=tc.name)
+        yield StreamDelta(kind="done", result=result)
+
+    async def astream(self, *args, **kwargs) -> AsyncIterator[StreamDelta]:
+        """Async iterator over ``stream`` for event-loop callers.
+
+        The provider SDK calls block, so the sync stream is drained on a
+        worker thread and handed over through an asyncio.Queue.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        _end = object()
+
+        def _drain():
+            try:
+                for delta in self.stream(*args, **kwargs):
+                    loop.call_soon_threadsafe(queue.put_nowait, delta)
+            except BaseException as e:
+                loop.call_soon_threadsafe(queue.put_nowait, e)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, _end)
+
+        threading.Thread(target=_drain, name=f"{self.provider_name}-stream", daemon=True).start()
+        while True:
+            item = await queue.get()
+            if item is _end:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
     @abstractmethod
     def build_tool_response_message(
         self,
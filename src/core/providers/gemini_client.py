@@ -12,12 +12,12 @@ import json
 import logging
 import time
 import uuid
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 from google import genai
 from google.genai import types
 
-from providers.base import ProviderClient, GenerateResult, ToolCall, ModelInfo, ProviderAuthError, _is_auth_error
+from providers.base import ProviderClient, GenerateResult, ToolCall, ModelInfo, ProviderAuthError, StreamDelta, _is_auth_error
 from providers.tool_schema import NormalizedToolDeclaration, to_gemini_declarations
 
 logger = logging.getLogger(__name__)
@@ -51,24 +51,7 @@ class GeminiProviderClient(ProviderClient):
         system_instruction: str = "",
         config: Optional[dict] = None,
     ) -> GenerateResult:
-        config = config or {}
-        gen_config = types.GenerateContentConfig(
-            system_instruction=system_instruction or None,
-        )
-
-        # Apply thinking config if provided (convert dict to types.ThinkingConfig)
-        thinking = config.get("thinking")
-        if thinking:
-            if isinstance(thinking, dict):
-                gen_config.thinking_config = types.ThinkingConfig(**thinking)
-            else:
-                gen_config.thinking_config = thinking
-
-        # Structured output: force JSON with schema validation (V23)
-        if config.get("response_mime_type"):
-            gen_config.response_mime_type = config["response_mime_type"]
-        if config.get("response_schema"):
-            gen_config.response_schema = config["response_schema"]
+        gen_config = self._build_config(system_instruction, None, None, config)
 
         response = self._call_with_retry(
             lambda: self._client.models.generate_content(
@@ -93,57 +76,83 @@ class GeminiProviderClient(ProviderClient):
         tool_config: Optional[dict] = None,
         config: Optional[dict] = None,
     ) -> GenerateResult:
-        config = config or {}
+        gen_config = self._build_config(system_instruction, tools, tool_config, config)
 
-        # Convert normalized declarations to Gemini native format
-        if tools and isinstance(tools[0], NormalizedToolDeclaration):
-            gemini_declarations = to_gemini_declarations(tools)
-        else:
-            # Already native Gemini declarations (backward compat)
-            gemini_declarations = tools
-
-        gemini_tool = types.Tool(function_declarations=gemini_declarations)
-
-        # Build tool config
-        gemini_tool_config = None
-        if tool_config:
-            mode = tool_config.get("mode", "AUTO")
-            gemini_tool_config = types.ToolConfig(
-                function_calling_config=types.FunctionCallingConfig(mode=mode)
+        response = self._call_with_retry(
+            lambda: self._client.models.generate_content(
+                model=model,
+                contents=messages,
+                config=gen_config,
             )
-
-        gen_config = types.GenerateContentConfig(
-            system_instruction=system_instruction or None,
-            tools=[gemini_tool],
-            tool_config=gemini_tool_config,
-            automatic_function_calling=types.AutomaticFunctionCallingConfig(disable=True),
         )
 
-        # Apply thinking config if provided (convert dict to types.ThinkingConfig)
-        thinking = config.get("thinking")
-        if thinking:
-            if isinstance(thinking, dict):
-                gen_config.thinking_config = types.ThinkingConfig(**thinking)
-            else:
-                gen_config.thinking_config = thinking
+        return self._parse_response(response)
 
-        # Structured output: force JSON with schema validation (V23)
-        # Note: structured output + tool calling may conflict on some models.
-        # Only enable when explicitly requested via config.
-        if config.get("response_mime_type"):
-            gen_config.response_mime_type = config["response_mime_type"]
-        if config.get("response_schema"):
-            gen_config.response_schema = config["response_schema"]
+    # ------------------------------------------------------------------
+    # Streaming
+    # ------------------------------------------------------------------
 
-        response = self._call_with_retry(
-            lambda: self._client.models.generate_content(
+    def stream(
+        self,
+        model: str,
+        messages: list,
+        system_instruction: str = "",
+        tools: Optional[list] = None,
+        tool_config: Optional[dict] = None,
+        config: Optional[dict] = None,
+    ) -> Iterator[StreamDelta]:
+        gen_config = self._build_config(system_instruction, tools or None, tool_config, config)
+
+        chunks = self._call_with_retry(
+            lambda: self._client.models.generate_content_stream(
                 model=model,
                 contents=messages,
                 config=gen_config,
             )
         )
 
-        return self._parse_response(response)
+        # Gemini streams whole parts rather than token fragments; the parts
+        # are kept as-is (thought signatures included) to rebuild the
+        # model turn for conversation continuity.
+        parts = []
+        text_parts = []
+        tool_calls = []
+        usage = {"input_tokens": 0, "output_tokens": 0}
+        for chunk in chunks:
+            um = getattr(chunk, "usage_metadata", None)
+            if um:
+                usage["input_tokens"] = getattr(um, "prompt_token_count", 0) or 0
+                usage["output_tokens"] = getattr(um, "candidates_token_count", 0) or 0
+            if not chunk.candidates or not chunk.candidates[0].content:
+                continue
+            for part in chunk.candidates[0].content.parts or []:
+                parts.append(part)
+                if part.function_call:
+                    fc = part.function_call
+                    call = ToolCall(
+                        name=fc.name,
+                        args=dict(fc.args) if fc.args else {},
+                        id=str(uuid.uuid4()),
+                    )
+                    tool_calls.append(call)
+                    yield StreamDelta(
+                        kind="tool_call",
+                        index=len(tool_calls) - 1,
+                        tool_call_id=call.id,
+                        tool_name=call.name,
+                        args_fragment=json.dumps(call.args, default=str),
+                    )
+                elif part.text and not part.thought:
+                    text_parts.append(part.text)
+                    yield StreamDelta(kind="text", text=part.text)
+
+        result = GenerateResult(
+            text="".join(text_parts) or None,
+            tool_calls=tool_calls,
+            raw=types.Content(role="model", parts=parts) if parts else None,
+            usage=usage,
+        )
+        yield StreamDelta(kind="done", result=result)
 
     # ------------------------------------------------------------------
     # Message builders
@@ -249,6 +258,59 @@ class GeminiProviderClient(ProviderClient):
         except Exception:
             return False
 
+    # ------------------------------------------------------------------
+    # Request config
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _build_config(
+        system_instruction: str,
+        tools: Optional[list],
+        tool_config: Optional[dict],
+        config: Optional[dict],
+    ) -> "types.GenerateContentConfig":
+        """Build GenerateContentConfig; tools=None builds a text-only request."""
+        config = config or {}
+        gen_config = types.GenerateContentConfig(
+            system_instruction=system_instruction or None,
+        )
+
+        if tools is not None:
+            # Convert normalized declarations to Gemini native format
+            if tools and isinstance(tools[0], NormalizedToolDeclaration):
+                gemini_declarations = to_gemini_declarations(tools)
+            else:
+                # Already native Gemini declarations (backward compat)
+                gemini_declarations = tools
+
+            gen_config.tools = [types.Tool(function_declarations=gemini_declarations)]
+            gen_config.automatic_function_calling = types.AutomaticFunctionCallingConfig(disable=True)
+
+            # Build tool config
+            if tool_config:
+                mode = tool_config.get("mode", "AUTO")
+                gen_config.tool_config = types.ToolConfig(
+                    function_calling_config=types.FunctionCallingConfig(mode=mode)
+                )
+
+        # Apply thinking config if provided (convert dict to types.ThinkingConfig)
+        thinking = config.get("thinking")
+        if thinking:
+            if isinstance(thinking, dict):
+                gen_config.thinking_config = types.ThinkingConfig(**thinking)
+            else:
+                gen_config.thinking_config = thinking
+
+        # Structured output: force JSON with schema validation (V23)
+        # Note: structured output + tool calling may conflict on some models.
+        # Only enable when explicitly requested via config.
+        if config.get("response_mime_type"):
+            gen_config.response_mime_type = config["response_mime_type"]
+        if config.get("response_schema"):
+            gen_config.response_schema = config["response_schema"]
+
+        return gen_config
+
     # ------------------------------------------------------------------
     # Retry logic (preserved from orchestrator)
     # ------------------------------------------------------------------
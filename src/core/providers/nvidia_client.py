@@ -24,10 +24,12 @@ import json
 import logging
 import os
 import time
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
-from providers.base import ProviderClient, GenerateResult, ToolCall, ModelInfo, ProviderAuthError, _is_auth_error
+from providers.base import ProviderClient, GenerateResult, ToolCall, ModelInfo, ProviderAuthError, StreamDelta, _is_auth_error
 from providers.tool_schema import NormalizedToolDeclaration, to_openai_tools
+from providers.prompt_caching import extract_openai_cache_usage
+from providers.streaming import STREAM_OPTIONS, iter_openai_stream
 
 logger = logging.getLogger(__name__)
 
@@ -140,21 +142,9 @@ class NvidiaProviderClient(ProviderClient):
         tool_config: Optional[dict] = None,
         config: Optional[dict] = None,
     ) -> GenerateResult:
-        if tools and isinstance(tools[0], NormalizedToolDeclaration):
-            openai_tools = to_openai_tools(tools)
-        else:
-            openai_tools = tools
-
+        openai_tools, kwargs = self._tool_request(tools, tool_config)
         api_messages = self._prepend_system(system_instruction, messages)
 
-        kwargs = {}
-        if tool_config:
-            mode = tool_config.get("mode", "AUTO")
-            if mode == "ANY":
-                kwargs["tool_choice"] = "required"
-            elif mode == "NONE":
-                kwargs["tool_choice"] = "none"
-
         response = self._call_with_retry(
             lambda: self._client.chat.completions.create(
                 model=model,
@@ -166,6 +156,35 @@ class NvidiaProviderClient(ProviderClient):
 
         return self._parse_response(response)
 
+    # ------------------------------------------------------------------
+    # Streaming
+    # ------------------------------------------------------------------
+
+    def stream(
+        self,
+        model: str,
+        messages: list,
+        system_instruction: str = "",
+        tools: Optional[list] = None,
+        tool_config: Optional[dict] = None,
+        config: Optional[dict] = None,
+    ) -> Iterator[StreamDelta]:
+        api_messages = self._prepend_system(system_instruction, messages)
+        kwargs = dict(STREAM_OPTIONS)
+        if tools:
+            openai_tools, tool_kwargs = self._tool_request(tools, tool_config)
+            kwargs.update(tool_kwargs, tools=openai_tools)
+
+        chunks = self._call_with_retry(
+            lambda: self._client.chat.completions.create(
+                model=model,
+                messages=api_messages,
+                stream=True,
+                **kwargs,
+            )
+        )
+        yield from iter_openai_stream(chunks)
+
     # ------------------------------------------------------------------
     # Message builders
     # ------------------------------------------------------------------
@@ -250,6 +269,23 @@ class NvidiaProviderClient(ProviderClient):
         result.extend(messages)
         return result
 
+    @staticmethod
+    def _tool_request(tools: list, tool_config: Optional[dict]) -> tuple[list, dict]:
+        """Convert tool declarations and map tool_config to request kwargs."""
+        if tools and isinstance(tools[0], NormalizedToolDeclaration):
+            openai_tools = to_openai_tools(tools)
+        else:
+            openai_tools = tools
+
+        kwargs = {}
+        if tool_config:
+            mode = tool_config.get("mode", "AUTO")
+            if mode == "ANY":
+                kwargs["tool_choice"] = "required"
+            elif mode == "NONE":
+                kwargs["tool_choice"] = "none"
+        return openai_tools, kwargs
+
     @staticmethod
     def _is_retryable_error(exc: Exception) -> bool:
         err_str = str(exc).lower()
@@ -303,6 +339,7 @@ class NvidiaProviderClient(ProviderClient):
         if response.usage:
             usage["input_tokens"] = response.usage.prompt_tokens or 0
             usage["output_tokens"] = response.usage.completion_tokens or 0
+            usage.update(extract_openai_cache_usage(response.usage))
 
         raw = message
 
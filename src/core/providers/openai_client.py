@@ -11,10 +11,12 @@ Public API:
 import json
 import logging
 import time
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
-from providers.base import ProviderClient, GenerateResult, ToolCall, ModelInfo, ProviderAuthError, _is_auth_error
+from providers.base import ProviderClient, GenerateResult, ToolCall, ModelInfo, ProviderAuthError, StreamDelta, _is_auth_error
 from providers.tool_schema import NormalizedToolDeclaration, to_openai_tools
+from providers.prompt_caching import extract_openai_cache_usage, openai_prefix_cache_key
+from providers.streaming import STREAM_OPTIONS, iter_openai_stream
 
 logger = logging.getLogger(__name__)
 
@@ -72,24 +74,9 @@ class OpenAIProviderClient(ProviderClient):
         tool_config: Optional[dict] = None,
         config: Optional[dict] = None,
     ) -> GenerateResult:
-        # Convert normalized declarations to OpenAI format
-        if tools and isinstance(tools[0], NormalizedToolDeclaration):
-            openai_tools = to_openai_tools(tools)
-        else:
-            openai_tools = tools
-
+        openai_tools, kwargs = self._tool_request(system_instruction, tools, tool_config)
         api_messages = self._prepend_system(system_instruction, messages)
 
-        # Map tool_config mode
-        kwargs = {}
-        if tool_config:
-            mode = tool_config.get("mode", "AUTO")
-            if mode == "ANY":
-                kwargs["tool_choice"] = "required"
-            elif mode == "NONE":
-                kwargs["tool_choice"] = "none"
-            # AUTO is the default, no need to set
-
         response = self._call_with_retry(
             lambda: self._client.chat.completions.create(
                 model=model,
@@ -101,6 +88,35 @@ class OpenAIProviderClient(ProviderClient):
 
         return self._parse_response(response)
 
+    # ------------------------------------------------------------------
+    # Streaming
+    # ------------------------------------------------------------------
+
+    def stream(
+        self,
+        model: str,
+        messages: list,
+        system_instruction: str = "",
+        tools: Optional[list] = None,
+        tool_config: Optional[dict] = None,
+        config: Optional[dict] = None,
+    ) -> Iterator[StreamDelta]:
+        api_messages = self._prepend_system(system_instruction, messages)
+        kwargs = dict(STREAM_OPTIONS)
+        if tools:
+            openai_tools, tool_kwargs = self._tool_request(system_instruction, tools, tool_config)
+            kwargs.update(tool_kwargs, tools=openai_tools)
+
+        chunks = self._call_with_retry(
+            lambda: self._client.chat.completions.create(
+                model=model,
+                messages=api_messages,
+                stream=True,
+                **kwargs,
+            )
+        )
+        yield from iter_openai_stream(chunks)
+
     # ------------------------------------------------------------------
     # Message builders
     # ------------------------------------------------------------------
@@ -183,13 +199,42 @@ class OpenAIProviderClient(ProviderClient):
 
     @staticmethod
     def _prepend_system(system_instruction: str, messages: list) -> list:
-        """Prepend system message to the message list."""
+        """Prepend system message to the message list.
+
+        The system message always comes first and is never rewritten, so
+        the request prefix stays byte-identical for automatic prompt caching.
+        """
         result = []
         if system_instruction:
             result.append({"role": "system", "content": system_instruction})
         result.extend(messages)
         return result
 
+    @staticmethod
+    def _tool_request(system_instruction: str, tools: list, tool_config: Optional[dict]) -> tuple[list, dict]:
+        """Convert tool declarations and map tool_config to request kwargs."""
+        # Convert normalized declarations to OpenAI format
+        if tools and isinstance(tools[0], NormalizedToolDeclaration):
+            openai_tools = to_openai_tools(tools)
+        else:
+            openai_tools = tools
+
+        # Map tool_config mode
+        kwargs = {}
+        # Prompt-prefix caching is automatic; a stable key routes requests
+        # sharing the same system prompt + tools to the same warm cache.
+        cache_key = openai_prefix_cache_key(system_instruction, openai_tools)
+        if cache_key:
+            kwargs["extra_body"] = {"prompt_cache_key": cache_key}
+        if tool_config:
+            mode = tool_config.get("mode", "AUTO")
+            if mode == "ANY":
+                kwargs["tool_choice"] = "required"
+            elif mode == "NONE":
+                kwargs["tool_choice"] = "none"
+            # AUTO is the default, no need to set
+        return openai_tools, kwargs
+
     @staticmethod
     def _is_retryable_error(exc: Exception) -> bool:
         err_str = str(exc).lower()
@@ -244,6 +289,7 @@ class OpenAIProviderClient(ProviderClient):
         if response.usage:
             usage["input_tokens"] = response.usage.prompt_tokens or 0
             usage["output_tokens"] = response.usage.completion_tokens or 0
+            usage.update(extract_openai_cache_usage(response.usage))
 
         # raw = the assistant message dict for conversation continuity
         raw = message
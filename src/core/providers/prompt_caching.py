@@ -0,0 +1,166 @@
+"""
+Prompt-prefix caching helpers for provider clients.
+
+Gemini uses explicit cached-content objects (see
+``LancelotOrchestrator._init_context_cache``). Anthropic and OpenAI cache
+request *prefixes* instead, and each needs a different nudge:
+
+    Anthropic — explicit ``cache_control`` breakpoints. The cache prefix is
+                tools → system → messages, so one breakpoint at the end of
+                the system prompt covers tools + system, and one on the
+                newest message lets later agentic iterations reuse the
+                earlier conversation.
+    OpenAI    — automatic for prompts ≥ 1024 tokens; hits need a
+                byte-identical prefix. The system message must come first
+                and stay stable, and a ``prompt_cache_key`` derived from the
+                stable prefix improves routing to a warm cache.
+
+Both report cached token counts in their usage blocks; ``extract_*``
+normalize them into ``GenerateResult.usage`` as ``cache_read_tokens``,
+``cache_write_tokens`` and ``prompt_tokens_total`` so
+``UsageTracker.record_prompt_cache`` can report hit ratios.
+
+Environment variables:
+    LANCELOT_PROMPT_CACHE — "true" (default) / "false" kill switch
+
+Public API:
+    prompt_caching_enabled()                          → bool
+    anthropic_cache_request(system, tools, messages)  → (system, tools, messages)
+    openai_prefix_cache_key(system, tools)            → str | None
+    extract_anthropic_cache_usage(usage)              → dict
+    extract_openai_cache_usage(usage)                 → dict
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Optional
+
+# Below this size the prefix is under the providers' minimum cacheable
+# length (1024 tokens ≈ 4096 chars) and breakpoints would just add noise.
+MIN_CACHEABLE_CHARS = 4096
+
+_EPHEMERAL = {"type": "ephemeral"}
+
+
+def prompt_caching_enabled() -> bool:
+    return os.getenv("LANCELOT_PROMPT_CACHE", "true").lower() not in ("false", "0", "no")
+
+
+def _as_int(value: Any) -> int:
+    """Coerce SDK usage fields (may be None or missing) to int."""
+    return value if isinstance(value, int) else 0
+
+
+# ---------------------------------------------------------------------------
+# Anthropic
+# ---------------------------------------------------------------------------
+
+def _with_breakpoint_on_last_block(message: dict) -> dict:
+    """Copy ``message`` with cache_control on its final content block.
+
+    The caller's message is never mutated — the agentic loop reuses its
+    message list across iterations and Anthropic rejects more than four
+    breakpoints per request.
+    """
+    content = message.get("content")
+    if isinstance(content, str):
+        if not content:
+            return message
+        blocks = [{"type": "text", "text": content, "cache_control": _EPHEMERAL}]
+    elif isinstance(content, list) and content:
+        last = content[-1]
+        if not isinstance(last, dict) or last.get("type") in ("thinking", "redacted_thinking"):
+            return message
+        blocks = list(content[:-1]) + [{**last, "cache_control": _EPHEMERAL}]
+    else:
+        return message
+    return {**message, "content": blocks}
+
+
+def anthropic_cache_request(
+    system_instruction: str,
+    tools: Optional[list],
+    messages: list,
+) -> tuple:
+    """Return ``(system, tools, messages)`` with Anthropic cache breakpoints.
+
+    ``system`` becomes a list of text blocks when a breakpoint is added,
+    otherwise the original string is returned unchanged.
+    """
+    if not prompt_caching_enabled():
+        return system_instruction, tools, messages
+
+    prefix_chars = len(system_instruction or "")
+    if tools:
+        prefix_chars += sum(len(json.dumps(t, default=str)) for t in tools if isinstance(t, dict))
+    if prefix_chars < MIN_CACHEABLE_CHARS:
+        return system_instruction, tools, messages
+
+    system = system_instruction
+    if system_instruction:
+        system = [{"type": "text", "text": system_instruction, "cache_control": _EPHEMERAL}]
+    elif tools and isinstance(tools[-1], dict):
+        # No system prompt — put the prefix breakpoint on the last tool instead
+        tools = list(tools[:-1]) + [{**tools[-1], "cache_control": _EPHEMERAL}]
+
+    if messages and isinstance(messages[-1], dict):
+        messages = list(messages[:-1]) + [_with_breakpoint_on_last_block(messages[-1])]
+
+    return system, tools, messages
+
+
+def extract_anthropic_cache_usage(usage: Any) -> dict:
+    """cache_read_input_tokens / cache_creation_input_tokens → normalized dict.
+
+    Anthropic's ``input_tokens`` excludes cached and cache-written tokens,
+    so ``prompt_tokens_total`` adds them back for a comparable hit ratio.
+    """
+    if usage is None:
+        return {"cache_read_tokens": 0, "cache_write_tokens": 0, "prompt_tokens_total": 0}
+    read = _as_int(getattr(usage, "cache_read_input_tokens", 0))
+    write = _as_int(getattr(usage, "cache_creation_input_tokens", 0))
+    return {
+        "cache_read_tokens": read,
+        "cache_write_tokens": write,
+        "prompt_tokens_total": _as_int(getattr(usage, "input_tokens", 0)) + read + write,
+    }
+
+
+# ---------------------------------------------------------------------------
+# OpenAI (and OpenAI-compatible)
+# ---------------------------------------------------------------------------
+
+def openai_prefix_cache_key(system_instruction: str, tools: Optional[list]) -> Optional[str]:
+    """Stable routing key for OpenAI's automatic prefix cache.
+
+    Requests that share the same system prompt + tool set get the same key,
+    so they land on the same cache shard. Returns None when caching is
+    disabled or the prefix is too small to be cached.
+    """
+    if not prompt_caching_enabled():
+        return None
+    tools_blob = json.dumps(tools or [], sort_keys=True, default=str)
+    if len(system_instruction or "") + len(tools_blob) < MIN_CACHEABLE_CHARS:
+        return None
+    digest = hashlib.sha256()
+    digest.update((system_instruction or "").encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(tools_blob.encode("utf-8"))
+    return f"lancelot-{digest.hexdigest()[:32]}"
+
+
+def extract_openai_cache_usage(usage: Any) -> dict:
+    """usage.prompt_tokens_details.cached_tokens → normalized dict.
+
+    OpenAI does not bill cache writes separately, so writes are always 0,
+    and ``prompt_tokens`` already includes the cached tokens.
+    """
+    if usage is None:
+        return {"cache_read_tokens": 0, "cache_write_tokens": 0, "prompt_tokens_total": 0}
+    details = getattr(usage, "prompt_tokens_details", None)
+    return {
+        "cache_read_tokens": _as_int(getattr(details, "cached_tokens", 0)) if details is not None else 0,
+        "cache_write_tokens": 0,
+        "prompt_tokens_total": _as_int(getattr(usage, "prompt_tokens", 0)),
+    }
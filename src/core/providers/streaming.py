@@ -0,0 +1,113 @@
+"""
+Streaming helpers for OpenAI-compatible chat completions.
+
+OpenAI, xAI and NVIDIA all speak the same ``chat.completions`` chunk
+protocol when called with ``stream=True``: each chunk carries a
+``choices[0].delta`` with a text fragment and/or tool-call fragments keyed
+by ``index``, and (with ``stream_options={"include_usage": True}``) a final
+chunk with an empty ``choices`` list and the usage block.
+
+``iter_openai_stream`` turns that chunk sequence into ``StreamDelta``s and
+assembles the final ``GenerateResult`` itself. The assembled ``raw`` is a
+plain assistant-message dict, which the SDK accepts back in ``messages``
+exactly like the ``ChatCompletionMessage`` a non-streamed call returns.
+
+Chunks may be SDK objects or plain dicts (the local llama.cpp client
+parses SSE lines into dicts), so field access goes through ``_get``.
+
+Public API:
+    STREAM_OPTIONS                       → kwargs to request a usage chunk
+    iter_openai_stream(chunks)           → Iterator[StreamDelta]
+"""
+
+import json
+from typing import Any, Iterable, Iterator
+
+from providers.base import GenerateResult, StreamDelta, ToolCall
+from providers.prompt_caching import extract_openai_cache_usage
+
+STREAM_OPTIONS = {"stream_options": {"include_usage": True}}
+
+
+def _get(obj: Any, name: str, default: Any = None) -> Any:
+    if obj is None:
+        return default
+    if isinstance(obj, dict):
+        return obj.get(name, default)
+    return getattr(obj, name, default)
+
+
+def _parse_args(arguments: str) -> dict:
+    if not arguments:
+        return {}
+    try:
+        args = json.loads(arguments)
+    except json.JSONDecodeError:
+        return {"raw": arguments}
+    return args if isinstance(args, dict) else {"raw": arguments}
+
+
+def iter_openai_stream(chunks: Iterable[Any]) -> Iterator[StreamDelta]:
+    """Convert OpenAI-style stream chunks into deltas plus a final result."""
+    text_parts: list[str] = []
+    calls: dict[int, dict] = {}
+    usage = {"input_tokens": 0, "output_tokens": 0}
+
+    for chunk in chunks:
+        chunk_usage = _get(chunk, "usage")
+        if chunk_usage:
+            usage["input_tokens"] = _get(chunk_usage, "prompt_tokens", 0) or 0
+            usage["output_tokens"] = _get(chunk_usage, "completion_tokens", 0) or 0
+            usage.update(extract_openai_cache_usage(chunk_usage))
+
+        choices = _get(chunk, "choices") or []
+        if not choices:
+            continue
+        delta = _get(choices[0], "delta")
+        if delta is None:
+            continue
+
+        content = _get(delta, "content")
+        if content:
+            text_parts.append(content)
+            yield StreamDelta(kind="text", text=content)
+
+        for tc in _get(delta, "tool_calls") or []:
+            index = _get(tc, "index", 0) or 0
+            fn = _get(tc, "function")
+            call = calls.setdefault(index, {"id": "", "name": "", "arguments": ""})
+            call_id = _get(tc, "id") or ""
+            name = _get(fn, "name") or ""
+            fragment = _get(fn, "arguments") or ""
+            call["id"] = call["id"] or call_id
+            call["name"] += name
+            call["arguments"] += fragment
+            yield StreamDelta(
+                kind="tool_call",
+                index=index,
+                tool_call_id=call_id,
+                tool_name=name,
+                args_fragment=fragment,
+            )
+
+    text = "".join(text_parts) or None
+    tool_calls = [
+        ToolCall(name=c["name"], args=_parse_args(c["arguments"]), id=c["id"])
+        for _, c in sorted(calls.items())
+    ]
+
+    raw: dict = {"role": "assistant", "content": text}
+    if tool_calls:
+        raw["tool_calls"] = [
+            {
+                "id": tc.id,
+                "type": "function",
+                "function": {"name": tc.name, "arguments": calls[i]["arguments"] or "{}"},
+            }
+            for i, tc in zip(sorted(calls), tool_calls)
+        ]
+
+    yield StreamDelta(
+        kind="done",
+        result=GenerateResult(text=text, tool_calls=tool_calls, raw=raw, usage=usage),
+    )
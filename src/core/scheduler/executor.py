@@ -2,13 +2,16 @@
 Job Executor — execution pipeline with gating, receipts, and cron tick loop.
 
 Executes scheduled jobs through a gating pipeline before invoking the
-skill executor.  The tick loop evaluates cron/interval triggers every 60 s.
+skill executor.  The tick loop keeps each job's next fire time in a
+min-heap, sleeps until the earliest one and hands due jobs to a bounded
+worker pool.
 
 Public API:
-    JobExecutor(scheduler_service, skill_executor, gates)
+    JobExecutor(scheduler_service, skill_executor, gates, max_concurrent_jobs)
     execute_job(job_id) → JobExecutionResult
     start_tick_loop()   → starts background thread
     stop()              → stops background thread
+    next_fire_times     → dict[job_id, datetime]
     receipts            → list[dict]
 """
 
@@ -17,15 +20,25 @@ from __future__ import annotations
 import logging
 import threading
 import time
+import heapq
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import date, datetime, time as dt_time, timedelta, timezone, tzinfo
+from functools import lru_cache
 from zoneinfo import ZoneInfo
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
 
 from src.core.scheduler.service import SchedulerService
 
 logger = logging.getLogger(__name__)
 
+# Longest the tick loop sleeps; bounds the effect of wall-clock jumps
+_MAX_SLEEP_S = 60.0
+
+# Full re-read of the job table, for edits made without the service
+# (another process, direct SQL)
+_RESYNC_INTERVAL_S = 300.0
+
 # Optional: import event_bus for War Room notifications
 try:
     from event_bus import event_bus, Event
@@ -67,43 +80,178 @@ class JobExecutionResult:
 # Cron matching (no external dependency)
 # ---------------------------------------------------------------------------
 
+# (low, high) bounds for minute, hour, day-of-month, month, day-of-week
+_CRON_BOUNDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 6))
+
+# How far ahead to look for a cron match before giving up (e.g. "0 0 31 2 *")
+_CRON_SEARCH_DAYS = 366 * 5
+
+
+def _parse_cron_field(pattern: str, low: int, high: int) -> FrozenSet[int]:
+    """Expand one cron field into the set of values it matches.
+
+    Supports '*', single values, 'a-b' ranges and ','-separated lists of
+    either. Raises ValueError on anything else.
+    """
+    if pattern == "*":
+        return frozenset(range(low, high + 1))
+    values = set()
+    for part in pattern.split(","):
+        if "-" in part:
+            lo, hi = part.split("-", 1)
+            values.update(range(int(lo), int(hi) + 1))
+        else:
+            values.add(int(part))
+    return frozenset(values)
+
+
+@lru_cache(maxsize=256)
+def _parse_cron(expression: str) -> Optional[Tuple[FrozenSet[int], ...]]:
+    """Parse a 5-field cron expression, or None if it is malformed."""
+    fields = expression.strip().split()
+    if len(fields) != 5:
+        return None
+    try:
+        return tuple(
+            _parse_cron_field(pattern, low, high)
+            for pattern, (low, high) in zip(fields, _CRON_BOUNDS)
+        )
+    except ValueError:
+        return None
+
+
+def _cron_day_matches(spec: Tuple[FrozenSet[int], ...], day: date) -> bool:
+    # Python weekday: 0=Mon..6=Sun → cron: 0=Sun..6=Sat
+    cron_dow = (day.weekday() + 1) % 7
+    return day.day in spec[2] and day.month in spec[3] and cron_dow in spec[4]
+
+
 def _cron_matches(expression: str, now: datetime) -> bool:
     """Check if a 5-field cron expression matches the current time.
 
     Supports: specific values, '*' (any), ',' (list), '-' (range).
     Day-of-week: 0=Sunday (cron convention).
     """
-    fields = expression.strip().split()
-    if len(fields) != 5:
+    spec = _parse_cron(expression)
+    if spec is None:
         return False
+    return (
+        now.minute in spec[0]
+        and now.hour in spec[1]
+        and _cron_day_matches(spec, now.date())
+    )
 
-    # Python weekday: 0=Mon..6=Sun → cron: 0=Sun..6=Sat
-    cron_dow = (now.weekday() + 1) % 7
-
-    checks = [
-        (fields[0], now.minute),
-        (fields[1], now.hour),
-        (fields[2], now.day),
-        (fields[3], now.month),
-        (fields[4], cron_dow),
-    ]
-    for pattern, value in checks:
-        if pattern == "*":
-            continue
-        if "," in pattern:
-            if value not in [int(v) for v in pattern.split(",")]:
-                return False
-        elif "-" in pattern:
-            lo, hi = pattern.split("-", 1)
-            if not (int(lo) <= value <= int(hi)):
-                return False
-        else:
-            try:
-                if int(pattern) != value:
-                    return False
-            except ValueError:
-                return False
-    return True
+
+def _next_cron_fire(expression: str, start: datetime, tz: tzinfo) -> Optional[datetime]:
+    """Earliest minute at or after ``start`` matching the expression in ``tz``.
+
+    Walks matching days rather than minutes, so the cost is bounded by the
+    number of days until the next match. Local times skipped by a DST
+    transition never fire, as with a minute-by-minute check.
+
+    Returns:
+        Aware UTC datetime, or None if the expression is malformed or
+        never matches.
+    """
+    spec = _parse_cron(expression)
+    if spec is None:
+        return None
+    minutes, hours = sorted(spec[0]), sorted(spec[1])
+
+    local = start.astimezone(tz)
+    if local.second or local.microsecond:
+        local += timedelta(minutes=1)
+    local = local.replace(second=0, microsecond=0, tzinfo=None)
+
+    day = local.date()
+    for _ in range(_CRON_SEARCH_DAYS):
+        if _cron_day_matches(spec, day):
+            floor = (local.hour, local.minute) if day == local.date() else (0, 0)
+            for hour in hours:
+                if hour < floor[0]:
+                    continue
+                for minute in minutes:
+                    if (hour, minute) < floor:
+                        continue
+                    wall = datetime.combine(day, dt_time(hour, minute))
+                    fire = wall.replace(tzinfo=tz).astimezone(timezone.utc)
+                    # Nonexistent wall time (spring-forward gap)
+                    if fire.astimezone(tz).replace(tzinfo=None) != wall:
+                        continue
+                    return fire
+        day += timedelta(days=1)
+    return None
+
+
+def _job_timezone(job: Any) -> tzinfo:
+    """The zone a job's cron expression is evaluated in."""
+    if job.timezone and job.timezone != "UTC":
+        return ZoneInfo(job.timezone)
+    return timezone.utc
+
+
+def _parse_last_run(job: Any) -> Optional[datetime]:
+    if not job.last_run_at:
+        return None
+    try:
+        last = datetime.fromisoformat(job.last_run_at)
+    except (ValueError, TypeError):
+        return None
+    return last if last.tzinfo else last.replace(tzinfo=timezone.utc)
+
+
+def _next_fire_time(job: Any, now: datetime) -> Optional[datetime]:
+    """When a job should next fire, at or after ``now``.
+
+    Cron jobs fire at their next matching minute, skipping the minute of
+    their last run. Interval jobs fire ``interval`` seconds after their
+    last run, or immediately if that has passed or they never ran.
+
+    Returns:
+        Aware UTC datetime, or None if the job should not be scheduled.
+    """
+    if not job.enabled or not job.skill or not job.trigger_value:
+        return None
+
+    if job.trigger_type == "cron":
+        try:
+            tz = _job_timezone(job)
+        except (KeyError, ValueError) as exc:
+            logger.warning("Job '%s' has invalid timezone %r: %s", job.id, job.timezone, exc)
+            return None
+        start = now.replace(second=0, microsecond=0)
+        last = _parse_last_run(job)
+        if last is not None and last >= start:
+            # Prevent double-fire within the same minute
+            start = last.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        return _next_cron_fire(job.trigger_value, start, tz)
+
+    if job.trigger_type == "interval":
+        try:
+            interval_s = int(job.trigger_value)
+        except ValueError:
+            return None
+        last = _parse_last_run(job)
+        if last is None:
+            return now  # Never run before
+        return max(last + timedelta(seconds=interval_s), now)
+
+    return None
+
+
+def _refire_step(job: Any) -> timedelta:
+    """Minimum gap before a job that just fired may fire again.
+
+    A successful run reports back through SchedulerService.run_now and
+    reschedules the job from its new last_run_at; this step covers skipped
+    or failed runs, which retry after at most a minute.
+    """
+    if job.trigger_type == "interval":
+        try:
+            return timedelta(seconds=min(int(job.trigger_value), int(_MAX_SLEEP_S)))
+        except ValueError:
+            pass
+    return timedelta(minutes=1)
 
 
 # ---------------------------------------------------------------------------
@@ -118,6 +266,7 @@ class JobExecutor:
         scheduler_service: SchedulerService,
         skill_execute_fn: Optional[Callable[[str, Dict[str, Any]], Any]] = None,
         gates: Optional[List[Gate]] = None,
+        max_concurrent_jobs: int = 5,
     ):
         self._scheduler = scheduler_service
         self._skill_execute_fn = skill_execute_fn
@@ -125,12 +274,24 @@ class JobExecutor:
         self._receipts: List[Dict[str, Any]] = []
         self._tick_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
+        # Schedule: heap of (fire_at, seq, job_id); an entry is live only
+        # while _next_fire[job_id] still holds its seq
+        self._max_workers = max(1, max_concurrent_jobs)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._heap: List[Tuple[datetime, int, str]] = []
+        self._next_fire: Dict[str, Tuple[datetime, int]] = {}
+        self._seq = 0
+        self._inflight: Set[str] = set()
+        self._schedule_cond = threading.Condition()
+        self._last_resync = 0.0
         self._job_locks: Dict[str, threading.Lock] = {}
         self._job_locks_guard = threading.Lock()
         # F-008: Pending approval tracking
         self._pending_approvals: Dict[str, Dict[str, Any]] = {}
         self._granted_approvals: Dict[str, str] = {}  # job_id -> ISO timestamp
 
+        scheduler_service.add_change_listener(self._on_job_changed)
+
     @property
     def receipts(self) -> List[Dict[str, Any]]:
         return list(self._receipts)
@@ -146,99 +307,168 @@ class JobExecutor:
         return receipt
 
     # ------------------------------------------------------------------
-    # Tick loop — evaluates cron/interval triggers every 60 seconds
+    # Tick loop — sleeps until the earliest next-fire time
     # ------------------------------------------------------------------
 
+    @property
+    def next_fire_times(self) -> Dict[str, datetime]:
+        """Next scheduled fire time (UTC) of every schedulable job."""
+        with self._schedule_cond:
+            return {job_id: fire_at for job_id, (fire_at, _) in self._next_fire.items()}
+
     def start_tick_loop(self) -> None:
         """Start the background scheduler tick loop."""
         if self._tick_thread and self._tick_thread.is_alive():
             logger.warning("Tick loop already running")
             return
         self._stop_event.clear()
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="scheduler-job",
+            )
+        self._resync()
         self._tick_thread = threading.Thread(
             target=self._tick_loop, daemon=True, name="scheduler-tick"
         )
         self._tick_thread.start()
-        logger.info("Scheduler tick loop started (60s interval)")
+        logger.info(
+            "Scheduler tick loop started (%d job workers)", self._max_workers,
+        )
 
     def stop(self) -> None:
-        """Stop the tick loop."""
+        """Stop the tick loop and wait briefly for running jobs."""
         self._stop_event.set()
+        with self._schedule_cond:
+            self._schedule_cond.notify_all()
         if self._tick_thread:
             self._tick_thread.join(timeout=5)
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
         logger.info("Scheduler tick loop stopped")
 
     def _tick_loop(self) -> None:
-        """Background loop that checks jobs every 60 seconds."""
+        """Background loop: sleep until the next deadline, then dispatch."""
         while not self._stop_event.is_set():
+            with self._schedule_cond:
+                delay = _MAX_SLEEP_S
+                if self._heap:
+                    until = (self._heap[0][0] - datetime.now(timezone.utc)).total_seconds()
+                    delay = min(max(until, 0.0), _MAX_SLEEP_S)
+                if delay > 0:
+                    # Woken early by stop() or a schedule change
+                    self._schedule_cond.wait(timeout=delay)
+            if self._stop_event.is_set():
+                return
             try:
+                if time.monotonic() - self._last_resync >= _RESYNC_INTERVAL_S:
+                    self._resync()
                 self._tick()
             except Exception:
                 logger.exception("Scheduler tick error")
-            # Sleep in small increments so stop() is responsive
-            for _ in range(60):
-                if self._stop_event.is_set():
-                    return
-                time.sleep(1)
 
     def _tick(self) -> None:
-        """Single tick — evaluate all jobs."""
-        now_utc = datetime.now(timezone.utc)
-        jobs = self._scheduler.list_jobs()
-        fired = 0
+        """Single tick — dispatch every job whose fire time has passed."""
+        now = datetime.now(timezone.utc)
+        due: List[Tuple[datetime, str]] = []
+        with self._schedule_cond:
+            while self._heap and self._heap[0][0] <= now:
+                fire_at, seq, job_id = heapq.heappop(self._heap)
+                current = self._next_fire.get(job_id)
+                if current is None or current[1] != seq:
+                    continue  # Superseded by a later reschedule
+                del self._next_fire[job_id]
+                due.append((fire_at, job_id))
 
-        for job in jobs:
-            if not job.enabled or not job.skill:
+        fired = 0
+        for fire_at, job_id in due:
+            job = self._scheduler.get_job(job_id)
+            if job is None:
                 continue
+            # Book the following occurrence before running this one
+            self._schedule(job, after=max(now, fire_at + _refire_step(job)))
 
-            should_run = False
-
-            if job.trigger_type == "cron" and job.trigger_value:
-                # Convert UTC to the job's timezone for cron evaluation
-                job_tz = ZoneInfo(job.timezone) if job.timezone and job.timezone != "UTC" else timezone.utc
-                now_local = now_utc.astimezone(job_tz)
-                if _cron_matches(job.trigger_value, now_local):
-                    # Prevent double-fire within the same minute
-                    if job.last_run_at:
-                        try:
-                            last = datetime.fromisoformat(job.last_run_at)
-                            last_local = last.astimezone(job_tz) if last.tzinfo else last
-                            if (
-                                last_local.year == now_local.year
-                                and last_local.month == now_local.month
-                                and last_local.day == now_local.day
-                                and last_local.hour == now_local.hour
-                                and last_local.minute == now_local.minute
-                            ):
-                                continue  # Already ran this minute
-                        except (ValueError, TypeError):
-                            pass
-                    should_run = True
-
-            elif job.trigger_type == "interval" and job.trigger_value:
-                try:
-                    interval_s = int(job.trigger_value)
-                except ValueError:
+            with self._schedule_cond:
+                if job_id in self._inflight:
+                    logger.info("Job '%s' still running, skipping this fire", job_id)
                     continue
-                if job.last_run_at:
-                    try:
-                        last = datetime.fromisoformat(job.last_run_at)
-                        elapsed = (now_utc - last).total_seconds()
-                        if elapsed >= interval_s:
-                            should_run = True
-                    except (ValueError, TypeError):
-                        should_run = True
-                else:
-                    should_run = True  # Never run before
-
-            if should_run:
-                logger.info("Scheduler tick: firing job '%s' (skill=%s)", job.id, job.skill)
-                self.execute_job(job.id)
-                fired += 1
+                self._inflight.add(job_id)
+            logger.info("Scheduler tick: firing job '%s' (skill=%s)", job.id, job.skill)
+            self._dispatch(job_id)
+            fired += 1
 
         if fired:
             logger.info("Scheduler tick: fired %d job(s)", fired)
 
+    def _dispatch(self, job_id: str) -> None:
+        """Run a job on the worker pool (inline if the loop is not running)."""
+        def run() -> None:
+            try:
+                self.execute_job(job_id)
+            except Exception:
+                logger.exception("Scheduled job '%s' crashed", job_id)
+            finally:
+                with self._schedule_cond:
+                    self._inflight.discard(job_id)
+
+        pool = self._pool
+        if pool is None:
+            run()
+            return
+        try:
+            pool.submit(run)
+        except RuntimeError:  # Pool shut down by stop()
+            with self._schedule_cond:
+                self._inflight.discard(job_id)
+
+    # ------------------------------------------------------------------
+    # Schedule maintenance
+    # ------------------------------------------------------------------
+
+    def _schedule(self, job: Any, after: Optional[datetime] = None) -> None:
+        """Recompute one job's heap entry (dropping it if unschedulable)."""
+        now = after or datetime.now(timezone.utc)
+        fire_at = _next_fire_time(job, now)
+        with self._schedule_cond:
+            if fire_at is None:
+                self._next_fire.pop(job.id, None)
+                return
+            self._seq += 1
+            self._next_fire[job.id] = (fire_at, self._seq)
+            heapq.heappush(self._heap, (fire_at, self._seq, job.id))
+            if self._heap[0][2] == job.id:
+                self._schedule_cond.notify_all()
+
+    def _resync(self) -> None:
+        """Rebuild the whole schedule from the job table."""
+        now = datetime.now(timezone.utc)
+        jobs = self._scheduler.list_jobs()
+        entries: Dict[str, Tuple[datetime, int]] = {}
+        with self._schedule_cond:
+            for job in jobs:
+                fire_at = _next_fire_time(job, now)
+                if fire_at is not None:
+                    self._seq += 1
+                    entries[job.id] = (fire_at, self._seq)
+            self._next_fire = entries
+            self._heap = [(fire_at, seq, job_id) for job_id, (fire_at, seq) in entries.items()]
+            heapq.heapify(self._heap)
+            self._schedule_cond.notify_all()
+        self._last_resync = time.monotonic()
+
+    def _on_job_changed(self, event: str, job_id: str) -> None:
+        """SchedulerService listener: recompute only the affected job."""
+        if event == "deleted":
+            with self._schedule_cond:
+                self._next_fire.pop(job_id, None)
+            return
+        job = self._scheduler.get_job(job_id)
+        if job is None:
+            with self._schedule_cond:
+                self._next_fire.pop(job_id, None)
+            return
+        self._schedule(job)
+
     # ------------------------------------------------------------------
     # Job execution
     # ------------------------------------------------------------------
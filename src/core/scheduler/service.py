@@ -10,6 +10,7 @@ Public API:
     run_now(job_id)   → JobRecord
     enable_job(job_id)  → None
     disable_job(job_id) → None
+    add_change_listener(callback)
     last_scheduler_tick_at → str | None
 """
 
@@ -20,7 +21,7 @@ import logging
 import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -75,6 +76,7 @@ class SchedulerService:
         self._db_path = self._data_dir / _DB_FILE
         self._config_dir = config_dir
         self._last_tick: Optional[str] = None
+        self._listeners: List[Callable[[str, str], None]] = []
 
         self._init_db()
 
@@ -82,6 +84,21 @@ class SchedulerService:
     def last_scheduler_tick_at(self) -> Optional[str]:
         return self._last_tick
 
+    def add_change_listener(self, callback: Callable[[str, str], None]) -> None:
+        """Register ``callback(event, job_id)`` to run after each job mutation.
+
+        Events: registered, created, enabled, disabled, run,
+        timezone_updated, deleted.
+        """
+        self._listeners.append(callback)
+
+    def _notify(self, event: str, job_id: str) -> None:
+        for callback in list(self._listeners):
+            try:
+                callback(event, job_id)
+            except Exception as exc:
+                logger.warning("Scheduler listener failed on %s(%s): %s", event, job_id, exc)
+
     def _get_conn(self) -> sqlite3.Connection:
         conn = sqlite3.connect(str(self._db_path))
         conn.row_factory = sqlite3.Row
@@ -140,6 +157,7 @@ class SchedulerService:
         for job_spec in config.jobs:
             if self.get_job(job_spec.id) is None:
                 self._register_job(job_spec)
+                self._notify("registered", job_spec.id)
                 count += 1
             else:
                 logger.debug("Job '%s' already registered, skipping", job_spec.id)
@@ -246,6 +264,7 @@ class SchedulerService:
         finally:
             conn.close()
         logger.info("job_enabled: %s", job_id)
+        self._notify("enabled", job_id)
 
     def disable_job(self, job_id: str) -> None:
         """Disable a job.
@@ -261,6 +280,7 @@ class SchedulerService:
         finally:
             conn.close()
         logger.info("job_disabled: %s", job_id)
+        self._notify("disabled", job_id)
 
     def run_now(self, job_id: str) -> JobRecord:
         """Mark a job as having been run (for manual triggers).
@@ -287,6 +307,7 @@ class SchedulerService:
 
         self._last_tick = now
         logger.info("job_triggered: %s", job_id)
+        self._notify("run", job_id)
         return self.get_job(job_id)
 
     def create_job(
@@ -353,6 +374,7 @@ class SchedulerService:
             conn.close()
 
         logger.info("job_created: %s (skill=%s, trigger=%s %s)", job_id, skill, trigger_type, trigger_value)
+        self._notify("created", job_id)
         return self.get_job(job_id)
 
     def update_job_timezone(self, job_id: str, tz: str) -> None:
@@ -369,6 +391,7 @@ class SchedulerService:
         finally:
             conn.close()
         logger.info("job_timezone_updated: %s → %s", job_id, tz)
+        self._notify("timezone_updated", job_id)
 
     def delete_job(self, job_id: str) -> None:
         """Delete a scheduled job.
@@ -384,3 +407,4 @@ class SchedulerService:
         finally:
             conn.close()
         logger.info("job_deleted: %s", job_id)
+        self._notify("deleted", job_id)
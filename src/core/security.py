@@ -1,3 +1,4 @@
+import collections
 import hashlib
 import ipaddress
 import logging
@@ -6,6 +7,7 @@ import datetime
 import re
 import socket
 import threading
+import time
 from urllib.parse import urlparse, unquote
 
 _security_logger = logging.getLogger("lancelot.security")
@@ -311,8 +313,15 @@ class NetworkInterceptor:
 class CognitionGovernor:
     """Limits the agent's improved cognition to prevent runaway costs or infinite loops.
 
-    F-015: All file I/O is guarded by a threading.Lock to prevent
-    concurrent read/write corruption of usage_stats.json.
+    Counters live in memory behind a lock, so ``check_limit`` and
+    ``log_usage`` (called on every agentic-loop iteration) never touch the
+    disk. Day rollover happens in memory; ``usage_stats.json`` is a
+    checkpoint written by a background thread every
+    ``LANCELOT_USAGE_CHECKPOINT_S`` seconds when counters changed, and on
+    ``flush()`` (gateway shutdown).
+
+    ``actions_per_minute`` is enforced over a 60-second sliding window of
+    tool calls.
     """
     LIMITS = {
         "tokens_daily": 2_000_000,
@@ -320,66 +329,139 @@ class CognitionGovernor:
         "actions_per_minute": 60
     }
 
-    def __init__(self, data_dir="/home/lancelot/data"):
+    # Metrics that count as actions for the per-minute rate limit
+    RATE_METRICS = ("tool_calls", "actions")
+    RATE_WINDOW_S = 60.0
+
+    def __init__(self, data_dir="/home/lancelot/data", checkpoint_interval_s=None):
         self.data_dir = data_dir
         self.usage_file = os.path.join(data_dir, "usage_stats.json")
+        if checkpoint_interval_s is None:
+            checkpoint_interval_s = float(os.getenv("LANCELOT_USAGE_CHECKPOINT_S", "30"))
+        self.checkpoint_interval_s = checkpoint_interval_s
+        self._lock = threading.Lock()
         self._file_lock = threading.Lock()
+        self._dirty = False
+        # (monotonic timestamp, cost) of recent actions, oldest first
+        self._window = collections.deque()
+        self._window_total = 0
+        self._stop = threading.Event()
+        self._checkpointer = None
+        self.usage = {}
         self._load_usage()
 
     def _load_usage(self):
+        """Sync the in-memory counters with the checkpoint file.
+
+        Unsaved increments are checkpointed first, so nothing is lost.
+        """
         import json
+        self.flush()
         with self._file_lock:
             if os.path.exists(self.usage_file):
                 try:
                     with open(self.usage_file, "r") as f:
-                        self.usage = json.load(f)
+                        usage = json.load(f)
                 except Exception:
-                    self.usage = {}
+                    usage = {}
             else:
-                self.usage = {}
+                usage = {}
+        with self._lock:
+            self.usage = usage
+            self._roll_day_locked()
 
-            # Reset if new day (simple logic)
-            today = datetime.datetime.utcnow().strftime("%Y-%m-%d")
-            if self.usage.get("date") != today:
-                self.usage = {"date": today, "tokens": 0, "tool_calls": 0, "actions": 0}
-                self._save_usage_locked()
+    def _roll_day_locked(self):
+        """Reset daily counters when the UTC day changes (caller holds _lock)."""
+        today = datetime.datetime.utcnow().strftime("%Y-%m-%d")
+        if self.usage.get("date") != today:
+            self.usage = {"date": today, "tokens": 0, "tool_calls": 0, "actions": 0}
+            self._dirty = True
 
-    def _save_usage_locked(self):
+    def _save_usage_locked(self, usage):
         """Write usage file (caller must hold _file_lock)."""
         import json
         try:
             tmp_path = self.usage_file + ".tmp"
             with open(tmp_path, "w") as f:
-                json.dump(self.usage, f)
+                json.dump(usage, f)
             os.replace(tmp_path, self.usage_file)
+            return True
         except Exception as e:
             _security_logger.warning("Failed to save usage stats: %s", e)
+            return False
 
-    def _save_usage(self):
-        import json
+    def flush(self):
+        """Checkpoint the counters to disk if they changed since the last write."""
         with self._file_lock:
-            self._save_usage_locked()
+            with self._lock:
+                if not self._dirty:
+                    return
+                usage = dict(self.usage)
+                self._dirty = False
+            if not self._save_usage_locked(usage):
+                with self._lock:
+                    self._dirty = True
+
+    def close(self):
+        """Stop the checkpoint thread and write a final checkpoint."""
+        self._stop.set()
+        self.flush()
+
+    def _checkpoint_loop(self):
+        while not self._stop.wait(self.checkpoint_interval_s):
+            self.flush()
+
+    def _ensure_checkpointer(self):
+        if self._checkpointer is None and self.checkpoint_interval_s > 0 and not self._stop.is_set():
+            self._checkpointer = threading.Thread(
+                target=self._checkpoint_loop, name="usage-checkpoint", daemon=True,
+            )
+            self._checkpointer.start()
+
+    def _prune_window_locked(self, now):
+        cutoff = now - self.RATE_WINDOW_S
+        while self._window and self._window[0][0] <= cutoff:
+            self._window_total -= self._window.popleft()[1]
+
+    def actions_last_minute(self) -> int:
+        """Actions recorded in the current sliding window."""
+        with self._lock:
+            self._prune_window_locked(time.monotonic())
+            return self._window_total
 
     def check_limit(self, metric: str, cost: int = 1) -> bool:
         """Returns True if the action is allowed, False if blocked."""
-        self._load_usage()  # Sync
-
-        if metric == "tokens":
-            if self.usage.get("tokens", 0) + cost > self.LIMITS["tokens_daily"]:
-                _security_logger.warning("GOVERNANCE BLOCK: Daily token limit exceeded.")
-                return False
-        elif metric == "tool_calls":
-            if self.usage.get("tool_calls", 0) + cost > self.LIMITS["tool_calls_daily"]:
-                _security_logger.warning("GOVERNANCE BLOCK: Daily tool call limit exceeded.")
-                return False
+        with self._lock:
+            self._roll_day_locked()
+            if metric == "tokens":
+                if self.usage.get("tokens", 0) + cost > self.LIMITS["tokens_daily"]:
+                    _security_logger.warning("GOVERNANCE BLOCK: Daily token limit exceeded.")
+                    return False
+            elif metric == "tool_calls":
+                if self.usage.get("tool_calls", 0) + cost > self.LIMITS["tool_calls_daily"]:
+                    _security_logger.warning("GOVERNANCE BLOCK: Daily tool call limit exceeded.")
+                    return False
+
+            if metric in self.RATE_METRICS:
+                self._prune_window_locked(time.monotonic())
+                if self._window_total + cost > self.LIMITS["actions_per_minute"]:
+                    _security_logger.warning("GOVERNANCE BLOCK: Actions per minute limit exceeded.")
+                    return False
 
         return True
 
     def log_usage(self, metric: str, cost: int = 1):
-        """Updates internal counters."""
-        with self._file_lock:
+        """Updates internal counters (in memory; checkpointed in the background)."""
+        with self._lock:
+            self._roll_day_locked()
             self.usage[metric] = self.usage.get(metric, 0) + cost
-            self._save_usage_locked()
+            if metric in self.RATE_METRICS:
+                if metric != "actions":
+                    self.usage["actions"] = self.usage.get("actions", 0) + cost
+                self._window.append((time.monotonic(), cost))
+                self._window_total += cost
+            self._dirty = True
+        self._ensure_checkpointer()
 
 
 class Sentry:
@@ -7,6 +7,9 @@ Multi-source intelligence gathering:
 3. Source diversity balancing — caps per-source articles to ensure breadth
 4. AI-relevance keyword filtering for general feeds
 5. Deduplication by normalized title similarity
+
+Feeds are fetched over the shared keep-alive transport, so requests to
+the same host (e.g. Google News queries) can reuse open connections.
 """
 
 from __future__ import annotations
@@ -16,16 +19,17 @@ import json
 import logging
 import os
 import re
-import ssl
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
 from typing import Any, Dict, List, Optional
 from urllib.error import HTTPError, URLError
 from urllib.parse import quote_plus
-from urllib.request import Request, urlopen
+from urllib.request import Request
 import xml.etree.ElementTree as ET
 
+from src.core import http_transport
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -172,9 +176,8 @@ def _fetch_feed(name: str, url: str, cutoff: datetime) -> List[Dict[str, Any]]:
     req.add_header("User-Agent", _USER_AGENT)
     req.add_header("Accept", "application/rss+xml, application/atom+xml, application/xml, text/xml")
 
-    ctx = ssl.create_default_context()
-    resp = urlopen(req, timeout=_FETCH_TIMEOUT, context=ctx)
-    data = resp.read()
+    with http_transport.urlopen(req, timeout=_FETCH_TIMEOUT) as resp:
+        data = resp.read()
 
     root = ET.fromstring(data)
     articles: List[Dict[str, Any]] = []
@@ -273,9 +276,8 @@ def _fetch_google_news(query: str, cutoff: datetime) -> List[Dict[str, Any]]:
     req = Request(url)
     req.add_header("User-Agent", _USER_AGENT)
 
-    ctx = ssl.create_default_context()
-    resp = urlopen(req, timeout=_FETCH_TIMEOUT, context=ctx)
-    data = resp.read()
+    with http_transport.urlopen(req, timeout=_FETCH_TIMEOUT) as resp:
+        data = resp.read()
 
     root = ET.fromstring(data)
     articles = _parse_rss(root, "Google News", cutoff)
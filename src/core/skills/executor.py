@@ -16,6 +16,7 @@ import json
 import logging
 import subprocess
 import sys
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -24,6 +25,7 @@ from typing import Any, Callable, Dict, List, Optional
 
 from src.core.skills.schema import SkillError, SkillManifest
 from src.core.skills.registry import SkillRegistry, SkillEntry, SkillOwnership, SignatureState
+from src.tools.sandbox_pool import ContainerSpec, SandboxPool
 
 logger = logging.getLogger(__name__)
 
@@ -153,6 +155,26 @@ except Exception as exc:
 _SKILL_SANDBOX_IMAGE = "python:3.11-slim"
 _SKILL_SANDBOX_MEMORY = "256m"
 _SKILL_SANDBOX_TIMEOUT_S = 60
+_SKILL_SANDBOX_POOL_SIZE = 4
+
+_shared_pool: Optional[SandboxPool] = None
+_shared_pool_lock = threading.Lock()
+
+
+def _get_shared_pool() -> SandboxPool:
+    """Warm skill containers shared by every SkillExecutor in the process."""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = SandboxPool(max_containers=_SKILL_SANDBOX_POOL_SIZE)
+        return _shared_pool
+
+
+def close_shared_pool() -> None:
+    """Remove warm skill containers (called on gateway shutdown)."""
+    with _shared_pool_lock:
+        if _shared_pool is not None:
+            _shared_pool.close()
 
 
 class SkillExecutor:
@@ -162,8 +184,9 @@ class SkillExecutor:
     Non-builtin skills (user/marketplace) run in isolated Docker containers (F-007).
     """
 
-    def __init__(self, registry: SkillRegistry):
+    def __init__(self, registry: SkillRegistry, sandbox_pool: Optional[SandboxPool] = None):
         self._registry = registry
+        self._sandbox_pool = sandbox_pool
         self._loaded: Dict[str, SkillExecuteFunc] = {}
         self._receipts: List[Dict[str, Any]] = []
 
@@ -281,7 +304,8 @@ class SkillExecutor:
         The skill directory is mounted read-only at /skill. A lightweight
         runner script reads JSON from stdin, loads execute.py, and writes
         JSON results to stdout. The container has no network access, limited
-        memory (256MB), and a 60-second timeout.
+        memory (256MB), and a 60-second timeout. Containers come from a warm
+        SandboxPool and are reused per skill directory via ``docker exec``.
         """
         if not entry.manifest_path:
             return SkillResult(success=False, error="Skill has no manifest_path for sandbox execution")
@@ -302,17 +326,13 @@ class SkillExecutor:
             "inputs": inputs,
         })
 
-        # Build Docker command
-        docker_cmd = [
-            "docker", "run", "--rm",
-            f"--memory={_SKILL_SANDBOX_MEMORY}",
-            "--cpus=1",
-            "--network=none",
-            "-v", f"{skill_dir.resolve()}:/skill:ro",
-            "-i",  # Keep stdin open for payload
-            _SKILL_SANDBOX_IMAGE,
-            "python", "-c", _SKILL_SANDBOX_RUNNER,
-        ]
+        spec = ContainerSpec(
+            image=_SKILL_SANDBOX_IMAGE,
+            mounts=((str(skill_dir.resolve()), "/skill", "ro"),),
+            network=False,
+            memory=_SKILL_SANDBOX_MEMORY,
+        )
+        pool = self._sandbox_pool or _get_shared_pool()
 
         self._emit_receipt(
             "skill_sandbox_start",
@@ -324,17 +344,19 @@ class SkillExecutor:
 
         start = time.monotonic()
         try:
-            result = subprocess.run(
-                docker_cmd,
-                input=payload,
-                capture_output=True,
-                text=True,
-                timeout=_SKILL_SANDBOX_TIMEOUT_S + 5,
+            result = pool.run(
+                spec,
+                ["python", "-c", _SKILL_SANDBOX_RUNNER],
+                stdin=payload,
+                timeout_s=_SKILL_SANDBOX_TIMEOUT_S,
             )
             duration_ms = (time.monotonic() - start) * 1000
 
-            if result.returncode != 0:
-                error = f"Sandbox exited with code {result.returncode}: {result.stderr[:500]}"
+            if result.timed_out:
+                raise subprocess.TimeoutExpired("docker exec", _SKILL_SANDBOX_TIMEOUT_S)
+
+            if result.exit_code != 0:
+                error = f"Sandbox exited with code {result.exit_code}: {result.stderr[:500]}"
                 self._emit_receipt(
                     "skill_sandbox_failed",
                     skill=entry.name,
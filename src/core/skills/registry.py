@@ -11,6 +11,8 @@ Public API:
     disable_skill(name)   → None
     list_skills()         → list[SkillEntry]
     get_skill(name)       → SkillEntry | None
+    revision              → int (bumped on every install/enable/disable/uninstall)
+    add_change_listener(callback)
 """
 
 from __future__ import annotations
@@ -21,7 +23,7 @@ import os
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -74,8 +76,31 @@ class SkillRegistry:
         self._data_dir.mkdir(parents=True, exist_ok=True)
         self._registry_path = self._data_dir / _REGISTRY_FILE
         self._skills: Dict[str, SkillEntry] = {}
+        self._revision = 0
+        self._listeners: List[Callable[[str, str], None]] = []
         self._load()
 
+    @property
+    def revision(self) -> int:
+        """Monotonic counter bumped on every registry mutation.
+
+        Consumers that derive artifacts from the installed skill set (tool
+        declarations, system instructions) use it as a cache key.
+        """
+        return self._revision
+
+    def add_change_listener(self, callback: Callable[[str, str], None]) -> None:
+        """Register ``callback(event, skill_name)`` to run after each mutation."""
+        self._listeners.append(callback)
+
+    def _notify(self, event: str, name: str) -> None:
+        self._revision += 1
+        for callback in list(self._listeners):
+            try:
+                callback(event, name)
+            except Exception as exc:
+                logger.warning("Skill registry listener failed on %s(%s): %s", event, name, exc)
+
     def _load(self) -> None:
         """Load registry from disk."""
         if not self._registry_path.exists():
@@ -162,6 +187,7 @@ class SkillRegistry:
         self._save()
 
         logger.info("skill_installed: name=%s, version=%s", entry.name, entry.version)
+        self._notify("installed", entry.name)
         return entry
 
     def enable_skill(self, name: str) -> None:
@@ -176,6 +202,7 @@ class SkillRegistry:
         entry.enabled = True
         self._save()
         logger.info("skill_enabled: name=%s", name)
+        self._notify("enabled", name)
 
     def disable_skill(self, name: str) -> None:
         """Disable an installed skill.
@@ -189,6 +216,7 @@ class SkillRegistry:
         entry.enabled = False
         self._save()
         logger.info("skill_disabled: name=%s", name)
+        self._notify("disabled", name)
 
     def list_skills(self) -> List[SkillEntry]:
         """List all installed skills."""
@@ -209,3 +237,4 @@ class SkillRegistry:
         del self._skills[name]
         self._save()
         logger.info("skill_uninstalled: name=%s", name)
+        self._notify("uninstalled", name)
@@ -16,13 +16,14 @@ Public API:
     list_versions(soul_dir)    → list[str]
     get_active_version(soul_dir) → str
     set_active_version(version, soul_dir) → None
+    add_change_listener(callback)         → None
 """
 
 import logging
 import os
 import re
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 import yaml
 from pydantic import BaseModel, Field, ValidationError, field_validator
@@ -31,6 +32,9 @@ logger = logging.getLogger(__name__)
 
 _DEFAULT_SOUL_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "..", "soul")
 
+# Callbacks run after the ACTIVE pointer changes (e.g. amendment activation).
+_change_listeners: List[Callable[[str], None]] = []
+
 
 # ---------------------------------------------------------------------------
 # Pydantic models
@@ -166,6 +170,22 @@ def set_active_version(version: str, soul_dir: Optional[str] = None) -> None:
     active_file.write_text(version, encoding="utf-8")
     logger.info("Soul active version set to %s", version)
 
+    for callback in list(_change_listeners):
+        try:
+            callback(version)
+        except Exception as exc:
+            logger.warning("Soul change listener failed for %s: %s", version, exc)
+
+
+def add_change_listener(callback: Callable[[str], None]) -> None:
+    """Register ``callback(version)`` to run after the active version changes.
+
+    Used to drop prompt caches derived from the soul and reload it.
+    Registering the same callback twice is a no-op.
+    """
+    if callback not in _change_listeners:
+        _change_listeners.append(callback)
+
 
 def list_versions(soul_dir: Optional[str] = None) -> list[str]:
     """List all available soul versions, sorted ascending.
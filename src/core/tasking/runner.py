@@ -4,21 +4,41 @@ Task Runner — executes a TaskRun step-by-step with receipt emission.
 The runner walks through the TaskGraph's steps in dependency order,
 checks token authority before each step, executes via skills/tools,
 emits receipts, and updates TaskRun state.
+
+Steps whose dependencies have all completed run concurrently on a thread
+pool, up to ``max_parallel`` at a time (LANCELOT_TASK_MAX_PARALLEL,
+default 4; 1 restores strictly sequential execution). Authority checks,
+receipts and TaskStore writes stay on the calling thread; workers only
+execute a step and run its verifier, so a step's dependents never start
+before it has passed verification.
+
+Fail-fast: once a step is denied, fails, fails verification or needs
+human input, no further steps are started. Steps already in flight are
+allowed to finish and their receipts are recorded.
+
+Run progress (status, current step, receipts, completed steps) is written
+to the TaskStore once per scheduling round rather than once per event.
+Completed step IDs are persisted, so running a TaskRun that was
+interrupted (e.g. by a crash) skips the steps it already finished.
 """
 
 from __future__ import annotations
 
 import logging
+import os
 import time
 import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from src.core.tasking.schema import RunStatus, StepType, TaskGraph, TaskRun, TaskStep
 from src.core.tasking.store import TaskStore
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_MAX_PARALLEL = int(os.getenv("LANCELOT_TASK_MAX_PARALLEL", "4"))
+
 
 @dataclass
 class StepResult:
@@ -39,10 +59,11 @@ class TaskRunResult:
     step_results: List[StepResult] = field(default_factory=list)
     receipts: List[str] = field(default_factory=list)
     blocked_step: Optional[str] = None
+    resumed_steps: List[str] = field(default_factory=list)  # skipped: completed by an earlier attempt
 
 
 class TaskRunner:
-    """Executes a TaskRun step-by-step with receipt emission.
+    """Executes a TaskRun's steps as a dependency DAG with receipt emission.
 
     Dependencies:
         task_store: TaskStore for persisting run state
@@ -51,6 +72,7 @@ class TaskRunner:
         receipt_service: ReceiptService for emitting receipts
         skill_executor: SkillExecutor for running skills
         verifier: Verifier for acceptance checks
+        max_parallel: Maximum number of steps executing at once
     """
 
     def __init__(
@@ -61,6 +83,7 @@ class TaskRunner:
         receipt_service=None,
         skill_executor=None,
         verifier=None,
+        max_parallel: int = _DEFAULT_MAX_PARALLEL,
     ):
         self.task_store = task_store
         self.token_store = token_store
@@ -68,18 +91,22 @@ class TaskRunner:
         self.receipt_service = receipt_service
         self.skill_executor = skill_executor
         self.verifier = verifier
+        self.max_parallel = max(1, max_parallel)
 
     def run(self, task_run_id: str) -> TaskRunResult:
         """Execute all steps in a TaskRun, respecting dependencies.
 
-        Walks through the graph's steps in dependency order. For each step:
+        Repeatedly starts every step whose dependencies have completed
+        (up to ``max_parallel`` in flight). For each step:
         1. Check token authority
         2. Emit STEP_STARTED receipt
-        3. Execute based on step type
-        4. Emit STEP_COMPLETED or STEP_FAILED receipt
-        5. Run verifier if token.requires_verifier
-        6. Update TaskRun state
-        7. Increment token actions_used
+        3. Execute based on step type (worker thread)
+        4. Run verifier if token.requires_verifier (worker thread)
+        5. Emit STEP_COMPLETED or STEP_FAILED, then VERIFY_* receipts
+        6. Increment token actions_used
+        7. Record the step as completed
+
+        Steps already recorded as completed on the TaskRun are skipped.
 
         Returns:
             TaskRunResult with final status and receipts.
@@ -101,119 +128,146 @@ class TaskRunner:
         if run.execution_token_id and self.token_store:
             token = self.token_store.get(run.execution_token_id)
 
+        execution_order = self._resolve_execution_order(graph.steps)
+        dependencies = self._effective_dependencies(execution_order)
+        step_ids = {s.step_id for s in execution_order}
+
+        # Resume: skip steps a previous attempt already completed
+        resumed = [sid for sid in run.completed_steps if sid in step_ids]
+        completed: List[str] = list(resumed)
+        done: Set[str] = set(completed)
+        pending = [s for s in execution_order if s.step_id not in done]
+        if resumed:
+            logger.info("TaskRun %s: resuming, %d/%d steps already completed",
+                        run.id, len(resumed), len(execution_order))
+
         # Transition to RUNNING
         self.task_store.update_status(run.id, RunStatus.RUNNING.value)
 
         step_results: List[StepResult] = []
         receipt_ids: List[str] = []
-        execution_order = self._resolve_execution_order(graph.steps)
-
-        for step in execution_order:
-            # Update current step
-            self.task_store.update_status(run.id, RunStatus.RUNNING.value,
-                                          current_step=step.step_id)
-
-            # 1. Check token authority
-            if token and self.minter:
-                auth = self._check_step_authority(token, step)
-                if not auth.allowed:
-                    result = StepResult(
-                        step_id=step.step_id, success=False,
-                        error=f"Authority denied: {auth.reason}",
-                    )
-                    step_results.append(result)
-                    self._emit_step_failed(run.id, step, auth.reason, receipt_ids)
-                    self.task_store.update_status(
-                        run.id, RunStatus.FAILED.value,
-                        current_step=step.step_id,
-                        error=f"Authority denied: {auth.reason}",
-                    )
-                    return TaskRunResult(
-                        run_id=run.id, status=RunStatus.FAILED.value,
-                        step_results=step_results, receipts=receipt_ids,
-                    )
-
-            # 2. HUMAN_INPUT → BLOCKED
-            if step.type == StepType.HUMAN_INPUT.value:
-                self.task_store.update_status(
-                    run.id, RunStatus.BLOCKED.value,
-                    current_step=step.step_id,
-                )
-                step_results.append(StepResult(
-                    step_id=step.step_id, success=True,
-                    outputs={"status": "BLOCKED_FOR_HUMAN_INPUT"},
-                ))
-                return TaskRunResult(
-                    run_id=run.id, status=RunStatus.BLOCKED.value,
-                    step_results=step_results, receipts=receipt_ids,
-                    blocked_step=step.step_id,
-                )
-
-            # 3. Emit STEP_STARTED receipt
-            started_receipt_id = self._emit_step_started(run.id, step, receipt_ids)
+        flushed = 0  # receipt_ids[:flushed] are already in the store
+        # (status, current_step, error, blocked_step) once the run stops early
+        outcome: Optional[Tuple[str, str, Optional[str], Optional[str]]] = None
+        running: Dict[Future, TaskStep] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_parallel,
+                                thread_name_prefix="task-step") as pool:
+            while True:
+                # Start every ready step while there is capacity
+                while outcome is None and len(running) < self.max_parallel:
+                    step = next((s for s in pending if dependencies[s.step_id] <= done), None)
+                    if step is None:
+                        break
+                    pending.remove(step)
+
+                    # 1. Check token authority
+                    if token and self.minter:
+                        auth = self._check_step_authority(token, step)
+                        if not auth.allowed:
+                            step_results.append(StepResult(
+                                step_id=step.step_id, success=False,
+                                error=f"Authority denied: {auth.reason}",
+                            ))
+                            self._emit_step_failed(run.id, step, auth.reason, receipt_ids)
+                            outcome = (RunStatus.FAILED.value, step.step_id,
+                                       f"Authority denied: {auth.reason}", None)
+                            break
 
-            # 4. Execute step
-            start_time = time.monotonic()
-            try:
-                outputs = self._execute_step(step)
-                duration_ms = (time.monotonic() - start_time) * 1000
-                result = StepResult(
-                    step_id=step.step_id, success=True,
-                    outputs=outputs, duration_ms=duration_ms,
-                )
-            except Exception as exc:
-                duration_ms = (time.monotonic() - start_time) * 1000
-                error_msg = str(exc)
-                result = StepResult(
-                    step_id=step.step_id, success=False,
-                    error=error_msg, duration_ms=duration_ms,
+                    # HUMAN_INPUT → BLOCKED
+                    if step.type == StepType.HUMAN_INPUT.value:
+                        step_results.append(StepResult(
+                            step_id=step.step_id, success=True,
+                            outputs={"status": "BLOCKED_FOR_HUMAN_INPUT"},
+                        ))
+                        outcome = (RunStatus.BLOCKED.value, step.step_id, None, step.step_id)
+                        break
+
+                    # 2. Emit STEP_STARTED receipt, then hand off to a worker
+                    self._emit_step_started(run.id, step, receipt_ids)
+                    running[pool.submit(self._execute_and_verify, step, token)] = step
+
+                if not running:
+                    break
+
+                # One batched store write per scheduling round
+                current = next(iter(running.values())).step_id
+                self.task_store.record_progress(
+                    run.id, RunStatus.RUNNING.value, current_step=current,
+                    new_receipts=receipt_ids[flushed:], completed_steps=completed,
                 )
+                flushed = len(receipt_ids)
 
-            step_results.append(result)
-
-            # 5. Emit STEP_COMPLETED or STEP_FAILED receipt
-            if result.success:
-                self._emit_step_completed(run.id, step, result, receipt_ids)
-            else:
-                self._emit_step_failed(run.id, step, result.error, receipt_ids)
-                # Step failed → run fails
-                self.task_store.update_status(
-                    run.id, RunStatus.FAILED.value,
-                    current_step=step.step_id,
-                    error=result.error,
-                )
-                return TaskRunResult(
-                    run_id=run.id, status=RunStatus.FAILED.value,
-                    step_results=step_results, receipts=receipt_ids,
-                )
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in [f for f in running if f in finished]:
+                    step = running.pop(future)
+                    result, verified = future.result()
+                    step_results.append(result)
 
-            # 6. Run verifier if needed
-            if token and getattr(token, 'requires_verifier', False) and step.acceptance_check:
-                verify_ok = self._run_verifier(step, result)
-                if not verify_ok:
-                    self._emit_verify_failed(run.id, step, receipt_ids)
-                    self.task_store.update_status(
-                        run.id, RunStatus.FAILED.value,
-                        current_step=step.step_id,
-                        error=f"Verification failed for step {step.step_id}",
-                    )
-                    return TaskRunResult(
-                        run_id=run.id, status=RunStatus.FAILED.value,
-                        step_results=step_results, receipts=receipt_ids,
-                    )
-                self._emit_verify_passed(run.id, step, receipt_ids)
-
-            # 7. Increment token actions
-            if token and self.token_store:
-                self.token_store.increment_actions(token.id)
-
-        # All steps completed
-        self.task_store.update_status(run.id, RunStatus.SUCCEEDED.value)
+                    # 5. Emit STEP_COMPLETED or STEP_FAILED receipt
+                    if not result.success:
+                        self._emit_step_failed(run.id, step, result.error, receipt_ids)
+                        if outcome is None:
+                            outcome = (RunStatus.FAILED.value, step.step_id, result.error, None)
+                        continue
+                    self._emit_step_completed(run.id, step, result, receipt_ids)
+
+                    if verified is False:
+                        self._emit_verify_failed(run.id, step, receipt_ids)
+                        if outcome is None:
+                            outcome = (RunStatus.FAILED.value, step.step_id,
+                                       f"Verification failed for step {step.step_id}", None)
+                        continue
+                    if verified:
+                        self._emit_verify_passed(run.id, step, receipt_ids)
+
+                    # 6. Increment token actions
+                    if token and self.token_store:
+                        self.token_store.increment_actions(token.id)
+
+                    done.add(step.step_id)
+                    completed.append(step.step_id)
+
+        if outcome is not None:
+            status, current_step, error, blocked_step = outcome
+        else:
+            # All steps completed
+            status, current_step, error, blocked_step = RunStatus.SUCCEEDED.value, None, None, None
+
+        self.task_store.record_progress(
+            run.id, status, current_step=current_step, error=error,
+            new_receipts=receipt_ids[flushed:], completed_steps=completed,
+        )
         return TaskRunResult(
-            run_id=run.id, status=RunStatus.SUCCEEDED.value,
+            run_id=run.id, status=status,
             step_results=step_results, receipts=receipt_ids,
+            blocked_step=blocked_step,
+            resumed_steps=resumed,
         )
 
+    def _execute_and_verify(self, step: TaskStep, token) -> Tuple[StepResult, Optional[bool]]:
+        """Worker: execute a step, then verify it if the token requires it.
+
+        Returns the StepResult and the verifier verdict (None when the
+        step failed or needs no verification).
+        """
+        start_time = time.monotonic()
+        try:
+            outputs = self._execute_step(step)
+            result = StepResult(
+                step_id=step.step_id, success=True, outputs=outputs,
+                duration_ms=(time.monotonic() - start_time) * 1000,
+            )
+        except Exception as exc:
+            return StepResult(
+                step_id=step.step_id, success=False, error=str(exc),
+                duration_ms=(time.monotonic() - start_time) * 1000,
+            ), None
+
+        if token and getattr(token, 'requires_verifier', False) and step.acceptance_check:
+            return result, self._run_verifier(step, result)
+        return result, None
+
     def _resolve_execution_order(self, steps: List[TaskStep]) -> List[TaskStep]:
         """Topological sort based on dependencies.
 
@@ -240,6 +294,21 @@ class TaskRunner:
 
         return order
 
+    @staticmethod
+    def _effective_dependencies(order: List[TaskStep]) -> Dict[str, Set[str]]:
+        """Dependencies the scheduler waits on, per step.
+
+        Only dependencies that precede the step in the topological order
+        count: unknown step IDs are ignored (as in sequential execution)
+        and a cycle's back-edge is dropped rather than deadlocking.
+        """
+        position = {s.step_id: i for i, s in enumerate(order)}
+        return {
+            s.step_id: {d for d in s.dependencies
+                        if d in position and position[d] < position[s.step_id]}
+            for s in order
+        }
+
     def _check_step_authority(self, token, step: TaskStep):
         """Check token authority for a step."""
         tool_name = step.type  # Map step type to tool
@@ -338,8 +407,8 @@ class TaskRunner:
             except Exception as exc:
                 logger.warning("Receipt emission failed: %s", exc)
 
+        # Persisted with the next batched progress write
         receipt_ids.append(receipt_id)
-        self.task_store.add_receipt(run_id, receipt_id)
         return receipt_id
 
     def _emit_step_started(self, run_id: str, step: TaskStep,
@@ -109,6 +109,7 @@ class TaskRun:
     receipts_index: List[str] = field(default_factory=list)
     last_error: Optional[str] = None
     session_id: str = ""
+    completed_steps: List[str] = field(default_factory=list)  # step IDs, in completion order
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -122,6 +123,7 @@ class TaskRun:
             "receipts_index": self.receipts_index,
             "last_error": self.last_error,
             "session_id": self.session_id,
+            "completed_steps": self.completed_steps,
         }
 
     @classmethod
@@ -43,6 +43,7 @@ class TaskStore:
         receipts_index TEXT NOT NULL DEFAULT '[]',
         last_error TEXT,
         session_id TEXT NOT NULL DEFAULT '',
+        completed_steps TEXT NOT NULL DEFAULT '[]',
         FOREIGN KEY (task_graph_id) REFERENCES task_graphs(id)
     );
 
@@ -79,6 +80,11 @@ class TaskStore:
     def _init_database(self):
         with self._transaction() as conn:
             conn.executescript(self.CREATE_TABLE_SQL)
+            # Migration: add completed_steps column if missing (for existing DBs)
+            try:
+                conn.execute("ALTER TABLE task_runs ADD COLUMN completed_steps TEXT NOT NULL DEFAULT '[]'")
+            except sqlite3.OperationalError:
+                pass  # Column already exists
 
     # --- TaskGraph CRUD ---
 
@@ -122,14 +128,15 @@ class TaskStore:
                 INSERT INTO task_runs (
                     id, task_graph_id, execution_token_id, status,
                     current_step_id, created_at, updated_at,
-                    receipts_index, last_error, session_id
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    receipts_index, last_error, session_id, completed_steps
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 run.id, run.task_graph_id, run.execution_token_id,
                 run.status, run.current_step_id,
                 run.created_at, run.updated_at,
                 json.dumps(run.receipts_index),
                 run.last_error, run.session_id,
+                json.dumps(run.completed_steps),
             ))
         return run.id
 
@@ -170,6 +177,43 @@ class TaskStore:
                     (json.dumps(index), datetime.now(timezone.utc).isoformat(), run_id),
                 )
 
+    def record_progress(
+        self,
+        run_id: str,
+        status: str,
+        current_step: Optional[str] = None,
+        error: Optional[str] = None,
+        new_receipts: Optional[List[str]] = None,
+        completed_steps: Optional[List[str]] = None,
+    ) -> None:
+        """Batched run update: status, appended receipts and completed steps in one transaction.
+
+        ``completed_steps`` replaces the stored list when given (it is what
+        a resumed run skips).
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        with self._transaction() as conn:
+            if new_receipts:
+                row = conn.execute(
+                    "SELECT receipts_index FROM task_runs WHERE id = ?", (run_id,),
+                ).fetchone()
+                if row:
+                    index = json.loads(row["receipts_index"]) + list(new_receipts)
+                    conn.execute(
+                        "UPDATE task_runs SET receipts_index = ? WHERE id = ?",
+                        (json.dumps(index), run_id),
+                    )
+            if completed_steps is not None:
+                conn.execute(
+                    "UPDATE task_runs SET completed_steps = ? WHERE id = ?",
+                    (json.dumps(completed_steps), run_id),
+                )
+            conn.execute("""
+                UPDATE task_runs SET status = ?, current_step_id = ?,
+                    last_error = ?, updated_at = ?
+                WHERE id = ?
+            """, (status, current_step, error, now, run_id))
+
     def get_active_run(self) -> Optional[TaskRun]:
         """Get the currently active (QUEUED or RUNNING) TaskRun."""
         conn = self._get_connection()
@@ -219,6 +263,7 @@ class TaskStore:
             receipts_index=json.loads(row["receipts_index"]),
             last_error=row["last_error"],
             session_id=row["session_id"],
+            completed_steps=json.loads(row["completed_steps"] or "[]"),
         )
 
     def close(self):
@@ -9,10 +9,12 @@ Tool Flow Streaming — real-time progress events during agentic loop execution.
 Emits ToolFlowEvents via the EventBus so that War Room and Telegram
 can show live progress indicators as tools are called and results arrive.
 
-Feature-gated by FEATURE_TOOL_FLOW_STREAMING.
+Feature-gated by FEATURE_TOOL_FLOW_STREAMING. Response text streaming
+(ResponseStreamEmitter) is gated separately by FEATURE_RESPONSE_STREAMING.
 """
 
 from toolflow.events import ToolFlowEvent, ToolFlowEventType
 from toolflow.emitter import ToolFlowEmitter
+from toolflow.response_stream import ResponseStreamEmitter
 
-__all__ = ["ToolFlowEvent", "ToolFlowEventType", "ToolFlowEmitter"]
+__all__ = ["ToolFlowEvent", "ToolFlowEventType", "ToolFlowEmitter", "ResponseStreamEmitter"]
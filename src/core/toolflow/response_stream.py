@@ -0,0 +1,144 @@
+# Lancelot — A Governed Autonomous System
+# Copyright (c) 2026 Myles Russell Hamilton
+# Licensed under BUSL-1.1. See LICENSE for details.
+# Patent Pending: US Provisional Application #63/982,183
+
+"""
+ResponseStreamEmitter — publishes LLM text deltas through the EventBus.
+
+Injected into the orchestrator. Feature-gated by FEATURE_RESPONSE_STREAMING.
+Each chat() turn is one stream, keyed by its quest_id:
+
+    chat.stream_started  — generation began
+    chat.delta           — new text to append (coalesced, ordered by seq)
+    chat.stream_reset    — discard the provisional text (the model went on
+                           to call tools; the next pass starts a fresh answer)
+    chat.stream_end      — generation finished; the final response follows
+                           through the normal reply path
+
+Providers emit a delta per token; publishing each one would flood the
+War Room socket and Telegram, so deltas are buffered and flushed at most
+once per ``flush_interval`` seconds.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from event_bus import Event
+
+logger = logging.getLogger(__name__)
+
+STREAM_STARTED = "chat.stream_started"
+STREAM_DELTA = "chat.delta"
+STREAM_RESET = "chat.stream_reset"
+STREAM_END = "chat.stream_end"
+
+# Seconds between coalesced delta events
+_DEFAULT_FLUSH_INTERVAL = 0.05
+
+
+class ResponseStreamEmitter:
+    """Emits chat.* streaming events through the EventBus.
+
+    All events carry stream_id (the quest_id) and channel so subscribers
+    can route them. Safe to call from the orchestrator's worker threads.
+    """
+
+    def __init__(self, event_bus, enabled: bool = True,
+                 flush_interval: float = _DEFAULT_FLUSH_INTERVAL):
+        self._event_bus = event_bus
+        self._enabled = enabled
+        self._flush_interval = flush_interval
+        self._lock = threading.Lock()
+        # stream_id -> {"channel": str, "seq": int, "buffer": list, "flushed_at": float}
+        self._streams: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool):
+        self._enabled = value
+
+    def stream_started(self, stream_id: str, channel: str = "api") -> None:
+        """Begin a stream. Restarting an active stream_id resets its sequence."""
+        if not self._enabled:
+            return
+        with self._lock:
+            self._streams[stream_id] = {
+                "channel": channel,
+                "seq": 0,
+                "buffer": [],
+                "flushed_at": time.monotonic(),
+            }
+        self._emit(STREAM_STARTED, stream_id, channel)
+
+    def delta(self, stream_id: str, text: str) -> None:
+        """Buffer a text fragment; publish once the flush interval has passed."""
+        if not self._enabled or not text:
+            return
+        with self._lock:
+            state = self._streams.get(stream_id)
+            if state is None:
+                return
+            state["buffer"].append(text)
+            if time.monotonic() - state["flushed_at"] < self._flush_interval:
+                return
+            payload = self._take_buffer(state)
+        self._emit(STREAM_DELTA, stream_id, state["channel"], **payload)
+
+    def reset(self, stream_id: str) -> None:
+        """Drop buffered text and tell subscribers to clear what they showed."""
+        if not self._enabled:
+            return
+        with self._lock:
+            state = self._streams.get(stream_id)
+            if state is None:
+                return
+            state["buffer"].clear()
+            state["seq"] += 1
+            seq = state["seq"]
+        self._emit(STREAM_RESET, stream_id, state["channel"], seq=seq)
+
+    def stream_end(self, stream_id: str, error: Optional[str] = None) -> None:
+        """Flush any buffered text and close the stream."""
+        if not self._enabled:
+            return
+        with self._lock:
+            state = self._streams.pop(stream_id, None)
+            if state is None:
+                return
+            payload = self._take_buffer(state) if state["buffer"] else None
+            state["seq"] += 1
+            seq = state["seq"]
+        if payload:
+            self._emit(STREAM_DELTA, stream_id, state["channel"], **payload)
+        extra = {"seq": seq}
+        if error:
+            extra["error"] = error
+        self._emit(STREAM_END, stream_id, state["channel"], **extra)
+
+    @staticmethod
+    def _take_buffer(state: Dict[str, Any]) -> Dict[str, Any]:
+        """Drain the buffer into a delta payload. Caller holds the lock."""
+        state["seq"] += 1
+        text = "".join(state["buffer"])
+        state["buffer"].clear()
+        state["flushed_at"] = time.monotonic()
+        return {"seq": state["seq"], "text": text}
+
+    def _emit(self, event_type: str, stream_id: str, channel: str, **payload) -> None:
+        """Publish event via EventBus."""
+        try:
+            self._event_bus.publish_sync(Event(
+                type=event_type,
+                payload={"stream_id": stream_id, "channel": channel, **payload},
+            ))
+        except Exception as exc:
+            logger.warning("Failed to emit response stream event %s: %s",
+                           event_type, exc)
@@ -0,0 +1,142 @@
+# Lancelot — A Governed Autonomous System
+# Copyright (c) 2026 Myles Russell Hamilton
+# Licensed under BUSL-1.1. See LICENSE for details.
+# Patent Pending: US Provisional Application #63/982,183
+
+"""
+TelegramStreamBridge — live preview of a streaming response in Telegram.
+
+For each telegram-channel stream, sends one preview message on the first
+text delta and edits it as more text arrives. Telegram rate-limits edits
+(roughly one per second per chat), so edits are throttled; text arriving
+in between is picked up by the next edit.
+
+The preview is deleted when the stream ends: the finished response is
+post-processed (claim verification, formatting) and delivered through
+TelegramBot.send_message, which also handles chunking past 4096 chars.
+
+Bot calls block on HTTP, so they run in a worker thread to keep the
+event loop free for the War Room socket.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import html
+import logging
+import time
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between edits of one preview message
+_EDIT_INTERVAL_S = 1.0
+
+# Preview is cut here (Telegram rejects messages over 4096 chars)
+_MAX_PREVIEW_CHARS = 4000
+
+
+class TelegramStreamBridge:
+    """Bridges chat.* stream events to an edited Telegram preview message.
+
+    Subscribes to all events via EventBus; only chat.* events on the
+    telegram channel are handled.
+    """
+
+    def __init__(self, telegram_bot, edit_interval: float = _EDIT_INTERVAL_S):
+        self._bot = telegram_bot
+        self._edit_interval = edit_interval
+        # stream_id -> {"chat_id", "text", "shown", "message_id", "busy", "edited_at", "ended"}
+        self._streams: Dict[str, Dict[str, Any]] = {}
+
+    async def on_stream_event(self, event) -> None:
+        """EventBus subscriber callback (async)."""
+        event_type = event.type
+        if not event_type.startswith("chat."):
+            return
+
+        payload = event.payload
+        stream_id = payload.get("stream_id", "")
+        if not stream_id:
+            return
+
+        try:
+            if event_type == "chat.stream_started":
+                if payload.get("channel") == "telegram":
+                    self._streams[stream_id] = {
+                        "chat_id": self._bot.chat_id,
+                        "text": "",
+                        "shown": "",
+                        "message_id": None,
+                        "busy": False,
+                        "edited_at": 0.0,
+                        "ended": False,
+                    }
+                return
+
+            state = self._streams.get(stream_id)
+            if state is None:
+                return
+
+            if event_type == "chat.delta":
+                state["text"] += payload.get("text", "")
+            elif event_type == "chat.stream_reset":
+                state["text"] = ""
+            elif event_type == "chat.stream_end":
+                state["ended"] = True
+            await self._sync(stream_id, state)
+        except Exception as exc:
+            logger.warning("TelegramStreamBridge: Error handling %s: %s", event_type, exc)
+
+    async def _sync(self, stream_id: str, state: Dict[str, Any]) -> None:
+        """Bring the preview message up to date, respecting the edit throttle.
+
+        Only one bot call per stream is in flight at a time; events that
+        arrive meanwhile just update state and the in-flight call's loop
+        picks them up.
+        """
+        if state["busy"]:
+            return
+        state["busy"] = True
+        try:
+            while True:
+                if state["ended"]:
+                    self._streams.pop(stream_id, None)
+                    if state["message_id"]:
+                        await asyncio.to_thread(
+                            self._bot.delete_message, state["message_id"], chat_id=state["chat_id"],
+                        )
+                    return
+
+                text = self._preview_text(state["text"])
+                if not text or text == state["shown"]:
+                    return
+                if time.monotonic() - state["edited_at"] < self._edit_interval:
+                    return
+
+                if state["message_id"] is None:
+                    state["message_id"] = await asyncio.to_thread(
+                        self._bot.send_message_with_keyboard, text, None, state["chat_id"],
+                    )
+                    if not state["message_id"]:
+                        logger.warning("TelegramStreamBridge: Failed to send preview for %s", stream_id)
+                        self._streams.pop(stream_id, None)
+                        return
+                else:
+                    await asyncio.to_thread(
+                        self._bot.edit_message, state["message_id"], text, chat_id=state["chat_id"],
+                    )
+                state["shown"] = text
+                state["edited_at"] = time.monotonic()
+        finally:
+            state["busy"] = False
+
+    @staticmethod
+    def _preview_text(text: str) -> str:
+        """Escape for HTML parse mode and cut to the preview limit."""
+        text = text.strip()
+        if not text:
+            return ""
+        if len(text) > _MAX_PREVIEW_CHARS:
+            text = text[:_MAX_PREVIEW_CHARS] + " …"
+        return html.escape(text, quote=False) + " ▍"
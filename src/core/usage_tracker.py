@@ -20,10 +20,12 @@ Public API:
     tracker.set_persistence(persistence)
     tracker.record(decision)
     tracker.record_simple(model, tokens)
+    tracker.record_prompt_cache(model, usage)
     tracker.summary()               → dict
     tracker.lane_breakdown()        → dict
     tracker.model_breakdown()       → dict
     tracker.estimated_savings()     → dict
+    tracker.prompt_cache_breakdown() → dict
     tracker.reset()
 """
 
@@ -139,6 +141,9 @@ class UsageTracker:
         )
         self._started_at: str = datetime.now(timezone.utc).isoformat()
         self._total_requests: int = 0
+        self._prompt_cache: dict[str, dict] = defaultdict(
+            lambda: {"requests": 0, "prompt_tokens": 0, "cache_read_tokens": 0, "cache_write_tokens": 0}
+        )
         self._persistence = None  # Optional UsagePersistence
 
     def set_persistence(self, persistence) -> None:
@@ -227,6 +232,22 @@ class UsageTracker:
             except Exception as exc:
                 logger.warning("UsageTracker: persistence write failed: %s", exc)
 
+    def record_prompt_cache(self, model: str, usage: Optional[dict]) -> None:
+        """Record provider-reported prompt-prefix cache usage for one call.
+
+        Args:
+            model: Model name.
+            usage: ``GenerateResult.usage`` dict. Only calls that report
+                   ``cache_read_tokens`` / ``cache_write_tokens`` are counted.
+        """
+        if not usage or ("cache_read_tokens" not in usage and "cache_write_tokens" not in usage):
+            return
+        p = self._prompt_cache[model]
+        p["requests"] += 1
+        p["prompt_tokens"] += usage.get("prompt_tokens_total", usage.get("input_tokens", 0)) or 0
+        p["cache_read_tokens"] += usage.get("cache_read_tokens", 0) or 0
+        p["cache_write_tokens"] += usage.get("cache_write_tokens", 0) or 0
+
     # ------------------------------------------------------------------
     # Queries
     # ------------------------------------------------------------------
@@ -246,6 +267,27 @@ class UsageTracker:
             for model, info in sorted(self._models.items())
         }
 
+    def prompt_cache_breakdown(self) -> dict:
+        """Per-model prompt-prefix cache usage with hit ratios.
+
+        ``hit_ratio`` is cached prompt tokens over all prompt tokens.
+        """
+        by_model = {
+            model: {
+                **p,
+                "hit_ratio": round(p["cache_read_tokens"] / p["prompt_tokens"], 4) if p["prompt_tokens"] else 0.0,
+            }
+            for model, p in sorted(self._prompt_cache.items())
+        }
+        total_read = sum(p["cache_read_tokens"] for p in self._prompt_cache.values())
+        total_prompt = sum(p["prompt_tokens"] for p in self._prompt_cache.values())
+        return {
+            "cache_read_tokens": total_read,
+            "cache_write_tokens": sum(p["cache_write_tokens"] for p in self._prompt_cache.values()),
+            "hit_ratio": round(total_read / total_prompt, 4) if total_prompt else 0.0,
+            "by_model": by_model,
+        }
+
     def estimated_savings(self) -> dict:
         """Calculate how much was saved by routing to local models.
 
@@ -302,12 +344,14 @@ class UsageTracker:
             "by_lane": self.lane_breakdown(),
             "by_model": self.model_breakdown(),
             "savings": self.estimated_savings(),
+            "prompt_cache": self.prompt_cache_breakdown(),
         }
 
     def reset(self) -> None:
         """Clear all counters and start a new tracking period."""
         self._lanes.clear()
         self._models.clear()
+        self._prompt_cache.clear()
         self._total_requests = 0
         self._started_at = datetime.now(timezone.utc).isoformat()
         logger.info("UsageTracker reset")
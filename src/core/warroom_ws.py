@@ -7,14 +7,48 @@ Supports JSON message protocol for bidirectional communication.
 Security (F-003): Connections require authentication via first message.
 The client must send {"type": "auth", "token": "<bearer_token>"} as the
 first message after connecting. Unauthenticated connections are closed.
+
+Fan-out: each connection has its own bounded send queue drained by its
+own sender task, so ``broadcast`` never waits on a socket and one slow
+browser tab cannot delay events for the others or back-pressure the
+EventBus. Messages are serialized once per broadcast. When a client falls
+behind:
+
+    - coalesced types (per-iteration progress) replace their queued
+      predecessor for the same quest instead of queueing another copy;
+    - consecutive ``chat.delta`` events for one stream merge into one;
+    - a full queue sheds its oldest droppable event; a client whose queue
+      is full of events that must not be lost is disconnected and
+      resyncs on reconnect.
+
+Per-connection queue depth, lag and drop counters are reported by
+``connection_manager.stats()`` (surfaced in ``/health``).
+
+Resume: when the EventBus has a journal, events carry a ``seq`` and
+``auth_ok`` reports the journal's ``epoch`` and latest ``seq``. A client
+that includes ``since`` (and the ``epoch`` it was seen in) in its auth
+message first receives one ``replay`` message holding every retained
+event after that seq, then live events with no gap or overlap (the
+channel skips live events the replay already covered):
+
+    {"type": "replay", "epoch": "...", "seq": <last replayed>,
+     "complete": <false if older events were already discarded>,
+     "events": [...]}
+
+Environment variables:
+    LANCELOT_WARROOM_WS_QUEUE        — per-connection queue bound (default: 256)
+    LANCELOT_WARROOM_WS_SEND_TIMEOUT — seconds before a stuck send drops the client (default: 10)
 """
 
 import hmac
 import json
 import logging
 import asyncio
+import itertools
 import os
-from typing import Optional
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
 
 from fastapi import WebSocket, WebSocketDisconnect
 
@@ -25,46 +59,246 @@ logger = logging.getLogger(__name__)
 # Auth timeout: client must authenticate within this many seconds
 _AUTH_TIMEOUT_S = 10
 
+_SEND_QUEUE_SIZE = int(os.getenv("LANCELOT_WARROOM_WS_QUEUE", "256"))
+_SEND_TIMEOUT_S = float(os.getenv("LANCELOT_WARROOM_WS_SEND_TIMEOUT", "10"))
+
+# Progress snapshots: only the newest per payload key matters to a client
+# that is behind, so a newer one replaces the queued one.
+_COALESCE_KEYS = {
+    "toolflow.iteration_started": "quest_id",
+    "toolflow.iteration_completed": "quest_id",
+}
+
+# Streamed text fragments: consecutive queued deltas for one stream merge
+_MERGE_KEYS = {
+    "chat.delta": "stream_id",
+}
+
+# Event types a full queue may shed (the UI recovers from later events)
+_DROPPABLE = frozenset(_COALESCE_KEYS) | {"warroom_notification"}
+
+
+class _Outgoing:
+    """A queued message. ``data`` is the shared serialized form."""
+
+    __slots__ = ("type", "key", "message", "data", "enqueued_at")
+
+    def __init__(self, message: dict, data: str, key: Optional[tuple]) -> None:
+        self.type = message.get("type", "")
+        self.key = key
+        self.message = message
+        self.data = data
+        self.enqueued_at = time.monotonic()
+
+
+class ClientChannel:
+    """Bounded send queue and sender task for one WebSocket connection."""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, websocket: WebSocket, manager: "ConnectionManager",
+                 max_queue: int = _SEND_QUEUE_SIZE) -> None:
+        self.id = next(self._ids)
+        self.websocket = websocket
+        self._manager = manager
+        self._max_queue = max_queue
+        self._queue: Deque[_Outgoing] = deque()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.closed = False
+        self.connected_at = time.time()
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_lag_s = 0.0
+        self.last_send_s = 0.0
+        # Events up to this seq went out in the replay batch; skip them live
+        self.replayed_seq = 0
+
+    def start(self, first: Optional[dict] = None) -> None:
+        """Start the sender; ``first`` is sent ahead of anything queued."""
+        if first is not None:
+            self._queue.appendleft(_Outgoing(first, json.dumps(first), None))
+            self._wakeup.set()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        self.closed = True
+        self._queue.clear()
+        if self._task and self._task is not asyncio.current_task():
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    # ── Enqueue (called on the event loop, never awaits) ──────────
+
+    def offer(self, message: dict, data: str) -> bool:
+        """Queue a serialized message. Returns False if the client must be dropped."""
+        if self.closed:
+            return True
+        if message.get("seq", 0) and message["seq"] <= self.replayed_seq:
+            # Recorded before the replay was cut but broadcast after it
+            return True
+        msg_type = message.get("type", "")
+        payload = message.get("payload") or {}
+
+        key = None
+        coalesce_field = _COALESCE_KEYS.get(msg_type)
+        merge_field = _MERGE_KEYS.get(msg_type)
+        if coalesce_field:
+            key = (msg_type, payload.get(coalesce_field))
+            for queued in self._queue:
+                if queued.key == key:
+                    self._queue.remove(queued)
+                    self.coalesced += 1
+                    break
+        elif merge_field:
+            key = (msg_type, payload.get(merge_field))
+            tail = self._queue[-1] if self._queue else None
+            if tail is not None and tail.key == key:
+                merged = dict(tail.message["payload"])
+                merged["text"] = merged.get("text", "") + payload.get("text", "")
+                merged["seq"] = payload.get("seq", merged.get("seq"))
+                tail.message = {**message, "payload": merged}
+                tail.data = None  # re-serialized at send time
+                self.coalesced += 1
+                return True
+
+        return self._enqueue(_Outgoing(message, data, key))
+
+    def _enqueue(self, item: _Outgoing) -> bool:
+        if len(self._queue) >= self._max_queue:
+            # Shed the oldest droppable event; if there is none, drop the
+            # incoming one when allowed, else the client has overflowed.
+            victim = next((q for q in self._queue if q.type in _DROPPABLE), None)
+            if victim is not None:
+                self._queue.remove(victim)
+            elif item.type in _DROPPABLE:
+                self.dropped += 1
+                return True
+            else:
+                return False
+            self.dropped += 1
+        self._queue.append(item)
+        self._wakeup.set()
+        return True
+
+    # ── Sender task ───────────────────────────────────────────────
+
+    async def _run(self) -> None:
+        try:
+            while not self.closed:
+                await self._wakeup.wait()
+                while self._queue:
+                    item = self._queue.popleft()
+                    data = item.data if item.data is not None else json.dumps(item.message)
+                    started = time.monotonic()
+                    # asyncio.timeout rather than wait_for: 3.11's wait_for can
+                    # swallow a cancel that races a completed send
+                    async with asyncio.timeout(_SEND_TIMEOUT_S):
+                        await self.websocket.send_text(data)
+                    now = time.monotonic()
+                    self.last_send_s = now - started
+                    self.max_lag_s = max(self.max_lag_s, now - item.enqueued_at)
+                    self.sent += 1
+                # No await between the empty check and clear(): nothing can be lost
+                self._wakeup.clear()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.info("War Room WS client %d send failed (%s); disconnecting", self.id, exc)
+            await self._manager.drop(self)
+
+    # ── Metrics ───────────────────────────────────────────────────
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        lag = now - self._queue[0].enqueued_at if self._queue else 0.0
+        return {
+            "id": self.id,
+            "connected_seconds": round(time.time() - self.connected_at, 1),
+            "queue_depth": len(self._queue),
+            "lag_ms": round(lag * 1000, 1),
+            "max_lag_ms": round(self.max_lag_s * 1000, 1),
+            "last_send_ms": round(self.last_send_s * 1000, 1),
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+        }
+
 
 class ConnectionManager:
     """Manages active War Room WebSocket connections."""
 
-    def __init__(self) -> None:
-        self._connections: list[WebSocket] = []
-        self._lock = asyncio.Lock()
+    def __init__(self, max_queue: int = _SEND_QUEUE_SIZE) -> None:
+        self._channels: Dict[WebSocket, ClientChannel] = {}
+        self._max_queue = max_queue
+        self._broadcasts = 0
+        self._disconnected_slow = 0
 
     async def connect(self, websocket: WebSocket) -> None:
         await websocket.accept()
-        async with self._lock:
-            self._connections.append(websocket)
-        count = len(self._connections)
-        logger.info("War Room WS connected (%d active)", count)
+        self.register(websocket)
+
+    def register(self, websocket: WebSocket, start: bool = True) -> ClientChannel:
+        """Start fanning out events to an accepted (and authenticated) socket.
+
+        With ``start=False`` events are queued but not sent until the
+        caller starts the channel (used to put a replay batch first).
+        """
+        channel = ClientChannel(websocket, self, max_queue=self._max_queue)
+        self._channels[websocket] = channel
+        if start:
+            channel.start()
+        logger.info("War Room WS connected (%d active)", len(self._channels))
+        return channel
 
     async def disconnect(self, websocket: WebSocket) -> None:
-        async with self._lock:
-            if websocket in self._connections:
-                self._connections.remove(websocket)
-        count = len(self._connections)
-        logger.info("War Room WS disconnected (%d active)", count)
+        channel = self._channels.pop(websocket, None)
+        if channel is not None:
+            await channel.stop()
+        logger.info("War Room WS disconnected (%d active)", len(self._channels))
+
+    async def drop(self, channel: ClientChannel) -> None:
+        """Disconnect a client whose sends failed or that fell too far behind."""
+        if self._channels.get(channel.websocket) is channel:
+            del self._channels[channel.websocket]
+        await channel.stop()
+        try:
+            await channel.websocket.close(code=1013, reason="Client too slow")
+        except Exception:
+            pass
 
     async def broadcast(self, message: dict) -> None:
-        """Send a JSON message to all connected clients."""
-        if not self._connections:
+        """Queue a JSON message for every connected client. Never waits on a socket."""
+        if not self._channels:
             return
+        self._broadcasts += 1
         data = json.dumps(message)
-        async with self._lock:
-            stale: list[WebSocket] = []
-            for ws in self._connections:
-                try:
-                    await ws.send_text(data)
-                except Exception:
-                    stale.append(ws)
-            for ws in stale:
-                self._connections.remove(ws)
+        for channel in list(self._channels.values()):
+            if not channel.offer(message, data):
+                self._disconnected_slow += 1
+                logger.warning(
+                    "War Room WS client %d queue full (%d queued); disconnecting",
+                    channel.id, self._max_queue,
+                )
+                asyncio.get_running_loop().create_task(self.drop(channel))
 
     @property
     def active_count(self) -> int:
-        return len(self._connections)
+        return len(self._channels)
+
+    def stats(self) -> dict:
+        """Snapshot of fan-out counters and per-connection lag/drops."""
+        return {
+            "active": len(self._channels),
+            "max_queue": self._max_queue,
+            "broadcasts": self._broadcasts,
+            "disconnected_slow": self._disconnected_slow,
+            "clients": [c.stats() for c in self._channels.values()],
+        }
 
 
 # Global singleton
@@ -80,6 +314,23 @@ async def _on_event(event: Event) -> None:
 event_bus.subscribe_all(_on_event)
 
 
+async def _replay_since(journal, since: int, upto: int) -> dict:
+    """Build the catch-up message for events ``since < seq <= upto``."""
+    events, complete = journal.since(since, upto)
+    if not complete:
+        # Older events may have spilled to disk; read them off the loop
+        before = events[0]["seq"] if events else upto + 1
+        spilled, complete = await asyncio.to_thread(journal.read_spill, since, before)
+        events = spilled + events
+    return {
+        "type": "replay",
+        "epoch": journal.epoch,
+        "seq": upto,
+        "complete": complete,
+        "events": events,
+    }
+
+
 def _verify_ws_token(token: str) -> bool:
     """Validate a WebSocket auth token against LANCELOT_API_TOKEN."""
     try:
@@ -106,6 +357,8 @@ async def warroom_websocket(websocket: WebSocket) -> None:
 
     # --- Authentication gate ---
     authenticated = False
+    since = None
+    client_epoch = None
 
     # Legacy: check query param (deprecated but supported for transition)
     query_token = websocket.query_params.get("token", "")
@@ -126,6 +379,8 @@ async def warroom_websocket(websocket: WebSocket) -> None:
             msg = json.loads(data)
             if msg.get("type") == "auth" and _verify_ws_token(msg.get("token", "")):
                 authenticated = True
+                since = msg.get("since")
+                client_epoch = msg.get("epoch")
             elif msg.get("type") == "ping":
                 # Some clients send ping first — check if dev mode allows unauthenticated
                 if _verify_ws_token(""):
@@ -142,13 +397,32 @@ async def warroom_websocket(websocket: WebSocket) -> None:
         logger.warning("War Room WS: rejected unauthenticated connection")
         return
 
-    await websocket.send_text(json.dumps({"type": "auth_ok"}))
+    journal = event_bus.journal
+    auth_ok = {"type": "auth_ok"}
+    if journal is not None:
+        auth_ok["epoch"] = journal.epoch
+        auth_ok["seq"] = journal.last_seq
+    await websocket.send_text(json.dumps(auth_ok))
 
     # --- Authenticated: register and handle messages ---
-    async with connection_manager._lock:
-        connection_manager._connections.append(websocket)
-    count = len(connection_manager._connections)
-    logger.info("War Room WS authenticated and connected (%d active)", count)
+    if journal is not None and isinstance(since, int) and since >= 0:
+        if client_epoch != journal.epoch:
+            since = 0  # seq numbers from an earlier run mean nothing now
+        # Register before reading the journal so live events published
+        # while the replay is built queue up behind it
+        channel = connection_manager.register(websocket, start=False)
+        upto = journal.last_seq
+        channel.replayed_seq = upto
+        try:
+            replay = await _replay_since(journal, since, upto)
+        except Exception as exc:
+            logger.warning("War Room WS: replay since %d failed: %s", since, exc)
+            replay = {"type": "replay", "epoch": journal.epoch, "seq": upto,
+                      "complete": False, "events": []}
+        if not channel.closed:
+            channel.start(first=replay)
+    else:
+        connection_manager.register(websocket)
 
     try:
         while True:
@@ -13,9 +13,9 @@ Key rules:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
-from concurrent.futures import Future
 from datetime import datetime, timezone
 from typing import Any, Callable, Dict, List, Optional
 
@@ -47,9 +47,9 @@ class ArchitectAgent:
     Lifecycle:
     1. Receive goal → generate quest_id
     2. Decompose into subtasks (via TaskDecomposer)
-    3. For each execution group:
-       a. Spawn agents
-       b. Execute concurrently
+    3. Execute subtasks as a dependency graph:
+       a. Spawn an agent as soon as a subtask's predecessors finish
+       b. Await agents concurrently (per-agent timeouts)
        c. Collect results
     4. Handle interventions (replan with feedback)
     5. Assemble and return results
@@ -167,58 +167,76 @@ class ArchitectAgent:
         plan: DecomposedTask,
         quest_id: str,
     ) -> List[TaskResult]:
-        """Execute a decomposed plan group by group.
+        """Execute a decomposed plan as a dependency graph.
 
-        Groups are executed sequentially; agents within a group
-        execute concurrently.
-        """
-        all_results: List[TaskResult] = []
-
-        for group_idx, group in enumerate(plan.execution_order):
-            logger.info(
-                "Quest %s: executing group %d/%d (%d agents)",
-                quest_id, group_idx + 1, len(plan.execution_order), len(group),
-            )
+        Each subtask starts as soon as its own predecessors have finished
+        (``TaskSpec.depends_on``, defaulting to the previous execution
+        group), so a slow agent only delays the subtasks that need it.
+        Agents run on the lifecycle manager's threads and are awaited
+        without blocking the event loop.
 
-            group_results = await self._execute_group(
-                plan, group, quest_id,
-            )
-            all_results.extend(group_results)
-
-            # Check for critical failures
-            failures = [r for r in group_results if not r.success]
-            if failures:
-                critical = any(
-                    r.collapse_reason == CollapseReason.OPERATOR_KILL
-                    or r.collapse_reason == CollapseReason.OPERATOR_KILL_ALL
-                    for r in failures
-                )
-                if critical:
+        An operator kill stops new subtasks from starting; agents already
+        running are left to finish. Results are returned in plan order.
+        """
+        order = self._scheduled_indices(plan)
+        dependencies = self._subtask_dependencies(plan, order)
+        results: Dict[int, TaskResult] = {}
+        pending = list(order)
+        running: Dict[asyncio.Task, int] = {}
+        stopped = False
+
+        while pending or running:
+            if not stopped:
+                ready = [i for i in pending if all(d in results for d in dependencies[i])]
+                for idx in ready:
+                    pending.remove(idx)
+                    running[asyncio.ensure_future(self._run_subtask(plan, idx, quest_id))] = idx
+                if ready:
+                    logger.info(
+                        "Quest %s: started %d subtask(s), %d running, %d waiting",
+                        quest_id, len(ready), len(running), len(pending),
+                    )
+            if not running:
+                break
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                idx = running.pop(task)
+                result = task.result()
+                results[idx] = result
+                if not stopped and result.collapse_reason in (
+                    CollapseReason.OPERATOR_KILL, CollapseReason.OPERATOR_KILL_ALL,
+                ):
                     logger.warning(
                         "Quest %s: operator kill detected, stopping execution",
                         quest_id,
                     )
-                    break
+                    stopped = True
+
+        if pending and not stopped:
+            logger.error(
+                "Quest %s: %d subtask(s) never became ready", quest_id, len(pending),
+            )
 
-        return all_results
+        return [results[i] for i in order if i in results]
 
-    async def _execute_group(
+    async def _run_subtask(
         self,
         plan: DecomposedTask,
-        group_indices: List,
+        idx: int,
         quest_id: str,
-    ) -> List[TaskResult]:
-        """Execute a single group of subtasks concurrently."""
-        futures: List[tuple[str, Future]] = []
-
-        for raw_idx in group_indices:
-            idx = int(raw_idx) if isinstance(raw_idx, str) else raw_idx
-            if idx >= len(plan.subtasks):
-                continue
-            spec = plan.subtasks[idx]
+    ) -> TaskResult:
+        """Spawn an agent for one subtask and await its result.
 
+        The agent's timeout is its spec's, capped by the configured
+        default; an agent that overruns is killed.
+        """
+        spec = plan.subtasks[idx]
+        agent_id = ""
+        try:
             # Spawn agent
             record = self._lifecycle.spawn(spec, quest_id=quest_id)
+            agent_id = record.agent_id
 
             # Build actions for the agent with full context for UAB execution
             task_context = plan.context.get("original_context", {}) if plan.context else {}
@@ -230,27 +248,74 @@ class ArchitectAgent:
             }]
 
             # Execute
-            future = self._lifecycle.execute(record.agent_id, actions)
-            futures.append((record.agent_id, future))
-
-        # Collect results
-        results = []
-        for agent_id, future in futures:
+            future = self._lifecycle.execute(agent_id, actions)
+            timeout = min(spec.timeout_seconds, self._config.default_task_timeout)
             try:
-                result = future.result(timeout=self._config.default_task_timeout)
-                results.append(result)
-                self._results[agent_id] = result
-            except Exception as exc:
-                logger.error("Agent %s failed: %s", agent_id, exc)
-                results.append(TaskResult(
-                    task_id="",
+                result = await asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.error("Agent %s timed out after %ss", agent_id, timeout)
+                try:
+                    self._lifecycle.kill(agent_id, f"Timed out after {timeout}s")
+                except Exception:
+                    pass
+                result = TaskResult(
+                    task_id=spec.task_id,
                     agent_id=agent_id,
                     success=False,
-                    error_message=str(exc),
-                    collapse_reason=CollapseReason.ERROR,
-                ))
+                    error_message=f"Timed out after {timeout}s",
+                    collapse_reason=CollapseReason.TIMEOUT,
+                )
+        except Exception as exc:
+            logger.error("Agent %s failed: %s", agent_id or f"for subtask {idx}", exc)
+            result = TaskResult(
+                task_id=spec.task_id,
+                agent_id=agent_id,
+                success=False,
+                error_message=str(exc),
+                collapse_reason=CollapseReason.ERROR,
+            )
+
+        if agent_id:
+            self._results[agent_id] = result
+        return result
 
-        return results
+    @staticmethod
+    def _scheduled_indices(plan: DecomposedTask) -> List[int]:
+        """Subtask indices named in execution_order, in plan order."""
+        order: List[int] = []
+        for group in plan.execution_order:
+            for raw_idx in group:
+                idx = int(raw_idx) if isinstance(raw_idx, str) else raw_idx
+                if idx < len(plan.subtasks) and idx not in order:
+                    order.append(idx)
+        return order
+
+    @staticmethod
+    def _subtask_dependencies(plan: DecomposedTask, order: List[int]) -> Dict[int, List[int]]:
+        """Predecessors each scheduled subtask waits for.
+
+        Explicit ``depends_on`` wins; otherwise a subtask waits for every
+        scheduled subtask in the previous execution group. Dependencies on
+        subtasks that are not scheduled are ignored.
+        """
+        scheduled = set(order)
+        dependencies: Dict[int, List[int]] = {}
+        previous_group: List[int] = []
+        for group in plan.execution_order:
+            current: List[int] = []
+            for raw_idx in group:
+                idx = int(raw_idx) if isinstance(raw_idx, str) else raw_idx
+                if idx not in scheduled or idx in dependencies:
+                    continue
+                spec = plan.subtasks[idx]
+                if spec.depends_on is not None:
+                    dependencies[idx] = [d for d in spec.depends_on if d in scheduled and d != idx]
+                else:
+                    dependencies[idx] = list(previous_group)
+                current.append(idx)
+            if current:
+                previous_group = current
+        return dependencies
 
     # ── Decomposition ────────────────────────────────────────────────
 
@@ -448,6 +513,7 @@ class ArchitectAgent:
         import hashlib
         content = "|".join(
             f"{s.description}:{s.priority}:{s.control_method}"
+            + (f":{s.depends_on}" if s.depends_on is not None else "")
             for s in plan.subtasks
         )
         content += "|" + str(plan.execution_order)
@@ -45,6 +45,9 @@ executed independently or in dependency order.
 - Maximum {max_subtasks} subtasks
 - Each subtask must have: description, priority (critical/high/normal/low), control_method (fully_autonomous/supervised/manual_confirm)
 - Group subtasks into execution_order groups (subtasks in same group run in parallel)
+- Optionally give a subtask "depends_on": the indices of the subtasks whose
+  results it actually needs. It then starts as soon as those finish instead
+  of waiting for the whole previous group. Omit it to wait for the previous group.
 - Higher-risk actions should use supervised or manual_confirm control
 - Read-only operations can be fully_autonomous
 
@@ -138,6 +141,9 @@ class TaskDecomposer:
             filtered = [idx for idx in group if idx < max_idx]
             if filtered:
                 execution_order.append(filtered)
+        for i, spec in enumerate(subtasks):
+            if spec.depends_on is not None:
+                spec.depends_on = [d for d in spec.depends_on if d < max_idx and d != i]
 
         # Validate
         self._validate(subtasks, execution_order)
@@ -253,11 +259,27 @@ class TaskDecomposer:
                 timeout_seconds=raw_task.get("timeout_seconds", 300),
                 max_actions=raw_task.get("max_actions", 50),
                 allowed_categories=raw_task.get("allowed_categories"),
+                depends_on=self._parse_depends_on(raw_task.get("depends_on")),
             )
             subtasks.append(spec)
 
         return subtasks
 
+    @staticmethod
+    def _parse_depends_on(raw: Any) -> Optional[List[int]]:
+        """Normalize a subtask's depends_on list; None when not given."""
+        if not isinstance(raw, list):
+            return None
+        deps = []
+        for item in raw:
+            try:
+                idx = int(item)
+            except (TypeError, ValueError):
+                continue
+            if idx >= 0 and idx not in deps:
+                deps.append(idx)
+        return deps
+
     def _validate(
         self,
         subtasks: List[TaskSpec],
@@ -289,3 +311,21 @@ class TaskDecomposer:
                         f"execution_order references index {int_idx} multiple times"
                     )
                 all_indices.add(int_idx)
+
+        # depends_on must not form a cycle (the subtasks would never start)
+        state: Dict[int, int] = {}  # 1 = visiting, 2 = done
+
+        def visit(idx: int) -> None:
+            state[idx] = 1
+            for dep in subtasks[idx].depends_on or []:
+                if state.get(dep) == 1:
+                    raise TaskDecompositionError(
+                        f"depends_on forms a cycle through subtask {dep}"
+                    )
+                if dep not in state:
+                    visit(dep)
+            state[idx] = 2
+
+        for idx in range(len(subtasks)):
+            if idx not in state:
+                visit(idx)
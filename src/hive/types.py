@@ -95,6 +95,9 @@ class TaskSpec:
     context: Dict[str, Any] = field(default_factory=dict)
     parent_task_id: Optional[str] = None
     execution_group: int = 0  # Tasks in same group run concurrently
+    # Indices (into the plan's subtasks) that must finish before this one
+    # starts; None = everything in the previous execution_order group
+    depends_on: Optional[List[int]] = None
 
     def __post_init__(self):
         if self.timeout_seconds < 1:
@@ -6,6 +6,11 @@ and routes them through the Lancelot orchestrator.
 
 Supports text messages and voice notes (Fix Pack V1 PR7).
 Uses only `requests` (no extra dependencies beyond voice_processor).
+
+Updates are dispatched off the polling thread: ActionCard callbacks run on
+a small fast-lane pool, messages on one ordered worker per chat, so a long
+chat turn neither stalls polling nor delays button clicks. All API calls
+share one keep-alive session.
 """
 
 import json
@@ -15,13 +20,23 @@ import time
 import threading
 import logging
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Set
+
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger("lancelot.telegram_bot")
 
 # Telegram Bot API base
 TG_API = "https://api.telegram.org/bot{token}/{method}"
 
+# Concurrent callback handlers (ActionCard clicks are instant, keep this small)
+_CALLBACK_WORKERS = 4
+# Keep-alive connections held by the shared session: one long-poll, one
+# per callback worker, and a few for chat lanes and bridge edits
+_HTTP_POOL_SIZE = 10
+
 
 class TelegramBot:
     """
@@ -47,6 +62,21 @@ class TelegramBot:
         self._offset = self._load_offset()  # V33: Persist across restarts
         self._receipt_service = None  # Set externally if available
 
+        # Shared keep-alive session: avoids a TLS handshake per API call
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=_HTTP_POOL_SIZE)
+        self._http.mount("https://", adapter)
+
+        # Dispatcher state. _offset is the persisted low-water mark (every
+        # update below it is fully handled); _fetch_offset runs ahead of it
+        # so getUpdates does not re-deliver updates still being handled.
+        self._fetch_offset = self._offset
+        self._offset_lock = threading.Lock()
+        self._inflight: Set[int] = set()
+        self._handled_high = self._offset
+        self._callback_pool = None
+        self._chat_lanes: Dict[str, ThreadPoolExecutor] = {}
+
         if not self.token:
             logger.warning("TelegramBot: No LANCELOT_TELEGRAM_TOKEN set.")
         if not self.chat_id:
@@ -68,8 +98,10 @@ class TelegramBot:
         """Persist current offset to disk."""
         try:
             os.makedirs(os.path.dirname(self._OFFSET_FILE), exist_ok=True)
-            with open(self._OFFSET_FILE, "w") as f:
-                f.write(str(self._offset))
+            # Lanes finish concurrently; serialize writers of the offset file
+            with self._offset_lock:
+                with open(self._OFFSET_FILE, "w") as f:
+                    f.write(str(self._offset))
         except Exception:
             pass  # Non-critical — worst case we re-process on restart
 
@@ -87,6 +119,16 @@ class TelegramBot:
 
     def stop_polling(self):
         self.running = False
+        # Queued updates are dropped; they are re-fetched on restart because
+        # the persisted offset never moves past an unhandled update.
+        with self._offset_lock:
+            pools = list(self._chat_lanes.values())
+            self._chat_lanes.clear()
+            if self._callback_pool:
+                pools.append(self._callback_pool)
+                self._callback_pool = None
+        for pool in pools:
+            pool.shutdown(wait=False, cancel_futures=True)
         logger.info("TelegramBot: Polling stopped.")
 
     @staticmethod
@@ -535,7 +577,7 @@ class TelegramBot:
                     clean = clean.replace("&amp;", "&").replace("&lt;", "<").replace("&gt;", ">")
                     payload["text"] = clean
 
-                resp = requests.post(url, json=payload, timeout=15)
+                resp = self._http.post(url, json=payload, timeout=15)
                 if resp.ok:
                     result = resp.json().get("result", {})
                     message_id = result.get("message_id")
@@ -582,7 +624,7 @@ class TelegramBot:
                     clean = clean.replace("&amp;", "&").replace("&lt;", "<").replace("&gt;", ">")
                     payload["text"] = clean
 
-                resp = requests.post(url, json=payload, timeout=15)
+                resp = self._http.post(url, json=payload, timeout=15)
                 if resp.ok:
                     return True
                 # Telegram returns error if message content is unchanged — not a real error
@@ -597,6 +639,24 @@ class TelegramBot:
 
         return False
 
+    def delete_message(self, message_id: int, chat_id: str = None) -> bool:
+        """Delete a message. Uses Telegram deleteMessage API.
+
+        Used by the response stream bridge to remove its live preview once
+        the final response is delivered. Returns True on success.
+        """
+        target = chat_id or self.chat_id
+        if not self.token or not target:
+            return False
+
+        url = TG_API.format(token=self.token, method="deleteMessage")
+        try:
+            resp = self._http.post(url, json={"chat_id": target, "message_id": message_id}, timeout=15)
+            return resp.ok
+        except Exception as e:
+            logger.error("TelegramBot: delete_message error: %s", e)
+            return False
+
     def answer_callback_query(self, callback_query_id: str, text: str = "") -> bool:
         """Answer a callback_query (required by Telegram API to stop the loading spinner).
 
@@ -611,7 +671,7 @@ class TelegramBot:
             payload["text"] = text[:200]  # Telegram limit for callback answer
 
         try:
-            resp = requests.post(url, json=payload, timeout=15)
+            resp = self._http.post(url, json=payload, timeout=15)
             return resp.ok
         except Exception as e:
             logger.error("TelegramBot: answer_callback_query error: %s", e)
@@ -680,7 +740,7 @@ class TelegramBot:
                     }
                     if parse_mode:
                         payload["parse_mode"] = parse_mode
-                    resp = requests.post(url, json=payload, timeout=15)
+                    resp = self._http.post(url, json=payload, timeout=15)
                     if resp.ok:
                         sent = True
                         break
@@ -705,13 +765,17 @@ class TelegramBot:
     # ------------------------------------------------------------------
 
     def _poll_loop(self):
-        """Long-polling loop using getUpdates."""
+        """Long-polling loop using getUpdates.
+
+        Only fetches and dispatches; handlers run on the callback pool and
+        per-chat lanes (see _dispatch).
+        """
         logger.info("TelegramBot: _poll_loop thread started (running=%s)", self.running)
         while self.running:
             try:
                 url = TG_API.format(token=self.token, method="getUpdates")
-                resp = requests.post(url, json={
-                    "offset": self._offset,
+                resp = self._http.post(url, json={
+                    "offset": self._fetch_offset,
                     "timeout": 30,  # long-poll 30s
                     "allowed_updates": ["message", "callback_query"],
                 }, timeout=40)
@@ -729,12 +793,10 @@ class TelegramBot:
 
                 updates = data.get("result", [])
                 if updates:
-                    logger.info("TelegramBot: Received %d update(s), offset=%s", len(updates), self._offset)
+                    logger.info("TelegramBot: Received %d update(s), offset=%s", len(updates), self._fetch_offset)
                 for update in updates:
-                    self._handle_update(update)
-                # V33: Persist offset after processing batch so restarts don't re-process
-                if updates:
-                    self._save_offset()
+                    self._fetch_offset = max(self._fetch_offset, update.get("update_id", 0) + 1)
+                    self._dispatch(update)
 
             except requests.exceptions.Timeout:
                 # Normal for long-polling — just loop again
@@ -743,6 +805,59 @@ class TelegramBot:
                 logger.error("TelegramBot: Poll error: %s", e)
                 time.sleep(5)
 
+    def _dispatch(self, update: dict) -> None:
+        """Route an update to the lane that will handle it.
+
+        Callback queries go to the fast-lane pool; messages from the
+        configured chat go to that chat's single-worker lane, preserving
+        order within the chat. Anything else is acked inline (it only logs).
+        """
+        update_id = update.get("update_id", 0)
+        with self._offset_lock:
+            self._inflight.add(update_id)
+            if "callback_query" in update:
+                if self._callback_pool is None:
+                    self._callback_pool = ThreadPoolExecutor(
+                        max_workers=_CALLBACK_WORKERS, thread_name_prefix="tg-callback",
+                    )
+                lane = self._callback_pool
+            else:
+                chat_id = str(update.get("message", {}).get("chat", {}).get("id", ""))
+                if chat_id and (not self.chat_id or chat_id == self.chat_id):
+                    lane = self._chat_lanes.get(chat_id)
+                    if lane is None:
+                        lane = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"tg-chat-{chat_id}")
+                        self._chat_lanes[chat_id] = lane
+                else:
+                    lane = None
+        if lane is None:
+            self._run_update(update)
+        else:
+            lane.submit(self._run_update, update)
+
+    def _run_update(self, update: dict) -> None:
+        """Handle one update on its lane and persist the offset it frees."""
+        update_id = update.get("update_id", 0)
+        try:
+            self._handle_update(update)
+        except Exception as e:
+            # Ack anyway: with concurrent lanes a retry-forever update would
+            # pin the persisted offset and replay every later update on restart
+            logger.error("TelegramBot: Unhandled error for update %s: %s", update_id, e)
+            self._ack(update_id)
+        # V33: Persist offset so restarts don't re-process handled updates
+        self._save_offset()
+
+    def _ack(self, update_id: int) -> None:
+        """Mark an update fully handled and advance the low-water offset."""
+        with self._offset_lock:
+            self._inflight.discard(update_id)
+            self._handled_high = max(self._handled_high, update_id + 1)
+            if self._inflight:
+                self._offset = max(self._offset, min(self._inflight))
+            else:
+                self._offset = max(self._offset, self._handled_high)
+
     def send_document(self, file_bytes: bytes, filename: str, chat_id: str = None, caption: str = None):
         """Sends a document/file to the configured chat."""
         # V33: Trace all document sends for debugging JSON injection
@@ -766,7 +881,7 @@ class TelegramBot:
             data = {"chat_id": target}
             if caption:
                 data["caption"] = caption[:1024]  # Telegram caption limit
-            resp = requests.post(
+            resp = self._http.post(
                 url,
                 data=data,
                 files={"document": (filename, file_bytes, "application/octet-stream")},
@@ -790,7 +905,7 @@ class TelegramBot:
 
         url = TG_API.format(token=self.token, method="sendVoice")
         try:
-            resp = requests.post(
+            resp = self._http.post(
                 url,
                 data={"chat_id": target},
                 files={"voice": ("reply.ogg", audio_bytes, "audio/ogg")},
@@ -805,7 +920,7 @@ class TelegramBot:
         """Download a file from Telegram by file_id."""
         # Step 1: Get file path
         url = TG_API.format(token=self.token, method="getFile")
-        resp = requests.get(url, params={"file_id": file_id}, timeout=15)
+        resp = self._http.get(url, params={"file_id": file_id}, timeout=15)
         if not resp.ok:
             raise RuntimeError(f"getFile failed: {resp.text[:200]}")
 
@@ -815,7 +930,7 @@ class TelegramBot:
 
         # Step 2: Download file content
         download_url = f"https://api.telegram.org/file/bot{self.token}/{file_path}"
-        dl_resp = requests.get(download_url, timeout=30)
+        dl_resp = self._http.get(download_url, timeout=30)
         if not dl_resp.ok:
             raise RuntimeError(f"File download failed: {dl_resp.status_code}")
 
@@ -827,6 +942,9 @@ class TelegramBot:
         V15b: Offset is now incremented AFTER processing succeeds (or is
         deliberately skipped for non-message updates). This prevents permanent
         message loss if orchestrator.chat() crashes mid-processing.
+
+        Runs on a dispatcher lane; _ack() only advances the persisted offset
+        once every earlier in-flight update has been handled as well.
         """
         update_id = update.get("update_id", 0)
 
@@ -834,13 +952,13 @@ class TelegramBot:
         callback_query = update.get("callback_query")
         if callback_query:
             self._handle_callback_query(callback_query)
-            self._offset = update_id + 1
+            self._ack(update_id)
             return
 
         msg = update.get("message")
         if not msg:
             # Non-message updates (edited_message, etc.) — ack and skip
-            self._offset = update_id + 1
+            self._ack(update_id)
             return
 
         sender_chat_id = str(msg.get("chat", {}).get("id", ""))
@@ -849,14 +967,14 @@ class TelegramBot:
         # Only respond to the configured chat (security)
         if self.chat_id and sender_chat_id != self.chat_id:
             logger.warning(f"TelegramBot: Ignoring message from unauthorized chat {sender_chat_id}")
-            self._offset = update_id + 1  # Ack ignored messages
+            self._ack(update_id)  # Ack ignored messages
             return
 
         # Check for voice note / audio
         voice = msg.get("voice") or msg.get("audio")
         if voice:
             self._handle_voice(voice, sender_chat_id, sender_name)
-            self._offset = update_id + 1
+            self._ack(update_id)
             return
 
         # V14: Check for photo messages
@@ -865,7 +983,7 @@ class TelegramBot:
             caption = msg.get("caption", "What's in this image?")
             largest = photo[-1]  # Highest resolution
             self._handle_photo(largest["file_id"], caption, sender_chat_id, sender_name)
-            self._offset = update_id + 1
+            self._ack(update_id)
             return
 
         # V14: Check for document messages
@@ -873,19 +991,19 @@ class TelegramBot:
         if document:
             caption = msg.get("caption", "Please analyze this document.")
             self._handle_document(document, caption, sender_chat_id, sender_name)
-            self._offset = update_id + 1
+            self._ack(update_id)
             return
 
         text = msg.get("text", "")
         if not text:
-            self._offset = update_id + 1
+            self._ack(update_id)
             return
 
         logger.info(f"TelegramBot: [{sender_name}] {text[:50]}...")
 
         if not self.orchestrator:
             self.send_message("Lancelot orchestrator is not available.", sender_chat_id)
-            self._offset = update_id + 1
+            self._ack(update_id)
             return
 
         try:
@@ -899,12 +1017,12 @@ class TelegramBot:
                     logger.info("TelegramBot: Response already sent via telegram_send — skipping duplicate")
                 self.orchestrator._telegram_already_sent = False  # Reset for next message
             # V15b: Only ack after successful processing
-            self._offset = update_id + 1
+            self._ack(update_id)
         except Exception as e:
             logger.error(f"TelegramBot: Orchestrator error: {e}")
             self.send_message(f"Error processing request: {e}", sender_chat_id)
             # V15b: Still ack on handled errors (user got an error message)
-            self._offset = update_id + 1
+            self._ack(update_id)
 
     def _handle_voice(self, voice: dict, chat_id: str, sender_name: str):
         """Handle a voice note: STT → orchestrator → TTS → voice reply."""
@@ -9,19 +9,61 @@ Receipts are:
 - Hidden from users by default
 - Always available for audit
 - Persisted in SQLite for durability
+
+Write-behind mode (LANCELOT_RECEIPTS_WRITE_BEHIND, default on):
+``create``/``update`` enqueue the row in memory and a background writer
+drains the queue into ``executemany`` batches every
+LANCELOT_RECEIPTS_FLUSH_MS (default 250) or once
+LANCELOT_RECEIPTS_BATCH_SIZE (default 128) rows are pending. A create
+followed by its update before the next flush collapses into one INSERT.
+``get()`` is served from the queue (read-your-writes), every other query
+flushes first, and ``close()``/interpreter exit flush durably. At most
+LANCELOT_RECEIPTS_MAX_PENDING (default 1024) rows are ever buffered —
+producers flush synchronously beyond that — so a crash loses at most one
+flush interval or that many rows.
+
+Partitioning: receipts are stored one SQLite file per calendar month under
+``<data_dir>/receipts/`` (``receipts-YYYY-MM.db``), each with its own FTS
+index and stats rollup, and time-filtered queries only open the months
+they overlap. Months older than LANCELOT_RECEIPTS_HOT_MONTHS (default 3)
+are compacted into gzip'd read-only archives (``receipts-YYYY-MM.db.gz``)
+that queries load into memory on demand, keeping the
+LANCELOT_RECEIPTS_ARCHIVE_CACHE (default 2) most recent ones open.
+Retention drops whole files. A pre-partitioning ``receipts.db`` is split
+into partitions by a background thread on first start; until it is done,
+queries wait for it and writes go straight to the partitions.
+
+A small id index (``receipts/index.db``) records each receipt's month,
+quest and parent, so lookups by id, quest or parent open only the months
+that hold matching rows instead of every partition and archive.
 """
 
 import os
+import re
+import gzip
 import uuid
 import json
+import atexit
+import shutil
+import logging
 import sqlite3
 import threading
+import time
+import weakref
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, Iterable
+from urllib.request import pathname2url
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 from contextlib import contextmanager
 
+logger = logging.getLogger(__name__)
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    return os.getenv(name, "true" if default else "false").lower() in ("true", "1", "yes")
+
 
 class ActionType(str, Enum):
     """Types of actions that generate receipts."""
@@ -186,44 +228,424 @@ class ReceiptService:
     CREATE INDEX IF NOT EXISTS idx_receipts_status ON receipts(status);
     CREATE INDEX IF NOT EXISTS idx_receipts_quest_id ON receipts(quest_id);
     CREATE INDEX IF NOT EXISTS idx_receipts_parent_id ON receipts(parent_id);
+
+    CREATE TABLE IF NOT EXISTS schema_meta (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    );
+    """
+
+    # FTS5 index for search(). Keyed by receipts.rowid; it stores its own
+    # copy of the text so deleting a never-indexed row is a harmless no-op.
+    CREATE_FTS_SQL = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS receipts_fts USING fts5(
+        action_name,
+        inputs,
+        outputs,
+        error_message
+    );
+
+    CREATE TRIGGER IF NOT EXISTS receipts_fts_ai AFTER INSERT ON receipts BEGIN
+        INSERT INTO receipts_fts(rowid, action_name, inputs, outputs, error_message)
+        VALUES (NEW.rowid, NEW.action_name, NEW.inputs, NEW.outputs, COALESCE(NEW.error_message, ''));
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS receipts_fts_ad AFTER DELETE ON receipts BEGIN
+        DELETE FROM receipts_fts WHERE rowid = OLD.rowid;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS receipts_fts_au AFTER UPDATE ON receipts BEGIN
+        DELETE FROM receipts_fts WHERE rowid = OLD.rowid;
+        INSERT INTO receipts_fts(rowid, action_name, inputs, outputs, error_message)
+        VALUES (NEW.rowid, NEW.action_name, NEW.inputs, NEW.outputs, COALESCE(NEW.error_message, ''));
+    END;
     """
 
-    def __init__(self, data_dir: str = "/home/lancelot/data"):
+    # Hourly rollup for get_stats(), maintained by triggers. Buckets are
+    # keyed by the first 13 chars of the ISO timestamp ("YYYY-MM-DDTHH").
+    # Maxima only ever grow, so after a row moves out of a bucket (status
+    # change, delete) the bucket max is an upper bound.
+    CREATE_STATS_SQL = """
+    CREATE TABLE IF NOT EXISTS receipt_stats_hourly (
+        hour TEXT NOT NULL,
+        action_type TEXT NOT NULL,
+        status TEXT NOT NULL,
+        count INTEGER NOT NULL DEFAULT 0,
+        token_n INTEGER NOT NULL DEFAULT 0,
+        token_sum INTEGER NOT NULL DEFAULT 0,
+        token_max INTEGER,
+        duration_n INTEGER NOT NULL DEFAULT 0,
+        duration_sum INTEGER NOT NULL DEFAULT 0,
+        duration_max INTEGER,
+        PRIMARY KEY (hour, action_type, status)
+    );
+
+    CREATE TRIGGER IF NOT EXISTS receipt_stats_ai AFTER INSERT ON receipts BEGIN
+        INSERT INTO receipt_stats_hourly (
+            hour, action_type, status, count,
+            token_n, token_sum, token_max, duration_n, duration_sum, duration_max
+        ) VALUES (
+            substr(NEW.timestamp, 1, 13), NEW.action_type, NEW.status, 1,
+            NEW.token_count IS NOT NULL, COALESCE(NEW.token_count, 0), NEW.token_count,
+            NEW.duration_ms IS NOT NULL, COALESCE(NEW.duration_ms, 0), NEW.duration_ms
+        )
+        ON CONFLICT (hour, action_type, status) DO UPDATE SET
+            count = count + 1,
+            token_n = token_n + excluded.token_n,
+            token_sum = token_sum + excluded.token_sum,
+            token_max = max(COALESCE(token_max, excluded.token_max), COALESCE(excluded.token_max, token_max)),
+            duration_n = duration_n + excluded.duration_n,
+            duration_sum = duration_sum + excluded.duration_sum,
+            duration_max = max(COALESCE(duration_max, excluded.duration_max), COALESCE(excluded.duration_max, duration_max));
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS receipt_stats_ad AFTER DELETE ON receipts BEGIN
+        UPDATE receipt_stats_hourly SET
+            count = count - 1,
+            token_n = token_n - (OLD.token_count IS NOT NULL),
+            token_sum = token_sum - COALESCE(OLD.token_count, 0),
+            duration_n = duration_n - (OLD.duration_ms IS NOT NULL),
+            duration_sum = duration_sum - COALESCE(OLD.duration_ms, 0)
+        WHERE hour = substr(OLD.timestamp, 1, 13)
+          AND action_type = OLD.action_type AND status = OLD.status;
+        DELETE FROM receipt_stats_hourly
+        WHERE hour = substr(OLD.timestamp, 1, 13)
+          AND action_type = OLD.action_type AND status = OLD.status AND count <= 0;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS receipt_stats_au
+    AFTER UPDATE OF timestamp, action_type, status, token_count, duration_ms ON receipts BEGIN
+        UPDATE receipt_stats_hourly SET
+            count = count - 1,
+            token_n = token_n - (OLD.token_count IS NOT NULL),
+            token_sum = token_sum - COALESCE(OLD.token_count, 0),
+            duration_n = duration_n - (OLD.duration_ms IS NOT NULL),
+            duration_sum = duration_sum - COALESCE(OLD.duration_ms, 0)
+        WHERE hour = substr(OLD.timestamp, 1, 13)
+          AND action_type = OLD.action_type AND status = OLD.status;
+        DELETE FROM receipt_stats_hourly
+        WHERE hour = substr(OLD.timestamp, 1, 13)
+          AND action_type = OLD.action_type AND status = OLD.status AND count <= 0;
+        INSERT INTO receipt_stats_hourly (
+            hour, action_type, status, count,
+            token_n, token_sum, token_max, duration_n, duration_sum, duration_max
+        ) VALUES (
+            substr(NEW.timestamp, 1, 13), NEW.action_type, NEW.status, 1,
+            NEW.token_count IS NOT NULL, COALESCE(NEW.token_count, 0), NEW.token_count,
+            NEW.duration_ms IS NOT NULL, COALESCE(NEW.duration_ms, 0), NEW.duration_ms
+        )
+        ON CONFLICT (hour, action_type, status) DO UPDATE SET
+            count = count + 1,
+            token_n = token_n + excluded.token_n,
+            token_sum = token_sum + excluded.token_sum,
+            token_max = max(COALESCE(token_max, excluded.token_max), COALESCE(excluded.token_max, token_max)),
+            duration_n = duration_n + excluded.duration_n,
+            duration_sum = duration_sum + excluded.duration_sum,
+            duration_max = max(COALESCE(duration_max, excluded.duration_max), COALESCE(excluded.duration_max, duration_max));
+    END;
+    """
+
+    # Single-pass aggregate, used to seed the rollup and for the tail scan
+    STATS_GROUP_SQL = """
+        SELECT
+            {hour} AS hour, action_type, status,
+            COUNT(*) AS count,
+            COUNT(token_count) AS token_n,
+            COALESCE(SUM(token_count), 0) AS token_sum,
+            MAX(token_count) AS token_max,
+            COUNT(duration_ms) AS duration_n,
+            COALESCE(SUM(duration_ms), 0) AS duration_sum,
+            MAX(duration_ms) AS duration_max
+        FROM receipts
+        WHERE {where}
+        GROUP BY {group}
+    """
+
+    # BM25 column weights: action_name, inputs, outputs, error_message
+    FTS_WEIGHTS = (4.0, 1.0, 1.0, 2.0)
+    # Rowids indexed per transaction when backfilling a partition's FTS index
+    FTS_BACKFILL_CHUNK = 5000
+
+    PARTITION_DIR = "receipts"
+    PARTITION_RE = re.compile(r"^receipts-(\d{4}-\d{2})\.db(\.gz)?$")
+    INDEX_FILE = "index.db"
+    # Scratch files left behind by a compaction cut short by a crash
+    SCRATCH_RE = re.compile(r"^receipts-.*\.(work|work-journal|tmp)$")
+    # Timestamps that don't start with "YYYY-MM" are filed under this month
+    UNDATED_MONTH = "0000-00"
+    MONTH_SQL = (
+        "CASE WHEN timestamp GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]*' "
+        "THEN substr(timestamp, 1, 7) ELSE '0000-00' END"
+    )
+    COLUMNS = (
+        "id, timestamp, action_type, action_name, inputs, outputs, status, "
+        "duration_ms, token_count, tier, parent_id, quest_id, error_message, metadata"
+    )
+
+    INDEX_SQL = """
+    CREATE TABLE IF NOT EXISTS receipt_index (
+        id TEXT PRIMARY KEY,
+        month TEXT NOT NULL,
+        timestamp TEXT NOT NULL,
+        quest_id TEXT,
+        parent_id TEXT
+    );
+    CREATE INDEX IF NOT EXISTS idx_receipt_index_quest_id ON receipt_index(quest_id);
+    CREATE INDEX IF NOT EXISTS idx_receipt_index_parent_id ON receipt_index(parent_id);
+
+    CREATE TABLE IF NOT EXISTS index_meta (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    );
+    """
+
+    INDEX_INSERT_SQL = """
+        INSERT OR IGNORE INTO receipt_index (id, month, timestamp, quest_id, parent_id)
+        VALUES (?, ?, ?, ?, ?)
+    """
+
+    # Retries of a compaction invalidated by writes to its month before
+    # the last attempt runs under _flush_lock
+    COMPACT_ATTEMPTS = 3
+
+    INSERT_SQL = """
+        INSERT INTO receipts (
+            id, timestamp, action_type, action_name,
+            inputs, outputs, status, duration_ms,
+            token_count, tier, parent_id, quest_id,
+            error_message, metadata
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    UPDATE_SQL = """
+        UPDATE receipts SET
+            outputs = ?,
+            status = ?,
+            duration_ms = ?,
+            token_count = ?,
+            error_message = ?,
+            metadata = ?
+        WHERE id = ?
+    """
+
+    # Late update of a receipt whose month is archived: the full row goes
+    # into a live file that shadows the archived copy until compaction.
+    # Also used while a legacy receipts.db is being migrated: an update to a
+    # row not copied yet lands whole, and the copy (INSERT OR IGNORE) skips it
+    UPSERT_SQL = INSERT_SQL + """
+        ON CONFLICT (id) DO UPDATE SET
+            outputs = excluded.outputs,
+            status = excluded.status,
+            duration_ms = excluded.duration_ms,
+            token_count = excluded.token_count,
+            error_message = excluded.error_message,
+            metadata = excluded.metadata
+    """
+
+    def __init__(
+        self,
+        data_dir: str = "/home/lancelot/data",
+        write_behind: Optional[bool] = None,
+        batch_size: Optional[int] = None,
+        flush_interval_ms: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        hot_months: Optional[int] = None,
+    ):
         """
         Initialize the receipt service.
         
         Args:
-            data_dir: Directory for storing receipts.db
+            data_dir: Directory holding the receipts/ partition directory
+            write_behind: Buffer writes and persist them from a background
+                thread (default: LANCELOT_RECEIPTS_WRITE_BEHIND, on)
+            batch_size: Pending rows that trigger an early flush
+            flush_interval_ms: Maximum time a row waits before it is flushed
+            max_pending: Hard cap on buffered rows; producers flush inline beyond it
+            hot_months: Months (including the current one) kept as live
+                partitions before being archived (default:
+                LANCELOT_RECEIPTS_HOT_MONTHS, 3)
         """
         self.data_dir = data_dir
-        self.db_path = os.path.join(data_dir, "receipts.db")
+        self.partition_dir = os.path.join(data_dir, self.PARTITION_DIR)
         self._local = threading.local()
         self._lock = threading.Lock()
-        
-        # Ensure data directory exists
-        os.makedirs(data_dir, exist_ok=True)
-        
-        # Initialize database schema
-        self._init_database()
-
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get thread-local database connection."""
-        if not hasattr(self._local, 'connection') or self._local.connection is None:
-            self._local.connection = sqlite3.connect(
-                self.db_path,
-                check_same_thread=False,
-                timeout=30.0
+        self._hot_months = max(1, hot_months or int(os.getenv("LANCELOT_RECEIPTS_HOT_MONTHS", "3")))
+
+        # Partition state: live files are re-opened whenever their
+        # generation moves (archived or dropped); archives are loaded into
+        # memory and kept in a small LRU
+        self._generations: Dict[str, int] = {}
+        self._initialized: set = set()
+        self._archives: "OrderedDict[str, tuple]" = OrderedDict()
+        self._archive_rollups: Dict[str, tuple] = {}
+        self._archive_cache_size = max(1, int(os.getenv("LANCELOT_RECEIPTS_ARCHIVE_CACHE", "2")))
+        self._archive_lock = threading.Lock()
+        self._index_path = os.path.join(self.partition_dir, self.INDEX_FILE)
+        # Bumped after every change to a month's files, so a compaction
+        # built outside _flush_lock can tell whether it went stale
+        self._month_versions: Dict[str, int] = {}
+        self._compact_lock = threading.Lock()
+        self._fts_ready = True
+        # Live partitions whose FTS index is still being backfilled
+        self._fts_pending: set = set()
+        self._maintainer: Optional[threading.Thread] = None
+        self._maintenance_requested = False
+        self._closed = False
+        # Set once the first maintenance pass has brought an existing
+        # store up to date; queries wait for it
+        self._ready = threading.Event()
+        self._legacy_path = os.path.join(data_dir, "receipts.db")
+        self._migrating = os.path.exists(self._legacy_path)
+
+        # Ensure the partition directory exists
+        os.makedirs(self.partition_dir, exist_ok=True)
+
+        for name in os.listdir(self.partition_dir):
+            if self.SCRATCH_RE.match(name):
+                self._remove_files(os.path.join(self.partition_dir, name))
+        self._index().executescript(self.INDEX_SQL)
+
+        # Write-behind state: receipt id → ("insert" | "update", snapshot)
+        if write_behind is None:
+            write_behind = _env_flag("LANCELOT_RECEIPTS_WRITE_BEHIND", True)
+        self.write_behind = write_behind
+        self._batch_size = batch_size or int(os.getenv("LANCELOT_RECEIPTS_BATCH_SIZE", "128"))
+        self._flush_interval = (
+            flush_interval_ms if flush_interval_ms is not None
+            else int(os.getenv("LANCELOT_RECEIPTS_FLUSH_MS", "250"))
+        ) / 1000.0
+        self._max_pending = max(
+            max_pending or int(os.getenv("LANCELOT_RECEIPTS_MAX_PENDING", "1024")),
+            self._batch_size,
+        )
+        self._pending: Dict[str, tuple] = {}
+        self._inflight: Dict[str, tuple] = {}
+        self._pending_cond = threading.Condition(self._lock)
+        self._flush_lock = threading.Lock()  # serializes batch writes and partition moves
+        self._stopped = False
+        self._writer: Optional[threading.Thread] = None
+        if self.write_behind:
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="receipt-writer", daemon=True,
             )
-            self._local.connection.row_factory = sqlite3.Row
-            # Enable WAL mode for better concurrent performance
-            self._local.connection.execute("PRAGMA journal_mode=WAL")
-            self._local.connection.execute("PRAGMA synchronous=NORMAL")
-        return self._local.connection
+            self._writer.start()
+            ref = weakref.ref(self)
+            atexit.register(lambda: ref() is not None and ref().flush())
+
+        # Legacy migration, id index fill, FTS backfills and compaction all
+        # run in the background, so a large store doesn't hold up startup
+        self._schedule_maintenance()
+
+    def _get_connection(self, path: str, create: bool = False) -> sqlite3.Connection:
+        """Get this thread's connection to a live partition file.
+
+        Raises sqlite3.OperationalError if the file doesn't exist and
+        ``create`` is False, so readers never resurrect a month that was
+        archived or dropped.
+        """
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = {}
+        generation = self._generations.get(path, 0)
+        cached = connections.get(path)
+        if cached is not None:
+            if cached[0] == generation:
+                return cached[1]
+            # The file was archived or dropped since this thread opened it
+            cached[1].close()
+            del connections[path]
+        conn = sqlite3.connect(
+            "file:%s?mode=%s" % (pathname2url(path), "rwc" if create else "rw"),
+            uri=True,
+            check_same_thread=False,
+            timeout=30.0
+        )
+        conn.row_factory = sqlite3.Row
+        # Enable WAL mode for better concurrent performance
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if path not in self._initialized:
+            self._init_database(conn, path)
+            self._initialized.add(path)
+        connections[path] = (generation, conn)
+        return conn
+
+    def _close_local(self) -> None:
+        """Close the calling thread's partition and index connections."""
+        for _, conn in getattr(self._local, "connections", {}).values():
+            conn.close()
+        self._local.connections = {}
+        index = getattr(self._local, "index", None)
+        if index is not None:
+            index.close()
+            self._local.index = None
+
+    def _index(self) -> sqlite3.Connection:
+        """Get this thread's connection to the id index."""
+        conn = getattr(self._local, "index", None)
+        if conn is None:
+            conn = sqlite3.connect(self._index_path, check_same_thread=False, timeout=30.0)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.index = conn
+        return conn
+
+    def _init_index(self) -> None:
+        """Fill the id index from existing partitions once.
+
+        Rows are added with INSERT OR IGNORE and completion is recorded
+        last, so a backfill cut short by a crash resumes on the next start.
+        """
+        conn = self._index()
+        if conn.execute("SELECT 1 FROM index_meta WHERE key = 'complete'").fetchone():
+            return
+        for part in self._partitions():
+            rows = self._query(part, "SELECT id, timestamp, quest_id, parent_id FROM receipts")
+            with conn:
+                conn.executemany(self.INDEX_INSERT_SQL, [
+                    (row["id"], part[0], row["timestamp"], row["quest_id"], row["parent_id"])
+                    for row in rows
+                ])
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO index_meta (key, value) VALUES ('complete', '1')")
+
+    def _index_receipts(self, month: str, receipts: List[Receipt]) -> None:
+        """Record rows about to be written to a month (caller holds ``_flush_lock``).
+
+        Written ahead of the partition, so a crash in between leaves an
+        entry that points at a month without the row — a wasted lookup —
+        never a row the index can't find.
+        """
+        if receipts:
+            with self._index() as conn:
+                conn.executemany(self.INDEX_INSERT_SQL, [
+                    (r.id, month, r.timestamp, r.quest_id, r.parent_id) for r in receipts
+                ])
+
+    def _indexed_months(self, column: str, values: Iterable[str]) -> Dict[str, set]:
+        """Map month → matching values, for index rows whose ``column``
+        (id, quest_id or parent_id) is one of ``values``."""
+        months: Dict[str, set] = {}
+        values = list(values)
+        for i in range(0, len(values), 500):
+            chunk = values[i:i + 500]
+            placeholders = ",".join("?" for _ in chunk)
+            for row in self._index().execute(
+                f"SELECT month, {column} AS value FROM receipt_index WHERE {column} IN ({placeholders})",
+                chunk,
+            ):
+                months.setdefault(row["month"], set()).add(row["value"])
+        return months
+
+    def _touch_month(self, month: str) -> None:
+        with self._lock:
+            self._month_versions[month] = self._month_versions.get(month, 0) + 1
 
     @contextmanager
-    def _transaction(self):
-        """Context manager for database transactions."""
-        conn = self._get_connection()
+    def _transaction(self, path: str, create: bool = True):
+        """Context manager for a transaction on one live partition."""
+        conn = self._get_connection(path, create=create)
         try:
             yield conn
             conn.commit()
@@ -231,10 +653,625 @@ class ReceiptService:
             conn.rollback()
             raise
 
-    def _init_database(self):
-        """Initialize database schema."""
-        with self._transaction() as conn:
-            conn.executescript(self.CREATE_TABLE_SQL)
+    def _init_database(self, conn: sqlite3.Connection, path: str):
+        """Initialize a partition's schema."""
+        conn.executescript(self.CREATE_TABLE_SQL)
+        self._init_stats_rollup(conn)
+        self._init_fts(conn, path)
+
+    def _init_stats_rollup(self, conn: sqlite3.Connection) -> None:
+        """Create the hourly stats rollup, seeding it from existing rows.
+
+        Table, triggers and seed are created in one transaction, so no
+        write can slip between the seed scan and the triggers going live.
+        """
+        with conn:
+            # sqlite3 doesn't open transactions for DDL on its own; take the
+            # write lock up front so seeding is atomic across processes too
+            conn.execute("BEGIN IMMEDIATE")
+            existed = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'receipt_stats_hourly'"
+            ).fetchone() is not None
+            # executescript() would commit mid-transaction; run statements singly
+            for statement in self._split_sql(self.CREATE_STATS_SQL):
+                conn.execute(statement)
+            if existed:
+                return
+            conn.execute(
+                "INSERT INTO receipt_stats_hourly "
+                + self.STATS_GROUP_SQL.format(
+                    hour="substr(timestamp, 1, 13)", where="1=1",
+                    group="substr(timestamp, 1, 13), action_type, status",
+                )
+            )
+
+    @staticmethod
+    def _split_sql(script: str) -> List[str]:
+        """Split a DDL script into complete statements (trigger bodies intact)."""
+        statements, buf = [], ""
+        for line in script.splitlines(keepends=True):
+            buf += line
+            if sqlite3.complete_statement(buf):
+                if buf.strip():
+                    statements.append(buf.strip())
+                buf = ""
+        return statements
+
+    # ------------------------------------------------------------------
+    # Full-text index
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _get_meta(conn: sqlite3.Connection, key: str) -> Optional[str]:
+        row = conn.execute("SELECT value FROM schema_meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    @staticmethod
+    def _set_meta(conn: sqlite3.Connection, key: str, value: str) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO schema_meta (key, value) VALUES (?, ?)", (key, value)
+        )
+
+    def _init_fts(self, conn: sqlite3.Connection, path: str) -> None:
+        """Create a partition's FTS5 index, backfilling pre-existing rows online.
+
+        Triggers index every write from the moment they exist, so a new
+        partition needs no backfill. A file created where FTS5 was
+        unavailable records its rowid high-water mark in ``schema_meta``
+        and is indexed up to it in chunks on the maintenance thread,
+        resuming after a restart; ``search()`` uses the LIKE scan until
+        every partition is done.
+        """
+        if not self._fts_ready:
+            return
+        try:
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                existed = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'receipts_fts'"
+                ).fetchone() is not None
+                for statement in self._split_sql(self.CREATE_FTS_SQL):
+                    conn.execute(statement)
+                if not existed:
+                    high = conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM receipts").fetchone()[0]
+                    self._set_meta(conn, "fts_backfill_high", str(high))
+                    self._set_meta(conn, "fts_backfill_pos", "0")
+                high = int(self._get_meta(conn, "fts_backfill_high") or 0)
+                pos = int(self._get_meta(conn, "fts_backfill_pos") or 0)
+        except sqlite3.OperationalError as exc:
+            # SQLite built without FTS5 — search() keeps the LIKE scan
+            logger.warning("ReceiptService: FTS5 unavailable, using LIKE search: %s", exc)
+            self._fts_ready = False
+            return
+        if pos < high:
+            with self._lock:
+                self._fts_pending.add(path)
+            self._schedule_maintenance()
+
+    def _backfill_fts(self, path: str) -> None:
+        """Index a partition's rows up to its backfill high-water mark.
+
+        Progress is committed with each chunk. Rows a trigger already
+        indexed (updated since the index was added) are skipped.
+        """
+        conn = self._get_connection(path)
+        while True:
+            if self._closed:
+                return  # resumes on the next start
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                high = int(self._get_meta(conn, "fts_backfill_high") or 0)
+                pos = int(self._get_meta(conn, "fts_backfill_pos") or 0)
+                if pos >= high:
+                    break
+                upto = min(pos + self.FTS_BACKFILL_CHUNK, high)
+                conn.execute("""
+                    INSERT INTO receipts_fts(rowid, action_name, inputs, outputs, error_message)
+                    SELECT rowid, action_name, inputs, outputs, COALESCE(error_message, '')
+                    FROM receipts
+                    WHERE rowid > ? AND rowid <= ?
+                      AND rowid NOT IN (
+                          SELECT rowid FROM receipts_fts WHERE rowid > ? AND rowid <= ?
+                      )
+                """, (pos, upto, pos, upto))
+                self._set_meta(conn, "fts_backfill_pos", str(upto))
+        with self._lock:
+            self._fts_pending.discard(path)
+        logger.info("ReceiptService: FTS backfill of %s complete", os.path.basename(path))
+
+    def _backfill_pending_fts(self) -> None:
+        with self._lock:
+            pending = sorted(self._fts_pending)
+        for path in pending:
+            try:
+                self._backfill_fts(path)
+            except sqlite3.OperationalError:
+                if os.path.exists(path):
+                    raise
+                # Dropped meanwhile
+                with self._lock:
+                    self._fts_pending.discard(path)
+
+    @staticmethod
+    def _fts_query(query: str) -> Optional[str]:
+        """Turn free text into a safe FTS5 prefix-phrase query.
+
+        The text becomes one quoted phrase whose last token is a prefix,
+        e.g. ``web sea`` → ``"web sea" *``. Returns None if nothing
+        searchable is left.
+        """
+        escaped = query.replace('"', '""')
+        for char in ["'", "(", ")", "{", "}", "[", "]", "^", "*", ":", "-", "+"]:
+            escaped = escaped.replace(char, " ")
+        escaped = " ".join(escaped.split())
+        if not escaped:
+            return None
+        return f'"{escaped}" *'
+
+    # ------------------------------------------------------------------
+    # Partitions
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def _month_of(cls, timestamp: Optional[str]) -> str:
+        """Partition month ("YYYY-MM") of an ISO timestamp."""
+        if timestamp and re.match(r"\d{4}-\d{2}", timestamp):
+            return timestamp[:7]
+        return cls.UNDATED_MONTH
+
+    @staticmethod
+    def _shift_month(month: str, delta: int) -> str:
+        index = int(month[:4]) * 12 + int(month[5:7]) - 1 + delta
+        return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+    def _partition_path(self, month: str) -> str:
+        return os.path.join(self.partition_dir, f"receipts-{month}.db")
+
+    def _archive_path(self, month: str) -> str:
+        return self._partition_path(month) + ".gz"
+
+    def _partitions(
+        self,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        months: Optional[Iterable[str]] = None,
+    ) -> List[Tuple[str, str, bool]]:
+        """List ``(month, path, archived)`` partitions overlapping a time range,
+        optionally restricted to the given ``months``.
+
+        Newest month first. A month's live file comes before its archive,
+        so a row re-written there after archival shadows the archived copy.
+        """
+        low = since[:7] if since else None
+        high = until[:7] if until else None
+        wanted = set(months) if months is not None else None
+        parts = []
+        for name in os.listdir(self.partition_dir):
+            match = self.PARTITION_RE.match(name)
+            if not match:
+                continue
+            month = match.group(1)
+            if (low and month < low) or (high and month > high):
+                continue
+            if wanted is not None and month not in wanted:
+                continue
+            parts.append((month, os.path.join(self.partition_dir, name), bool(match.group(2))))
+        parts.sort(key=lambda part: (part[0], not part[2]), reverse=True)
+        return parts
+
+    def _query(self, part: Tuple[str, str, bool], sql: str, params: Any = ()) -> List[Any]:
+        """Run a read on one partition. A file that vanished since it was
+        listed (archived or dropped meanwhile) reads as empty."""
+        _, path, archived = part
+        try:
+            if archived:
+                with self._archive_lock:
+                    return self._open_archive(path).execute(sql, params).fetchall()
+            return self._get_connection(path).execute(sql, params).fetchall()
+        except (OSError, sqlite3.OperationalError):
+            if os.path.exists(path):
+                raise
+            return []
+
+    def _fanout(
+        self,
+        sql: str,
+        params: Any = (),
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        stop_after: Optional[int] = None,
+        months: Optional[Iterable[str]] = None,
+    ) -> List[Any]:
+        """Run a query on every partition overlapping [since, until]
+        (and in ``months``, if given).
+
+        Rows come back newest month first; a receipt id already returned by
+        a newer file is skipped. With ``stop_after`` (for queries ordered by
+        timestamp DESC), months older than the one that brought the row
+        count up to it are never opened.
+        """
+        rows: List[Any] = []
+        seen = set()
+        parts = self._partitions(since, until, months)
+        for i, part in enumerate(parts):
+            for row in self._query(part, sql, params):
+                if row["id"] not in seen:
+                    seen.add(row["id"])
+                    rows.append(row)
+            month_done = i + 1 == len(parts) or parts[i + 1][0] != part[0]
+            if stop_after is not None and len(rows) >= stop_after and month_done:
+                break
+        return rows
+
+    def _open_archive(self, path: str) -> sqlite3.Connection:
+        """Load an archive into a query-only in-memory database.
+
+        Caller holds ``_archive_lock``; the connection is shared.
+        """
+        mtime = os.stat(path).st_mtime_ns
+        cached = self._archives.get(path)
+        if cached is not None and cached[0] == mtime:
+            self._archives.move_to_end(path)
+            return cached[1]
+        if cached is not None:
+            cached[1].close()
+        with gzip.open(path, "rb") as f:
+            image = f.read()
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+        conn.deserialize(image)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA query_only = ON")
+        self._archives[path] = (mtime, conn)
+        self._archives.move_to_end(path)
+        while len(self._archives) > self._archive_cache_size:
+            _, (_, evicted) = self._archives.popitem(last=False)
+            evicted.close()
+        return conn
+
+    def _rollup_rows(self, part: Tuple[str, str, bool]) -> List[Any]:
+        """A partition's hourly stats rollup. Archives never change, so
+        theirs is kept in memory after the first read."""
+        _, path, archived = part
+        if not archived:
+            return self._query(part, "SELECT * FROM receipt_stats_hourly")
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return []
+        cached = self._archive_rollups.get(path)
+        if cached is None or cached[0] != mtime:
+            rows = [dict(row) for row in self._query(part, "SELECT * FROM receipt_stats_hourly")]
+            cached = self._archive_rollups[path] = (mtime, rows)
+        return cached[1]
+
+    def _shadowed_ids(self, parts: List[Tuple[str, str, bool]]) -> Dict[str, List[str]]:
+        """Map month → ids in its live file, for months in ``parts`` that
+        also have an archive. Those archived copies are stale: the live
+        rows shadow them until the next compaction."""
+        archived = {month for month, _, is_archive in parts if is_archive}
+        return {
+            part[0]: [row["id"] for row in self._query(part, "SELECT id FROM receipts")]
+            for part in parts
+            if not part[2] and part[0] in archived
+        }
+
+    def _shadow_groups(
+        self,
+        part: Tuple[str, str, bool],
+        ids: List[str],
+        where: str = "1=1",
+        params: Any = (),
+        hourly: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Negated STATS_GROUP_SQL rows for the archived copies of ``ids``.
+
+        Added to an archive's own aggregates, they take shadowed rows back
+        out so each receipt is counted once, from its live copy. Maxima
+        can't be subtracted and stay upper bounds, as in the rollup.
+        """
+        hour = "substr(timestamp, 1, 13)" if hourly else "NULL"
+        group = ("substr(timestamp, 1, 13), " if hourly else "") + "action_type, status"
+        groups = []
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            placeholders = ",".join("?" for _ in chunk)
+            sql = self.STATS_GROUP_SQL.format(
+                hour=hour, where=f"({where}) AND id IN ({placeholders})", group=group,
+            )
+            for g in self._query(part, sql, list(params) + chunk):
+                groups.append({
+                    **dict(g),
+                    **{key: -g[key] for key in ("count", "token_n", "token_sum", "duration_n", "duration_sum")},
+                    "token_max": None,
+                    "duration_max": None,
+                })
+        return groups
+
+    def _retire(self, path: str) -> None:
+        """Invalidate every thread's connection to a live partition file."""
+        with self._lock:
+            self._generations[path] = self._generations.get(path, 0) + 1
+            self._initialized.discard(path)
+            self._fts_pending.discard(path)
+        cached = getattr(self._local, "connections", {}).pop(path, None)
+        if cached is not None:
+            cached[1].close()
+
+    def _forget_archive(self, path: str) -> None:
+        with self._archive_lock:
+            cached = self._archives.pop(path, None)
+            if cached is not None:
+                cached[1].close()
+        self._archive_rollups.pop(path, None)
+
+    @staticmethod
+    def _remove_files(*paths: str) -> None:
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _drop(self, part: Tuple[str, str, bool]) -> None:
+        """Delete a partition file (caller holds ``_flush_lock``)."""
+        _, path, archived = part
+        if archived:
+            self._forget_archive(path)
+            self._remove_files(path)
+        else:
+            self._retire(path)
+            self._remove_files(path, path + "-wal", path + "-shm")
+        self._touch_month(part[0])
+
+    def _build_archive(
+        self,
+        month: str,
+        delete_before: Optional[str] = None,
+    ) -> Optional[Tuple[Optional[str], int, bool]]:
+        """Build a month's next archive in scratch files.
+
+        The archive is rebuilt starting from the existing archive if any,
+        with live rows replacing their archived copies, then vacuumed and
+        gzipped next to the real one. ``delete_before`` drops older rows on
+        the way. Nothing visible changes, so no lock is needed: the live
+        file is read through a snapshot of its own.
+
+        Returns:
+            None if there is nothing to do, else ``(staged, deleted,
+            has_live)``: the gzipped scratch file (None if no rows remain),
+            the number of rows dropped by ``delete_before`` and whether a
+            live file was folded in
+        """
+        live, archive = self._partition_path(month), self._archive_path(month)
+        has_live, has_archive = os.path.exists(live), os.path.exists(archive)
+        if not has_live and (not has_archive or delete_before is None):
+            return None
+        if has_live and live in self._fts_pending:
+            # The archive keeps whatever FTS index the live file has
+            self._backfill_fts(live)
+        suffix = f".{threading.get_ident()}"
+        work, staged = live + suffix + ".work", archive + suffix + ".tmp"
+        self._remove_files(work, work + "-journal", staged)
+        deleted = 0
+        try:
+            if has_archive:
+                with gzip.open(archive, "rb") as src, open(work, "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+            else:
+                source = sqlite3.connect(live)
+                try:
+                    source.execute("VACUUM INTO ?", (work,))
+                finally:
+                    source.close()
+            conn = sqlite3.connect(work)
+            try:
+                # Archives are deserialized, which needs a rollback-journal header
+                conn.execute("PRAGMA journal_mode=DELETE")
+                if has_archive and has_live:
+                    conn.execute("ATTACH DATABASE ? AS live", (live,))
+                    with conn:
+                        # Delete-then-insert so the FTS and rollup triggers fire
+                        conn.execute("DELETE FROM receipts WHERE id IN (SELECT id FROM live.receipts)")
+                        conn.execute(
+                            f"INSERT INTO receipts ({self.COLUMNS}) SELECT {self.COLUMNS} FROM live.receipts"
+                        )
+                    conn.execute("DETACH DATABASE live")
+                if delete_before:
+                    with conn:
+                        deleted = conn.execute(
+                            "DELETE FROM receipts WHERE timestamp < ?", (delete_before,)
+                        ).rowcount
+                remaining = conn.execute("SELECT COUNT(*) FROM receipts").fetchone()[0]
+                if remaining and (has_archive or deleted):
+                    conn.execute("VACUUM")
+            finally:
+                conn.close()
+
+            if remaining:
+                with open(work, "rb") as src, gzip.open(staged, "wb", compresslevel=6) as dst:
+                    shutil.copyfileobj(src, dst)
+            else:
+                staged = None
+        except BaseException:
+            if staged:
+                self._remove_files(staged)
+            raise
+        finally:
+            self._remove_files(work, work + "-journal")
+        return staged, deleted, has_live
+
+    def _install_archive(self, month: str, staged: Optional[str], has_live: bool) -> None:
+        """Swap a built archive in and remove the live file it folded in.
+
+        Caller holds ``_flush_lock``.
+        """
+        live, archive = self._partition_path(month), self._archive_path(month)
+        self._forget_archive(archive)
+        if staged:
+            os.replace(staged, archive)
+        else:
+            self._remove_files(archive)
+        if has_live:
+            self._retire(live)
+            self._remove_files(live, live + "-wal", live + "-shm")
+        self._touch_month(month)
+
+    def _archive_month(self, month: str, delete_before: Optional[str] = None) -> int:
+        """Fold a month's live file into its compressed archive in one go.
+
+        Caller holds ``_flush_lock``; see ``_build_archive``.
+
+        Returns:
+            Number of rows dropped by ``delete_before``
+        """
+        built = self._build_archive(month, delete_before)
+        if built is None:
+            return 0
+        staged, deleted, has_live = built
+        self._install_archive(month, staged, has_live)
+        return deleted
+
+    def _compact_month(self, month: str) -> None:
+        """Archive a month, holding ``_flush_lock`` only for the file swap.
+
+        A write to the month while the archive was being built makes the
+        build stale; it is redone, with the last attempt under the lock.
+        """
+        for _ in range(self.COMPACT_ATTEMPTS - 1):
+            with self._lock:
+                version = self._month_versions.get(month, 0)
+            built = self._build_archive(month)
+            with self._flush_lock:
+                if self._month_versions.get(month, 0) == version:
+                    if built is not None:
+                        self._install_archive(month, built[0], built[2])
+                    return
+            if built is not None and built[0]:
+                self._remove_files(built[0])
+        with self._flush_lock:
+            self._archive_month(month)
+
+    def _hot_boundary(self) -> str:
+        """Oldest month still kept as a live partition."""
+        current = self._month_of(datetime.now(timezone.utc).isoformat())
+        return self._shift_month(current, 1 - self._hot_months)
+
+    def _compactable_months(self) -> List[str]:
+        boundary = self._hot_boundary()
+        return sorted({
+            month for month, _, archived in self._partitions()
+            if not archived and month < boundary
+        })
+
+    def compact_partitions(self) -> int:
+        """
+        Archive live partitions older than the hot window.
+        
+        Returns:
+            Number of months archived
+        """
+        self._ready.wait()
+        months = self._compactable_months()
+        for month in months:
+            with self._compact_lock:
+                self._compact_month(month)
+            logger.info("ReceiptService: archived receipt partition %s", month)
+        return len(months)
+
+    def _schedule_maintenance(self) -> None:
+        """Run a maintenance pass on a background thread (coalesced)."""
+        with self._lock:
+            self._maintenance_requested = True
+            if self._maintainer is not None or self._closed:
+                return
+            self._maintainer = threading.Thread(
+                target=self._maintenance_loop, name="receipt-maintenance", daemon=True,
+            )
+            self._maintainer.start()
+
+    def _maintenance_loop(self) -> None:
+        try:
+            while True:
+                with self._lock:
+                    if not self._maintenance_requested or self._closed:
+                        self._maintainer = None
+                        return
+                    self._maintenance_requested = False
+                try:
+                    self._maintain()
+                except Exception as exc:
+                    logger.error("ReceiptService: receipt maintenance failed: %s", exc)
+        finally:
+            # Queries must not wait on a pass that will never finish
+            self._ready.set()
+            self._close_local()
+
+    def _maintain(self) -> None:
+        """One maintenance pass: bring an existing store up to date (first
+        pass only), finish FTS backfills, then archive cold months."""
+        if not self._ready.is_set():
+            try:
+                self._prepare()
+            finally:
+                self._ready.set()
+        if self._closed:
+            return
+        self._backfill_pending_fts()
+        self.compact_partitions()
+
+    def _prepare(self) -> None:
+        """Migrate a legacy receipts.db, fill the id index and open every
+        live partition, so backfills they need are known before a query runs."""
+        if self._migrating:
+            self._migrate_legacy()
+            if self._migrating:
+                return  # closed mid-way; resumes on the next start
+        self._init_index()
+        for part in self._partitions():
+            if not part[2]:
+                self._query(part, "SELECT 1 FROM receipts LIMIT 1")
+
+    def _migrate_legacy(self) -> None:
+        """Split a pre-partitioning receipts.db into monthly partitions.
+
+        Each month is copied under ``_flush_lock`` with INSERT OR IGNORE, so
+        writes interleave with the migration and one cut short by a crash
+        resumes on the next start; the old file is removed only once every
+        month is in.
+        """
+        legacy = self._legacy_path
+        source = sqlite3.connect(legacy)
+        try:
+            months = [row[0] for row in source.execute(
+                f"SELECT DISTINCT {self.MONTH_SQL} FROM receipts"
+            )]
+        except sqlite3.OperationalError as exc:
+            if "no such table" not in str(exc):
+                raise
+            months = []
+        finally:
+            source.close()
+
+        for month in months:
+            if self._closed:
+                return
+            with self._flush_lock:
+                conn = self._get_connection(self._partition_path(month), create=True)
+                conn.execute("ATTACH DATABASE ? AS legacy", (legacy,))
+                try:
+                    with conn:
+                        conn.execute(
+                            f"INSERT OR IGNORE INTO receipts ({self.COLUMNS}) "
+                            f"SELECT {self.COLUMNS} FROM legacy.receipts WHERE {self.MONTH_SQL} = ?",
+                            (month,),
+                        )
+                finally:
+                    conn.execute("DETACH DATABASE legacy")
+                    self._touch_month(month)
+        with self._flush_lock:
+            self._remove_files(legacy, legacy + "-wal", legacy + "-shm")
+            self._migrating = False
+        logger.info("ReceiptService: migrated receipts.db into %d monthly partitions", len(months))
 
     def create(self, receipt: Receipt) -> Receipt:
         """
@@ -245,31 +1282,18 @@ class ReceiptService:
             
         Returns:
             The stored receipt
+
+        Raises:
+            sqlite3.IntegrityError: If a receipt with the same id exists,
+                with or without write-behind
         """
-        with self._transaction() as conn:
-            conn.execute("""
-                INSERT INTO receipts (
-                    id, timestamp, action_type, action_name,
-                    inputs, outputs, status, duration_ms,
-                    token_count, tier, parent_id, quest_id,
-                    error_message, metadata
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                receipt.id,
-                receipt.timestamp,
-                receipt.action_type,
-                receipt.action_name,
-                json.dumps(receipt.inputs),
-                json.dumps(receipt.outputs),
-                receipt.status,
-                receipt.duration_ms,
-                receipt.token_count,
-                receipt.tier,
-                receipt.parent_id,
-                receipt.quest_id,
-                receipt.error_message,
-                json.dumps(receipt.metadata)
-            ))
+        if self.write_behind or self._migrating:
+            self._reject_duplicate(receipt)
+        if self.write_behind:
+            self._enqueue(receipt, "insert")
+            return receipt
+        with self._flush_lock:
+            self._write_month(self._month_of(receipt.timestamp), [receipt], [], strict=True)
         return receipt
 
     def update(self, receipt: Receipt) -> Receipt:
@@ -282,25 +1306,11 @@ class ReceiptService:
         Returns:
             The updated receipt
         """
-        with self._transaction() as conn:
-            conn.execute("""
-                UPDATE receipts SET
-                    outputs = ?,
-                    status = ?,
-                    duration_ms = ?,
-                    token_count = ?,
-                    error_message = ?,
-                    metadata = ?
-                WHERE id = ?
-            """, (
-                json.dumps(receipt.outputs),
-                receipt.status,
-                receipt.duration_ms,
-                receipt.token_count,
-                receipt.error_message,
-                json.dumps(receipt.metadata),
-                receipt.id
-            ))
+        if self.write_behind:
+            self._enqueue(receipt, "update")
+            return receipt
+        with self._flush_lock:
+            self._write_month(self._month_of(receipt.timestamp), [], [receipt], strict=True)
         return receipt
 
     def get(self, receipt_id: str) -> Optional[Receipt]:
@@ -313,14 +1323,18 @@ class ReceiptService:
         Returns:
             The receipt if found, None otherwise
         """
-        conn = self._get_connection()
-        cursor = conn.execute(
-            "SELECT * FROM receipts WHERE id = ?",
-            (receipt_id,)
-        )
-        row = cursor.fetchone()
-        if row:
-            return self._row_to_receipt(row)
+        if self.write_behind:
+            with self._lock:
+                entry = self._pending.get(receipt_id) or self._inflight.get(receipt_id)
+            if entry is not None:
+                return Receipt.from_dict(entry[1].to_dict())
+        self._ready.wait()
+        # Ids carry no time; the index says which month holds the row
+        months = self._indexed_months("id", [receipt_id])
+        for part in self._partitions(months=months):
+            rows = self._query(part, "SELECT * FROM receipts WHERE id = ?", (receipt_id,))
+            if rows:
+                return self._row_to_receipt(rows[0])
         return None
 
     def list(
@@ -371,12 +1385,15 @@ class ReceiptService:
             query += " AND timestamp <= ?"
             params.append(until)
         
-        query += " ORDER BY timestamp DESC LIMIT ? OFFSET ?"
-        params.extend([limit, offset])
+        # Each partition returns its newest limit + offset rows; the page
+        # is cut from the merge
+        query += " ORDER BY timestamp DESC LIMIT ?"
+        params.append(limit + offset)
         
-        conn = self._get_connection()
-        cursor = conn.execute(query, params)
-        return [self._row_to_receipt(row) for row in cursor.fetchall()]
+        self._flush_for_read()
+        rows = self._fanout(query, params, since=since, until=until, stop_after=limit + offset)
+        rows.sort(key=lambda row: row["timestamp"], reverse=True)
+        return [self._row_to_receipt(row) for row in rows[offset:offset + limit]]
 
     def search(
         self,
@@ -388,7 +1405,11 @@ class ReceiptService:
         """
         Search receipts by text query.
         
-        Searches action_name, inputs, outputs, and error_message.
+        Searches action_name, inputs, outputs, and error_message. Uses the
+        partitions' FTS5 indexes (BM25-ranked, whole-word/prefix matching).
+        While a partition's index is still being backfilled in the
+        background, or without FTS5, falls back to a substring scan ordered
+        by recency.
         
         Args:
             query: Text to search for
@@ -399,36 +1420,56 @@ class ReceiptService:
         Returns:
             List of matching receipts
         """
-        sql = """
-            SELECT * FROM receipts 
-            WHERE (
-                action_name LIKE ? OR
-                inputs LIKE ? OR
-                outputs LIKE ? OR
-                error_message LIKE ?
-            )
-        """
-        pattern = f"%{query}%"
-        params: List[Any] = [pattern, pattern, pattern, pattern]
+        self._flush_for_read()
+        fts_query = self._fts_query(query) if self._fts_ready and not self._fts_pending else None
+        if fts_query:
+            weights = ", ".join(str(w) for w in self.FTS_WEIGHTS)
+            sql = f"""
+                SELECT r.*, bm25(receipts_fts, {weights}) AS score FROM receipts_fts
+                JOIN receipts r ON r.rowid = receipts_fts.rowid
+                WHERE receipts_fts MATCH ?
+            """
+            params: List[Any] = [fts_query]
+        else:
+            sql = """
+                SELECT * FROM receipts r
+                WHERE (
+                    action_name LIKE ? OR
+                    inputs LIKE ? OR
+                    outputs LIKE ? OR
+                    error_message LIKE ?
+                )
+            """
+            pattern = f"%{query}%"
+            params = [pattern, pattern, pattern, pattern]
         
         if action_types:
             placeholders = ",".join(["?" for _ in action_types])
-            sql += f" AND action_type IN ({placeholders})"
+            sql += f" AND r.action_type IN ({placeholders})"
             params.extend(action_types)
         
+        since = None
         if time_range_hours:
             cutoff = datetime.now(timezone.utc)
             from datetime import timedelta
             cutoff = cutoff - timedelta(hours=time_range_hours)
-            sql += " AND timestamp >= ?"
-            params.append(cutoff.isoformat())
+            since = cutoff.isoformat()
+            sql += " AND r.timestamp >= ?"
+            params.append(since)
         
-        sql += " ORDER BY timestamp DESC LIMIT ?"
+        if fts_query:
+            sql += " ORDER BY score, r.timestamp DESC LIMIT ?"
+        else:
+            sql += " ORDER BY r.timestamp DESC LIMIT ?"
         params.append(limit)
         
-        conn = self._get_connection()
-        cursor = conn.execute(sql, params)
-        return [self._row_to_receipt(row) for row in cursor.fetchall()]
+        rows = self._fanout(sql, params, since=since, stop_after=None if fts_query else limit)
+        rows.sort(key=lambda row: row["timestamp"], reverse=True)
+        if fts_query:
+            # BM25 is scored against each partition's own index; close
+            # enough to merge on
+            rows.sort(key=lambda row: row["score"])
+        return [self._row_to_receipt(row) for row in rows[:limit]]
 
     def get_quest_receipts(self, quest_id: str) -> List[Receipt]:
         """
@@ -440,12 +1481,14 @@ class ReceiptService:
         Returns:
             All receipts in the quest, ordered by timestamp
         """
-        conn = self._get_connection()
-        cursor = conn.execute(
+        self._flush_for_read()
+        rows = self._fanout(
             "SELECT * FROM receipts WHERE quest_id = ? ORDER BY timestamp ASC",
-            (quest_id,)
+            (quest_id,),
+            months=self._indexed_months("quest_id", [quest_id]),
         )
-        return [self._row_to_receipt(row) for row in cursor.fetchall()]
+        rows.sort(key=lambda row: row["timestamp"])
+        return [self._row_to_receipt(row) for row in rows]
 
     def get_children(self, parent_id: str) -> List[Receipt]:
         """
@@ -457,12 +1500,14 @@ class ReceiptService:
         Returns:
             All child receipts, ordered by timestamp
         """
-        conn = self._get_connection()
-        cursor = conn.execute(
+        self._flush_for_read()
+        rows = self._fanout(
             "SELECT * FROM receipts WHERE parent_id = ? ORDER BY timestamp ASC",
-            (parent_id,)
+            (parent_id,),
+            months=self._indexed_months("parent_id", [parent_id]),
         )
-        return [self._row_to_receipt(row) for row in cursor.fetchall()]
+        rows.sort(key=lambda row: row["timestamp"])
+        return [self._row_to_receipt(row) for row in rows]
 
     def validate_parent_chain(
         self,
@@ -491,15 +1536,31 @@ class ReceiptService:
               )
         """
         params: List[Any] = []
+        months = None
         if quest_id:
             sql += " AND r.quest_id = ?"
             params.append(quest_id)
 
-        conn = self._get_connection()
-        cursor = conn.execute(sql, params)
+        self._flush_for_read()
+        if quest_id:
+            months = self._indexed_months("quest_id", [quest_id])
+        candidates = [(row["id"], row["parent_id"]) for row in self._fanout(sql, params, months=months)]
+
+        # A parent missing from its child's partition may sit in another
+        # month; only the months the index places those ids in are opened
+        missing = {parent_id for _, parent_id in candidates}
+        for month, ids in self._indexed_months("id", missing).items():
+            ids = list(ids)
+            for part in self._partitions(months=[month]):
+                for i in range(0, len(ids), 500):
+                    chunk = ids[i:i + 500]
+                    placeholders = ",".join("?" for _ in chunk)
+                    found = self._query(part, f"SELECT id FROM receipts WHERE id IN ({placeholders})", chunk)
+                    missing.difference_update(row["id"] for row in found)
         return [
-            {"receipt_id": row["id"], "orphaned_parent_id": row["parent_id"]}
-            for row in cursor.fetchall()
+            {"receipt_id": receipt_id, "orphaned_parent_id": parent_id}
+            for receipt_id, parent_id in candidates
+            if parent_id in missing
         ]
 
     def get_stats(
@@ -516,78 +1577,101 @@ class ReceiptService:
             
         Returns:
             Dictionary with counts, token usage, etc.
+
+        Answered from each overlapping partition's hourly rollup plus a
+        scan of the partial hour ``since`` falls in; quest-scoped stats take
+        a single indexed pass per partition. A receipt re-written to a live
+        file after its month was archived is counted from the live copy only.
         """
-        base_query = "SELECT * FROM receipts WHERE 1=1"
-        params: List[Any] = []
-        
-        if since:
-            base_query += " AND timestamp >= ?"
-            params.append(since)
-        
-        if quest_id:
-            base_query += " AND quest_id = ?"
-            params.append(quest_id)
-        
-        conn = self._get_connection()
-        
-        # Total count
-        count_cursor = conn.execute(
-            f"SELECT COUNT(*) as total FROM ({base_query})",
-            params
-        )
-        total = count_cursor.fetchone()["total"]
-        
-        # Status breakdown
-        status_cursor = conn.execute(
-            f"""SELECT status, COUNT(*) as count 
-                FROM ({base_query}) GROUP BY status""",
-            params
-        )
-        by_status = {row["status"]: row["count"] for row in status_cursor.fetchall()}
-        
-        # Action type breakdown
-        type_cursor = conn.execute(
-            f"""SELECT action_type, COUNT(*) as count 
-                FROM ({base_query}) GROUP BY action_type""",
-            params
-        )
-        by_type = {row["action_type"]: row["count"] for row in type_cursor.fetchall()}
-        
-        # Token usage
-        token_cursor = conn.execute(
-            f"""SELECT 
-                SUM(token_count) as total_tokens,
-                AVG(token_count) as avg_tokens,
-                MAX(token_count) as max_tokens
-                FROM ({base_query}) WHERE token_count IS NOT NULL""",
-            params
-        )
-        token_row = token_cursor.fetchone()
-        
-        # Duration stats
-        duration_cursor = conn.execute(
-            f"""SELECT 
-                SUM(duration_ms) as total_ms,
-                AVG(duration_ms) as avg_ms,
-                MAX(duration_ms) as max_ms
-                FROM ({base_query}) WHERE duration_ms IS NOT NULL""",
-            params
+        self._flush_for_read()
+
+        parts = self._partitions(since=since)
+        shadowed = self._shadowed_ids(parts)
+        groups: List[Any] = []
+        for part in parts:
+            shadow = shadowed.get(part[0], []) if part[2] else []
+            if quest_id:
+                # Quest-scoped stats aren't rolled up; one indexed pass instead
+                where = "quest_id = ?"
+                params: List[Any] = [quest_id]
+                if since:
+                    where += " AND timestamp >= ?"
+                    params.append(since)
+                groups += self._stats_scan(part, where, params, shadow)
+                continue
+
+            # Whole hours come from the rollup. A bucket is fully inside the
+            # range when its "YYYY-MM-DDTHH" prefix sorts at or after
+            # ``since``; only the hour ``since`` falls inside needs a tail scan.
+            rollup = self._rollup_rows(part) + self._shadow_groups(part, shadow, hourly=True)
+            if since and len(since) > 13:
+                hour = since[:13]
+                groups += [g for g in rollup if g["hour"] > hour]
+                if part[0] == since[:7]:
+                    # "~" sorts after every character of an ISO timestamp
+                    groups += self._stats_scan(
+                        part, "timestamp >= ? AND timestamp < ?", (since, hour + "~"), shadow,
+                    )
+            elif since:
+                groups += [g for g in rollup if g["hour"] >= since]
+            else:
+                groups += rollup
+        return self._combine_stats(groups)
+
+    def _stats_scan(
+        self,
+        part: Tuple[str, str, bool],
+        where: str,
+        params: Any,
+        shadow: List[str],
+    ) -> List[Any]:
+        """Per-(action_type, status) aggregates of one partition's rows matching ``where``."""
+        rows = self._query(
+            part,
+            self.STATS_GROUP_SQL.format(hour="NULL", where=where, group="action_type, status"),
+            params,
         )
-        duration_row = duration_cursor.fetchone()
-        
+        return rows + self._shadow_groups(part, shadow, where, params)
+
+    @staticmethod
+    def _combine_stats(groups: List[Any]) -> Dict[str, Any]:
+        """Fold per-(action_type, status) aggregate rows into the stats dict."""
+        total = 0
+        by_status: Dict[str, int] = {}
+        by_type: Dict[str, int] = {}
+        token_n = token_sum = duration_n = duration_sum = 0
+        token_max = duration_max = None
+        for g in groups:
+            if not g["count"]:
+                continue
+            total += g["count"]
+            by_status[g["status"]] = by_status.get(g["status"], 0) + g["count"]
+            by_type[g["action_type"]] = by_type.get(g["action_type"], 0) + g["count"]
+            token_n += g["token_n"]
+            token_sum += g["token_sum"]
+            duration_n += g["duration_n"]
+            duration_sum += g["duration_sum"]
+            if g["token_max"] is not None:
+                token_max = g["token_max"] if token_max is None else max(token_max, g["token_max"])
+            if g["duration_max"] is not None:
+                duration_max = g["duration_max"] if duration_max is None else max(duration_max, g["duration_max"])
+        # Shadowed archive rows cancel out to zero
+        by_status = {key: n for key, n in by_status.items() if n}
+        by_type = {key: n for key, n in by_type.items() if n}
+
         return {
             "total_receipts": total,
             "by_status": by_status,
             "by_action_type": by_type,
             "tokens": {
-                "total": token_row["total_tokens"] or 0,
-                "average": round(token_row["avg_tokens"] or 0, 2),
-                "max": token_row["max_tokens"] or 0
+                "total": token_sum,
+                "average": round(token_sum / token_n, 2) if token_n else 0,
+                "max": token_max or 0
             },
             "duration_ms": {
-                "total": duration_row["total_ms"] or 0,
-                "average": round(duration_row["avg_ms"] or 0, 2),
-                "max": duration_row["max_ms"] or 0
+                "total": duration_sum,
+                "average": round(duration_sum / duration_n, 2) if duration_n else 0,
+                "max": duration_max or 0
             }
         }
 
@@ -595,6 +1679,9 @@ class ReceiptService:
         """
         Delete receipts older than specified days.
         
+        Months entirely before the cutoff are dropped as files; only the
+        month the cutoff falls in has rows deleted.
+        
         Args:
             days: Number of days to retain
             
@@ -602,14 +1689,237 @@ class ReceiptService:
             Number of deleted receipts
         """
         from datetime import timedelta
-        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+        cutoff_month = cutoff[:7]
         
-        with self._transaction() as conn:
-            cursor = conn.execute(
-                "DELETE FROM receipts WHERE timestamp < ?",
-                (cutoff.isoformat(),)
+        self._flush_for_read()
+        deleted = 0
+        with self._flush_lock:
+            parts = self._partitions(until=cutoff)
+            archived = {month for month, _, is_archive in parts if is_archive}
+            # Taken before any file goes: the live file is dropped first
+            shadowed = self._shadowed_ids([part for part in parts if part[0] < cutoff_month])
+            for part in parts:
+                month, path, is_archive = part
+                self._touch_month(month)
+                if month < cutoff_month:
+                    groups = self._rollup_rows(part)
+                    if is_archive:
+                        # Rows also in the live file were counted there
+                        groups = groups + self._shadow_groups(part, shadowed.get(month, []))
+                    deleted += sum(g["count"] for g in groups)
+                    self._drop(part)
+                elif is_archive:
+                    # Also folds in the month's live file, if it has one
+                    deleted += self._archive_month(month, delete_before=cutoff)
+                elif month not in archived:
+                    with self._transaction(path, create=False) as conn:
+                        deleted += conn.execute(
+                            "DELETE FROM receipts WHERE timestamp < ?", (cutoff,)
+                        ).rowcount
+            with self._index() as conn:
+                conn.execute(
+                    "DELETE FROM receipt_index WHERE month < ? OR timestamp < ?",
+                    (cutoff_month, cutoff),
+                )
+        return deleted
+
+    # ------------------------------------------------------------------
+    # Write-behind
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _insert_params(receipt: Receipt) -> tuple:
+        return (
+            receipt.id,
+            receipt.timestamp,
+            receipt.action_type,
+            receipt.action_name,
+            json.dumps(receipt.inputs),
+            json.dumps(receipt.outputs),
+            receipt.status,
+            receipt.duration_ms,
+            receipt.token_count,
+            receipt.tier,
+            receipt.parent_id,
+            receipt.quest_id,
+            receipt.error_message,
+            json.dumps(receipt.metadata)
+        )
+
+    @staticmethod
+    def _update_params(receipt: Receipt) -> tuple:
+        return (
+            json.dumps(receipt.outputs),
+            receipt.status,
+            receipt.duration_ms,
+            receipt.token_count,
+            receipt.error_message,
+            json.dumps(receipt.metadata),
+            receipt.id
+        )
+
+    def _enqueue(self, receipt: Receipt, op: str) -> None:
+        """Buffer a write. An update to a still-pending insert stays an insert."""
+        # Snapshot now — callers keep mutating their Receipt objects
+        snapshot = Receipt.from_dict(receipt.to_dict())
+        with self._lock:
+            if op == "update" and self._pending.get(receipt.id, ("",))[0] == "insert":
+                op = "insert"
+            self._pending[receipt.id] = (op, snapshot)
+            pending = len(self._pending)
+            if pending == 1 or pending >= self._batch_size:
+                # Wake the writer to start the interval timer, or flush early
+                self._pending_cond.notify()
+        if pending >= self._max_pending or self._stopped:
+            # Bound the loss window: the producer pays for the flush
+            self.flush()
+
+    def _reject_duplicate(self, receipt: Receipt) -> None:
+        """Raise IntegrityError if a receipt's id is buffered or stored.
+
+        The buffer is checked first: rows leave it only once committed, so
+        a row cannot slip between the two checks. While a legacy
+        receipts.db is being migrated it is checked too; it is removed only
+        after its last row has been copied.
+        """
+        with self._lock:
+            buffered = receipt.id in self._pending or receipt.id in self._inflight
+        month = self._month_of(receipt.timestamp)
+        if buffered or self._query(
+            (month, self._partition_path(month), False),
+            "SELECT 1 FROM receipts WHERE id = ?", (receipt.id,),
+        ) or (self._migrating and self._in_legacy(receipt.id)):
+            raise sqlite3.IntegrityError(f"UNIQUE constraint failed: receipts.id ({receipt.id})")
+
+    def _in_legacy(self, receipt_id: str) -> bool:
+        try:
+            conn = sqlite3.connect(
+                "file:%s?mode=ro" % pathname2url(self._legacy_path), uri=True, timeout=30.0,
             )
-            return cursor.rowcount
+        except sqlite3.OperationalError:
+            return False  # migrated and removed meanwhile
+        try:
+            return conn.execute(
+                "SELECT 1 FROM receipts WHERE id = ?", (receipt_id,)
+            ).fetchone() is not None
+        except sqlite3.OperationalError as exc:
+            if "no such table" not in str(exc):
+                raise
+            return False
+        finally:
+            conn.close()
+
+    def _writer_loop(self) -> None:
+        while True:
+            with self._lock:
+                if not self._pending and not self._stopped:
+                    self._pending_cond.wait()
+                if self._stopped and not self._pending:
+                    break
+                if len(self._pending) < self._batch_size and not self._stopped:
+                    # Give the batch a chance to fill before writing it
+                    self._pending_cond.wait(self._flush_interval)
+            try:
+                self.flush()
+            except Exception as exc:
+                logger.error("ReceiptService: background flush failed: %s", exc)
+                time.sleep(self._flush_interval)
+        self._close_local()
+
+    def flush(self) -> int:
+        """Write all pending receipts to SQLite. Returns the number of rows written."""
+        if not self.write_behind:
+            return 0
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                batch, self._pending = self._pending, {}
+                self._inflight = batch
+            written = len(batch)
+            try:
+                self._write_batch(batch)
+            except Exception:
+                # Put unwritten rows back (newer pending writes win) so
+                # the next flush retries them instead of dropping them
+                with self._lock:
+                    self._pending = {**batch, **self._pending}
+                raise
+            finally:
+                with self._lock:
+                    self._inflight = {}
+            return written
+
+    def _write_batch(self, batch: Dict[str, tuple]) -> None:
+        """Write a batch, one transaction per month it touches.
+
+        Months that made it are removed from ``batch``, so a failure in a
+        later month only puts its own rows back for the retry.
+        """
+        by_month: Dict[str, Tuple[List[Receipt], List[Receipt]]] = {}
+        for op, r in batch.values():
+            inserts, updates = by_month.setdefault(self._month_of(r.timestamp), ([], []))
+            (inserts if op == "insert" else updates).append(r)
+        for month, (inserts, updates) in sorted(by_month.items()):
+            self._write_month(month, inserts, updates)
+            for r in inserts + updates:
+                batch.pop(r.id, None)
+
+    def _write_month(
+        self,
+        month: str,
+        inserts: List[Receipt],
+        updates: List[Receipt],
+        strict: bool = False,
+    ) -> None:
+        """Write rows into one month's live partition (caller holds ``_flush_lock``).
+
+        Unless ``strict``, an IntegrityError falls back to per-row inserts
+        that drop only the offending rows.
+        """
+        path = self._partition_path(month)
+        created = not os.path.exists(path)
+        update_sql, update_params = self.UPDATE_SQL, self._update_params
+        if self._migrating or os.path.exists(self._archive_path(month)):
+            update_sql, update_params = self.UPSERT_SQL, self._insert_params
+            self._index_receipts(month, inserts + updates)
+        else:
+            self._index_receipts(month, inserts)
+        insert_rows = [self._insert_params(r) for r in inserts]
+        update_rows = [update_params(r) for r in updates]
+        try:
+            with self._transaction(path) as conn:
+                if insert_rows:
+                    conn.executemany(self.INSERT_SQL, insert_rows)
+                if update_rows:
+                    conn.executemany(update_sql, update_rows)
+        except sqlite3.IntegrityError:
+            if strict:
+                raise
+            # One bad row (e.g. duplicate id) must not sink the batch —
+            # fall back to per-row writes and drop only the offenders
+            for params in insert_rows:
+                try:
+                    with self._transaction(path) as conn:
+                        conn.execute(self.INSERT_SQL, params)
+                except sqlite3.IntegrityError as exc:
+                    logger.error("ReceiptService: dropped receipt %s: %s", params[0], exc)
+            if update_rows:
+                with self._transaction(path) as conn:
+                    conn.executemany(update_sql, update_rows)
+        finally:
+            self._touch_month(month)
+        if created:
+            # A new month started (or a late write re-opened an archived one)
+            self._schedule_maintenance()
+
+    def _flush_for_read(self) -> None:
+        """Make pending writes, and a legacy store still being migrated,
+        visible before a query hits SQLite."""
+        self._ready.wait()
+        if self.write_behind and self._pending:
+            self.flush()
 
     def _row_to_receipt(self, row: sqlite3.Row) -> Receipt:
         """Convert a database row to a Receipt object."""
@@ -631,10 +1941,24 @@ class ReceiptService:
         )
 
     def close(self):
-        """Close database connections."""
-        if hasattr(self._local, 'connection') and self._local.connection:
-            self._local.connection.close()
-            self._local.connection = None
+        """Flush pending receipts, stop the writer and maintenance threads and close database connections."""
+        with self._lock:
+            self._closed = True
+            maintainer = self._maintainer
+        if self.write_behind and not self._stopped:
+            with self._lock:
+                self._stopped = True
+                self._pending_cond.notify_all()
+            if self._writer is not None and self._writer is not threading.current_thread():
+                self._writer.join(timeout=10.0)
+            self.flush()
+        if maintainer is not None and maintainer is not threading.current_thread():
+            maintainer.join(timeout=30.0)
+        self._close_local()
+        with self._archive_lock:
+            for _, conn in self._archives.values():
+                conn.close()
+            self._archives.clear()
 
 
 # Convenience function for creating receipts
@@ -14,6 +14,11 @@ Gated by: FEATURE_TOOLS_HOST_BRIDGE (default: false)
 Architecture:
     Container (Lancelot) ---HTTP---> host.docker.internal:9111 ---> Host Agent ---> Host OS
 
+Requests go through the shared keep-alive transport (src.core.http_transport),
+so calls reuse pooled connections to the agent. File operations use
+the agent's native /files/* endpoints (no shell or interpreter spawn);
+large files stream through /files/upload and /files/download.
+
 Security model:
     - Host agent must be running on the host machine
     - Bearer token authentication between container and agent
@@ -31,10 +36,12 @@ Required:
 from __future__ import annotations
 
 import hashlib
+import http.client
 import json
 import logging
 import os
 import shlex
+import tempfile
 import time
 import urllib.error
 import urllib.request
@@ -42,7 +49,9 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import quote
 
+from src.core import http_transport
 from src.tools.contracts import (
     BaseProvider,
     Capability,
@@ -70,6 +79,13 @@ class HostBridgeConfig:
     agent_token: str = ""  # Set from env in __post_init__
     connect_timeout_s: int = 5
     read_timeout_s: int = 300
+    # Concurrent requests to the agent; matches its default worker count, so
+    # further calls queue here instead of stalling inside the agent
+    max_connections: int = 16
+
+    # Writes larger than this stream through /files/upload instead of JSON
+    upload_threshold_bytes: int = 256 * 1024
+    transfer_chunk_bytes: int = 64 * 1024
 
     # Output limits
     max_stdout_chars: int = 100_000
@@ -119,6 +135,12 @@ class HostBridgeProvider(BaseProvider):
     ):
         self.config = config or HostBridgeConfig()
         self._workspace = workspace
+        http_transport.configure(
+            self.config.agent_url,
+            connect_timeout_s=self.config.connect_timeout_s,
+            max_connections=self.config.max_connections,
+            blocksize=self.config.transfer_chunk_bytes,
+        )
 
     @property
     def provider_id(self) -> str:
@@ -137,31 +159,29 @@ class HostBridgeProvider(BaseProvider):
     # HTTP Communication
     # =========================================================================
 
-    def _request(
+    def close(self) -> None:
+        """Close idle pooled connections to the agent."""
+        http_transport.close(self.config.agent_url)
+
+    def _send(
         self,
         method: str,
         path: str,
-        body: Optional[dict] = None,
+        body: Any = None,
+        headers: Optional[Dict[str, str]] = None,
         timeout: Optional[int] = None,
-    ) -> dict:
-        """Make an HTTP request to the host agent."""
+    ) -> http.client.HTTPResponse:
+        """Send a request to the agent; returns the unread response.
+
+        Read the response to the end (or close it) to hand its connection
+        back to the pool. Error statuses raise ConnectionError.
+        """
+        all_headers = {"Authorization": f"Bearer {self.config.agent_token}"}
+        all_headers.update(headers or {})
         url = f"{self.config.agent_url}{path}"
-        headers = {
-            "Authorization": f"Bearer {self.config.agent_token}",
-            "Content-Type": "application/json",
-        }
-
-        data = None
-        if body is not None:
-            data = json.dumps(body).encode("utf-8")
-
-        req = urllib.request.Request(url, data=data, headers=headers, method=method)
-
-        effective_timeout = timeout or self.config.read_timeout_s
-
+        req = urllib.request.Request(url, data=body, headers=all_headers, method=method)
         try:
-            with urllib.request.urlopen(req, timeout=effective_timeout) as resp:
-                return json.loads(resp.read().decode("utf-8"))
+            return http_transport.urlopen(req, timeout=timeout or self.config.read_timeout_s)
         except urllib.error.HTTPError as e:
             error_body = ""
             try:
@@ -172,10 +192,33 @@ class HostBridgeProvider(BaseProvider):
                 f"Host agent returned {e.code}: {error_body[:200]}"
             ) from e
         except urllib.error.URLError as e:
-            raise ConnectionError(
-                f"Cannot reach host agent at {url}: {e.reason}"
-            ) from e
-        except Exception as e:
+            raise ConnectionError(f"Cannot reach host agent at {url}: {e.reason}") from e
+
+    def _read_body(self, resp: http.client.HTTPResponse) -> bytes:
+        try:
+            with resp:
+                return resp.read()
+        except (OSError, http.client.HTTPException) as e:
+            raise ConnectionError(f"Host agent request failed: {str(e)[:200]}") from e
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[dict] = None,
+        timeout: Optional[int] = None,
+    ) -> dict:
+        """Make a JSON request to the host agent."""
+        data = None
+        headers = {}
+        if body is not None:
+            data = json.dumps(body).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+
+        resp = self._send(method, path, body=data, headers=headers, timeout=timeout)
+        try:
+            return json.loads(self._read_body(resp).decode("utf-8"))
+        except ValueError as e:
             raise ConnectionError(
                 f"Host agent request failed: {str(e)[:200]}"
             ) from e
@@ -201,6 +244,7 @@ class HostBridgeProvider(BaseProvider):
                     "host_platform": info.get("platform", "unknown"),
                     "host_hostname": info.get("hostname", "unknown"),
                     "agent_version": info.get("agent_version", "unknown"),
+                    "transport": http_transport.stats(self.config.agent_url),
                 },
             )
         except Exception as e:
@@ -402,43 +446,111 @@ class HostBridgeProvider(BaseProvider):
         return result.exit_code == 0
 
     # =========================================================================
-    # FileOps Capability (via shell commands on host)
+    # FileOps Capability (native /files/* endpoints on the host agent)
     # =========================================================================
 
     def read(self, path: str) -> str:
         """Read file contents on host."""
-        # Use 'type' on Windows, 'cat' on Unix — agent handles OS detection
-        result = self.run(f'python -c "print(open(r\'{path}\', encoding=\'utf-8\').read(), end=\'\')"', os.path.dirname(path) or ".")
-        if not result.success:
-            return f"Error: {result.stderr}"
-        return result.stdout
+        try:
+            data = self._download_bytes(path)
+        except ConnectionError as e:
+            return f"Error: {e}"
+        return data.decode("utf-8", errors="replace")
 
     def write(self, path: str, content: str, atomic: bool = True) -> FileChange:
         """Write content to file on host."""
-        # Use Python one-liner via agent for safe cross-platform writes
-        escaped = content.replace("\\", "\\\\").replace("'", "\\'").replace("\n", "\\n").replace("\r", "\\r")
-        script = f"import os; os.makedirs(os.path.dirname(r'{path}') or '.', exist_ok=True); open(r'{path}', 'w', encoding='utf-8').write('{escaped}')"
-        result = self.run(f'python -c "{script}"', os.path.dirname(path) or ".")
-        if not result.success:
-            return FileChange(path=path, action="error", error_message=result.stderr)
-        return FileChange(path=path, action="modified" if os.path.exists(path) else "created")
+        data = content.encode("utf-8")
+        try:
+            if len(data) > self.config.upload_threshold_bytes:
+                result = self._upload(path, data, len(data), atomic=atomic)
+            else:
+                result = self._request("POST", "/files/write", body={
+                    "path": path, "content": content, "atomic": atomic,
+                })
+        except ConnectionError as e:
+            logger.warning("Host bridge write failed for %s: %s", path, e)
+            return FileChange(path=path, action="error", error_message=str(e))
+        return self._file_change(result)
 
     def list(self, path: str, recursive: bool = False) -> List[str]:
         """List files in directory on host."""
-        if recursive:
-            result = self.run(f'python -c "import os; [print(os.path.relpath(os.path.join(r,f), r\'{path}\')) for r,d,files in os.walk(r\'{path}\') for f in files]"', path)
-        else:
-            result = self.run(f'python -c "import os; [print(f) for f in sorted(os.listdir(r\'{path}\'))]"', path)
-        if not result.success:
-            return [f"Error: {result.stderr}"]
-        return [line for line in result.stdout.strip().split("\n") if line]
+        try:
+            result = self._request("POST", "/files/list", body={"path": path, "recursive": recursive})
+        except ConnectionError as e:
+            return [f"Error: {e}"]
+        return result.get("entries", [])
 
     def delete(self, path: str) -> FileChange:
         """Delete a file on host."""
-        result = self.run(f'python -c "import os; os.remove(r\'{path}\')"', os.path.dirname(path) or ".")
-        if not result.success:
-            return FileChange(path=path, action="error", error_message=result.stderr)
-        return FileChange(path=path, action="deleted")
+        try:
+            result = self._request("POST", "/files/delete", body={"path": path})
+        except ConnectionError as e:
+            logger.warning("Host bridge delete failed for %s: %s", path, e)
+            return FileChange(path=path, action="error", error_message=str(e))
+        return self._file_change(result)
+
+    def stat(self, path: str, hash: bool = False) -> Dict[str, Any]:
+        """Stat a path on host (``exists``, ``is_dir``, ``size``, ``mtime``)."""
+        return self._request("POST", "/files/stat", body={"path": path, "hash": hash})
+
+    def batch(self, ops: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run many small file ops in one round trip.
+
+        Each op is a dict with ``op`` (stat/read/write/list/delete) plus that
+        op's fields. Results come back in order, each with ``ok`` and either
+        the op's result fields or ``error``.
+        """
+        return self._request("POST", "/files/batch", body={"ops": ops}).get("results", [])
+
+    def upload(self, local_path: str, remote_path: str, atomic: bool = True) -> FileChange:
+        """Stream a local file to the host in chunks."""
+        with open(local_path, "rb") as f:
+            result = self._upload(remote_path, f, os.fstat(f.fileno()).st_size, atomic=atomic)
+        return self._file_change(result)
+
+    def download(self, remote_path: str, local_path: str) -> int:
+        """Stream a host file to ``local_path`` in chunks. Returns bytes written."""
+        resp = self._send("GET", f"/files/download?path={quote(remote_path, safe='')}")
+        local_dir = os.path.dirname(os.path.abspath(local_path))
+        fd, tmp_path = tempfile.mkstemp(dir=local_dir, prefix=".host-bridge-")
+        written = 0
+        try:
+            with resp, os.fdopen(fd, "wb") as f:
+                while True:
+                    chunk = resp.read(self.config.transfer_chunk_bytes)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    written += len(chunk)
+            os.replace(tmp_path, local_path)
+        except (OSError, http.client.HTTPException):
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return written
+
+    def _download_bytes(self, path: str) -> bytes:
+        resp = self._send("GET", f"/files/download?path={quote(path, safe='')}")
+        return self._read_body(resp)
+
+    def _upload(self, path: str, body: Any, size: int, atomic: bool = True) -> dict:
+        query = f"path={quote(path, safe='')}&atomic={1 if atomic else 0}"
+        resp = self._send(
+            "PUT", f"/files/upload?{query}", body=body,
+            headers={"Content-Type": "application/octet-stream", "Content-Length": str(size)},
+        )
+        return json.loads(self._read_body(resp).decode("utf-8"))
+
+    @staticmethod
+    def _file_change(result: Dict[str, Any]) -> FileChange:
+        return FileChange(
+            path=result.get("path", ""),
+            action=result.get("action", "modified"),
+            hash_before=result.get("hash_before"),
+            hash_after=result.get("hash_after"),
+            size_before=result.get("size_before"),
+            size_after=result.get("size_after"),
+        )
 
     # =========================================================================
     # Helpers
@@ -43,6 +43,7 @@ from src.tools.contracts import (
     ProviderHealth,
     ProviderState,
 )
+from src.tools.sandbox_pool import ContainerSpec, SandboxPool
 
 logger = logging.getLogger(__name__)
 
@@ -240,6 +241,14 @@ class SandboxConfig:
     workspace_mount_path: str = "/workspace"
     read_only_mounts: Dict[str, str] = field(default_factory=dict)
 
+    # Warm container pool (0 = fresh `docker run --rm` per command)
+    warm_pool_size: int = 2
+    warm_pool_idle_s: float = 300.0
+    warm_pool_max_commands: int = 50
+    # Extra cleanup after each command; the pool already empties /tmp,
+    # /dev/shm and HOME, the only writable paths besides the workspace
+    warm_pool_reset_command: Optional[str] = None
+
 
 # =============================================================================
 # LocalSandboxProvider
@@ -258,6 +267,7 @@ class LocalSandboxProvider(BaseProvider):
         self,
         config: Optional[SandboxConfig] = None,
         workspace: Optional[str] = None,
+        pool: Optional[SandboxPool] = None,
     ):
         """
         Initialize the LocalSandboxProvider.
@@ -265,9 +275,17 @@ class LocalSandboxProvider(BaseProvider):
         Args:
             config: Optional SandboxConfig (uses defaults if not provided)
             workspace: Default workspace path for operations
+            pool: Optional SandboxPool (built from config if not provided)
         """
         self.config = config or SandboxConfig()
         self._workspace = workspace
+        self._pool = pool
+        if self._pool is None and self.config.warm_pool_size > 0:
+            self._pool = SandboxPool(
+                max_containers=self.config.warm_pool_size,
+                idle_ttl_s=self.config.warm_pool_idle_s,
+                max_commands=self.config.warm_pool_max_commands,
+            )
         self._docker_available: Optional[bool] = None
         self._last_health_check: Optional[str] = None
 
@@ -330,6 +348,7 @@ class LocalSandboxProvider(BaseProvider):
             metadata={
                 "docker_image": self.config.docker_image,
                 "network_enabled": self.config.network_enabled,
+                "warm_pool": self._pool.stats() if self._pool else None,
             },
         )
 
@@ -430,6 +449,9 @@ class LocalSandboxProvider(BaseProvider):
         # Determine network mode
         use_network = network and self.config.network_enabled
 
+        if self._pool is not None:
+            return self._run_pooled(cmd_str, cwd, env, use_network, timeout_s, start_time)
+
         # Build Docker command
         docker_cmd = self._build_docker_command(
             command=cmd_str,
@@ -503,6 +525,86 @@ class LocalSandboxProvider(BaseProvider):
                 working_dir=cwd,
             )
 
+    def _run_pooled(
+        self,
+        cmd_str: str,
+        cwd: str,
+        env: Optional[Dict[str, str]],
+        network: bool,
+        timeout_s: int,
+        start_time: float,
+    ) -> ExecResult:
+        """Execute via ``docker exec`` in a warm container for this workspace."""
+        spec = self._container_spec(cwd, network)
+
+        # F-001: Validate the container start command before execution
+        validation_error = DockerRunValidator.validate(self._pool.runtime.build_start_command(spec))
+        if validation_error:
+            return ExecResult(
+                exit_code=126,
+                stdout="",
+                stderr=f"Docker security validation failed: {validation_error}",
+                duration_ms=int((time.time() - start_time) * 1000),
+                command=cmd_str,
+                working_dir=cwd,
+            )
+
+        safe_env = {k: v for k, v in (env or {}).items() if k.isidentifier()}
+        try:
+            result = self._pool.run(
+                spec, ["sh", "-c", cmd_str], env=safe_env, timeout_s=timeout_s,
+            )
+        except Exception as e:
+            return ExecResult(
+                exit_code=1,
+                stdout="",
+                stderr=f"Execution error: {str(e)[:200]}",
+                duration_ms=int((time.time() - start_time) * 1000),
+                command=cmd_str,
+                working_dir=cwd,
+            )
+
+        stdout, stdout_truncated = self._bound_output(
+            result.stdout, self.config.max_stdout_chars
+        )
+        stderr, stderr_truncated = self._bound_output(
+            result.stderr, self.config.max_stderr_chars
+        )
+        return ExecResult(
+            exit_code=result.exit_code,
+            stdout=stdout,
+            stderr=stderr,
+            duration_ms=int((time.time() - start_time) * 1000),
+            truncated=stdout_truncated or stderr_truncated,
+            command=cmd_str,
+            working_dir=cwd,
+            timed_out=result.timed_out,
+        )
+
+    def _container_spec(self, workspace: str, network: bool) -> ContainerSpec:
+        """Build the warm-pool spec; mounts mirror _build_docker_command."""
+        mounts = []
+        workdir = None
+        if workspace and os.path.exists(workspace):
+            mounts.append((os.path.abspath(workspace), self.config.workspace_mount_path, "rw"))
+            workdir = self.config.workspace_mount_path
+        for host_path, container_path in self.config.read_only_mounts.items():
+            if os.path.exists(host_path):
+                mounts.append((host_path, container_path, "ro"))
+        return ContainerSpec(
+            image=self.config.docker_image,
+            mounts=tuple(mounts),
+            workdir=workdir,
+            network=network,
+            memory=self.config.docker_memory_limit,
+            reset_command=self.config.warm_pool_reset_command,
+        )
+
+    def close(self) -> None:
+        """Remove warm sandbox containers."""
+        if self._pool is not None:
+            self._pool.close()
+
     def _build_docker_command(
         self,
         command: str,
@@ -59,6 +59,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Union
 
+from src.core import http_transport
 from src.tools.contracts import (
     AppActionResult,
     AppState,
@@ -147,6 +148,8 @@ class UABConfig:
     daemon_url: str = ""
     connect_timeout_s: int = 5
     read_timeout_s: int = 30
+    # Concurrent RPCs on keep-alive connections; further calls queue in order
+    max_connections: int = 4
 
     # JSON-RPC settings
     rpc_version: str = "2.0"
@@ -179,6 +182,11 @@ class UABProvider(BaseProvider):
     def __init__(self, config: Optional[UABConfig] = None):
         self.config = config or UABConfig()
         self._connected_apps: Dict[int, Dict[str, Any]] = {}
+        http_transport.configure(
+            self.config.daemon_url,
+            connect_timeout_s=self.config.connect_timeout_s,
+            max_connections=self.config.max_connections,
+        )
 
     @property
     def provider_id(self) -> str:
@@ -220,7 +228,7 @@ class UABProvider(BaseProvider):
         effective_timeout = timeout or self.config.read_timeout_s
 
         try:
-            with urllib.request.urlopen(req, timeout=effective_timeout) as resp:
+            with http_transport.urlopen(req, timeout=effective_timeout) as resp:
                 result = json.loads(resp.read().decode("utf-8"))
 
             if "error" in result and result["error"] is not None:
@@ -278,6 +286,7 @@ class UABProvider(BaseProvider):
                     "daemon_url": self.config.daemon_url,
                     "connected_apps": connected_count,
                     "supported_frameworks": frameworks,
+                    "transport": http_transport.stats(self.config.daemon_url),
                 },
             )
         except Exception as e:
@@ -0,0 +1,562 @@
+"""
+Sandbox Pool — warm, reusable sandbox containers
+================================================
+
+Starting a fresh ``docker run --rm`` per command costs container create,
+start and teardown (typically 0.5-2 s). The pool keeps a bounded set of
+pre-started containers per ContainerSpec (image, mounts, network, limits)
+and runs each command with ``docker exec`` instead.
+
+Hygiene policy:
+- Health: a container idle for longer than ``health_check_interval_s`` is
+  probed before reuse; dead containers are replaced.
+- Idle eviction: containers unused for ``idle_ttl_s`` are removed.
+- Recycling: a container is removed after ``max_commands`` commands, after
+  a timed-out command (its process may still be running inside), and when
+  its reset fails.
+- Isolation: containers run with a read-only root filesystem; the only
+  writable paths outside the spec's mounts are the tmpfs ``scratch_dirs``
+  (/tmp, /dev/shm and HOME).
+- Reset: before a container goes back to the pool, every process the
+  command left behind (``cmd &``, ``nohup``, daemons) is killed — a
+  container where one survives is recycled — the scratch dirs are
+  emptied, and then the spec's optional ``reset_command`` runs.
+
+Runtimes:
+- DockerCLIRuntime — ``docker run -d`` / ``docker exec`` / ``docker rm -f``
+- ProcessRuntime   — runs commands as host subprocesses with container
+  paths mapped to their mount sources. NO isolation; for tests and
+  development on machines without Docker.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import shutil
+import signal
+import subprocess
+import tempfile
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# HOME inside sandbox containers; a tmpfs like the other scratch dirs
+SANDBOX_HOME = "/home/sandbox"
+
+_SCRATCH_SIZE = "64m"
+
+
+# =============================================================================
+# Container spec and exec result
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class ContainerSpec:
+    """Everything that makes two sandbox containers interchangeable.
+
+    Commands only share a container when their specs are equal, so the
+    workspace mount keeps pools per-workspace.
+    """
+
+    image: str
+    # (host_path, container_path, mode) with mode "rw" or "ro"
+    mounts: Tuple[Tuple[str, str, str], ...] = ()
+    workdir: Optional[str] = None
+    network: bool = False
+    memory: str = "512m"
+    cpus: str = "1"
+    # Writable tmpfs mounts on the read-only root, emptied between commands
+    scratch_dirs: Tuple[str, ...] = ("/tmp", "/dev/shm", SANDBOX_HOME)
+    reset_command: Optional[str] = None
+
+
+@dataclass
+class PoolExecResult:
+    """Outcome of one command run through the pool."""
+
+    exit_code: int
+    stdout: str
+    stderr: str
+    timed_out: bool = False
+    reused: bool = False
+
+
+class SandboxStartError(RuntimeError):
+    """A sandbox container could not be started."""
+
+
+# =============================================================================
+# Runtimes
+# =============================================================================
+
+
+class ContainerRuntime:
+    """Starts, probes, runs commands in and removes sandbox containers."""
+
+    def build_start_command(self, spec: ContainerSpec) -> List[str]:
+        """The command that starts a container for ``spec`` (for validation/logging)."""
+        return []
+
+    def start(self, spec: ContainerSpec) -> str:
+        """Start a container and return its id. Raises SandboxStartError."""
+        raise NotImplementedError
+
+    def exec(
+        self,
+        container_id: str,
+        spec: ContainerSpec,
+        argv: List[str],
+        stdin: Optional[str],
+        env: Optional[Dict[str, str]],
+        timeout_s: float,
+    ) -> subprocess.CompletedProcess:
+        """Run ``argv`` in the container. Raises subprocess.TimeoutExpired."""
+        raise NotImplementedError
+
+    def kill_strays(self, container_id: str, spec: ContainerSpec) -> bool:
+        """Kill processes left running by earlier commands.
+
+        Returns False if some could not be killed, so the container is recycled.
+        """
+        raise NotImplementedError
+
+    def is_alive(self, container_id: str) -> bool:
+        raise NotImplementedError
+
+    def remove(self, container_id: str) -> None:
+        raise NotImplementedError
+
+
+# Runs in the container between commands. PID 1 is the --init process and
+# its oldest child the ``sleep infinity`` keepalive; everything else other
+# than this shell is left over from a command. Exits non-zero if processes
+# are still there after a few passes (e.g. one forking as fast as it is
+# killed). Builtins only inside the loops, so the shell forks nothing
+# while it kills.
+_KILL_STRAYS_SCRIPT = """
+keep=
+for d in /proc/[0-9]*; do
+  while read -r key value; do
+    if [ "$key" = PPid: ]; then
+      if [ "$value" = 1 ] && { [ -z "$keep" ] || [ "${d#/proc/}" -lt "$keep" ]; }; then
+        keep=${d#/proc/}
+      fi
+      break
+    fi
+  done < "$d/status" 2>/dev/null
+done
+for pass in 1 2 3; do
+  left=0
+  for d in /proc/[0-9]*; do
+    case "${d#/proc/}" in 1|"$$"|"$keep") continue ;; esac
+    kill -9 "${d#/proc/}" 2>/dev/null && left=1
+  done
+  [ "$left" = 0 ] && exit 0
+  sleep 0.2
+done
+exit 1
+"""
+
+
+class DockerCLIRuntime(ContainerRuntime):
+    """Runtime backed by the docker CLI (same binary the sandbox already uses)."""
+
+    LABEL = "lancelot.sandbox-pool=1"
+
+    def build_start_command(self, spec: ContainerSpec) -> List[str]:
+        cmd = [
+            "docker", "run", "-d", "--rm", "--init", "--read-only",
+            f"--memory={spec.memory}",
+            f"--cpus={spec.cpus}",
+            f"--label={self.LABEL}",
+        ]
+        for path in spec.scratch_dirs:
+            cmd.append(f"--tmpfs={path}:rw,exec,size={_SCRATCH_SIZE}")
+        if SANDBOX_HOME in spec.scratch_dirs:
+            cmd.append(f"--env=HOME={SANDBOX_HOME}")
+        if not spec.network:
+            cmd.append("--network=none")
+        for host_path, container_path, mode in spec.mounts:
+            suffix = ":ro" if mode == "ro" else ""
+            cmd.extend(["-v", f"{host_path}:{container_path}{suffix}"])
+        if spec.workdir:
+            cmd.extend(["-w", spec.workdir])
+        cmd.extend([spec.image, "sleep", "infinity"])
+        return cmd
+
+    def start(self, spec: ContainerSpec) -> str:
+        try:
+            result = subprocess.run(
+                self.build_start_command(spec), capture_output=True, text=True, timeout=60,
+            )
+        except (subprocess.TimeoutExpired, OSError) as exc:
+            raise SandboxStartError(f"docker run failed: {exc}") from exc
+        if result.returncode != 0 or not result.stdout.strip():
+            raise SandboxStartError(f"docker run failed: {result.stderr.strip()[:200]}")
+        return result.stdout.strip()
+
+    def exec(self, container_id, spec, argv, stdin, env, timeout_s):
+        cmd = ["docker", "exec"]
+        if stdin is not None:
+            cmd.append("-i")
+        for key, value in (env or {}).items():
+            cmd.extend(["-e", f"{key}={value}"])
+        if spec.workdir:
+            cmd.extend(["-w", spec.workdir])
+        cmd.append(container_id)
+        cmd.extend(argv)
+        return subprocess.run(cmd, input=stdin, capture_output=True, text=True, timeout=timeout_s)
+
+    def kill_strays(self, container_id: str, spec: ContainerSpec) -> bool:
+        try:
+            result = subprocess.run(
+                ["docker", "exec", container_id, "sh", "-c", _KILL_STRAYS_SCRIPT],
+                capture_output=True, text=True, timeout=30,
+            )
+        except (subprocess.TimeoutExpired, OSError) as exc:
+            logger.warning("Failed to clear processes in %s: %s", container_id[:12], exc)
+            return False
+        return result.returncode == 0
+
+    def is_alive(self, container_id: str) -> bool:
+        try:
+            result = subprocess.run(
+                ["docker", "inspect", "-f", "{{.State.Running}}", container_id],
+                capture_output=True, text=True, timeout=10,
+            )
+        except (subprocess.TimeoutExpired, OSError):
+            return False
+        return result.returncode == 0 and result.stdout.strip() == "true"
+
+    def remove(self, container_id: str) -> None:
+        try:
+            subprocess.run(["docker", "rm", "-f", container_id], capture_output=True, timeout=30)
+        except (subprocess.TimeoutExpired, OSError) as exc:
+            logger.warning("Failed to remove sandbox container %s: %s", container_id[:12], exc)
+
+
+class ProcessRuntime(ContainerRuntime):
+    """Stub runtime: "containers" are ids, commands run as host subprocesses.
+
+    Mount points and scratch dirs in the command line are mapped to their
+    host paths (each container gets private directories for its scratch
+    dirs), so working directories, mounted files and the reset behave as
+    they would in Docker. Each command runs in its own session, and
+    ``kill_strays`` kills those sessions' process groups. There is no
+    isolation — never use this for untrusted commands.
+    """
+
+    def __init__(self) -> None:
+        self._alive: Dict[str, str] = {}
+        self._groups: Dict[str, List[int]] = {}
+        self._lock = threading.Lock()
+
+    def start(self, spec: ContainerSpec) -> str:
+        container_id = uuid.uuid4().hex
+        scratch = tempfile.mkdtemp(prefix="sandbox-pool-")
+        for path in spec.scratch_dirs:
+            os.makedirs(self._scratch_path(scratch, path))
+        with self._lock:
+            self._alive[container_id] = scratch
+        return container_id
+
+    def exec(self, container_id, spec, argv, stdin, env, timeout_s):
+        with self._lock:
+            scratch = self._alive.get(container_id)
+        if scratch is None:
+            raise RuntimeError(f"container {container_id[:12]} is not running")
+        paths = {mount_point: host_path for host_path, mount_point, _ in spec.mounts}
+        for path in spec.scratch_dirs:
+            paths[path] = self._scratch_path(scratch, path)
+        pattern = re.compile(
+            r"(?<![\w./-])(" + "|".join(re.escape(p) for p in sorted(paths, key=len, reverse=True)) + r")(?![\w.-])"
+        )
+        mapped = [pattern.sub(lambda m: paths[m.group(1)], arg) for arg in argv]
+        cwd = pattern.sub(lambda m: paths[m.group(1)], spec.workdir) if spec.workdir else None
+        proc = subprocess.Popen(
+            mapped, stdin=subprocess.PIPE if stdin is not None else None,
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+            cwd=cwd, env={**os.environ, **self._scratch_env(paths), **(env or {})},
+            start_new_session=True,
+        )
+        with self._lock:
+            self._groups.setdefault(container_id, []).append(proc.pid)
+        try:
+            stdout, stderr = proc.communicate(stdin, timeout=timeout_s)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            raise
+        return subprocess.CompletedProcess(mapped, proc.returncode, stdout, stderr)
+
+    @staticmethod
+    def _scratch_path(scratch: str, path: str) -> str:
+        return os.path.join(scratch, path.strip("/").replace("/", "_"))
+
+    @staticmethod
+    def _scratch_env(paths: Dict[str, str]) -> Dict[str, str]:
+        env = {}
+        if "/tmp" in paths:
+            env["TMPDIR"] = paths["/tmp"]
+        if SANDBOX_HOME in paths:
+            env["HOME"] = paths[SANDBOX_HOME]
+        return env
+
+    def kill_strays(self, container_id: str, spec: ContainerSpec) -> bool:
+        with self._lock:
+            groups = self._groups.pop(container_id, [])
+        for pgid in groups:
+            try:
+                os.killpg(pgid, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError):
+                pass
+        return True
+
+    def is_alive(self, container_id: str) -> bool:
+        with self._lock:
+            return container_id in self._alive
+
+    def remove(self, container_id: str) -> None:
+        self.kill_strays(container_id, None)
+        with self._lock:
+            scratch = self._alive.pop(container_id, None)
+        if scratch:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+    def kill(self, container_id: str) -> None:
+        """Simulate a container dying underneath the pool."""
+        with self._lock:
+            self._alive.pop(container_id, None)
+
+
+# =============================================================================
+# Pool
+# =============================================================================
+
+
+@dataclass
+class _Container:
+    container_id: str
+    spec: ContainerSpec
+    started_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    last_health_check: float = field(default_factory=time.monotonic)
+    commands: int = 0
+    pooled: bool = True
+
+
+class SandboxPool:
+    """Bounded pool of warm sandbox containers keyed by ContainerSpec."""
+
+    def __init__(
+        self,
+        runtime: Optional[ContainerRuntime] = None,
+        max_containers: int = 4,
+        idle_ttl_s: float = 300.0,
+        max_commands: int = 50,
+        health_check_interval_s: float = 30.0,
+    ) -> None:
+        self.runtime = runtime or DockerCLIRuntime()
+        self.max_containers = max_containers
+        self.idle_ttl_s = idle_ttl_s
+        self.max_commands = max_commands
+        self.health_check_interval_s = health_check_interval_s
+        self._lock = threading.Lock()
+        self._idle: Dict[ContainerSpec, List[_Container]] = {}
+        self._busy = 0
+        self._closed = False
+        self._stats = {
+            "started": 0, "reused": 0, "recycled": 0, "evicted": 0,
+            "unhealthy": 0, "overflow": 0,
+        }
+
+    # ── Public API ────────────────────────────────────────────────
+
+    def run(
+        self,
+        spec: ContainerSpec,
+        argv: List[str],
+        stdin: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+        timeout_s: float = 60,
+    ) -> PoolExecResult:
+        """Run ``argv`` in a warm container for ``spec``.
+
+        Raises SandboxStartError if no container could be started.
+        """
+        container, reused = self._acquire(spec)
+        healthy = True
+        try:
+            completed = self.runtime.exec(container.container_id, spec, argv, stdin, env, timeout_s)
+        except subprocess.TimeoutExpired:
+            # The process may still be running inside: never reuse this one
+            self._release(container, healthy=False)
+            return PoolExecResult(
+                exit_code=124, stdout="", stderr=f"Command timed out after {timeout_s}s",
+                timed_out=True, reused=reused,
+            )
+        except Exception:
+            self._release(container, healthy=False)
+            raise
+        if container.pooled:
+            healthy = self._reset(container)
+        self._release(container, healthy=healthy)
+        return PoolExecResult(
+            exit_code=completed.returncode,
+            stdout=completed.stdout or "",
+            stderr=completed.stderr or "",
+            reused=reused,
+        )
+
+    def evict_idle(self) -> int:
+        """Remove containers idle for longer than ``idle_ttl_s``. Returns the count."""
+        now = time.monotonic()
+        expired: List[_Container] = []
+        with self._lock:
+            for spec, containers in list(self._idle.items()):
+                keep = [c for c in containers if now - c.last_used < self.idle_ttl_s]
+                expired.extend(c for c in containers if now - c.last_used >= self.idle_ttl_s)
+                if keep:
+                    self._idle[spec] = keep
+                else:
+                    del self._idle[spec]
+            self._stats["evicted"] += len(expired)
+        for container in expired:
+            self.runtime.remove(container.container_id)
+        return len(expired)
+
+    def close(self) -> None:
+        """Remove every idle container; busy ones are removed on release."""
+        with self._lock:
+            self._closed = True
+            containers = [c for cs in self._idle.values() for c in cs]
+            self._idle.clear()
+        for container in containers:
+            self.runtime.remove(container.container_id)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "warm": sum(len(cs) for cs in self._idle.values()),
+                "busy": self._busy,
+                "max_containers": self.max_containers,
+                **self._stats,
+            }
+
+    # ── Internals ─────────────────────────────────────────────────
+
+    def _acquire(self, spec: ContainerSpec) -> Tuple[_Container, bool]:
+        self.evict_idle()
+        while True:
+            with self._lock:
+                candidates = self._idle.get(spec) or []
+                container = candidates.pop() if candidates else None
+                if container is not None:
+                    if not candidates:
+                        self._idle.pop(spec, None)
+                    self._busy += 1
+            if container is None:
+                break
+            if time.monotonic() - container.last_health_check >= self.health_check_interval_s:
+                if not self.runtime.is_alive(container.container_id):
+                    logger.info("Sandbox container %s failed health check", container.container_id[:12])
+                    with self._lock:
+                        self._busy -= 1
+                        self._stats["unhealthy"] += 1
+                    self.runtime.remove(container.container_id)
+                    continue
+                container.last_health_check = time.monotonic()
+            with self._lock:
+                self._stats["reused"] += 1
+            return container, True
+
+        victim = None
+        with self._lock:
+            pooled = not self._closed
+            if pooled and self._size_locked() >= self.max_containers:
+                victim = self._oldest_idle_locked()
+                if victim is None:
+                    # Every slot is busy: run this command in a one-off container
+                    pooled = False
+                    self._stats["overflow"] += 1
+                else:
+                    self._stats["evicted"] += 1
+            self._busy += 1
+        if victim is not None:
+            self.runtime.remove(victim.container_id)
+        try:
+            container_id = self.runtime.start(spec)
+        except Exception:
+            with self._lock:
+                self._busy -= 1
+            raise
+        with self._lock:
+            self._stats["started"] += 1
+        return _Container(container_id=container_id, spec=spec, pooled=pooled), False
+
+    def _release(self, container: _Container, healthy: bool) -> None:
+        container.commands += 1
+        container.last_used = time.monotonic()
+        discard = (
+            not healthy
+            or not container.pooled
+            or container.commands >= self.max_commands
+        )
+        with self._lock:
+            self._busy -= 1
+            if self._closed:
+                discard = True
+            if discard:
+                if container.pooled:
+                    self._stats["recycled"] += 1
+            else:
+                self._idle.setdefault(container.spec, []).append(container)
+        if discard:
+            self.runtime.remove(container.container_id)
+
+    def _reset(self, container: _Container) -> bool:
+        """Kill leftover processes, empty the scratch dirs, then run the spec's reset command."""
+        spec = container.spec
+        if not self.runtime.kill_strays(container.container_id, spec):
+            logger.warning("Sandbox %s has processes that survived reset", container.container_id[:12])
+            return False
+        steps = []
+        if spec.scratch_dirs:
+            steps.append("rm -rf " + " ".join(
+                f"{path}/* {path}/.[!.]* {path}/..?*" for path in spec.scratch_dirs
+            ))
+        if spec.reset_command:
+            steps.append(spec.reset_command)
+        if not steps:
+            return True
+        try:
+            result = self.runtime.exec(
+                container.container_id, spec, ["sh", "-c", " && ".join(steps)], None, None, 30,
+            )
+        except Exception as exc:
+            logger.warning("Sandbox reset failed for %s: %s", container.container_id[:12], exc)
+            return False
+        return result.returncode == 0
+
+    def _size_locked(self) -> int:
+        return self._busy + sum(len(cs) for cs in self._idle.values())
+
+    def _oldest_idle_locked(self) -> Optional[_Container]:
+        oldest = None
+        for containers in self._idle.values():
+            for container in containers:
+                if oldest is None or container.last_used < oldest.last_used:
+                    oldest = container
+        if oldest is not None:
+            containers = self._idle[oldest.spec]
+            containers.remove(oldest)
+            if not containers:
+                del self._idle[oldest.spec]
+        return oldest
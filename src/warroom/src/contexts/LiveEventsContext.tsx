@@ -1,7 +1,7 @@
 import { createContext, useContext, useCallback, useState, useMemo } from 'react'
 import type { ReactNode } from 'react'
 import type { WsEvent } from '@/hooks/useWebSocket'
-import type { ToolFlowStep, ToolFlowState, ActionCardData } from '@/types/api'
+import type { ToolFlowStep, ToolFlowState, ActionCardData, ResponseStreamState } from '@/types/api'
 
 // ------------------------------------------------------------------
 // Context value shape
@@ -12,6 +12,8 @@ interface LiveEventsContextValue {
   toolFlowState: Map<string, ToolFlowState>
   /** Pending action cards waiting for user decision */
   pendingActionCards: ActionCardData[]
+  /** Map of streamId (questId) -> in-progress response text */
+  responseStreams: Map<string, ResponseStreamState>
   /** Call this from WarRoomShell to route incoming WS events */
   handleLiveEvent: (event: WsEvent) => void
   /** Mark an action card as resolved locally (optimistic update) */
@@ -31,6 +33,7 @@ interface LiveEventsProviderProps {
 export function LiveEventsProvider({ children }: LiveEventsProviderProps) {
   const [toolFlowState, setToolFlowState] = useState<Map<string, ToolFlowState>>(new Map())
   const [pendingActionCards, setPendingActionCards] = useState<ActionCardData[]>([])
+  const [responseStreams, setResponseStreams] = useState<Map<string, ResponseStreamState>>(new Map())
 
   // ── Tool Flow event handlers ────────────────────────────────
 
@@ -155,6 +158,57 @@ export function LiveEventsProvider({ children }: LiveEventsProviderProps) {
     }
   }, [])
 
+  // ── Response stream event handlers ──────────────────────────
+
+  const handleResponseStreamEvent = useCallback((event: WsEvent) => {
+    const payload = event.payload
+    const streamId = payload.stream_id as string
+    if (!streamId) return
+    const seq = (payload.seq as number) || 0
+
+    setResponseStreams((prev) => {
+      const existing = prev.get(streamId)
+      switch (event.type) {
+        case 'chat.stream_started': {
+          // Finished previews are kept until the next request starts streaming
+          const next = new Map(
+            Array.from(prev.entries()).filter(([, s]) => s.status === 'streaming'),
+          )
+          next.set(streamId, {
+            streamId,
+            channel: (payload.channel as string) || 'api',
+            text: '',
+            seq: 0,
+            status: 'streaming',
+          })
+          return next
+        }
+        case 'chat.delta': {
+          if (!existing || seq <= existing.seq) return prev
+          const next = new Map(prev)
+          next.set(streamId, { ...existing, seq, text: existing.text + ((payload.text as string) || '') })
+          return next
+        }
+        case 'chat.stream_reset': {
+          if (!existing || seq <= existing.seq) return prev
+          const next = new Map(prev)
+          next.set(streamId, { ...existing, seq, text: '' })
+          return next
+        }
+        case 'chat.stream_end': {
+          // Keep showing the preview until the final reply arrives through
+          // the chat API (ChatInterface only renders it while sending)
+          if (!existing) return prev
+          const next = new Map(prev)
+          next.set(streamId, { ...existing, status: 'ended' })
+          return next
+        }
+        default:
+          return prev
+      }
+    })
+  }, [])
+
   // ── Action Card event handlers ──────────────────────────────
 
   const handleActionCardEvent = useCallback((event: WsEvent) => {
@@ -205,9 +259,11 @@ export function LiveEventsProvider({ children }: LiveEventsProviderProps) {
         handleToolFlowEvent(event)
       } else if (event.type.startsWith('actioncard_')) {
         handleActionCardEvent(event)
+      } else if (event.type.startsWith('chat.')) {
+        handleResponseStreamEvent(event)
       }
     },
-    [handleToolFlowEvent, handleActionCardEvent],
+    [handleToolFlowEvent, handleActionCardEvent, handleResponseStreamEvent],
   )
 
   // ── Optimistic resolve (called from ActionCardComponent) ────
@@ -232,10 +288,11 @@ export function LiveEventsProvider({ children }: LiveEventsProviderProps) {
     () => ({
       toolFlowState,
       pendingActionCards,
+      responseStreams,
       handleLiveEvent,
       resolveCard,
     }),
-    [toolFlowState, pendingActionCards, handleLiveEvent, resolveCard],
+    [toolFlowState, pendingActionCards, responseStreams, handleLiveEvent, resolveCard],
   )
 
   return <LiveEventsContext.Provider value={value}>{children}</LiveEventsContext.Provider>
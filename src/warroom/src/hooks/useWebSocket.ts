@@ -4,6 +4,18 @@ export interface WsEvent {
   type: string
   payload: Record<string, unknown>
   timestamp: number
+  /** Journal sequence number (absent when the server runs without a journal) */
+  seq?: number
+  /** True for events delivered in a catch-up batch after (re)connecting */
+  replayed?: boolean
+}
+
+interface ReplayMessage {
+  type: 'replay'
+  epoch: string
+  seq: number
+  complete: boolean
+  events: WsEvent[]
 }
 
 interface UseWebSocketOptions {
@@ -26,6 +38,8 @@ export function useWebSocket({
   const reconnectTimer = useRef<ReturnType<typeof setTimeout>>()
   const onMessageRef = useRef(onMessage)
   onMessageRef.current = onMessage
+  // Last journal position seen, sent on auth so the server replays what we missed
+  const resumeRef = useRef<{ epoch?: string; seq: number }>({ seq: 0 })
 
   const connect = useCallback(() => {
     if (!enabled) return
@@ -40,13 +54,35 @@ export function useWebSocket({
     ws.onopen = () => {
       // F-003: Send auth message as first frame
       const token = localStorage.getItem('lancelot_api_token') || ''
-      ws.send(JSON.stringify({ type: 'auth', token }))
+      const { epoch, seq } = resumeRef.current
+      ws.send(JSON.stringify({ type: 'auth', token, since: seq, epoch }))
       setStatus('connected')
     }
 
     ws.onmessage = (e) => {
       try {
         const data = JSON.parse(e.data) as WsEvent
+        if (data.type === 'replay') {
+          const replay = data as unknown as ReplayMessage
+          if (!replay.complete) {
+            console.warn('War Room WS: replay incomplete, some earlier events were discarded')
+          }
+          for (const event of replay.events) {
+            onMessageRef.current?.({ ...event, replayed: true })
+          }
+          resumeRef.current = { epoch: replay.epoch, seq: replay.seq }
+          return
+        }
+        if (data.type === 'auth_ok') {
+          const epoch = (data as unknown as { epoch?: string }).epoch
+          if (epoch && epoch !== resumeRef.current.epoch) {
+            resumeRef.current = { epoch, seq: 0 }
+          }
+        } else if (data.seq) {
+          // Already delivered (e.g. in the replay batch)
+          if (data.seq <= resumeRef.current.seq) return
+          resumeRef.current = { ...resumeRef.current, seq: data.seq }
+        }
         onMessageRef.current?.(data)
       } catch {
         // non-JSON message, ignore
@@ -34,11 +34,18 @@ function WarRoomShellInner() {
         read: false,
       }
       setNotifications(prev => [notif, ...prev].slice(0, 50))
-      setToasts(prev => [...prev, notif])
+      // Replayed notifications are history — list them without a toast
+      if (!event.replayed) {
+        setToasts(prev => [...prev, notif])
+      }
     }
 
-    // Route toolflow.* and actioncard_* events to LiveEventsContext
-    if (event.type.startsWith('toolflow.') || event.type.startsWith('actioncard_')) {
+    // Route toolflow.*, actioncard_* and chat.* events to LiveEventsContext
+    if (
+      event.type.startsWith('toolflow.') ||
+      event.type.startsWith('actioncard_') ||
+      event.type.startsWith('chat.')
+    ) {
       handleLiveEvent(event)
     }
   }, [handleLiveEvent])
@@ -24,7 +24,7 @@ export function ChatInterface() {
   const [historyLoaded, setHistoryLoaded] = useState(false)
   const messagesEndRef = useRef<HTMLDivElement>(null)
   const fileInputRef = useRef<HTMLInputElement>(null)
-  const { toolFlowState, pendingActionCards, resolveCard } = useLiveEvents()
+  const { toolFlowState, pendingActionCards, responseStreams, resolveCard } = useLiveEvents()
 
   const scrollToBottom = useCallback(() => {
     messagesEndRef.current?.scrollIntoView({ behavior: 'smooth' })
@@ -33,7 +33,7 @@ export function ChatInterface() {
   useEffect(scrollToBottom, [messages, scrollToBottom])
 
   // Also scroll when tool flow or action cards update
-  useEffect(scrollToBottom, [toolFlowState, pendingActionCards, scrollToBottom])
+  useEffect(scrollToBottom, [toolFlowState, pendingActionCards, responseStreams, scrollToBottom])
 
   // Load conversation history from backend on mount
   useEffect(() => {
@@ -126,6 +126,11 @@ export function ChatInterface() {
   // Determine if there are any running tool flows to show
   const activeFlows = Array.from(toolFlowState.values()).filter((f) => f.status === 'running')
 
+  // Response text streaming in for War Room requests (Telegram streams to Telegram)
+  const liveStreams = Array.from(responseStreams.values()).filter(
+    (s) => s.channel !== 'telegram' && s.text,
+  )
+
   // Get action cards that are not yet resolved
   const visibleActionCards = pendingActionCards
 
@@ -161,6 +166,17 @@ export function ChatInterface() {
             />
           ))}
 
+        {/* Provisional response text — replaced by the final reply */}
+        {sending &&
+          liveStreams.map((stream) => (
+            <ChatMessage
+              key={`stream-${stream.streamId}`}
+              role="assistant"
+              content={stream.text}
+              timestamp=""
+            />
+          ))}
+
         {/* Fallback sending indicator when no tool flow events are streaming */}
         {sending && activeFlows.length === 0 && (
           <div className="flex items-center gap-2 py-2 text-text-muted">
@@ -546,6 +546,20 @@ export interface ToolFlowState {
   maxIterations: number
 }
 
+// ------------------------------------------------------------------
+// Response Streams  (chat.* WebSocket events)
+// ------------------------------------------------------------------
+
+export interface ResponseStreamState {
+  streamId: string
+  channel: string
+  /** Provisional text received so far (replaced by the final reply) */
+  text: string
+  /** Last applied seq — deltas at or below it are stale */
+  seq: number
+  status: 'streaming' | 'ended'
+}
+
 // ------------------------------------------------------------------
 // Action Cards  (actioncard_* WebSocket events + REST API)
 // ------------------------------------------------------------------
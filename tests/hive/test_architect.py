@@ -315,3 +315,84 @@ class TestReplan:
         await architect.execute_task("Track revisions")
         status = architect.get_status()
         assert status["plan_revision_count"] == 1  # Initial plan
+
+
+def _gated_lifecycle(config, registry, receipt_mgr, started, release):
+    """Lifecycle whose executor blocks subtasks named 'Slow*' until released."""
+    import threading
+    lock = threading.Lock()
+
+    def _exec(action):
+        with lock:
+            started.append(action["spec"])
+        if action["spec"].startswith("Slow"):
+            release.wait(timeout=5)
+        return {"result": "ok"}
+
+    return AgentLifecycleManager(
+        config=config,
+        registry=registry,
+        receipt_manager=receipt_mgr,
+        soul_generator=ScopedSoulGenerator(),
+        action_executor=_exec,
+    )
+
+
+@pytest.mark.asyncio
+class TestDependencyStreaming:
+    async def test_dependent_starts_before_unrelated_slow_agent_finishes(
+        self, config, registry, receipt_mgr,
+    ):
+        import asyncio
+        import threading
+        started, release = [], threading.Event()
+        mgr = _gated_lifecycle(config, registry, receipt_mgr, started, release)
+        response = json.dumps({
+            "subtasks": [
+                {"description": "Slow fetch"},
+                {"description": "Fast fetch"},
+                {"description": "Use fast result", "depends_on": [1]},
+            ],
+            "execution_order": [[0, 1], [2]],
+        })
+        architect, _ = _make_architect(mgr, receipt_mgr, router=MockModelRouter(response=response))
+        try:
+            task = asyncio.ensure_future(architect.execute_task("Stream"))
+            # The loop stays free while agents run, so this polling proceeds
+            for _ in range(200):
+                if "Use fast result" in started:
+                    break
+                await asyncio.sleep(0.01)
+            assert "Use fast result" in started
+            assert not task.done()
+            release.set()
+            result = await task
+        finally:
+            release.set()
+            mgr.shutdown()
+
+        assert result["success"] is True
+        assert len(result["results"]) == 3
+
+    async def test_agent_timeout_enforced_without_blocking(self, config, registry, receipt_mgr):
+        import threading
+        started, release = [], threading.Event()
+        mgr = _gated_lifecycle(config, registry, receipt_mgr, started, release)
+        response = json.dumps({
+            "subtasks": [
+                {"description": "Slow agent", "timeout_seconds": 1},
+                {"description": "Quick agent"},
+            ],
+            "execution_order": [[0, 1]],
+        })
+        architect, _ = _make_architect(mgr, receipt_mgr, router=MockModelRouter(response=response))
+        try:
+            result = await architect.execute_task("Timeout")
+        finally:
+            release.set()
+            mgr.shutdown()
+
+        assert result["success"] is False
+        slow, quick = result["results"]
+        assert "Timed out" in slow["error"]
+        assert quick["success"] is True
@@ -265,3 +265,33 @@ class TestValidation:
         decomposer, _ = _make_decomposer(response=response)
         with pytest.raises(TaskDecompositionError, match="multiple times"):
             await decomposer.decompose("Dup order")
+
+
+@pytest.mark.asyncio
+class TestDependsOn:
+    async def test_depends_on_parsed(self):
+        response = json.dumps({
+            "subtasks": [
+                {"description": "A"},
+                {"description": "B"},
+                {"description": "C", "depends_on": [0, "0", 9, 2]},
+            ],
+            "execution_order": [[0, 1], [2]],
+        })
+        decomposer, _ = _make_decomposer(response=response)
+        result = await decomposer.decompose("Deps")
+        assert result.subtasks[0].depends_on is None
+        # Duplicates, out-of-range and self references are dropped
+        assert result.subtasks[2].depends_on == [0]
+
+    async def test_depends_on_cycle_rejected(self):
+        response = json.dumps({
+            "subtasks": [
+                {"description": "A", "depends_on": [1]},
+                {"description": "B", "depends_on": [0]},
+            ],
+            "execution_order": [[0], [1]],
+        })
+        decomposer, _ = _make_decomposer(response=response)
+        with pytest.raises(TaskDecompositionError, match="cycle"):
+            await decomposer.decompose("Cycle")
@@ -2,6 +2,8 @@
 
 import os
 import sys
+import threading
+import time
 import pytest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "core"))
@@ -197,3 +199,107 @@ def test_clear_results(queue):
     assert len(queue.results) == 1
     queue.clear_results()
     assert len(queue.results) == 0
+
+
+# ── Background Workers ──────────────────────────────────────────
+
+@pytest.fixture
+def started_queue():
+    queues = []
+
+    def _make(verify_fn=None, **config_kwargs):
+        q = AsyncVerificationQueue(
+            verify_fn=verify_fn,
+            config=AsyncVerificationConfig(**{"max_workers": 2, **config_kwargs}),
+        )
+        q.start()
+        queues.append(q)
+        return q
+
+    yield _make
+    for q in queues:
+        q.shutdown()
+
+
+def test_workers_verify_without_drain(started_queue):
+    done = threading.Event()
+    q = started_queue(verify_fn=lambda cap, out: done.set() or True)
+    q.submit(make_job())
+    assert done.wait(timeout=5)
+
+
+def test_workers_run_concurrently(started_queue):
+    barrier = threading.Barrier(2, timeout=5)
+
+    def verify(cap, out):
+        barrier.wait()  # both jobs must be in flight at once
+        return True
+
+    q = started_queue(verify_fn=verify)
+    q.submit(make_job())
+    q.submit(make_job())
+    result = q.drain(timeout_seconds=5)
+    assert result.drained_count == 2
+    assert result.passed == 2
+
+
+def test_drain_reports_background_failures(started_queue):
+    """Results completed before drain() is called are still reported once."""
+    q = started_queue(verify_fn=lambda cap, out: False)
+    q.submit(make_job())
+    for _ in range(500):
+        if q.depth == 0:
+            break
+        time.sleep(0.01)
+    first = q.drain()
+    assert first.failed == 1
+    assert q.drain().drained_count == 0
+
+
+def test_drain_timeout_reports_stragglers(started_queue):
+    release = threading.Event()
+    q = started_queue(verify_fn=lambda cap, out: release.wait(timeout=5))
+    job = make_job()
+    q.submit(job)
+    start = time.monotonic()
+    result = q.drain(timeout_seconds=0.1)
+    assert time.monotonic() - start < 2
+    assert result.timed_out is True
+    assert result.stragglers == [job.job_id]
+    release.set()
+    assert q.drain(timeout_seconds=5).passed == 1
+
+
+def test_serial_drain_honors_timeout():
+    q = AsyncVerificationQueue(verify_fn=lambda cap, out: time.sleep(0.05) or True)
+    jobs = [make_job() for _ in range(5)]
+    for job in jobs:
+        q.submit(job)
+    result = q.drain(timeout_seconds=0.01)
+    assert result.timed_out is True
+    assert 1 <= result.drained_count < 5
+    assert len(result.stragglers) == 5 - result.drained_count
+
+
+def test_start_hands_queued_jobs_to_workers():
+    q = AsyncVerificationQueue()
+    q.submit(make_job())
+    q.start()
+    try:
+        assert q.drain(timeout_seconds=5).drained_count == 1
+    finally:
+        q.shutdown()
+
+
+def test_stats(started_queue):
+    q = started_queue(verify_fn=lambda cap, out: "bad" not in out)
+    q.submit(make_job(output="ok"))
+    q.submit(make_job(output="bad"))
+    q.drain(timeout_seconds=5)
+    stats = q.stats()
+    assert stats["running"] is True
+    assert stats["depth"] == 0
+    assert stats["submitted"] == 2
+    assert stats["completed"] == 2
+    assert stats["failed"] == 1
+    assert stats["max_latency_ms"] >= stats["avg_latency_ms"] >= 0
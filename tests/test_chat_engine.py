@@ -0,0 +1,163 @@
+"""Tests for chat_engine — bounded, per-session ordered chat turn executor."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from chat_engine import (
+    ChatExecutionEngine,
+    EngineOverloadedError,
+    SessionQueueFullError,
+)
+
+
+@pytest.fixture
+def engine():
+    eng = ChatExecutionEngine(max_workers=4, max_pending=8, max_pending_per_session=4)
+    yield eng
+    eng.shutdown(wait=True)
+
+
+class TestOrdering:
+
+    def test_same_session_runs_in_order(self, engine):
+        order = []
+
+        def turn(i):
+            time.sleep(0.01)
+            order.append(i)
+            return i
+
+        futures = [engine.submit("s1", turn, i) for i in range(4)]
+        assert [f.result(timeout=5) for f in futures] == [0, 1, 2, 3]
+        assert order == [0, 1, 2, 3]
+
+    def test_same_session_never_overlaps(self, engine):
+        active = []
+        overlap = []
+        lock = threading.Lock()
+
+        def turn():
+            with lock:
+                active.append(1)
+                if len(active) > 1:
+                    overlap.append(True)
+            time.sleep(0.02)
+            with lock:
+                active.pop()
+
+        futures = [engine.submit("s1", turn) for _ in range(4)]
+        for f in futures:
+            f.result(timeout=5)
+        assert overlap == []
+
+    def test_different_sessions_run_concurrently(self, engine):
+        barrier = threading.Barrier(2, timeout=2)
+
+        def turn():
+            barrier.wait()  # deadlocks (and times out) if serialized
+            return "ok"
+
+        f1 = engine.submit("a", turn)
+        f2 = engine.submit("b", turn)
+        assert f1.result(timeout=5) == "ok"
+        assert f2.result(timeout=5) == "ok"
+
+
+class TestBackpressure:
+
+    def test_session_limit_raises_429(self):
+        eng = ChatExecutionEngine(max_workers=1, max_pending=10, max_pending_per_session=1)
+        gate = threading.Event()
+        try:
+            eng.submit("s", gate.wait)
+            time.sleep(0.05)  # first turn is now running, not pending
+            eng.submit("s", gate.wait)
+            with pytest.raises(SessionQueueFullError) as exc:
+                eng.submit("s", gate.wait)
+            assert exc.value.status_code == 429
+        finally:
+            gate.set()
+            eng.shutdown(wait=True)
+
+    def test_global_limit_raises_503(self):
+        eng = ChatExecutionEngine(max_workers=1, max_pending=2, max_pending_per_session=5)
+        gate = threading.Event()
+        try:
+            eng.submit("a", gate.wait)
+            time.sleep(0.05)
+            eng.submit("b", gate.wait)
+            eng.submit("c", gate.wait)
+            with pytest.raises(EngineOverloadedError) as exc:
+                eng.submit("d", gate.wait)
+            assert exc.value.status_code == 503
+        finally:
+            gate.set()
+            eng.shutdown(wait=True)
+
+    def test_submit_after_shutdown_rejected(self):
+        eng = ChatExecutionEngine(max_workers=1)
+        eng.shutdown(wait=True)
+        with pytest.raises(EngineOverloadedError):
+            eng.submit("s", lambda: None)
+
+
+class TestErrorsAndStats:
+
+    def test_exception_propagates_and_counts(self, engine):
+        def boom():
+            raise ValueError("bad turn")
+
+        with pytest.raises(ValueError):
+            engine.submit("s", boom).result(timeout=5)
+        assert engine.submit("s", lambda: 1).result(timeout=5) == 1
+        stats = engine.stats()
+        assert stats["failed"] == 1
+        assert stats["completed"] == 1
+
+    def test_stats_shape(self, engine):
+        engine.submit("s", lambda: None).result(timeout=5)
+        stats = engine.stats()
+        assert stats["queue_depth"] == 0
+        assert stats["running"] == 0
+        assert stats["submitted"] == 1
+        for key in ("wait_time", "run_time"):
+            assert set(stats[key]) == {"avg_ms", "p95_ms", "max_ms"}
+
+    def test_async_run_does_not_block_loop(self, engine):
+        async def scenario():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.01)
+
+            task = asyncio.ensure_future(ticker())
+            result = await engine.run("s", lambda: (time.sleep(0.2), "done")[1])
+            task.cancel()
+            return result, ticks
+
+        # A private loop: asyncio.run() would leave the main thread without
+        # a current event loop for later tests that call get_event_loop().
+        loop = asyncio.new_event_loop()
+        try:
+            result, ticks = loop.run_until_complete(scenario())
+        finally:
+            loop.close()
+        assert result == "done"
+        assert ticks >= 5
+
+    def test_shutdown_fails_queued_turns(self):
+        eng = ChatExecutionEngine(max_workers=1, max_pending=10, max_pending_per_session=10)
+        gate = threading.Event()
+        eng.submit("s", gate.wait)
+        time.sleep(0.05)
+        queued = eng.submit("s", lambda: "never")
+        eng.shutdown(wait=False)
+        gate.set()
+        with pytest.raises(EngineOverloadedError):
+            queued.result(timeout=5)
@@ -0,0 +1,86 @@
+"""
+Tests for CognitionGovernor — in-memory usage counters, checkpointing,
+day rollover and the actions-per-minute sliding window.
+"""
+
+import json
+import os
+import time
+
+import security
+from security import CognitionGovernor
+
+
+def _read(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+class TestCounters:
+    def test_log_usage_does_not_touch_disk(self, tmp_path):
+        gov = CognitionGovernor(str(tmp_path), checkpoint_interval_s=0)
+        gov.log_usage("tokens", 100)
+        assert not os.path.exists(gov.usage_file)
+        assert gov.usage["tokens"] == 100
+
+    def test_check_limit_uses_memory(self, tmp_path):
+        gov = CognitionGovernor(str(tmp_path), checkpoint_interval_s=0)
+        gov.log_usage("tokens", CognitionGovernor.LIMITS["tokens_daily"] - 10)
+        assert gov.check_limit("tokens", 10)
+        assert not gov.check_limit("tokens", 11)
+
+    def test_flush_checkpoints_and_reloads(self, tmp_path):
+        gov = CognitionGovernor(str(tmp_path), checkpoint_interval_s=0)
+        gov.log_usage("tokens", 250)
+        gov.log_usage("tool_calls", 2)
+        gov.flush()
+        saved = _read(gov.usage_file)
+        assert saved["tokens"] == 250
+        assert saved["tool_calls"] == 2
+        assert saved["actions"] == 2
+        assert CognitionGovernor(str(tmp_path), checkpoint_interval_s=0).usage["tokens"] == 250
+
+    def test_load_usage_keeps_unsaved_increments(self, tmp_path):
+        gov = CognitionGovernor(str(tmp_path), checkpoint_interval_s=0)
+        gov.log_usage("tokens", 100)
+        gov._load_usage()
+        assert gov.usage["tokens"] == 100
+
+    def test_day_rollover_in_memory(self, tmp_path):
+        gov = CognitionGovernor(str(tmp_path), checkpoint_interval_s=0)
+        gov.log_usage("tool_calls", CognitionGovernor.LIMITS["tool_calls_daily"])
+        gov.usage["date"] = "2000-01-01"
+        gov._window.clear()
+        gov._window_total = 0
+        assert gov.check_limit("tool_calls", 1)
+        assert gov.usage["tool_calls"] == 0
+
+    def test_background_checkpoint(self, tmp_path):
+        gov = CognitionGovernor(str(tmp_path), checkpoint_interval_s=0.05)
+        try:
+            gov.log_usage("tokens", 7)
+            deadline = time.time() + 5
+            while not os.path.exists(gov.usage_file) and time.time() < deadline:
+                time.sleep(0.01)
+            assert _read(gov.usage_file)["tokens"] == 7
+        finally:
+            gov.close()
+
+
+class TestActionsPerMinute:
+    def test_rate_limit_enforced_and_slides(self, tmp_path, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(security.time, "monotonic", lambda: now[0])
+        gov = CognitionGovernor(str(tmp_path), checkpoint_interval_s=0)
+        limit = CognitionGovernor.LIMITS["actions_per_minute"]
+        for _ in range(limit):
+            assert gov.check_limit("tool_calls", 1)
+            gov.log_usage("tool_calls", 1)
+        assert not gov.check_limit("tool_calls", 1)
+        assert gov.check_limit("tokens", 1)  # tokens are not actions
+
+        now[0] += 30
+        assert gov.actions_last_minute() == limit
+        now[0] += 30.5
+        assert gov.actions_last_minute() == 0
+        assert gov.check_limit("tool_calls", 1)
@@ -0,0 +1,152 @@
+"""
+Lancelot — Event Journal Tests
+==============================
+Tests for EventJournal: sequence stamping through the EventBus, ring
+buffer eviction, replay windows, disk spill and segment rotation.
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+from event_bus import EventBus, Event
+from event_journal import EventJournal
+
+
+def _record(journal, n, event_type="toolflow.tool_call_started"):
+    for i in range(n):
+        journal.record(Event(type=event_type, payload={"n": i}))
+
+
+class TestRecording:
+
+    def test_publish_stamps_seq(self):
+        bus = EventBus()
+        journal = EventJournal(capacity=10)
+        bus.set_journal(journal)
+        seen = []
+
+        async def subscriber(event):
+            seen.append(event.to_dict())
+
+        bus.subscribe_all(subscriber)
+
+        async def scenario():
+            await bus.publish(Event(type="a"))
+            await bus.publish(Event(type="b"))
+
+        asyncio.run(scenario())
+        assert [e["seq"] for e in seen] == [1, 2]
+        assert journal.last_seq == 2
+
+    def test_events_without_journal_have_no_seq(self):
+        assert "seq" not in Event(type="a").to_dict()
+
+    def test_publish_without_subscribers_still_journaled(self):
+        bus = EventBus()
+        journal = EventJournal(capacity=10)
+        bus.set_journal(journal)
+        asyncio.run(bus.publish(Event(type="a")))
+        events, complete = journal.since(0)
+        assert [e["type"] for e in events] == ["a"]
+        assert complete
+
+
+class TestReplayWindow:
+
+    def test_since_returns_later_events(self):
+        journal = EventJournal(capacity=10)
+        _record(journal, 5)
+        events, complete = journal.since(2)
+        assert [e["seq"] for e in events] == [3, 4, 5]
+        assert complete
+
+    def test_upto_bounds_window(self):
+        journal = EventJournal(capacity=10)
+        _record(journal, 5)
+        events, _ = journal.since(0, upto=3)
+        assert [e["seq"] for e in events] == [1, 2, 3]
+
+    def test_evicted_history_reported_incomplete(self):
+        journal = EventJournal(capacity=3)
+        _record(journal, 5)
+        events, complete = journal.since(0)
+        assert [e["seq"] for e in events] == [3, 4, 5]
+        assert not complete
+        assert journal.since(2) == (events, True)
+
+    def test_caught_up_client_gets_nothing(self):
+        journal = EventJournal(capacity=3)
+        _record(journal, 5)
+        assert journal.since(5) == ([], True)
+
+
+class TestSpill:
+
+    def test_evicted_events_readable_from_disk(self, tmp_path):
+        journal = EventJournal(capacity=2, spill_path=str(tmp_path / "events.jsonl"))
+        _record(journal, 6)
+        memory, complete = journal.since(0)
+        assert [e["seq"] for e in memory] == [5, 6]
+        assert not complete
+        spilled, complete = journal.read_spill(0, before=5)
+        assert [e["seq"] for e in spilled] == [1, 2, 3, 4]
+        assert complete
+
+    def test_segment_is_compact_json_lines(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        journal = EventJournal(capacity=1, spill_path=str(path))
+        _record(journal, 3)
+        journal.flush()
+        lines = path.read_text().splitlines()
+        assert [json.loads(line)["seq"] for line in lines] == [1, 2]
+        assert ", " not in lines[0]
+
+    def test_rotation_bounds_history(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        journal = EventJournal(capacity=1, spill_path=str(path), spill_max_bytes=300)
+        for _ in range(20):
+            _record(journal, 1)
+            journal.flush()
+        spilled, complete = journal.read_spill(0, before=20)
+        assert not complete
+        seqs = [e["seq"] for e in spilled]
+        assert seqs == list(range(seqs[0], 20))
+        assert journal.read_spill(seqs[0] - 1, before=20)[1]
+
+    def test_record_leaves_disk_writes_to_writer_thread(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        journal = EventJournal(capacity=1, spill_path=str(path))
+        writers = []
+        flush = journal.flush
+        journal.flush = lambda: (writers.append(threading.current_thread()), flush())[1]
+        _record(journal, 65)
+        deadline = time.monotonic() + 5
+        while not writers and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert writers and threading.current_thread() not in writers
+        _record(journal, 3)
+        journal.close()
+        assert [json.loads(line)["seq"] for line in path.read_text().splitlines()] == list(range(1, 68))
+
+    def test_previous_run_segments_removed(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        path.write_text('{"seq":1}\n')
+        journal = EventJournal(capacity=5, spill_path=str(path))
+        assert journal.read_spill(0, before=1) == ([], True)
+
+
+class TestFromEnv:
+
+    def test_disabled_with_zero_size(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("LANCELOT_EVENT_JOURNAL_SIZE", "0")
+        assert EventJournal.from_env(str(tmp_path)) is None
+
+    def test_spill_under_data_dir(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("LANCELOT_EVENT_JOURNAL_SIZE", "50")
+        monkeypatch.setenv("LANCELOT_EVENT_JOURNAL_SPILL", "true")
+        journal = EventJournal.from_env(str(tmp_path))
+        assert journal.capacity == 50
+        assert journal.stats()["spill"] is True
+        assert (tmp_path / "event_journal").is_dir()
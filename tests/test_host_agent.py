@@ -0,0 +1,183 @@
+"""
+Tests for the Host Agent file-operations API and HostBridgeProvider's
+pooled keep-alive client, run against a real agent bound to 127.0.0.1.
+"""
+
+import importlib.util
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.core import http_transport
+from src.tools.providers.host_bridge import HostBridgeConfig, HostBridgeProvider
+
+_AGENT_PATH = Path(__file__).resolve().parent.parent / "host_agent" / "agent.py"
+_spec = importlib.util.spec_from_file_location("host_agent_under_test", _AGENT_PATH)
+agent = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(agent)
+
+TOKEN = "test-token"
+
+
+@pytest.fixture
+def server():
+    agent.HostAgentHandler.auth_token = TOKEN
+    srv = agent.BoundedThreadingHTTPServer(("127.0.0.1", 0), agent.HostAgentHandler, max_workers=4)
+    thread = threading.Thread(target=srv.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture
+def bridge(server):
+    port = server.server_address[1]
+    provider = HostBridgeProvider(config=HostBridgeConfig(
+        agent_url=f"http://127.0.0.1:{port}",
+        agent_token=TOKEN,
+        upload_threshold_bytes=1024,
+        transfer_chunk_bytes=4096,
+    ))
+    yield provider
+    provider.close()
+
+
+class TestFileOps:
+    def test_write_then_read(self, bridge, tmp_path):
+        path = str(tmp_path / "sub" / "note.txt")
+        change = bridge.write(path, "héllo\nworld")
+        assert change.action == "created"
+        assert change.size_after == len("héllo\nworld".encode("utf-8"))
+        assert bridge.read(path) == "héllo\nworld"
+
+        again = bridge.write(path, "updated")
+        assert again.action == "modified"
+        assert again.hash_before == change.hash_after
+
+    def test_large_write_streams_through_upload(self, bridge, tmp_path):
+        path = tmp_path / "big.txt"
+        content = "x" * 50_000 + "end"
+        change = bridge.write(str(path), content)
+        assert change.action == "created" and change.size_after == len(content)
+        assert path.read_text() == content
+        assert bridge.read(str(path)) == content
+
+    def test_upload_and_download_files(self, bridge, tmp_path):
+        src = tmp_path / "src.bin"
+        src.write_bytes(os.urandom(100_000))
+        remote = tmp_path / "remote" / "copy.bin"
+        change = bridge.upload(str(src), str(remote))
+        assert change.size_after == 100_000
+        local = tmp_path / "back.bin"
+        assert bridge.download(str(remote), str(local)) == 100_000
+        assert local.read_bytes() == src.read_bytes()
+
+    def test_list_stat_delete(self, bridge, tmp_path):
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "d").mkdir()
+        (tmp_path / "d" / "b.txt").write_text("bb")
+        assert bridge.list(str(tmp_path)) == ["a.txt", "d"]
+        assert bridge.list(str(tmp_path), recursive=True) == ["a.txt", os.path.join("d", "b.txt")]
+
+        info = bridge.stat(str(tmp_path / "d" / "b.txt"))
+        assert info["exists"] and not info["is_dir"] and info["size"] == 2
+        assert bridge.stat(str(tmp_path / "missing"))["exists"] is False
+
+        change = bridge.delete(str(tmp_path / "a.txt"))
+        assert change.action == "deleted" and change.size_before == 1
+        assert not (tmp_path / "a.txt").exists()
+
+    def test_errors(self, bridge, tmp_path):
+        assert bridge.read(str(tmp_path / "missing.txt")).startswith("Error: Host agent returned 404")
+        assert bridge.delete(str(tmp_path / "missing.txt")).action == "error"
+        assert bridge.list(str(tmp_path / "nope"))[0].startswith("Error:")
+
+    def test_batch(self, bridge, tmp_path):
+        path = str(tmp_path / "batch.txt")
+        results = bridge.batch([
+            {"op": "write", "path": path, "content": "one"},
+            {"op": "read", "path": path},
+            {"op": "stat", "path": path},
+            {"op": "read", "path": str(tmp_path / "missing")},
+            {"op": "chmod", "path": path},
+        ])
+        assert [r["ok"] for r in results] == [True, True, True, False, False]
+        assert results[1]["content"] == "one" and results[1]["eof"]
+        assert results[2]["size"] == 3
+        assert results[3]["status"] == 404
+
+    def test_directories_are_not_deleted(self, bridge, tmp_path):
+        (tmp_path / "d").mkdir()
+        (tmp_path / "d" / "keep.txt").write_text("x")
+        assert bridge.delete(str(tmp_path / "d")).action == "error"
+        results = bridge.batch([{"op": "delete", "path": str(tmp_path / "d"), "recursive": True}])
+        assert results[0]["status"] == 400
+        assert (tmp_path / "d" / "keep.txt").exists()
+
+    def test_invalid_fields_are_rejected(self, bridge, tmp_path):
+        path = str(tmp_path / "f.txt")
+        bridge.write(path, "hello")
+        results = bridge.batch([
+            {"op": "read", "path": path, "offset": "abc"},
+            {"op": "read", "path": path, "length": -1},
+            {"op": "read", "path": path, "encoding": "no-such-codec"},
+            {"op": "write", "path": path, "content": "x", "encoding": 5},
+        ])
+        assert [r["status"] for r in results] == [400, 400, 400, 400]
+        with pytest.raises(ConnectionError, match="400"):
+            bridge._request("POST", "/files/read", body={"path": path, "offset": "abc"})
+        assert bridge.read(path) == "hello"
+
+
+class TestTransport:
+    def test_requests_share_one_connection(self, bridge, tmp_path):
+        bridge.write(str(tmp_path / "f.txt"), "x")
+        bridge.read(str(tmp_path / "f.txt"))
+        bridge.list(str(tmp_path))
+        stats = http_transport.stats(bridge.config.agent_url)
+        assert stats["connections_opened"] == 1
+        assert stats["reused"] == 2
+
+    def test_reconnects_after_idle_close(self, bridge, tmp_path, monkeypatch):
+        monkeypatch.setattr(agent.HostAgentHandler, "timeout", 0.2)
+        bridge.write(str(tmp_path / "f.txt"), "x")
+        time.sleep(0.5)  # agent drops the idle connection
+        assert bridge.read(str(tmp_path / "f.txt")) == "x"
+
+    def test_unauthorized(self, server, tmp_path):
+        port = server.server_address[1]
+        bad = HostBridgeProvider(config=HostBridgeConfig(
+            agent_url=f"http://127.0.0.1:{port}", agent_token="wrong",
+        ))
+        assert "401" in bad.read(str(tmp_path / "f.txt"))
+        assert "401" in bad.list(str(tmp_path))[0]
+
+    def test_write_and_delete_report_connection_errors(self, tmp_path):
+        closed = HostBridgeProvider(config=HostBridgeConfig(
+            agent_url="http://127.0.0.1:1", agent_token=TOKEN,
+        ))
+        for change in (closed.write(str(tmp_path / "f.txt"), "x"),
+                       closed.delete(str(tmp_path / "f.txt"))):
+            assert change.action == "error"
+            assert change.error_message
+
+    def test_long_command_does_not_block_other_calls(self, bridge, server, tmp_path):
+        port = server.server_address[1]
+        slow = HostBridgeProvider(config=HostBridgeConfig(
+            agent_url=f"http://127.0.0.1:{port}", agent_token=TOKEN,
+        ))
+        thread = threading.Thread(target=slow.run, args=("sleep 1", str(tmp_path)))
+        thread.start()
+        time.sleep(0.1)
+        start = time.monotonic()
+        assert bridge.stat(str(tmp_path))["is_dir"]
+        assert time.monotonic() - start < 0.5
+        thread.join()
+
+    def test_execute_still_works(self, bridge, tmp_path):
+        result = bridge.run("echo hi", str(tmp_path))
+        assert result.exit_code == 0 and result.stdout == "hi\n"
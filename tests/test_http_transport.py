@@ -0,0 +1,209 @@
+"""
+Tests for the shared keep-alive HTTP transport, against a local HTTP/1.1 server.
+"""
+
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import src.core.http_transport as http_transport
+from src.core.http_transport import HTTPTransport
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = set()
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, body=b"", headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        type(self).connections.add(self.client_address)
+        if self.path == "/missing":
+            self._reply(404, b"not here")
+        elif self.path == "/moved":
+            self._reply(302, headers={"Location": "/ok"})
+        elif self.path == "/slow":
+            time.sleep(0.3)
+            self._reply(200, b"slow")
+        elif self.path == "/reset":
+            self.close_connection = True
+            self.connection.shutdown(2)
+        elif self.path == "/stream":
+            self.send_response(200)
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for line in (b"data: a\n", b"data: b\n"):
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            self._reply(200, b"ok")
+
+    def do_POST(self):
+        type(self).connections.add(self.client_address)
+        if self.path == "/reset":
+            self.close_connection = True
+            self.connection.shutdown(2)
+            return
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self._reply(200, json.dumps({"echo": json.loads(body)}).encode())
+
+
+@pytest.fixture
+def server():
+    _Handler.connections = set()
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=srv.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{srv.server_address[1]}"
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture
+def transport():
+    t = HTTPTransport(backoff_s=0.001)
+    yield t
+    t.close()
+
+
+class TestKeepAlive:
+    def test_sequential_requests_share_one_connection(self, server, transport):
+        for _ in range(3):
+            with transport.urlopen(f"{server}/ok", timeout=5) as resp:
+                assert resp.read() == b"ok"
+        req = urllib.request.Request(
+            f"{server}/echo", data=json.dumps({"x": 1}).encode(),
+            headers={"Content-Type": "application/json"},
+        )
+        with transport.urlopen(req, timeout=5) as resp:
+            assert json.loads(resp.read()) == {"echo": {"x": 1}}
+        stats = transport.stats(server)
+        assert stats["connections_opened"] == 1
+        assert stats["reused"] == 3
+        assert len(_Handler.connections) == 1
+
+    def test_http_error_keeps_urllib_semantics(self, server, transport):
+        with pytest.raises(urllib.error.HTTPError) as info:
+            transport.urlopen(f"{server}/missing", timeout=5)
+        assert info.value.code == 404
+        assert info.value.read() == b"not here"
+        transport.urlopen(f"{server}/ok", timeout=5).read()
+        assert transport.stats(server)["connections_opened"] == 1
+
+    def test_follows_redirects(self, server, transport):
+        with transport.urlopen(f"{server}/moved", timeout=5) as resp:
+            assert resp.read() == b"ok"
+            assert resp.url.endswith("/ok")
+        assert transport.stats(server)["connections_opened"] == 1
+
+    def test_chunked_stream_returns_connection(self, server, transport):
+        with transport.urlopen(f"{server}/stream", timeout=5) as resp:
+            assert [line for line in resp] == [b"data: a\n", b"data: b\n"]
+        transport.urlopen(f"{server}/ok", timeout=5).read()
+        assert transport.stats(server)["reused"] == 1
+
+    def test_early_close_discards_connection(self, server, transport):
+        resp = transport.urlopen(f"{server}/ok", timeout=5)
+        resp.close()
+        transport.urlopen(f"{server}/ok", timeout=5).read()
+        stats = transport.stats(server)
+        assert stats["connections_opened"] == 2
+        assert stats["in_use"] == 0
+
+
+class TestRetry:
+    def test_stale_connection_is_replaced(self, server, transport):
+        transport.urlopen(f"{server}/ok", timeout=5).read()
+        pool = transport._pools[http_transport.target_key(server)]
+        pool.idle[0][0].sock.shutdown(2)  # as if the server timed it out
+        time.sleep(0.05)
+        assert transport.urlopen(f"{server}/ok", timeout=5).read() == b"ok"
+        assert transport.stats(server)["stale_dropped"] == 1
+
+    def test_reset_on_reused_connection_is_retried(self, server, transport, monkeypatch):
+        transport.urlopen(f"{server}/ok", timeout=5).read()
+        monkeypatch.setattr(http_transport, "_is_dropped", lambda conn: False)
+        pool = transport._pools[http_transport.target_key(server)]
+        pool.idle[0][0].sock.shutdown(2)
+        req = urllib.request.Request(f"{server}/echo", data=b'{"y": 2}')
+        assert json.loads(transport.urlopen(req, timeout=5).read()) == {"echo": {"y": 2}}
+        assert transport.stats(server)["retries"] == 1
+
+    def test_post_reset_awaiting_response_not_retried(self, server, transport):
+        transport.urlopen(f"{server}/ok", timeout=5).read()
+        with pytest.raises(urllib.error.URLError):
+            transport.urlopen(urllib.request.Request(f"{server}/reset", data=b"{}"), timeout=5)
+        stats = transport.stats(server)
+        assert stats["reused"] == 0 and stats["retries"] == 0
+
+    def test_idempotent_reset_retried_with_backoff(self, server, transport):
+        with pytest.raises(urllib.error.URLError):
+            transport.urlopen(f"{server}/reset", timeout=5)
+        stats = transport.stats(server)
+        assert stats["retries"] == 2
+        assert stats["errors"] == 1
+        assert stats["in_use"] == 0
+
+    def test_post_reset_on_new_connection_not_retried(self, server, transport):
+        with pytest.raises(urllib.error.URLError):
+            transport.urlopen(urllib.request.Request(f"{server}/reset", data=b"{}"), timeout=5)
+        assert transport.stats(server)["retries"] == 0
+
+
+class TestRequestQueue:
+    def test_max_connections_queues_requests(self, server, transport):
+        transport.configure(server, max_connections=1)
+        results = []
+
+        def fetch():
+            results.append(transport.urlopen(f"{server}/slow", timeout=5).read())
+
+        threads = [threading.Thread(target=fetch) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert results == [b"slow"] * 3
+        stats = transport.stats(server)
+        assert stats["connections_opened"] == 1
+        assert stats["queued"] == 2
+        assert stats["queue_wait_ms_avg"] > 0
+
+    def test_queue_timeout(self, server, transport):
+        transport.configure(server, max_connections=1, queue_timeout_s=0.05)
+        held = transport.urlopen(f"{server}/ok", timeout=5)
+        with pytest.raises(urllib.error.URLError, match="timed out waiting"):
+            transport.urlopen(f"{server}/ok", timeout=5)
+        held.read()
+        assert transport.urlopen(f"{server}/ok", timeout=5).read() == b"ok"
+        assert transport.stats(server)["queue_timeouts"] == 1
+
+
+class TestMetrics:
+    def test_latency_histogram(self, server, transport):
+        transport.urlopen(f"{server}/ok", timeout=5).read()
+        transport.urlopen(f"{server}/slow", timeout=5).read()
+        latency = transport.stats(server)["latency"]
+        assert latency["count"] == 2
+        assert sum(latency["buckets"].values()) == 2
+        assert latency["buckets"]["le_500"] == 1
+        assert latency["p95_ms"] == 500.0
+
+    def test_stats_per_target(self, server, transport):
+        transport.urlopen(f"{server}/ok", timeout=5).read()
+        assert list(transport.stats()) == [http_transport.target_key(server)]
+        assert transport.stats("http://elsewhere:1") == {}
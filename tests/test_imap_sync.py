@@ -0,0 +1,398 @@
+"""
+Tests for incremental IMAP sync — MailIndex, MailboxSync and the
+ProtocolAdapter IMAP operations built on them.
+
+Runs real imaplib against a small in-process fake IMAP server, so the
+UID commands, literals and response parsing are exercised end to end.
+"""
+
+import socketserver
+import threading
+
+import pytest
+
+from src.connectors.imap_sync import MailboxSync, MailIndex, parse_response
+from src.connectors.models import ConnectorResult, HTTPMethod
+from src.connectors.protocol_adapter import IMAPConfig, ProtocolAdapter
+
+
+# ── Fake IMAP server ─────────────────────────────────────────────
+
+def _q(value):
+    if value is None:
+        return "NIL"
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+class FakeMailbox:
+    def __init__(self, uidvalidity=1):
+        self.uidvalidity = uidvalidity
+        self.uidnext = 1
+        self.modseq = 1  # HIGHESTMODSEQ; tests bump it when they change flags
+        self.messages = []  # [uid, flags, subject, sender, attachment]
+
+    def append(self, subject, sender, flags=(), attachment=False):
+        self.messages.append([self.uidnext, set(flags), subject, sender, attachment])
+        self.uidnext += 1
+        return self.uidnext - 1
+
+    def in_set(self, uid_set):
+        highest = max((m[0] for m in self.messages), default=0)
+        uids = set()
+        for part in uid_set.split(","):
+            lo, _, hi = part.partition(":")
+            lo = highest if lo == "*" else int(lo)
+            hi = lo if not hi else (highest if hi == "*" else int(hi))
+            lo, hi = min(lo, hi), max(lo, hi)
+            uids.update(range(lo, hi + 1))
+        return [(seq, m) for seq, m in enumerate(self.messages, 1) if m[0] in uids]
+
+
+def _raw(message):
+    uid, _, subject, sender, _ = message
+    return (f"From: {sender}\r\nTo: me@example.com\r\nSubject: {subject}\r\n"
+            f"Message-ID: <{uid}@example.com>\r\n\r\nBody of message {uid}\r\n").encode()
+
+
+class FakeIMAPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeIMAPHandler)
+        self.mailboxes = {"INBOX": FakeMailbox(), "Archive": FakeMailbox()}
+        self.commands = []
+        self.condstore = False
+        self.lock = threading.Lock()
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def uid_commands(self, name):
+        return [c for c in self.commands if c.startswith(f"UID {name}")]
+
+
+class FakeIMAPHandler(socketserver.StreamRequestHandler):
+    disable_nagle_algorithm = True
+
+    def send(self, line):
+        self.wfile.write(line if isinstance(line, bytes) else line.encode() + b"\r\n")
+
+    def handle(self):
+        server = self.server
+        selected = None
+        self.send("* OK fake IMAP4rev1 ready")
+        for raw in self.rfile:
+            tag, _, rest = raw.decode().rstrip("\r\n").partition(" ")
+            cmd, _, args = rest.partition(" ")
+            cmd = cmd.upper()
+            with server.lock:
+                server.commands.append(f"{cmd} {args}".strip())
+                if cmd == "CAPABILITY":
+                    self.send("* CAPABILITY IMAP4rev1" + (" CONDSTORE" if server.condstore else ""))
+                elif cmd == "LOGOUT":
+                    self.send("* BYE")
+                    self.send(f"{tag} OK LOGOUT completed")
+                    return
+                elif cmd == "SELECT":
+                    selected = server.mailboxes[args.strip('"')]
+                    self.send(f"* {len(selected.messages)} EXISTS")
+                    self.send(f"* OK [UIDVALIDITY {selected.uidvalidity}] ok")
+                    self.send(f"* OK [UIDNEXT {selected.uidnext}] ok")
+                    if server.condstore:
+                        self.send(f"* OK [HIGHESTMODSEQ {selected.modseq}] ok")
+                    self.send(f"{tag} OK [READ-WRITE] SELECT completed")
+                    continue
+                elif cmd == "STATUS":
+                    name = args.split(" ", 1)[0]
+                    box = server.mailboxes[name.strip('"')]
+                    unseen = sum(1 for m in box.messages if "\\Seen" not in m[1])
+                    modseq = f" HIGHESTMODSEQ {box.modseq}" if "HIGHESTMODSEQ" in args else ""
+                    self.send(f"* STATUS {name} (MESSAGES {len(box.messages)} UIDNEXT {box.uidnext} "
+                              f"UIDVALIDITY {box.uidvalidity} UNSEEN {unseen}{modseq})")
+                elif cmd == "UID":
+                    self.uid(selected, args)
+                elif cmd == "EXPUNGE":
+                    for seq in range(len(selected.messages), 0, -1):
+                        if "\\Deleted" in selected.messages[seq - 1][1]:
+                            del selected.messages[seq - 1]
+                            self.send(f"* {seq} EXPUNGE")
+            self.send(f"{tag} OK {cmd} completed")
+
+    def uid(self, box, args):
+        sub, _, args = args.partition(" ")
+        sub = sub.upper()
+        if sub == "SEARCH":
+            if args.upper().startswith("UID "):
+                uids = [m[0] for _, m in box.in_set(args[4:])]
+            else:
+                uids = [m[0] for m in box.messages
+                        if args.upper() == "ALL" or "\\Seen" not in m[1]]
+            self.send("* SEARCH " + " ".join(map(str, uids)))
+        elif sub == "FETCH":
+            uid_set, _, items = args.partition(" ")
+            for seq, m in box.in_set(uid_set):
+                if "RFC822)" in items and "SIZE" not in items:
+                    m[1].add("\\Seen")
+                    body = _raw(m)
+                    self.send(f"* {seq} FETCH (UID {m[0]} RFC822 {{{len(body)}}}".encode() + b"\r\n" + body)
+                    self.send(")")
+                else:
+                    self.send_headers(seq, m)
+        elif sub == "STORE":
+            uid_set, _, rest = args.partition(" ")
+            flags = rest.split(" ", 1)[1].strip("()").split()
+            for _, m in box.in_set(uid_set):
+                m[1].update(flags)
+        elif sub == "COPY":
+            uid_set, _, dest = args.partition(" ")
+            target = self.server.mailboxes[dest.strip('"')]
+            for _, m in box.in_set(uid_set):
+                target.append(m[2], m[3], attachment=m[4])
+
+    def send_headers(self, seq, m):
+        uid, flags, subject, sender, attachment = m
+        name, _, address = sender.rpartition(" ")
+        local, _, host = address.strip("<>").partition("@")
+        addr = f"(({_q(name or None)} NIL {_q(local)} {_q(host)}))"
+        to = '((NIL NIL "me" "example.com"))'
+        date = "Mon, 05 Oct 2026 09:30:00 +0000"
+        if attachment:
+            structure = ('(("TEXT" "PLAIN" ("CHARSET" "utf-8") NIL NIL "7BIT" 5 1 NIL NIL NIL NIL)'
+                         '("APPLICATION" "PDF" ("NAME" "a.pdf") NIL NIL "BASE64" 100 NIL '
+                         '("ATTACHMENT" ("FILENAME" "a.pdf")) NIL NIL) "MIXED" ("BOUNDARY" "b") NIL NIL NIL)')
+        else:
+            structure = '("TEXT" "PLAIN" ("CHARSET" "utf-8") NIL NIL "7BIT" 20 1 NIL NIL NIL NIL)'
+        head = (f"* {seq} FETCH (UID {uid} FLAGS ({' '.join(sorted(flags))}) "
+                f"RFC822.SIZE {len(_raw(m))} ENVELOPE ({_q(date)} ")
+        tail = (f" {addr} {addr} {addr} {to} NIL NIL NIL {_q(f'<{uid}@example.com>')}) "
+                f"BODYSTRUCTURE {structure})")
+        if '"' in subject:
+            # Exercise literals: subjects with quotes go out as {n}
+            data = subject.encode()
+            self.send(head.encode() + b"{%d}\r\n" % len(data) + data + tail.encode() + b"\r\n")
+        else:
+            self.send(head + _q(subject) + tail)
+
+
+@pytest.fixture
+def server():
+    srv = FakeIMAPServer()
+    thread = threading.Thread(target=srv.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture
+def adapter(server):
+    adp = ProtocolAdapter(
+        imap_config=IMAPConfig(host="127.0.0.1", port=server.port, use_ssl=False),
+        credentials={"username": "me", "password": "secret"},
+        mail_index=MailIndex(),
+    )
+    yield adp
+    adp.close()
+
+
+def _imap(adapter, action, **extra):
+    body = {"protocol": "imap", "action": action}
+    body.update(extra)
+    resp = adapter.execute(ConnectorResult(
+        operation_id=action, connector_id="email", method=HTTPMethod.POST,
+        url="protocol://imap", body=body,
+    ))
+    assert resp.success, resp.error
+    return resp.body
+
+
+def _fill(server, n, folder="INBOX", **kwargs):
+    return [server.mailboxes[folder].append(f"Message {i}", "Alice <alice@example.com>", **kwargs)
+            for i in range(n)]
+
+
+# ── Parsing ──────────────────────────────────────────────────────
+
+class TestParseResponse:
+    def test_nested_lists_nil_and_escapes(self):
+        parsed = parse_response([b'1 (FLAGS (\\Seen) X NIL S "a \\"q\\"")'])
+        assert parsed == ["1", ["FLAGS", ["\\Seen"], "X", None, "S", 'a "q"']]
+
+    def test_literals_become_bytes(self):
+        parsed = parse_response([(b"1 (RFC822 {5}", b"hello"), b")"])
+        assert parsed == ["1", ["RFC822", b"hello"]]
+
+
+# ── Sync ─────────────────────────────────────────────────────────
+
+class TestSync:
+    def test_list_answered_from_index(self, server, adapter):
+        _fill(server, 3)
+        body = _imap(adapter, "list", max_results=2)
+        assert body["message_ids"] == ["2", "3"]
+        assert body["total"] == 3
+        first = body["messages"][0]
+        assert first["subject"] == "Message 1"
+        assert first["sender"] == "Alice <alice@example.com>"
+        assert first["date"].startswith("2026-10-05T09:30:00")
+        assert server.uid_commands("FETCH") == ["UID FETCH 1:3 (UID FLAGS ENVELOPE BODYSTRUCTURE RFC822.SIZE)"]
+
+    def test_unchanged_selected_mailbox_costs_one_select(self, server, adapter):
+        _fill(server, 3)
+        _imap(adapter, "list")
+        server.commands.clear()
+        _imap(adapter, "list")
+        # STATUS must not be used on the selected mailbox (RFC 3501 6.3.10)
+        assert [c.split()[0] for c in server.commands] == ["SELECT"]
+
+    def test_unselected_mailbox_uses_status(self, server, adapter):
+        _fill(server, 2)
+        _fill(server, 1, folder="Archive")
+        _imap(adapter, "list")
+        _imap(adapter, "list", folder="Archive")
+        _fill(server, 1)
+        server.commands.clear()
+        body = _imap(adapter, "list")
+        assert server.commands[0].startswith("STATUS INBOX")
+        assert body["message_ids"] == ["1", "2", "3"]
+
+    def test_only_new_uids_fetched(self, server, adapter):
+        _fill(server, 3)
+        _imap(adapter, "list")
+        _fill(server, 1)
+        server.commands.clear()
+        body = _imap(adapter, "list")
+        assert server.uid_commands("FETCH") == ["UID FETCH 4:4 (UID FLAGS ENVELOPE BODYSTRUCTURE RFC822.SIZE)"]
+        assert body["message_ids"][-1] == "4"
+
+    def test_fetch_batched_over_uid_ranges(self, server, adapter):
+        _fill(server, 5)
+        adapter._mailbox_sync = MailboxSync(adapter._mail_index, batch_size=2)
+        _imap(adapter, "list")
+        assert server.uid_commands("SEARCH") == ["UID SEARCH UID 1:*"]
+        assert [c.split()[2] for c in server.uid_commands("FETCH")] == ["1:2", "3:4", "5"]
+
+    def test_sparse_mailbox_fetches_only_existing_uids(self, server, adapter):
+        box = server.mailboxes["INBOX"]
+        _fill(server, 2)
+        box.uidnext = 1_000_000
+        _fill(server, 2)
+        body = _imap(adapter, "list")
+        assert body["total"] == 4
+        assert [c.split()[2] for c in server.uid_commands("FETCH")] == ["1:2,1000000:1000001"]
+
+    def test_uidvalidity_change_resyncs(self, server, adapter):
+        _fill(server, 2)
+        _imap(adapter, "list")
+        server.mailboxes["INBOX"] = box = FakeMailbox(uidvalidity=2)
+        box.uidnext = 10
+        box.append("Fresh", "Bob <bob@example.com>")
+        body = _imap(adapter, "list")
+        assert body["message_ids"] == ["10"]
+        assert body["messages"][0]["subject"] == "Fresh"
+
+    def test_expunged_elsewhere_removed(self, server, adapter):
+        _fill(server, 3)
+        _imap(adapter, "list")
+        del server.mailboxes["INBOX"].messages[1]
+        body = _imap(adapter, "list")
+        assert body["message_ids"] == ["1", "3"]
+        assert server.uid_commands("SEARCH") == ["UID SEARCH ALL"]
+
+    def test_seen_changed_elsewhere_reconciled(self, server, adapter):
+        _fill(server, 2)
+        _fill(server, 1, folder="Archive")
+        assert not any(m["seen"] for m in _imap(adapter, "list")["messages"])
+        _imap(adapter, "list", folder="Archive")  # INBOX no longer selected
+        server.mailboxes["INBOX"].messages[0][1].add("\\Seen")
+        seen = [m["seen"] for m in _imap(adapter, "list")["messages"]]
+        assert seen == [True, False]
+
+    def test_swapped_seen_flags_reconciled_after_interval(self, server, adapter):
+        # One read and one unread elsewhere: the unseen count doesn't move
+        adapter._mailbox_sync = MailboxSync(adapter._mail_index, flag_check_interval=0)
+        server.mailboxes["INBOX"].append("Read", "Alice <alice@example.com>", flags={"\\Seen"})
+        _fill(server, 1)
+        assert [m["seen"] for m in _imap(adapter, "list")["messages"]] == [True, False]
+        box = server.mailboxes["INBOX"]
+        box.messages[0][1].discard("\\Seen")
+        box.messages[1][1].add("\\Seen")
+        assert [m["seen"] for m in _imap(adapter, "list")["messages"]] == [False, True]
+
+    def test_condstore_modseq_drives_flag_reconciliation(self, server, adapter):
+        server.condstore = True
+        server.mailboxes["INBOX"].append("Read", "Alice <alice@example.com>", flags={"\\Seen"})
+        _fill(server, 1)
+        _imap(adapter, "list")
+        server.commands.clear()
+        _imap(adapter, "list")
+        assert server.uid_commands("SEARCH") == []  # HIGHESTMODSEQ unchanged
+        box = server.mailboxes["INBOX"]
+        box.messages[0][1].discard("\\Seen")
+        box.messages[1][1].add("\\Seen")
+        box.modseq += 1
+        assert [m["seen"] for m in _imap(adapter, "list")["messages"]] == [False, True]
+        assert server.uid_commands("SEARCH") == ["UID SEARCH UNSEEN"]
+
+    def test_literal_subject_and_attachment(self, server, adapter):
+        server.mailboxes["INBOX"].append('Re: "quoted" report', "Carol <carol@example.com>", attachment=True)
+        message = _imap(adapter, "list")["messages"][0]
+        assert message["subject"] == 'Re: "quoted" report'
+        assert message["has_attachments"] is True
+        assert message["content_type"] == "multipart/mixed"
+
+    def test_index_persists_across_adapters(self, server, tmp_path, monkeypatch):
+        monkeypatch.setenv("LANCELOT_DATA_DIR", str(tmp_path))
+        _fill(server, 2)
+        config = IMAPConfig(host="127.0.0.1", port=server.port, use_ssl=False)
+        creds = {"username": "me", "password": "secret"}
+        first = ProtocolAdapter(imap_config=config, credentials=creds)
+        _imap(first, "list")
+        first.close()
+        server.commands.clear()
+        second = ProtocolAdapter(imap_config=config, credentials=creds)
+        assert _imap(second, "list")["total"] == 2
+        second.close()
+        assert server.uid_commands("FETCH") == []
+        assert (tmp_path / "connectors" / "mail_index.db").exists()
+
+
+# ── Operations ───────────────────────────────────────────────────
+
+class TestOperations:
+    def test_search_is_local(self, server, adapter):
+        server.mailboxes["INBOX"].append("Invoice #42", "Billing <billing@example.com>")
+        server.mailboxes["INBOX"].append("Lunch?", "Dana <dana@example.com>")
+        body = _imap(adapter, "search", query="invoice")
+        assert body["message_ids"] == ["1"]
+        assert _imap(adapter, "search", query="dana")["message_ids"] == ["2"]
+        assert server.uid_commands("SEARCH") == []
+
+    def test_body_fetched_lazily_and_cached(self, server, adapter):
+        _fill(server, 2)
+        _imap(adapter, "list")
+        assert not any("RFC822)" in c for c in server.uid_commands("FETCH"))
+        body = _imap(adapter, "fetch", message_id="2")
+        assert "Subject: Message 1" in body["raw"]
+        server.commands.clear()
+        assert _imap(adapter, "fetch", message_id="2")["raw"] == body["raw"]
+        assert server.commands == []
+
+    def test_delete_removes_from_server_and_index(self, server, adapter):
+        _fill(server, 3)
+        _imap(adapter, "list")
+        _imap(adapter, "delete", message_id="2")
+        assert [m[0] for m in server.mailboxes["INBOX"].messages] == [1, 3]
+        server.commands.clear()
+        assert _imap(adapter, "list")["message_ids"] == ["1", "3"]
+        assert server.uid_commands("SEARCH") == []
+
+    def test_move_lands_in_destination(self, server, adapter):
+        _fill(server, 2)
+        _imap(adapter, "list")
+        _imap(adapter, "move", message_id="1", destination="Archive")
+        assert _imap(adapter, "list")["message_ids"] == ["2"]
+        archived = _imap(adapter, "list", folder="Archive")
+        assert [m["subject"] for m in archived["messages"]] == ["Message 0"]
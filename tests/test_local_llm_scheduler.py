@@ -0,0 +1,221 @@
+"""
+Tests for the local-llm inference scheduler and the server's streaming,
+priority and metrics behaviour, using a fake llama.cpp backend.
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+import local_models.server as srv
+from local_models.scheduler import END, InferenceScheduler, JobCancelled, PENDING, QueueFull
+
+
+def _wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert predicate()
+
+
+def _drain(job, timeout=5.0):
+    items = []
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        item = job.next_chunk(0.05)
+        if item is END:
+            return items
+        if item is not PENDING:
+            items.append(item)
+    raise AssertionError("stream did not finish")
+
+
+class TestScheduler:
+    def test_priority_order_with_fifo_ties(self):
+        sched = InferenceScheduler()
+        gate = threading.Event()
+        order = []
+        blocker = sched.submit(lambda job: gate.wait(5))
+        _wait_until(lambda: sched.metrics()["running"] == 1)
+        jobs = [
+            sched.submit(lambda job, n=name: order.append(n), priority=prio)
+            for name, prio in [("sum1", "low"), ("redact", "normal"), ("classify", "high"),
+                               ("sum2", "low"), ("verify", "high")]
+        ]
+        assert sched.metrics()["queued_by_priority"] == {"high": 2, "normal": 1, "low": 2}
+        gate.set()
+        for job in [blocker, *jobs]:
+            job.future.result(timeout=5)
+        assert order == ["classify", "verify", "redact", "sum1", "sum2"]
+
+    def test_queue_full_rejects(self):
+        sched = InferenceScheduler(max_queue=1)
+        gate = threading.Event()
+        sched.submit(lambda job: gate.wait(5))
+        _wait_until(lambda: sched.metrics()["running"] == 1)
+        sched.submit(lambda job: None)
+        with pytest.raises(QueueFull):
+            sched.submit(lambda job: None)
+        assert sched.metrics()["rejected"] == 1
+        gate.set()
+
+    def test_cancel_queued_job(self):
+        sched = InferenceScheduler()
+        gate = threading.Event()
+        ran = []
+        sched.submit(lambda job: gate.wait(5))
+        _wait_until(lambda: sched.metrics()["running"] == 1)
+        job = sched.submit(lambda job: ran.append(1))
+        job.cancel()
+        gate.set()
+        with pytest.raises(JobCancelled):
+            job.future.result(timeout=5)
+        assert ran == []
+        assert sched.metrics()["cancelled"] == 1
+
+    def test_failure_propagates(self):
+        sched = InferenceScheduler()
+
+        def boom(job):
+            raise RuntimeError("GPU crash")
+
+        with pytest.raises(RuntimeError, match="GPU crash"):
+            sched.run(boom, timeout=5)
+        assert sched.metrics()["failed"] == 1
+
+    def test_streaming_and_tokens_per_second(self):
+        sched = InferenceScheduler()
+
+        def tokens(job):
+            for word in ["a", "b", "c"]:
+                time.sleep(0.01)
+                yield word
+
+        job = sched.submit(tokens, stream=True)
+        assert _drain(job) == ["a", "b", "c"]
+        _wait_until(lambda: sched.metrics()["completed"] == 1)
+        assert sched.metrics()["tokens_per_s"] > 0
+
+    def test_cancel_stops_streaming_decode(self):
+        sched = InferenceScheduler()
+        produced = []
+        closed = threading.Event()
+
+        def endless(job):
+            try:
+                while True:
+                    produced.append(1)
+                    time.sleep(0.01)
+                    yield "tok"
+            finally:
+                closed.set()
+
+        job = sched.submit(endless, stream=True)
+        _wait_until(lambda: len(produced) >= 3)
+        job.cancel()
+        assert closed.wait(5)
+        _wait_until(lambda: sched.metrics()["cancelled"] == 1)
+        count = len(produced)
+        time.sleep(0.05)
+        assert len(produced) == count
+
+
+class FakeLlama:
+    """Stands in for llama_cpp.Llama: streams one chunk per token."""
+
+    def __init__(self, text_tokens, chat_tokens=None):
+        self.text_tokens = text_tokens
+        self.chat_tokens = chat_tokens or []
+
+    def __call__(self, prompt, stream=False, **kwargs):
+        if not stream:
+            text = "".join(self.text_tokens)
+            return {"choices": [{"text": text}], "usage": {"completion_tokens": len(self.text_tokens)}}
+        return ({"choices": [{"text": t}]} for t in self.text_tokens)
+
+    def create_chat_completion(self, stream=False, **kwargs):
+        assert stream
+        yield {"choices": [{"delta": {"role": "assistant"}, "finish_reason": None}]}
+        for t in self.chat_tokens:
+            yield {"choices": [{"delta": {"content": t}, "finish_reason": None}]}
+        yield {"choices": [{"delta": {}, "finish_reason": "stop"}]}
+
+
+def _events(resp):
+    events = []
+    for line in resp.text.splitlines():
+        if line.startswith("data: "):
+            data = line[6:]
+            events.append(data if data == "[DONE]" else json.loads(data))
+    return events
+
+
+class TestServerStreaming:
+    @pytest.fixture(autouse=True)
+    def _server(self, monkeypatch):
+        from fastapi.testclient import TestClient
+        monkeypatch.setattr(srv, "_scheduler", InferenceScheduler())
+        monkeypatch.setattr(srv, "_model_name", "fake")
+        monkeypatch.setattr(srv, "_loaded_at", time.time())
+        self.client = TestClient(srv.app)
+
+    def test_completion_stream(self, monkeypatch):
+        monkeypatch.setattr(srv, "_llm", FakeLlama(["Hel", "lo"]))
+        resp = self.client.post("/v1/completions", json={"prompt": "x", "stream": True, "priority": "high"})
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        events = _events(resp)
+        assert [e["text"] for e in events[:-1]] == ["Hel", "lo", ""]
+        assert events[-2]["finish_reason"] == "stop"
+        assert events[-1] == "[DONE]"
+
+    def test_chat_stream_filters_think_and_tool_calls(self, monkeypatch):
+        tokens = ["<th", "ink>plan</think>\n", "Sure", ". <tool", "_call>{\"name\": \"search\", ",
+                  "\"arguments\": {\"q\": \"x\"}}</tool_call>"]
+        monkeypatch.setattr(srv, "_llm", FakeLlama([], chat_tokens=tokens))
+        resp = self.client.post("/v1/chat/completions", json={
+            "messages": [{"role": "user", "content": "hi"}], "stream": True,
+        })
+        chunks = [e for e in _events(resp) if e != "[DONE]"]
+        deltas = [c["choices"][0]["delta"] for c in chunks]
+        content = "".join(d.get("content", "") for d in deltas)
+        assert content == "Sure. "
+        calls = [tc for d in deltas for tc in d.get("tool_calls", [])]
+        assert len(calls) == 1
+        assert calls[0]["index"] == 0
+        assert calls[0]["function"]["name"] == "search"
+        assert json.loads(calls[0]["function"]["arguments"]) == {"q": "x"}
+        assert chunks[-1]["choices"][0]["finish_reason"] == "tool_calls"
+
+    def test_stream_assembles_with_client_helper(self, monkeypatch):
+        from providers.streaming import iter_openai_stream
+
+        monkeypatch.setattr(srv, "_llm", FakeLlama([], chat_tokens=["Hello", " world"]))
+        resp = self.client.post("/v1/chat/completions", json={
+            "messages": [{"role": "user", "content": "hi"}], "stream": True,
+        })
+        chunks = [e for e in _events(resp) if e != "[DONE]"]
+        final = list(iter_openai_stream(chunks))[-1]
+        assert final.result.text == "Hello world"
+
+    def test_health_reports_scheduler_metrics(self, monkeypatch):
+        monkeypatch.setattr(srv, "_llm", FakeLlama(["a", "b"]))
+        assert self.client.post("/v1/completions", json={"prompt": "x"}).status_code == 200
+        metrics = self.client.get("/health").json()["scheduler"]
+        assert metrics["completed"] == 1
+        assert metrics["queue_depth"] == 0
+        assert {"wait_ms_avg", "wait_ms_p95", "tokens_per_s", "queue_max"} <= set(metrics)
+
+    def test_queue_full_returns_503(self, monkeypatch):
+        monkeypatch.setattr(srv, "_llm", FakeLlama(["a"]))
+        sched = InferenceScheduler(max_queue=0)
+        monkeypatch.setattr(srv, "_scheduler", sched)
+        resp = self.client.post("/v1/completions", json={"prompt": "x"})
+        assert resp.status_code == 503
+        assert resp.headers["retry-after"] == "1"
+
+    def test_invalid_priority_rejected(self, monkeypatch):
+        monkeypatch.setattr(srv, "_llm", FakeLlama(["a"]))
+        resp = self.client.post("/v1/completions", json={"prompt": "x", "priority": "urgent"})
+        assert resp.status_code == 422
@@ -64,7 +64,7 @@ def client(prompts):
 
 
 def _mock_urlopen(response_data, status=200):
-    """Create a mock for urllib.request.urlopen."""
+    """Create a mock for http_transport.urlopen."""
     mock_resp = MagicMock()
     mock_resp.read.return_value = json.dumps(response_data).encode("utf-8")
     mock_resp.status = status
@@ -144,7 +144,7 @@ class TestPromptLoading:
 
 class TestHealth:
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_health_returns_data(self, mock_open, client):
         mock_open.return_value = _mock_urlopen({
             "status": "ok", "model": "test-model", "uptime_seconds": 42.0,
@@ -154,22 +154,22 @@ class TestHealth:
         assert data["model"] == "test-model"
         assert data["uptime_seconds"] == 42.0
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_is_healthy_true(self, mock_open, client):
         mock_open.return_value = _mock_urlopen({"status": "ok"})
         assert client.is_healthy() is True
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_is_healthy_false_on_error(self, mock_open, client):
         mock_open.side_effect = URLError("connection refused")
         assert client.is_healthy() is False
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_is_healthy_false_on_bad_status(self, mock_open, client):
         mock_open.return_value = _mock_urlopen({"status": "degraded"})
         assert client.is_healthy() is False
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_health_raises_on_503(self, mock_open, client):
         mock_open.side_effect = HTTPError(
             "http://test-llm:8080/health", 503, "Model not loaded",
@@ -185,7 +185,7 @@ class TestHealth:
 
 class TestComplete:
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_complete_returns_text(self, mock_open, client):
         mock_open.return_value = _mock_urlopen({
             "text": "Paris", "model": "test", "tokens_generated": 1, "elapsed_ms": 50.0,
@@ -193,7 +193,7 @@ class TestComplete:
         result = client.complete("Capital of France?")
         assert result == "Paris"
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_complete_sends_correct_payload(self, mock_open, client):
         mock_open.return_value = _mock_urlopen({
             "text": "out", "model": "m", "tokens_generated": 1, "elapsed_ms": 1.0,
@@ -208,7 +208,7 @@ class TestComplete:
         assert sent["temperature"] == 0.5
         assert sent["stop"] == ["\n"]
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_complete_omits_stop_when_none(self, mock_open, client):
         mock_open.return_value = _mock_urlopen({
             "text": "out", "model": "m", "tokens_generated": 1, "elapsed_ms": 1.0,
@@ -219,13 +219,13 @@ class TestComplete:
         sent = json.loads(request_obj.data.decode("utf-8"))
         assert "stop" not in sent
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_complete_raises_on_connection_failure(self, mock_open, client):
         mock_open.side_effect = URLError("connection refused")
         with pytest.raises(LocalModelError, match="Connection failed"):
             client.complete("hello")
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_complete_raises_on_500(self, mock_open, client):
         mock_open.side_effect = HTTPError(
             "http://test-llm:8080/v1/completions", 500, "Inference error",
@@ -241,7 +241,7 @@ class TestComplete:
 
 class TestClassifyIntent:
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_returns_category(self, mock_open, client):
         mock_open.return_value = _mock_urlopen({
             "text": "question", "model": "m", "tokens_generated": 1, "elapsed_ms": 1.0,
@@ -249,7 +249,7 @@ class TestClassifyIntent:
         result = client.classify_intent("What time is it?")
         assert result == "question"
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_strips_whitespace(self, mock_open, client):
         mock_open.return_value = _mock_urlopen({
             "text": "  greeting\n", "model": "m", "tokens_generated": 1, "elapsed_ms": 1.0,
@@ -257,7 +257,7 @@ class TestClassifyIntent:
         result = client.classify_intent("Hello!")
         assert result == "greeting"
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_lowercases_result(self, mock_open, client):
         mock_open.return_value = _mock_urlopen({
             "text": "COMMAND", "model": "m", "tokens_generated": 1, "elapsed_ms": 1.0,
@@ -265,7 +265,7 @@ class TestClassifyIntent:
         result = client.classify_intent("Delete the file")
         assert result == "command"
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_uses_low_temperature(self, mock_open, client):
         mock_open.return_value = _mock_urlopen({
             "text": "question", "model": "m", "tokens_generated": 1, "elapsed_ms": 1.0,
@@ -277,7 +277,7 @@ class TestClassifyIntent:
         assert sent["temperature"] == 0.0
         assert sent["max_tokens"] == 16
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_prompt_contains_input(self, mock_open, client):
         mock_open.return_value = _mock_urlopen({
             "text": "question", "model": "m", "tokens_generated": 1, "elapsed_ms": 1.0,
@@ -295,7 +295,7 @@ class TestClassifyIntent:
 
 class TestExtractJson:
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_returns_parsed_dict(self, mock_open, client):
         mock_open.return_value = _mock_urlopen({
             "text": '{"name": "John", "age": 30}',
@@ -304,7 +304,7 @@ class TestExtractJson:
         result = client.extract_json("John is 30", '{"name": "string", "age": "number"}')
         assert result == {"name": "John", "age": 30}
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_strips_code_fences(self, mock_open, client):
         mock_open.return_value = _mock_urlopen({
             "text": '```json\n{"key": "value"}\n```',
@@ -313,7 +313,7 @@ class TestExtractJson:
         result = client.extract_json("text", "schema")
         assert result == {"key": "value"}
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_raises_on_invalid_json(self, mock_open, client):
         mock_open.return_value = _mock_urlopen({
             "text": "not json at all",
@@ -322,7 +322,7 @@ class TestExtractJson:
         with pytest.raises(LocalModelError, match="invalid JSON"):
             client.extract_json("text", "schema")
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_uses_zero_temperature(self, mock_open, client):
         mock_open.return_value = _mock_urlopen({
             "text": '{"a": 1}',
@@ -335,7 +335,7 @@ class TestExtractJson:
         assert sent["temperature"] == 0.0
         assert sent["max_tokens"] == 512
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_prompt_contains_input_and_schema(self, mock_open, client):
         mock_open.return_value = _mock_urlopen({
             "text": '{"x": 1}',
@@ -355,7 +355,7 @@ class TestExtractJson:
 
 class TestSummarize:
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_returns_summary_text(self, mock_open, client):
         mock_open.return_value = _mock_urlopen({
             "text": "Key points were discussed.",
@@ -364,7 +364,7 @@ class TestSummarize:
         result = client.summarize("Long text about many things...")
         assert result == "Key points were discussed."
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_strips_whitespace(self, mock_open, client):
         mock_open.return_value = _mock_urlopen({
             "text": "\n  Summary here.  \n",
@@ -373,7 +373,7 @@ class TestSummarize:
         result = client.summarize("text")
         assert result == "Summary here."
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_uses_256_max_tokens(self, mock_open, client):
         mock_open.return_value = _mock_urlopen({
             "text": "summary",
@@ -392,7 +392,7 @@ class TestSummarize:
 
 class TestRedact:
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_returns_redacted_text(self, mock_open, client):
         mock_open.return_value = _mock_urlopen({
             "text": "[NAME] lives at [ADDRESS].",
@@ -401,7 +401,7 @@ class TestRedact:
         result = client.redact("John lives at 123 Main St.")
         assert result == "[NAME] lives at [ADDRESS]."
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_uses_zero_temperature(self, mock_open, client):
         mock_open.return_value = _mock_urlopen({
             "text": "[NAME]",
@@ -413,7 +413,7 @@ class TestRedact:
         sent = json.loads(request_obj.data.decode("utf-8"))
         assert sent["temperature"] == 0.0
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_uses_512_max_tokens(self, mock_open, client):
         mock_open.return_value = _mock_urlopen({
             "text": "[NAME]",
@@ -432,7 +432,7 @@ class TestRedact:
 
 class TestRagRewrite:
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_returns_rewritten_query(self, mock_open, client):
         mock_open.return_value = _mock_urlopen({
             "text": "machine learning neural network architecture overview",
@@ -441,7 +441,7 @@ class TestRagRewrite:
         result = client.rag_rewrite("what's ML about?")
         assert "machine learning" in result
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_strips_whitespace(self, mock_open, client):
         mock_open.return_value = _mock_urlopen({
             "text": "\n  rewritten query  \n",
@@ -450,7 +450,7 @@ class TestRagRewrite:
         result = client.rag_rewrite("query")
         assert result == "rewritten query"
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_uses_128_max_tokens(self, mock_open, client):
         mock_open.return_value = _mock_urlopen({
             "text": "rewritten",
@@ -469,13 +469,13 @@ class TestRagRewrite:
 
 class TestErrorHandling:
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_connection_refused_raises_local_model_error(self, mock_open, client):
         mock_open.side_effect = URLError("Connection refused")
         with pytest.raises(LocalModelError, match="Connection failed"):
             client.classify_intent("test")
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_http_500_raises_local_model_error(self, mock_open, client):
         mock_open.side_effect = HTTPError(
             "http://test-llm:8080/v1/completions", 500, "Server Error",
@@ -484,7 +484,7 @@ class TestErrorHandling:
         with pytest.raises(LocalModelError, match="500"):
             client.summarize("text")
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_http_422_raises_local_model_error(self, mock_open, client):
         mock_open.side_effect = HTTPError(
             "http://test-llm:8080/v1/completions", 422, "Validation Error",
@@ -493,7 +493,7 @@ class TestErrorHandling:
         with pytest.raises(LocalModelError, match="422"):
             client.redact("text")
 
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_timeout_raises_local_model_error(self, mock_open, client):
         import socket
         mock_open.side_effect = URLError(socket.timeout("timed out"))
@@ -513,7 +513,7 @@ class TestAllUtilityMethods:
         ("redact", ("John Doe, 555-1234",), "redact"),
         ("rag_rewrite", ("what is ML?",), "rag_rewrite"),
     ])
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_each_method_uses_correct_template(
         self, mock_open, method, args, expected_template, client
     ):
@@ -538,7 +538,7 @@ class TestAllUtilityMethods:
         ("redact", ("text",)),
         ("rag_rewrite", ("text",)),
     ])
-    @patch("urllib.request.urlopen")
+    @patch("src.core.http_transport.urlopen")
     def test_each_method_raises_on_connection_error(
         self, mock_open, method, args, client
     ):
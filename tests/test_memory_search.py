@@ -266,6 +266,203 @@ class TestMultiTierSearch:
             assert result.source_tier != MemoryTier.core
 
 
+class TestScoreFusion:
+    """Tests for concurrent tier search and BM25 score fusion."""
+
+    def _fill(self, store_manager, tier, count=5):
+        for i in range(count):
+            store_manager.get_store(tier).insert(
+                create_item(tier, f"Filler {i}", f"Unrelated note number {i} about lunch")
+            )
+
+    def test_results_keep_bm25(self, populated_index):
+        results = populated_index.search("Python")
+        assert results
+        for r in results:
+            assert r.bm25 is not None and r.bm25 < 0
+            assert r.score == pytest.approx(-r.bm25 / (1 - r.bm25))
+
+    def test_strong_archival_match_beats_weak_working_match(self, store_manager, memory_index):
+        for tier in (MemoryTier.working, MemoryTier.archival):
+            self._fill(store_manager, tier)
+        store_manager.working.insert(create_item(
+            MemoryTier.working, "Daily notes",
+            "Long list of chores, errands, groceries, calls and reminders; kubernetes came up once "
+            "between the dentist appointment, the laundry and a dozen other unrelated items today",
+        ))
+        store_manager.archival.insert(create_item(
+            MemoryTier.archival, "Kubernetes kubernetes", "Kubernetes cluster notes",
+        ))
+        results = memory_index.search("kubernetes")
+        assert [r.source_tier for r in results] == [MemoryTier.archival, MemoryTier.working]
+
+    def test_tiers_are_searched_concurrently(self, store_manager, memory_index):
+        import threading
+
+        threads = set()
+        for tier in (MemoryTier.working, MemoryTier.episodic, MemoryTier.archival):
+            store = store_manager.get_store(tier)
+            original = store.search_scored
+
+            def spy(*args, _original=original, **kwargs):
+                threads.add(threading.current_thread().name)
+                return _original(*args, **kwargs)
+
+            store.search_scored = spy
+        memory_index.search("anything")
+        assert threading.current_thread().name not in threads
+        assert all(name.startswith("memory-search") for name in threads)
+
+    def test_close_all_closes_worker_connections(self, tmp_data_dir):
+        import sqlite3
+
+        manager = MemoryStoreManager(data_dir=tmp_data_dir)
+        manager.search_tiers("anything")
+        connections = [
+            conn for tier in (MemoryTier.working, MemoryTier.episodic, MemoryTier.archival)
+            for conn in manager.get_store(tier)._connections
+        ]
+        assert len(connections) >= 3
+        manager.close_all()
+        for conn in connections:
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+
+    def test_limit_is_top_k(self, store_manager, memory_index):
+        for i in range(8):
+            store_manager.episodic.insert(create_item(
+                MemoryTier.episodic, f"Deploy {i}", "deploy " * (i + 1),
+            ))
+        results = memory_index.search("deploy", tiers=[MemoryTier.episodic], limit=3)
+        assert len(results) == 3
+        assert [r.item.title for r in results] == ["Deploy 7", "Deploy 6", "Deploy 5"]
+
+
+class TestHybridSearch:
+    """Tests for the vector index and hybrid vector + BM25 search."""
+
+    @pytest.fixture(autouse=True)
+    def _needs_numpy(self):
+        pytest.importorskip("numpy")
+
+    def test_paraphrase_found_only_in_hybrid_mode(self, store_manager, memory_index):
+        store_manager.archival.insert(create_item(
+            MemoryTier.archival, "Deployment runbook",
+            "Steps for deploying the gateway container to production",
+        ))
+        store_manager.archival.insert(create_item(
+            MemoryTier.archival, "Lunch", "Sandwich order for the team meeting",
+        ))
+        query = "how do we deploy gateway containers"
+        assert memory_index.search(query) == []
+        results = memory_index.search(query, mode="hybrid")
+        assert results[0].item.title == "Deployment runbook"
+        assert results[0].bm25 is None
+        assert 0 < results[0].score <= 1
+
+    def test_index_follows_insert_update_delete(self, store_manager):
+        store = store_manager.episodic
+        item = create_item(MemoryTier.episodic, "Cache notes", "Redis eviction policy tuning")
+        store.insert(item)
+        assert store.search_vector("redis eviction")[0][0].id == item.id
+
+        item.title, item.content = "Billing", "Invoice reconciliation for March"
+        store.update(item)
+        stale = dict((hit.id, sim) for hit, sim in store.search_vector("redis eviction"))
+        fresh = store.search_vector("invoice reconciliation")
+        assert fresh[0][0].id == item.id
+        assert stale.get(item.id, 0.0) < fresh[0][1] / 2
+
+        store.delete(item.id)
+        assert item.id not in store.vector_index
+        assert store.search_vector("invoice reconciliation") == []
+
+    def test_vector_search_applies_filters(self, store_manager):
+        store = store_manager.archival
+        store.insert(create_item(MemoryTier.archival, "Alpha", "database migration plan",
+                                 namespace="project:a"))
+        store.insert(create_item(MemoryTier.archival, "Beta", "database migration plan",
+                                 namespace="project:b"))
+        results = store.search_vector("database migration", namespace="project:b")
+        assert [item.title for item, _ in results] == ["Beta"]
+
+    def test_index_persists_and_reuses_slots(self, tmp_data_dir):
+        manager = MemoryStoreManager(data_dir=tmp_data_dir)
+        store = manager.archival
+        items = [create_item(MemoryTier.archival, f"Note {i}", f"topic {i} details")
+                 for i in range(3)]
+        for item in items:
+            store.insert(item)
+        store.delete(items[0].id)
+        freed = store.vector_index._free[:]
+        replacement = create_item(MemoryTier.archival, "Note 3", "topic 3 details")
+        store.insert(replacement)
+        assert store.vector_index._slots[replacement.id] in freed
+        manager.close_all()
+
+        reopened = MemoryStoreManager(data_dir=tmp_data_dir)
+        index = reopened.archival.vector_index
+        assert not index.needs_rebuild
+        assert len(index) == 3
+        assert reopened.archival.search_vector("topic 3 details")[0][0].id == replacement.id
+        reopened.close_all()
+
+    def test_managers_on_one_data_dir_share_the_index(self, tmp_data_dir):
+        first = MemoryStoreManager(data_dir=tmp_data_dir)
+        second = MemoryStoreManager(data_dir=tmp_data_dir)
+        a = create_item(MemoryTier.archival, "Cluster", "kubernetes node pools")
+        b = create_item(MemoryTier.archival, "Dinner", "pasta carbonara recipe")
+        first.archival.insert(a)
+        second.archival.insert(b)
+        assert first.archival.vector_index is second.archival.vector_index
+        assert first.archival.search_vector("kubernetes")[0][0].id == a.id
+        second.close_all()
+        assert first.archival.search_vector("pasta carbonara")[0][0].id == b.id
+        first.close_all()
+
+    def test_map_changes_are_appended_to_log(self, tmp_data_dir):
+        manager = MemoryStoreManager(data_dir=tmp_data_dir)
+        store = manager.episodic
+        items = [create_item(MemoryTier.episodic, f"Log {i}", f"entry {i} body")
+                 for i in range(3)]
+        store.insert(items[0])
+        index = store.vector_index
+        snapshot = index.map_path.read_text()
+        store.insert(items[1])
+        store.insert(items[2])
+        store.delete(items[0].id)
+        assert index.map_path.read_text() == snapshot
+        assert len(index.log_path.read_text().splitlines()) == 5  # header + 4
+        manager.close_all()
+
+        reopened = MemoryStoreManager(data_dir=tmp_data_dir)
+        index = reopened.episodic.vector_index
+        assert not index.needs_rebuild
+        assert sorted(index._slots) == sorted(item.id for item in items[1:])
+        assert reopened.episodic.search_vector("entry 2 body")[0][0].id == items[2].id
+        reopened.close_all()
+
+    def test_missing_index_is_rebuilt(self, tmp_data_dir):
+        manager = MemoryStoreManager(data_dir=tmp_data_dir)
+        item = create_item(MemoryTier.working, "Standup", "Blocked on certificate renewal")
+        manager.working.insert(item)
+        matrix_path = manager.working.vector_index.matrix_path
+        manager.close_all()
+        matrix_path.unlink()
+
+        reopened = MemoryStoreManager(data_dir=tmp_data_dir)
+        assert reopened.working.search_vector("certificate renewal")[0][0].id == item.id
+        reopened.close_all()
+
+    def test_search_by_query_passes_mode(self, store_manager, memory_index):
+        store_manager.episodic.insert(create_item(
+            MemoryTier.episodic, "Outage", "The payments service crashed overnight",
+        ))
+        query = SearchQuery(query="payment service crash", mode="hybrid")
+        results = memory_index.search_by_query(query)
+        assert results and results[0].item.title == "Outage"
+
+
 # ---------------------------------------------------------------------------
 # Filter Tests
 # ---------------------------------------------------------------------------
@@ -530,6 +530,27 @@ class TestMemoryStoreManager:
         results = store_manager.search_all("Python")
         assert len(results) == 2
 
+    def test_search_all_ranks_across_tiers(self, store_manager):
+        """Test that search_all orders merged tiers by relevance, not by tier."""
+        for i in range(4):
+            store_manager.working.insert(create_test_item(
+                tier=MemoryTier.working, title=f"Errand {i}", content="Groceries and laundry"
+            ))
+            store_manager.archival.insert(create_test_item(
+                tier=MemoryTier.archival, title=f"Recipe {i}", content="Bread and soup"
+            ))
+        store_manager.working.insert(create_test_item(
+            tier=MemoryTier.working,
+            title="Misc",
+            content="A long list of errands, calls, chores and bills that mentions terraform once",
+        ))
+        store_manager.archival.insert(create_test_item(
+            tier=MemoryTier.archival, title="Terraform terraform", content="Terraform modules"
+        ))
+
+        results = store_manager.search_all("terraform")
+        assert [r.tier for r in results] == [MemoryTier.archival, MemoryTier.working]
+
     def test_stores_are_cached(self, store_manager):
         """Test that stores are cached and reused."""
         store1 = store_manager.working
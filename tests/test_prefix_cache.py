@@ -0,0 +1,133 @@
+"""
+Tests for the local-llm prompt-prefix KV-cache, using a fake Llama that
+mimics llama-cpp-python's longest-prefix reuse in generate().
+"""
+
+import re
+import time
+
+import pytest
+
+import local_models.server as srv
+from local_models.lockfile import load_all_prompts
+from local_models.prefix_cache import PrefixCache, template_prefix
+from local_models.scheduler import InferenceScheduler
+
+
+class FakeLlama:
+    """Word-level tokenizer; counts how many prompt tokens each call evaluates."""
+
+    def __init__(self):
+        self._input_ids = []
+        self.evaluated = []
+        self.prefix_evals = 0
+
+    def tokenize(self, text, add_bos=True):
+        return re.findall(r"\S+|\s+", text.decode("utf-8"))
+
+    def reset(self):
+        self._input_ids = []
+
+    def eval(self, tokens):
+        self.prefix_evals += 1
+        self._input_ids = self._input_ids + list(tokens)
+
+    def save_state(self):
+        return list(self._input_ids)
+
+    def load_state(self, state):
+        self._input_ids = list(state)
+
+    def __call__(self, prompt, **kwargs):
+        tokens = self.tokenize(prompt.encode("utf-8"))
+        reused = 0
+        for a, b in zip(self._input_ids, tokens[:-1]):
+            if a != b:
+                break
+            reused += 1
+        self.evaluated.append(len(tokens) - reused)
+        self._input_ids = tokens + ["out"]
+        return {"choices": [{"text": "question"}], "usage": {"completion_tokens": 1}}
+
+
+@pytest.fixture
+def templates():
+    return load_all_prompts()
+
+
+class TestPrefixCache:
+    def test_template_prefix(self):
+        assert template_prefix("Intro.\nUser message: {input}\nEnd") == "Intro.\nUser message: "
+        assert template_prefix("no placeholders") == "no placeholders"
+
+    def test_only_suffix_evaluated_when_templates_alternate(self, templates):
+        llm = FakeLlama()
+        cache = PrefixCache(llm, templates, min_prefix_tokens=4)
+        classify = templates["classify_intent"].format(input="what time is it")
+        verify = templates["verify_intent"].format(input="make a plan for the launch")
+
+        for prompt in [classify, verify, classify, verify]:
+            cache.prepare(prompt)
+            llm(prompt)
+
+        full = len(llm.tokenize(classify.encode()))
+        prefix = len(llm.tokenize(template_prefix(templates["classify_intent"]).encode()))
+        assert llm.evaluated[2] == full - prefix
+        assert llm.prefix_evals == 2
+        metrics = cache.metrics()
+        assert (metrics["hits"], metrics["misses"]) == (2, 2)
+        assert metrics["hit_rate"] == 0.5
+        assert metrics["tokens_reused"] > 0
+
+    def test_lru_eviction(self, templates):
+        llm = FakeLlama()
+        cache = PrefixCache(llm, templates, capacity=2, min_prefix_tokens=4)
+        prompts = {name: templates[name].format(input="x", schema="{}") for name in
+                   ("classify_intent", "redact", "summarize_internal")}
+        cache.prepare(prompts["classify_intent"])
+        cache.prepare(prompts["redact"])
+        cache.prepare(prompts["classify_intent"])      # refresh classify
+        cache.prepare(prompts["summarize_internal"])   # evicts redact
+        assert cache.metrics()["evictions"] == 1
+        cache.prepare(prompts["classify_intent"])
+        assert cache.metrics()["hits"] == 2
+        cache.prepare(prompts["redact"])
+        assert cache.metrics()["misses"] == 4
+
+    def test_unmatched_prompt_bypasses(self, templates):
+        llm = FakeLlama()
+        cache = PrefixCache(llm, templates, min_prefix_tokens=4)
+        assert cache.prepare("free-form prompt") is None
+        assert cache.metrics()["bypassed"] == 1
+        assert llm.prefix_evals == 0
+
+    def test_short_prefixes_are_not_cached(self):
+        llm = FakeLlama()
+        cache = PrefixCache(llm, {"tiny": "Q: {input}"}, min_prefix_tokens=16)
+        assert cache.metrics()["templates"] == []
+
+
+class TestServerIntegration:
+    def test_completions_use_prefix_cache(self, monkeypatch, templates):
+        from fastapi.testclient import TestClient
+
+        llm = FakeLlama()
+        monkeypatch.setattr(srv, "_llm", llm)
+        monkeypatch.setattr(srv, "_prefix_cache", PrefixCache(llm, templates, min_prefix_tokens=4))
+        monkeypatch.setattr(srv, "_scheduler", InferenceScheduler())
+        monkeypatch.setattr(srv, "_loaded_at", time.time())
+        client = TestClient(srv.app)
+
+        prompt = templates["classify_intent"].format(input="hello there")
+        for _ in range(2):
+            assert client.post("/v1/completions", json={"prompt": prompt}).json()["text"] == "question"
+        metrics = client.get("/health").json()["prefix_cache"]
+        assert metrics["hits"] == 1 and metrics["misses"] == 1
+
+    def test_cache_ignored_for_other_model(self, monkeypatch, templates):
+        llm = FakeLlama()
+        other = FakeLlama()
+        monkeypatch.setattr(srv, "_llm", other)
+        monkeypatch.setattr(srv, "_prefix_cache", PrefixCache(llm, templates, min_prefix_tokens=4))
+        srv._prepare_prompt(templates["redact"].format(input="x"))
+        assert srv._prefix_cache.metrics()["misses"] == 0
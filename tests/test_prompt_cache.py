@@ -0,0 +1,76 @@
+"""Tests for prompt_cache — versioned memo for tool declarations / instructions."""
+
+import threading
+
+from prompt_cache import PromptCache
+
+
+class TestPromptCache:
+
+    def test_builds_once_per_key(self):
+        cache = PromptCache()
+        calls = []
+
+        def build():
+            calls.append(1)
+            return ["decl"]
+
+        first = cache.get_or_build("tools", ("gemini", 1), build)
+        second = cache.get_or_build("tools", ("gemini", 1), build)
+        assert first is second
+        assert len(calls) == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_new_key_rebuilds(self):
+        cache = PromptCache()
+        a = cache.get_or_build("tools", ("gemini", 1), lambda: "rev1")
+        b = cache.get_or_build("tools", ("gemini", 2), lambda: "rev2")
+        assert (a, b) == ("rev1", "rev2")
+
+    def test_namespaces_are_isolated(self):
+        cache = PromptCache()
+        cache.get_or_build("tools", "k", lambda: "tools")
+        assert cache.get_or_build("system_instruction", "k", lambda: "sys") == "sys"
+
+    def test_invalidate_namespace(self):
+        cache = PromptCache()
+        cache.get_or_build("tools", "k", lambda: "old")
+        cache.get_or_build("system_instruction", "k", lambda: "sys")
+        assert cache.invalidate("tools") == 1
+        assert cache.get_or_build("tools", "k", lambda: "new") == "new"
+        assert cache.get_or_build("system_instruction", "k", lambda: "other") == "sys"
+
+    def test_invalidate_all(self):
+        cache = PromptCache()
+        cache.get_or_build("tools", "k", lambda: "a")
+        cache.get_or_build("system_instruction", "k", lambda: "b")
+        assert cache.invalidate() == 2
+        assert cache.stats()["entries"] == 0
+        assert cache.stats()["invalidations"] == 1
+
+    def test_lru_bound(self):
+        cache = PromptCache(max_entries=2)
+        cache.get_or_build("ns", 1, lambda: 1)
+        cache.get_or_build("ns", 2, lambda: 2)
+        cache.get_or_build("ns", 1, lambda: "unused")  # touch 1 → 2 is LRU
+        cache.get_or_build("ns", 3, lambda: 3)
+        assert cache.stats()["entries"] == 2
+        assert cache.get_or_build("ns", 1, lambda: "rebuilt") == 1
+        assert cache.get_or_build("ns", 2, lambda: "rebuilt") == "rebuilt"
+
+    def test_concurrent_access(self):
+        cache = PromptCache()
+        results = []
+
+        def worker():
+            for i in range(200):
+                results.append(cache.get_or_build("ns", i % 5, lambda i=i: i % 5))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(results) == 800
+        assert cache.stats()["entries"] == 5
@@ -0,0 +1,178 @@
+"""Tests for providers.prompt_caching — Anthropic/OpenAI prompt-prefix caching."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from providers.prompt_caching import (
+    MIN_CACHEABLE_CHARS,
+    anthropic_cache_request,
+    extract_anthropic_cache_usage,
+    extract_openai_cache_usage,
+    openai_prefix_cache_key,
+)
+from src.core.usage_tracker import UsageTracker
+
+LONG_SYSTEM = "You are Lancelot. " * (MIN_CACHEABLE_CHARS // 10)
+TOOLS = [
+    {"name": "network_client", "description": "HTTP", "input_schema": {"type": "object"}},
+    {"name": "repo_writer", "description": "Files", "input_schema": {"type": "object"}},
+]
+
+
+@pytest.fixture(autouse=True)
+def _caching_enabled(monkeypatch):
+    monkeypatch.delenv("LANCELOT_PROMPT_CACHE", raising=False)
+
+
+def _breakpoints(system, tools, messages):
+    count = 0
+    if isinstance(system, list):
+        count += sum(1 for b in system if "cache_control" in b)
+    count += sum(1 for t in tools or [] if "cache_control" in t)
+    for m in messages:
+        if isinstance(m.get("content"), list):
+            count += sum(1 for b in m["content"] if isinstance(b, dict) and "cache_control" in b)
+    return count
+
+
+class TestAnthropicCacheRequest:
+
+    def test_short_prompt_left_untouched(self):
+        messages = [{"role": "user", "content": "hi"}]
+        system, tools, out = anthropic_cache_request("short", TOOLS, messages)
+        assert system == "short"
+        assert tools is TOOLS
+        assert out is messages
+
+    def test_long_system_gets_breakpoint(self):
+        messages = [{"role": "user", "content": "hi"}]
+        system, tools, out = anthropic_cache_request(LONG_SYSTEM, TOOLS, messages)
+        assert system == [{"type": "text", "text": LONG_SYSTEM, "cache_control": {"type": "ephemeral"}}]
+        assert tools is TOOLS  # system breakpoint already covers the tools
+        assert out[-1]["content"][-1]["cache_control"] == {"type": "ephemeral"}
+        assert _breakpoints(system, tools, out) == 2
+
+    def test_tool_breakpoint_when_no_system(self):
+        big_tools = TOOLS + [{"name": "x", "description": "d" * MIN_CACHEABLE_CHARS, "input_schema": {}}]
+        system, tools, _ = anthropic_cache_request("", big_tools, [])
+        assert system == ""
+        assert tools[-1]["cache_control"] == {"type": "ephemeral"}
+        assert "cache_control" not in big_tools[-1]
+
+    def test_caller_messages_not_mutated_across_iterations(self):
+        messages = [
+            {"role": "user", "content": "hi"},
+            {"role": "user", "content": [{"type": "tool_result", "tool_use_id": "t1", "content": "ok"}]},
+        ]
+        for _ in range(3):
+            system, tools, out = anthropic_cache_request(LONG_SYSTEM, TOOLS, messages)
+            assert _breakpoints(system, tools, out) == 2
+        assert messages[1]["content"][0] == {"type": "tool_result", "tool_use_id": "t1", "content": "ok"}
+        assert messages[0]["content"] == "hi"
+
+    def test_sdk_block_objects_skipped(self):
+        block = MagicMock()
+        messages = [{"role": "assistant", "content": [block]}]
+        _, _, out = anthropic_cache_request(LONG_SYSTEM, None, messages)
+        assert out[-1]["content"] == [block]
+
+    def test_kill_switch(self, monkeypatch):
+        monkeypatch.setenv("LANCELOT_PROMPT_CACHE", "false")
+        system, _, _ = anthropic_cache_request(LONG_SYSTEM, TOOLS, [])
+        assert system == LONG_SYSTEM
+
+
+class TestOpenAIPrefixKey:
+
+    def test_stable_for_same_prefix(self):
+        assert openai_prefix_cache_key(LONG_SYSTEM, TOOLS) == openai_prefix_cache_key(LONG_SYSTEM, list(TOOLS))
+
+    def test_changes_with_tools(self):
+        assert openai_prefix_cache_key(LONG_SYSTEM, TOOLS) != openai_prefix_cache_key(LONG_SYSTEM, TOOLS[:1])
+
+    def test_none_for_short_prefix(self):
+        assert openai_prefix_cache_key("short", []) is None
+
+
+class TestUsageExtraction:
+
+    def test_anthropic_usage(self):
+        usage = MagicMock(input_tokens=50, cache_read_input_tokens=4000, cache_creation_input_tokens=200)
+        assert extract_anthropic_cache_usage(usage) == {
+            "cache_read_tokens": 4000, "cache_write_tokens": 200, "prompt_tokens_total": 4250,
+        }
+
+    def test_openai_usage(self):
+        usage = MagicMock(prompt_tokens=5000)
+        usage.prompt_tokens_details.cached_tokens = 4096
+        assert extract_openai_cache_usage(usage) == {
+            "cache_read_tokens": 4096, "cache_write_tokens": 0, "prompt_tokens_total": 5000,
+        }
+
+    def test_missing_fields_are_zero(self):
+        usage = MagicMock(spec=["prompt_tokens"], prompt_tokens=10)
+        assert extract_openai_cache_usage(usage)["cache_read_tokens"] == 0
+        assert extract_anthropic_cache_usage(None)["cache_write_tokens"] == 0
+
+
+class TestProviderWiring:
+
+    def test_anthropic_generate_with_tools_sends_breakpoints(self):
+        from providers.anthropic_client import AnthropicProviderClient
+
+        client = AnthropicProviderClient.__new__(AnthropicProviderClient)
+        client._mode = "sdk"
+        client._client = MagicMock()
+        response = MagicMock()
+        response.content = []
+        response.usage = MagicMock(input_tokens=10, output_tokens=5,
+                                   cache_read_input_tokens=3000, cache_creation_input_tokens=0)
+        client._client.messages.create.return_value = response
+
+        result = client.generate_with_tools("claude", [{"role": "user", "content": "hi"}], LONG_SYSTEM, TOOLS)
+
+        sent = client._client.messages.create.call_args.kwargs
+        assert sent["system"][0]["cache_control"] == {"type": "ephemeral"}
+        assert result.usage["cache_read_tokens"] == 3000
+
+    def test_openai_generate_with_tools_sends_cache_key(self):
+        from providers.openai_client import OpenAIProviderClient
+
+        client = OpenAIProviderClient.__new__(OpenAIProviderClient)
+        client._client = MagicMock()
+        message = MagicMock(content="ok", tool_calls=None)
+        response = MagicMock(choices=[MagicMock(message=message)])
+        response.usage = MagicMock(prompt_tokens=5000, completion_tokens=5)
+        response.usage.prompt_tokens_details.cached_tokens = 4096
+        client._client.chat.completions.create.return_value = response
+
+        result = client.generate_with_tools("gpt-4o", [{"role": "user", "content": "hi"}], LONG_SYSTEM, TOOLS)
+
+        sent = client._client.chat.completions.create.call_args.kwargs
+        assert sent["messages"][0] == {"role": "system", "content": LONG_SYSTEM}
+        assert sent["extra_body"]["prompt_cache_key"].startswith("lancelot-")
+        assert result.usage["cache_read_tokens"] == 4096
+
+
+class TestUsageTrackerPromptCache:
+
+    def test_hit_ratio_in_summary(self):
+        tracker = UsageTracker()
+        tracker.record_prompt_cache("claude", {"input_tokens": 10, "cache_read_tokens": 0,
+                                               "cache_write_tokens": 4000, "prompt_tokens_total": 4010})
+        tracker.record_prompt_cache("claude", {"input_tokens": 10, "cache_read_tokens": 4000,
+                                               "cache_write_tokens": 0, "prompt_tokens_total": 4010})
+        pc = tracker.summary()["prompt_cache"]
+        assert pc["cache_read_tokens"] == 4000
+        assert pc["cache_write_tokens"] == 4000
+        assert pc["by_model"]["claude"]["requests"] == 2
+        assert pc["hit_ratio"] == round(4000 / 8020, 4)
+
+    def test_calls_without_cache_fields_ignored(self):
+        tracker = UsageTracker()
+        tracker.record_prompt_cache("gemini", {"input_tokens": 10, "output_tokens": 2})
+        assert tracker.prompt_cache_breakdown()["by_model"] == {}
+        tracker.record_prompt_cache("claude", {"cache_read_tokens": 1, "prompt_tokens_total": 2})
+        tracker.reset()
+        assert tracker.prompt_cache_breakdown()["hit_ratio"] == 0.0
@@ -2,18 +2,35 @@
 Tests for ProtocolAdapter — SMTP/IMAP translation layer.
 
 Uses mocked smtplib/imaplib connections. No actual mail server calls.
+Sync against a (fake) IMAP server is covered in test_imap_sync.py.
 """
 
 import pytest
 from unittest.mock import MagicMock, patch
 
 from src.connectors.models import ConnectorResult, HTTPMethod
+from src.connectors.imap_sync import MailIndex
 from src.connectors.protocol_adapter import ProtocolAdapter, SMTPConfig, IMAPConfig
 
 
 @pytest.fixture
 def adapter():
-    return ProtocolAdapter()
+    return ProtocolAdapter(mail_index=MailIndex())
+
+
+def _mock_mailbox(subjects):
+    """Mock IMAP connection holding one message per subject (UIDs 1..n)."""
+    mock_imap = MagicMock()
+    n = len(subjects)
+    mock_imap.status.return_value = (
+        "OK", [f"INBOX (MESSAGES {n} UIDNEXT {n + 1} UIDVALIDITY 1 UNSEEN 0)".encode()],
+    )
+    mock_imap.select.return_value = ("OK", [str(n).encode()])
+    mock_imap.uid.return_value = ("OK", [
+        f'{uid} (UID {uid} FLAGS (\\Seen) ENVELOPE (NIL "{subject}" NIL NIL NIL NIL NIL NIL NIL NIL))'.encode()
+        for uid, subject in enumerate(subjects, 1)
+    ])
+    return mock_imap
 
 
 # ── Routing ──────────────────────────────────────────────────────
@@ -55,10 +72,7 @@ class TestRouting:
             body={"protocol": "imap", "action": "list"},
         )
         with patch.object(adapter, "_get_imap_connection") as mock_conn:
-            mock_imap = MagicMock()
-            mock_imap.select.return_value = ("OK", [b"0"])
-            mock_imap.search.return_value = ("OK", [b"1 2 3"])
-            mock_conn.return_value = mock_imap
+            mock_conn.return_value = _mock_mailbox(["a", "b", "c"])
             resp = adapter.execute(result)
         assert resp.success is True
         assert resp.body["total"] == 3
@@ -138,22 +152,25 @@ class TestIMAPOperations:
     def test_list_returns_message_ids(self, adapter):
         result = self._make_imap_result("list")
         with patch.object(adapter, "_get_imap_connection") as mock_conn:
-            mock_imap = MagicMock()
-            mock_imap.select.return_value = ("OK", [b"5"])
-            mock_imap.search.return_value = ("OK", [b"1 2 3 4 5"])
+            mock_imap = _mock_mailbox(["a", "b", "c", "d", "e"])
             mock_conn.return_value = mock_imap
             resp = adapter.execute(result)
 
         assert resp.success is True
         assert resp.body["total"] == 5
-        assert len(resp.body["message_ids"]) == 5
+        assert resp.body["message_ids"] == ["1", "2", "3", "4", "5"]
+        mock_imap.uid.assert_called_once_with(
+            "FETCH", "1:5", "(UID FLAGS ENVELOPE BODYSTRUCTURE RFC822.SIZE)",
+        )
 
     def test_fetch_returns_raw(self, adapter):
         result = self._make_imap_result("fetch", message_id="42")
         with patch.object(adapter, "_get_imap_connection") as mock_conn:
             mock_imap = MagicMock()
             mock_imap.select.return_value = ("OK", [b"0"])
-            mock_imap.fetch.return_value = ("OK", [(b"42", b"From: a@b.com\nSubject: Hi\n\nHello")])
+            mock_imap.uid.return_value = (
+                "OK", [(b"1 (UID 42 RFC822 {32}", b"From: a@b.com\nSubject: Hi\n\nHello"), b")"],
+            )
             mock_conn.return_value = mock_imap
             resp = adapter.execute(result)
 
@@ -164,15 +181,14 @@ class TestIMAPOperations:
     def test_search_returns_matches(self, adapter):
         result = self._make_imap_result("search", query="invoice")
         with patch.object(adapter, "_get_imap_connection") as mock_conn:
-            mock_imap = MagicMock()
-            mock_imap.select.return_value = ("OK", [b"0"])
-            mock_imap.search.return_value = ("OK", [b"10 20"])
+            mock_imap = _mock_mailbox(["Invoice 1", "Lunch", "Re: invoice 2"])
             mock_conn.return_value = mock_imap
             resp = adapter.execute(result)
 
         assert resp.success is True
         assert resp.body["query"] == "invoice"
-        assert len(resp.body["message_ids"]) == 2
+        assert resp.body["message_ids"] == ["1", "3"]
+        mock_imap.search.assert_not_called()
 
     def test_delete_expunges(self, adapter):
         result = self._make_imap_result("delete", message_id="99")
@@ -184,7 +200,7 @@ class TestIMAPOperations:
 
         assert resp.success is True
         assert resp.body["deleted"] == "99"
-        mock_imap.store.assert_called_once()
+        mock_imap.uid.assert_called_once_with("STORE", "99", "+FLAGS", "(\\Deleted)")
         mock_imap.expunge.assert_called_once()
 
     def test_move_copies_then_deletes(self, adapter):
@@ -197,7 +213,7 @@ class TestIMAPOperations:
 
         assert resp.success is True
         assert resp.body["destination"] == "Archive"
-        mock_imap.copy.assert_called_once_with("5", "Archive")
+        mock_imap.uid.assert_any_call("COPY", "5", "Archive")
         mock_imap.expunge.assert_called_once()
 
     def test_unknown_imap_action_fails(self, adapter):
@@ -219,10 +235,7 @@ class TestResponseMetadata:
             body={"protocol": "imap", "action": "list"},
         )
         with patch.object(adapter, "_get_imap_connection") as mock_conn:
-            mock_imap = MagicMock()
-            mock_imap.select.return_value = ("OK", [b"0"])
-            mock_imap.search.return_value = ("OK", [b""])
-            mock_conn.return_value = mock_imap
+            mock_conn.return_value = _mock_mailbox([])
             resp = adapter.execute(result)
 
         assert resp.elapsed_ms >= 0
@@ -6,6 +6,7 @@ Uses real SQLite database, real file operations.
 """
 
 import os
+import sqlite3
 import uuid
 import time
 import shutil
@@ -29,6 +30,16 @@ def temp_data_dir():
     shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+def wait_for_maintenance(svc):
+    """Let the service's background maintenance pass (and any re-run a
+    write requested) finish."""
+    for _ in range(10):
+        maintainer = svc._maintainer
+        if maintainer is None:
+            return
+        maintainer.join(timeout=10)
+
+
 @pytest.fixture
 def service(temp_data_dir):
     """Create a ReceiptService with temporary storage."""
@@ -149,10 +160,12 @@ class TestReceiptService:
     """Tests for the ReceiptService SQLite backend."""
 
     def test_database_created(self, temp_data_dir):
-        """Service creates SQLite database on init."""
-        service = ReceiptService(data_dir=temp_data_dir)
+        """Service creates the monthly partition database on first write."""
+        service = ReceiptService(data_dir=temp_data_dir, write_behind=False)
+        assert os.path.isdir(os.path.join(temp_data_dir, "receipts"))
         
-        db_path = os.path.join(temp_data_dir, "receipts.db")
+        receipt = service.create(create_receipt(ActionType.SYSTEM, "first", {}))
+        db_path = os.path.join(temp_data_dir, "receipts", f"receipts-{receipt.timestamp[:7]}.db")
         assert os.path.exists(db_path)
         service.close()
 
@@ -363,6 +376,356 @@ class TestReceiptService:
         assert service.get(recent_receipt.id) is not None
 
 
+class TestFullTextSearch:
+    """Tests for the FTS5 receipt search index."""
+
+    def test_bm25_ranks_action_name_matches_first(self, service):
+        service.create(create_receipt(ActionType.TOOL_CALL, "fetch_page", {"note": "deploy deploy"}))
+        service.create(create_receipt(ActionType.TOOL_CALL, "deploy_service", {"target": "prod"}))
+        results = service.search("deploy")
+        assert [r.action_name for r in results] == ["deploy_service", "fetch_page"]
+
+    def test_prefix_and_filters(self, service):
+        service.create(create_receipt(ActionType.TOOL_CALL, "search_web", {"q": "lancelot"}))
+        service.create(create_receipt(ActionType.FILE_OP, "search_files", {"q": "lancelot"}))
+        assert len(service.search("lance")) == 2
+        results = service.search("lancelot", action_types=[ActionType.FILE_OP.value])
+        assert [r.action_name for r in results] == ["search_files"]
+        assert len(service.search("lancelot", time_range_hours=1)) == 2
+
+    def test_updates_and_deletes_keep_index_in_sync(self, service):
+        receipt = service.create(create_receipt(ActionType.TOOL_CALL, "run_job", {}))
+        service.update(receipt.fail("connection refused", duration_ms=5))
+        assert [r.id for r in service.search("refused")] == [receipt.id]
+        service.flush()
+        conn = service._get_connection(service._partition_path(receipt.timestamp[:7]))
+        conn.execute("DELETE FROM receipts WHERE id = ?", (receipt.id,))
+        conn.commit()
+        assert service.search("refused") == []
+
+    def test_syntax_characters_are_safe(self, service):
+        service.create(create_receipt(ActionType.TOOL_CALL, "call", {"expr": "a OR (b AND c)"}))
+        assert service.search('"unbalanced (quote') == []
+        assert len(service.search("b AND c")) == 1
+
+    def test_existing_database_is_indexed(self, temp_data_dir):
+        """A receipts.db created before the FTS index is indexed as it is partitioned."""
+        import sqlite3
+        conn = sqlite3.connect(os.path.join(temp_data_dir, "receipts.db"))
+        conn.executescript(ReceiptService.CREATE_TABLE_SQL)
+        conn.execute("DROP TABLE schema_meta")
+        legacy = ReceiptService._insert_params(create_receipt(ActionType.SYSTEM, "legacy_migration", {}))
+        conn.execute(ReceiptService.INSERT_SQL, legacy)
+        conn.commit()
+        conn.close()
+
+        svc = ReceiptService(data_dir=temp_data_dir, write_behind=False)
+        assert svc._fts_ready
+        assert [r.id for r in svc.search("legacy")] == [legacy[0]]
+        svc.close()
+
+        # Restart does not migrate again
+        assert not os.path.exists(os.path.join(temp_data_dir, "receipts.db"))
+        svc = ReceiptService(data_dir=temp_data_dir, write_behind=False)
+        assert len(svc.search("legacy")) == 1
+        svc.close()
+
+    def test_partition_without_index_is_backfilled_in_background(self, temp_data_dir, monkeypatch):
+        """A partition written without FTS5 is indexed in chunks, off the constructor."""
+        import sqlite3
+        monkeypatch.setattr(ReceiptService, "FTS_BACKFILL_CHUNK", 2)
+        receipt = create_receipt(ActionType.SYSTEM, "unindexed", {})
+        path = os.path.join(temp_data_dir, "receipts", f"receipts-{receipt.timestamp[:7]}.db")
+        os.makedirs(os.path.dirname(path))
+        conn = sqlite3.connect(path)
+        conn.executescript(ReceiptService.CREATE_TABLE_SQL)
+        ids = []
+        for i in range(5):
+            r = create_receipt(ActionType.SYSTEM, f"unindexed_{i}", {})
+            conn.execute(ReceiptService.INSERT_SQL, ReceiptService._insert_params(r))
+            ids.append(r.id)
+        conn.commit()
+        conn.close()
+
+        svc = ReceiptService(data_dir=temp_data_dir, write_behind=False)
+        # Found by the LIKE scan while the backfill may still be running
+        assert len(svc.search("unindexed")) == 5
+        wait_for_maintenance(svc)
+        assert not svc._fts_pending
+        assert sorted(r.id for r in svc.search("unindexed")) == sorted(ids)
+        conn = svc._get_connection(path)
+        assert svc._get_meta(conn, "fts_backfill_pos") == svc._get_meta(conn, "fts_backfill_high") == "5"
+        svc.close()
+
+
+class TestStatsRollup:
+    """Tests for the trigger-maintained hourly stats rollup."""
+
+    def _brute_force(self, service, since=None):
+        where, params = "1=1", []
+        if since:
+            where, params = "timestamp >= ?", [since]
+        rows = service._fanout(f"SELECT * FROM receipts WHERE {where}", params)
+        tokens = [r["token_count"] for r in rows if r["token_count"] is not None]
+        durations = [r["duration_ms"] for r in rows if r["duration_ms"] is not None]
+        return len(rows), sum(tokens), max(tokens or [0]), sum(durations), max(durations or [0])
+
+    def _summary(self, stats):
+        return (stats["total_receipts"], stats["tokens"]["total"], stats["tokens"]["max"],
+                stats["duration_ms"]["total"], stats["duration_ms"]["max"])
+
+    def _seed(self, service):
+        now = datetime.now(timezone.utc)
+        for i in range(12):
+            r = create_receipt(ActionType.TOOL_CALL if i % 2 else ActionType.LLM_CALL, f"op_{i}", {})
+            r.timestamp = (now - timedelta(minutes=20 * i)).isoformat()
+            service.create(r)
+            if i % 3:
+                service.update(r.complete({}, duration_ms=10 * i, token_count=100 + i))
+        service.flush()
+        return now
+
+    def test_matches_full_scan(self, service):
+        now = self._seed(service)
+        for since in (None, (now - timedelta(minutes=95)).isoformat(), (now - timedelta(hours=2)).isoformat()[:13]):
+            assert self._summary(service.get_stats(since=since)) == self._brute_force(service, since)
+
+    def test_status_transition_moves_bucket(self, service):
+        r = service.create(create_receipt(ActionType.TOOL_CALL, "op", {}))
+        assert service.get_stats()["by_status"] == {ReceiptStatus.PENDING.value: 1}
+        service.update(r.complete({}, duration_ms=7, token_count=3))
+        stats = service.get_stats()
+        assert stats["by_status"] == {ReceiptStatus.SUCCESS.value: 1}
+        assert stats["tokens"]["total"] == 3 and stats["duration_ms"]["average"] == 7
+
+    def test_delete_old_removes_from_rollup(self, service):
+        old = create_receipt(ActionType.SYSTEM, "old", {})
+        old.timestamp = (datetime.now(timezone.utc) - timedelta(days=60)).isoformat()
+        service.create(old)
+        service.create(create_receipt(ActionType.SYSTEM, "new", {}))
+        service.delete_old(days=30)
+        assert service.get_stats()["total_receipts"] == 1
+        rollups = [service._rollup_rows(part) for part in service._partitions()]
+        assert sum(len(rows) for rows in rollups) == 1
+
+    def test_quest_scoped_stats(self, service):
+        quest_id = str(uuid.uuid4())
+        r = service.create(create_receipt(ActionType.TOOL_CALL, "q", {}, quest_id=quest_id))
+        service.update(r.complete({}, duration_ms=5, token_count=9))
+        service.create(create_receipt(ActionType.TOOL_CALL, "other", {}))
+        stats = service.get_stats(quest_id=quest_id)
+        assert stats["total_receipts"] == 1
+        assert stats["tokens"] == {"total": 9, "average": 9, "max": 9}
+
+    def test_existing_database_is_seeded(self, temp_data_dir):
+        import sqlite3
+        conn = sqlite3.connect(os.path.join(temp_data_dir, "receipts.db"))
+        conn.executescript(ReceiptService.CREATE_TABLE_SQL)
+        for i in range(3):
+            done = create_receipt(ActionType.SYSTEM, f"legacy_{i}", {}).complete({}, duration_ms=i, token_count=i)
+            conn.execute(ReceiptService.INSERT_SQL, ReceiptService._insert_params(done))
+        conn.commit()
+        conn.close()
+
+        svc = ReceiptService(data_dir=temp_data_dir, write_behind=False)
+        stats = svc.get_stats()
+        assert stats["total_receipts"] == 3
+        assert stats["tokens"]["total"] == 3
+        svc.close()
+
+
+class TestPartitions:
+    """Tests for monthly partitions, archival and file-drop retention."""
+
+    def _backdated(self, name, days, **kwargs):
+        receipt = create_receipt(ActionType.TOOL_CALL, name, {"topic": "partition"}, **kwargs)
+        receipt.timestamp = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+        return receipt
+
+    def _files(self, data_dir):
+        names = os.listdir(os.path.join(data_dir, "receipts"))
+        return sorted(name for name in names if ReceiptService.PARTITION_RE.match(name))
+
+    def test_time_filter_only_opens_overlapping_partitions(self, temp_data_dir):
+        svc = ReceiptService(data_dir=temp_data_dir, write_behind=False, hot_months=12)
+        old = svc.create(self._backdated("old", 70))
+        new = svc.create(create_receipt(ActionType.TOOL_CALL, "new", {}))
+        wait_for_maintenance(svc)
+        opened = []
+        query = svc._query
+        svc._query = lambda part, *args: opened.append(part[0]) or query(part, *args)
+
+        since = (datetime.now(timezone.utc) - timedelta(days=1)).isoformat()
+        assert [r.id for r in svc.list(since=since)] == [new.id]
+        assert set(opened) == {new.timestamp[:7]}
+        assert [r.id for r in svc.list()] == [new.id, old.id]
+        svc.close()
+
+    def test_old_months_are_archived_and_stay_readable(self, temp_data_dir):
+        svc = ReceiptService(data_dir=temp_data_dir, write_behind=False, hot_months=1)
+        quest_id = str(uuid.uuid4())
+        old = self._backdated("archived_op", 100, quest_id=quest_id)
+        svc.create(old)
+        svc.compact_partitions()
+
+        month = old.timestamp[:7]
+        assert f"receipts-{month}.db.gz" in self._files(temp_data_dir)
+        assert f"receipts-{month}.db" not in self._files(temp_data_dir)
+        assert svc.get(old.id).action_name == "archived_op"
+        assert [r.id for r in svc.list(since=old.timestamp[:10])] == [old.id]
+        assert [r.id for r in svc.search("archived")] == [old.id]
+        assert [r.id for r in svc.get_quest_receipts(quest_id)] == [old.id]
+        assert svc.get_stats()["total_receipts"] == 1
+        svc.close()
+
+    def test_late_update_shadows_archived_copy(self, temp_data_dir):
+        svc = ReceiptService(data_dir=temp_data_dir, write_behind=False, hot_months=1)
+        old = svc.create(self._backdated("late", 100))
+        svc.compact_partitions()
+        svc.update(old.complete({"ok": True}, duration_ms=5))
+        assert svc.get(old.id).status == ReceiptStatus.SUCCESS.value
+        assert [r.status for r in svc.list()] == [ReceiptStatus.SUCCESS.value]
+
+        svc.compact_partitions()
+        assert self._files(temp_data_dir) == [f"receipts-{old.timestamp[:7]}.db.gz"]
+        assert svc.get(old.id).outputs == {"ok": True}
+        assert svc.get_stats()["by_status"] == {ReceiptStatus.SUCCESS.value: 1}
+        svc.close()
+
+    def test_shadowed_archive_rows_counted_once(self, temp_data_dir):
+        svc = ReceiptService(data_dir=temp_data_dir, write_behind=False, hot_months=1)
+        quest_id = str(uuid.uuid4())
+        old = svc.create(self._backdated("late", 100, quest_id=quest_id))
+        for i in range(3):
+            svc.create(self._backdated(f"other_{i}", 100))
+        svc.compact_partitions()
+        svc._schedule_maintenance = lambda: None  # keep the live file shadowing the archive
+        svc.update(old.complete({"ok": True}, duration_ms=5, token_count=7))
+        assert f"receipts-{old.timestamp[:7]}.db" in self._files(temp_data_dir)
+
+        stats = svc.get_stats()
+        assert stats["total_receipts"] == 4
+        assert stats["by_status"] == {ReceiptStatus.PENDING.value: 3, ReceiptStatus.SUCCESS.value: 1}
+        assert stats["tokens"]["total"] == 7
+        assert svc.get_stats(since=old.timestamp)["total_receipts"] == 4
+        assert svc.get_stats(quest_id=quest_id)["total_receipts"] == 1
+        assert svc.delete_old(days=30) == 4
+        svc.close()
+
+    def test_retention_drops_whole_partitions(self, temp_data_dir):
+        svc = ReceiptService(data_dir=temp_data_dir, write_behind=False, hot_months=2)
+        archived = svc.create(self._backdated("archived", 200))
+        live_old = svc.create(self._backdated("live_old", 40))
+        recent = svc.create(create_receipt(ActionType.SYSTEM, "recent", {}))
+        svc.compact_partitions()
+
+        assert svc.delete_old(days=30) == 2
+        assert svc.get(archived.id) is None and svc.get(live_old.id) is None
+        assert svc.get(recent.id) is not None
+        assert not any(name.startswith(f"receipts-{archived.timestamp[:7]}") for name in self._files(temp_data_dir))
+        svc.close()
+
+    def test_id_and_quest_lookups_open_only_their_month(self, temp_data_dir):
+        svc = ReceiptService(data_dir=temp_data_dir, write_behind=False, hot_months=1)
+        quest_id = str(uuid.uuid4())
+        old = svc.create(self._backdated("old", 100, quest_id=quest_id))
+        svc.create(self._backdated("older", 200))
+        svc.create(create_receipt(ActionType.SYSTEM, "recent", {}))
+        svc.compact_partitions()
+        wait_for_maintenance(svc)
+        opened = []
+        query = svc._query
+        svc._query = lambda part, *args: opened.append(part[0]) or query(part, *args)
+
+        assert svc.get("no-such-id") is None
+        assert opened == []
+        assert svc.get(old.id).id == old.id
+        assert [r.id for r in svc.get_quest_receipts(quest_id)] == [old.id]
+        assert set(opened) == {old.timestamp[:7]}
+        svc.close()
+
+    def test_index_is_rebuilt_from_partitions(self, temp_data_dir):
+        svc = ReceiptService(data_dir=temp_data_dir, write_behind=False, hot_months=1)
+        old = svc.create(self._backdated("old", 100))
+        parent = svc.create(create_receipt(ActionType.SYSTEM, "parent", {}))
+        child = svc.create(create_receipt(ActionType.SYSTEM, "child", {}, parent_id=parent.id))
+        svc.compact_partitions()
+        svc.close()
+        os.remove(os.path.join(temp_data_dir, "receipts", ReceiptService.INDEX_FILE))
+
+        svc = ReceiptService(data_dir=temp_data_dir, write_behind=False, hot_months=1)
+        assert svc.get(old.id).action_name == "old"
+        assert [r.id for r in svc.get_children(parent.id)] == [child.id]
+        assert svc.validate_parent_chain() == []
+        assert svc.delete_old(days=30) == 1
+        assert svc._indexed_months("id", [old.id]) == {}
+        svc.close()
+
+    def test_compaction_builds_outside_flush_lock(self, temp_data_dir):
+        svc = ReceiptService(data_dir=temp_data_dir, write_behind=False, hot_months=1)
+        wait_for_maintenance(svc)
+        svc._schedule_maintenance = lambda: None  # only the compaction below builds
+        first = svc.create(self._backdated("first", 100))
+        late = self._backdated("late", 100)
+        build = svc._build_archive
+        held = []
+
+        def build_with_late_write(month, *args):
+            held.append(svc._flush_lock.locked())
+            if len(held) == 1:
+                svc.create(late)  # lands while the first build is running
+            return build(month, *args)
+
+        svc._build_archive = build_with_late_write
+        svc.compact_partitions()
+        assert held == [False, False]  # the stale first build was redone
+        assert self._files(temp_data_dir) == [f"receipts-{first.timestamp[:7]}.db.gz"]
+        assert svc.get(first.id) is not None and svc.get(late.id) is not None
+        svc.close()
+
+    def test_legacy_database_is_split_by_month(self, temp_data_dir):
+        import sqlite3
+        conn = sqlite3.connect(os.path.join(temp_data_dir, "receipts.db"))
+        conn.executescript(ReceiptService.CREATE_TABLE_SQL)
+        rows = [self._backdated(f"legacy_{days}", days) for days in (0, 45)]
+        for r in rows:
+            conn.execute(ReceiptService.INSERT_SQL, ReceiptService._insert_params(r))
+        conn.commit()
+        conn.close()
+
+        svc = ReceiptService(data_dir=temp_data_dir, write_behind=False, hot_months=12)
+        assert [r.id for r in svc.list()] == [r.id for r in rows]
+        assert self._files(temp_data_dir) == sorted({f"receipts-{r.timestamp[:7]}.db" for r in rows})
+        assert svc.get_stats()["total_receipts"] == 2
+        svc.close()
+
+    def test_legacy_migration_runs_in_background(self, temp_data_dir, monkeypatch):
+        import sqlite3
+        conn = sqlite3.connect(os.path.join(temp_data_dir, "receipts.db"))
+        conn.executescript(ReceiptService.CREATE_TABLE_SQL)
+        legacy = self._backdated("legacy", 0)
+        conn.execute(ReceiptService.INSERT_SQL, ReceiptService._insert_params(legacy))
+        conn.commit()
+        conn.close()
+
+        gate = threading.Event()
+        migrate = ReceiptService._migrate_legacy
+        monkeypatch.setattr(ReceiptService, "_migrate_legacy", lambda self: gate.wait(10) and migrate(self))
+        svc = ReceiptService(data_dir=temp_data_dir, write_behind=False, hot_months=12)
+        assert svc._migrating and not svc._ready.is_set()
+
+        # Writes go ahead: an update to a row not copied yet wins over the copy
+        svc.update(legacy.complete({"ok": True}, duration_ms=5))
+        with pytest.raises(sqlite3.IntegrityError):
+            svc.create(Receipt.from_dict(legacy.to_dict()))
+        gate.set()
+
+        assert svc.get(legacy.id).outputs == {"ok": True}
+        assert [r.status for r in svc.list()] == [ReceiptStatus.SUCCESS.value]
+        assert not os.path.exists(os.path.join(temp_data_dir, "receipts.db"))
+        svc.close()
+
+
 class TestThreadSafety:
     """Tests for thread-safe operation."""
 
@@ -430,6 +793,105 @@ class TestThreadSafety:
         assert len(write_results) == 10
 
 
+class TestWriteBehind:
+    """Tests for batched write-behind persistence."""
+
+    @pytest.fixture
+    def wb_service(self, temp_data_dir):
+        svc = ReceiptService(
+            data_dir=temp_data_dir, write_behind=True,
+            batch_size=50, flush_interval_ms=60000, max_pending=200,
+        )
+        yield svc
+        svc.close()
+
+    def _count_rows(self, data_dir):
+        import glob
+        import sqlite3
+        total = 0
+        for path in glob.glob(os.path.join(data_dir, "receipts", "receipts-*.db")):
+            conn = sqlite3.connect(path)
+            try:
+                total += conn.execute("SELECT COUNT(*) FROM receipts").fetchone()[0]
+            except sqlite3.OperationalError:
+                pass  # the writer created the file but not yet its schema
+            finally:
+                conn.close()
+        return total
+
+    def test_get_reads_own_pending_writes(self, wb_service, temp_data_dir):
+        """get() sees a receipt before it reaches SQLite."""
+        receipt = create_receipt(ActionType.TOOL_CALL, "pending", {"a": 1})
+        wb_service.create(receipt)
+        assert self._count_rows(temp_data_dir) == 0
+        assert wb_service.get(receipt.id).action_name == "pending"
+
+    def test_create_then_update_collapses_to_insert(self, wb_service, temp_data_dir):
+        """A completed receipt is written once, with its final state."""
+        receipt = wb_service.create(create_receipt(ActionType.TOOL_CALL, "op", {}))
+        wb_service.update(receipt.complete({"ok": True}, duration_ms=12))
+        assert wb_service.get(receipt.id).status == ReceiptStatus.SUCCESS.value
+        assert wb_service.flush() == 1
+        stored = wb_service.get(receipt.id)
+        assert stored.status == ReceiptStatus.SUCCESS.value
+        assert stored.outputs == {"ok": True}
+
+    def test_snapshot_isolated_from_caller_mutation(self, wb_service):
+        receipt = wb_service.create(create_receipt(ActionType.TOOL_CALL, "op", {}))
+        receipt.metadata["late"] = True
+        assert "late" not in wb_service.get(receipt.id).metadata
+
+    def test_queries_flush_first(self, wb_service):
+        for i in range(5):
+            wb_service.create(create_receipt(ActionType.SYSTEM, f"q_{i}", {}))
+        assert len(wb_service.list(limit=10)) == 5
+        assert wb_service.get_stats()["total_receipts"] == 5
+
+    def test_batch_size_triggers_background_flush(self, wb_service, temp_data_dir):
+        for i in range(50):
+            wb_service.create(create_receipt(ActionType.SYSTEM, f"b_{i}", {}))
+        deadline = time.time() + 5
+        while self._count_rows(temp_data_dir) < 50 and time.time() < deadline:
+            time.sleep(0.01)
+        assert self._count_rows(temp_data_dir) == 50
+
+    def test_max_pending_bounds_buffer(self, temp_data_dir):
+        svc = ReceiptService(
+            data_dir=temp_data_dir, write_behind=True,
+            batch_size=10, flush_interval_ms=60000, max_pending=10,
+        )
+        for i in range(25):
+            svc.create(create_receipt(ActionType.SYSTEM, f"m_{i}", {}))
+            assert len(svc._pending) < 10  # producer flushes inline at the cap
+        svc.close()
+        assert self._count_rows(temp_data_dir) == 25
+
+    def test_close_flushes_durably(self, temp_data_dir):
+        svc = ReceiptService(data_dir=temp_data_dir, write_behind=True, flush_interval_ms=60000)
+        ids = [svc.create(create_receipt(ActionType.SYSTEM, f"c_{i}", {})).id for i in range(7)]
+        svc.close()
+        assert self._count_rows(temp_data_dir) == 7
+        reopened = ReceiptService(data_dir=temp_data_dir, write_behind=False)
+        assert all(reopened.get(i) is not None for i in ids)
+        reopened.close()
+
+    def test_duplicate_create_raises(self, wb_service):
+        receipt = wb_service.create(create_receipt(ActionType.SYSTEM, "dup", {}))
+        with pytest.raises(sqlite3.IntegrityError):
+            wb_service.create(receipt)  # still buffered
+        wb_service.flush()
+        with pytest.raises(sqlite3.IntegrityError):
+            wb_service.create(receipt)  # already stored
+
+    def test_duplicate_id_does_not_sink_batch(self, wb_service):
+        first = wb_service.create(create_receipt(ActionType.SYSTEM, "dup", {}))
+        wb_service.flush()
+        other = wb_service.create(create_receipt(ActionType.SYSTEM, "other", {}))
+        wb_service._enqueue(first, "insert")
+        wb_service.flush()
+        assert wb_service.get(other.id) is not None
+
+
 class TestReceiptFactoryFunction:
     """Tests for the create_receipt helper function."""
 
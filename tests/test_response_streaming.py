@@ -0,0 +1,336 @@
+"""
+Lancelot — Response Streaming Tests
+====================================
+Tests for streamed LLM generation: the ProviderClient stream fallback,
+OpenAI-style chunk assembly, the local model SSE stream, the
+ResponseStreamEmitter's delta coalescing, and the Telegram live preview.
+All provider and Telegram calls are mocked.
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+
+from providers.base import GenerateResult, ProviderClient, StreamDelta, ToolCall
+from providers.streaming import iter_openai_stream
+from toolflow.response_stream import ResponseStreamEmitter
+from toolflow.telegram_stream import TelegramStreamBridge
+from src.core.local_model_client import LocalModelClient
+
+
+def _run(coro):
+    """Helper to run an async coroutine synchronously."""
+    return asyncio.new_event_loop().run_until_complete(coro)
+
+
+class _FakeProvider(ProviderClient):
+    """Minimal provider with canned non-streaming results."""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    @property
+    def provider_name(self):
+        return "fake"
+
+    def generate(self, model, messages, system_instruction="", config=None):
+        self.calls.append("generate")
+        return self.result
+
+    def generate_with_tools(self, model, messages, system_instruction, tools,
+                            tool_config=None, config=None):
+        self.calls.append("generate_with_tools")
+        return self.result
+
+    def build_tool_response_message(self, tool_results):
+        return []
+
+    def build_user_message(self, text, images=None):
+        return {"role": "user", "content": text}
+
+    def list_models(self):
+        return []
+
+    def validate_model(self, model_id):
+        return True
+
+
+def _chunk(content=None, tool_calls=None, usage=None):
+    """Build an OpenAI chat.completion.chunk dict."""
+    chunk = {"choices": [{"delta": {}}] if (content or tool_calls) else []}
+    if content:
+        chunk["choices"][0]["delta"]["content"] = content
+    if tool_calls:
+        chunk["choices"][0]["delta"]["tool_calls"] = tool_calls
+    if usage:
+        chunk["usage"] = usage
+    return chunk
+
+
+# ---------------------------------------------------------------------------
+# ProviderClient.stream fallback
+# ---------------------------------------------------------------------------
+
+class TestProviderStreamFallback:
+
+    def test_text_then_done(self):
+        result = GenerateResult(text="Hello there")
+        provider = _FakeProvider(result)
+        deltas = list(provider.stream(model="m", messages=[]))
+        assert [d.kind for d in deltas] == ["text", "done"]
+        assert deltas[0].text == "Hello there"
+        assert deltas[-1].result is result
+        assert provider.calls == ["generate"]
+
+    def test_tools_use_generate_with_tools(self):
+        result = GenerateResult(tool_calls=[ToolCall(name="search", args={"q": "x"}, id="c1")])
+        provider = _FakeProvider(result)
+        deltas = list(provider.stream(model="m", messages=[], tools=["decl"]))
+        assert provider.calls == ["generate_with_tools"]
+        assert deltas[0].kind == "tool_call"
+        assert deltas[0].tool_name == "search"
+        assert deltas[0].tool_call_id == "c1"
+        assert deltas[-1].result is result
+
+    def test_astream_yields_same_deltas(self):
+        provider = _FakeProvider(GenerateResult(text="hi"))
+
+        async def collect():
+            return [d async for d in provider.astream(model="m", messages=[])]
+
+        deltas = _run(collect())
+        assert [d.kind for d in deltas] == ["text", "done"]
+
+    def test_astream_propagates_errors(self):
+        provider = _FakeProvider(None)
+        provider.generate = MagicMock(side_effect=RuntimeError("boom"))
+
+        async def collect():
+            return [d async for d in provider.astream(model="m", messages=[])]
+
+        with pytest.raises(RuntimeError, match="boom"):
+            _run(collect())
+
+
+# ---------------------------------------------------------------------------
+# OpenAI-style chunk assembly
+# ---------------------------------------------------------------------------
+
+class TestIterOpenAIStream:
+
+    def test_text_deltas_and_result(self):
+        chunks = [
+            _chunk("Hel"),
+            _chunk("lo"),
+            _chunk(usage={"prompt_tokens": 12, "completion_tokens": 3}),
+        ]
+        deltas = list(iter_openai_stream(chunks))
+        assert [d.text for d in deltas if d.kind == "text"] == ["Hel", "lo"]
+        result = deltas[-1].result
+        assert deltas[-1].kind == "done"
+        assert result.text == "Hello"
+        assert result.usage["input_tokens"] == 12
+        assert result.usage["output_tokens"] == 3
+        assert result.raw == {"role": "assistant", "content": "Hello"}
+
+    def test_tool_call_fragments_assembled(self):
+        chunks = [
+            _chunk(tool_calls=[{"index": 0, "id": "call_1",
+                                "function": {"name": "web_search", "arguments": '{"que'}}]),
+            _chunk(tool_calls=[{"index": 0, "function": {"arguments": 'ry": "rust"}'}}]),
+            _chunk(tool_calls=[{"index": 1, "id": "call_2",
+                                "function": {"name": "read_file", "arguments": "{}"}}]),
+        ]
+        deltas = list(iter_openai_stream(chunks))
+        result = deltas[-1].result
+        assert [tc.name for tc in result.tool_calls] == ["web_search", "read_file"]
+        assert result.tool_calls[0].args == {"query": "rust"}
+        assert result.tool_calls[0].id == "call_1"
+        assert result.text is None
+        # raw is a replayable assistant message
+        assert result.raw["tool_calls"][0]["function"]["arguments"] == '{"query": "rust"}'
+        assert result.raw["tool_calls"][1]["id"] == "call_2"
+
+    def test_malformed_arguments_kept_raw(self):
+        chunks = [_chunk(tool_calls=[{"index": 0, "id": "c",
+                                      "function": {"name": "fn", "arguments": "not-json"}}])]
+        result = list(iter_openai_stream(chunks))[-1].result
+        assert result.tool_calls[0].args == {"raw": "not-json"}
+
+    def test_sdk_objects_supported(self):
+        delta = MagicMock(content="ok", tool_calls=None)
+        chunk = MagicMock(usage=None, choices=[MagicMock(delta=delta)])
+        result = list(iter_openai_stream([chunk]))[-1].result
+        assert result.text == "ok"
+
+
+# ---------------------------------------------------------------------------
+# LocalModelClient.chat_with_tools_stream
+# ---------------------------------------------------------------------------
+
+class TestLocalModelStream:
+
+    @patch("src.core.http_transport.urlopen")
+    def test_parses_sse_lines(self, mock_open):
+        lines = [
+            b'data: {"choices": [{"delta": {"content": "Hi"}}]}\n',
+            b"\n",
+            b": keep-alive\n",
+            b'data: {"choices": [{"delta": {"content": " there"}}]}\n',
+            b"data: [DONE]\n",
+            b'data: {"choices": [{"delta": {"content": "ignored"}}]}\n',
+        ]
+        resp = MagicMock()
+        resp.__enter__ = MagicMock(return_value=resp)
+        resp.__exit__ = MagicMock(return_value=False)
+        resp.__iter__ = MagicMock(return_value=iter(lines))
+        mock_open.return_value = resp
+
+        client = LocalModelClient(base_url="http://test:8080")
+        chunks = list(client.chat_with_tools_stream([{"role": "user", "content": "hello"}]))
+        assert len(chunks) == 2
+
+        payload = json.loads(mock_open.call_args[0][0].data)
+        assert payload["stream"] is True
+
+        result = list(iter_openai_stream(chunks))[-1].result
+        assert result.text == "Hi there"
+
+
+# ---------------------------------------------------------------------------
+# ResponseStreamEmitter
+# ---------------------------------------------------------------------------
+
+def _published(bus):
+    return [(c.args[0].type, c.args[0].payload) for c in bus.publish_sync.call_args_list]
+
+
+class TestResponseStreamEmitter:
+
+    def test_lifecycle_events(self):
+        bus = MagicMock()
+        emitter = ResponseStreamEmitter(bus, flush_interval=0)
+        emitter.stream_started("q1", "warroom")
+        emitter.delta("q1", "Hello")
+        emitter.stream_end("q1")
+        events = _published(bus)
+        assert [t for t, _ in events] == ["chat.stream_started", "chat.delta", "chat.stream_end"]
+        assert events[1][1] == {"stream_id": "q1", "channel": "warroom", "seq": 1, "text": "Hello"}
+
+    def test_deltas_coalesced_within_interval(self):
+        bus = MagicMock()
+        emitter = ResponseStreamEmitter(bus, flush_interval=60)
+        emitter.stream_started("q1")
+        for token in ("a", "b", "c"):
+            emitter.delta("q1", token)
+        # Nothing flushed yet — all three are buffered
+        assert [t for t, _ in _published(bus)] == ["chat.stream_started"]
+        emitter.stream_end("q1")
+        events = _published(bus)
+        assert events[1] == ("chat.delta", {"stream_id": "q1", "channel": "api", "seq": 1, "text": "abc"})
+        assert events[2][0] == "chat.stream_end"
+        assert events[2][1]["seq"] == 2
+
+    def test_reset_drops_buffer(self):
+        bus = MagicMock()
+        emitter = ResponseStreamEmitter(bus, flush_interval=60)
+        emitter.stream_started("q1")
+        emitter.delta("q1", "Let me check")
+        emitter.reset("q1")
+        emitter.stream_end("q1")
+        types = [t for t, _ in _published(bus)]
+        assert types == ["chat.stream_started", "chat.stream_reset", "chat.stream_end"]
+
+    def test_unknown_stream_ignored(self):
+        bus = MagicMock()
+        emitter = ResponseStreamEmitter(bus, flush_interval=0)
+        emitter.delta("nope", "x")
+        emitter.reset("nope")
+        emitter.stream_end("nope")
+        bus.publish_sync.assert_not_called()
+
+    def test_disabled_is_noop(self):
+        bus = MagicMock()
+        emitter = ResponseStreamEmitter(bus, enabled=False)
+        emitter.stream_started("q1")
+        emitter.delta("q1", "x")
+        emitter.stream_end("q1")
+        bus.publish_sync.assert_not_called()
+
+    def test_bus_errors_swallowed(self):
+        bus = MagicMock()
+        bus.publish_sync.side_effect = RuntimeError("no loop")
+        emitter = ResponseStreamEmitter(bus, flush_interval=0)
+        emitter.stream_started("q1")
+        emitter.delta("q1", "x")  # Should not raise
+
+
+# ---------------------------------------------------------------------------
+# TelegramStreamBridge
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def mock_bot():
+    bot = MagicMock()
+    bot.chat_id = "999888"
+    bot.send_message_with_keyboard = MagicMock(return_value=42)
+    bot.edit_message = MagicMock(return_value=True)
+    bot.delete_message = MagicMock(return_value=True)
+    return bot
+
+
+def _event(event_type, stream_id="q1", **payload):
+    event = MagicMock()
+    event.type = event_type
+    event.payload = {"stream_id": stream_id, **payload}
+    return event
+
+
+class TestTelegramStreamBridge:
+
+    def test_preview_sent_edited_and_deleted(self, mock_bot):
+        bridge = TelegramStreamBridge(mock_bot, edit_interval=0)
+
+        async def scenario():
+            await bridge.on_stream_event(_event("chat.stream_started", channel="telegram"))
+            await bridge.on_stream_event(_event("chat.delta", text="Hello"))
+            await bridge.on_stream_event(_event("chat.delta", text=" world"))
+            await bridge.on_stream_event(_event("chat.stream_end"))
+
+        _run(scenario())
+        sent_text = mock_bot.send_message_with_keyboard.call_args[0][0]
+        assert sent_text.startswith("Hello")
+        edited_text = mock_bot.edit_message.call_args[0][1]
+        assert edited_text.startswith("Hello world")
+        mock_bot.delete_message.assert_called_once_with(42, chat_id="999888")
+
+    def test_edits_throttled(self, mock_bot):
+        bridge = TelegramStreamBridge(mock_bot, edit_interval=60)
+
+        async def scenario():
+            await bridge.on_stream_event(_event("chat.stream_started", channel="telegram"))
+            for token in ("a", "b", "c"):
+                await bridge.on_stream_event(_event("chat.delta", text=token))
+
+        _run(scenario())
+        assert mock_bot.send_message_with_keyboard.call_count == 1
+        mock_bot.edit_message.assert_not_called()
+
+    def test_other_channels_ignored(self, mock_bot):
+        bridge = TelegramStreamBridge(mock_bot, edit_interval=0)
+
+        async def scenario():
+            await bridge.on_stream_event(_event("chat.stream_started", channel="warroom"))
+            await bridge.on_stream_event(_event("chat.delta", text="Hello"))
+            await bridge.on_stream_event(_event("chat.stream_end"))
+
+        _run(scenario())
+        mock_bot.send_message_with_keyboard.assert_not_called()
+        mock_bot.delete_message.assert_not_called()
+
+    def test_preview_escaped_and_truncated(self):
+        text = TelegramStreamBridge._preview_text("<b>" + "x" * 5000)
+        assert text.startswith("&lt;b&gt;")
+        assert len(text) < 4096
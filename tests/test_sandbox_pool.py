@@ -0,0 +1,230 @@
+"""
+Tests for SandboxPool — warm container reuse, health checks, idle eviction,
+recycling and reset, exercised through the ProcessRuntime stub so they run
+without Docker.
+"""
+
+import time
+
+import pytest
+
+from src.core.skills.executor import SkillExecutor, SkillContext
+from src.core.skills.registry import SkillEntry, SkillOwnership
+from src.tools.providers.local_sandbox import DockerRunValidator, LocalSandboxProvider, SandboxConfig
+from src.tools.sandbox_pool import (
+    ContainerSpec,
+    DockerCLIRuntime,
+    ProcessRuntime,
+    SandboxPool,
+    SandboxStartError,
+)
+
+
+class CountingRuntime(ProcessRuntime):
+    def __init__(self):
+        super().__init__()
+        self.starts = 0
+        self.removed = []
+
+    def start(self, spec):
+        self.starts += 1
+        return super().start(spec)
+
+    def remove(self, container_id):
+        self.removed.append(container_id)
+        super().remove(container_id)
+
+
+@pytest.fixture
+def runtime():
+    return CountingRuntime()
+
+
+@pytest.fixture
+def spec(tmp_path):
+    return ContainerSpec(
+        image="python:3.11-slim",
+        mounts=((str(tmp_path), "/workspace", "rw"),),
+        workdir="/workspace",
+    )
+
+
+class TestReuse:
+    def test_second_command_reuses_container(self, runtime, spec):
+        pool = SandboxPool(runtime)
+        first = pool.run(spec, ["sh", "-c", "echo one"])
+        second = pool.run(spec, ["sh", "-c", "echo two"])
+        assert (first.stdout, second.stdout) == ("one\n", "two\n")
+        assert not first.reused and second.reused
+        assert runtime.starts == 1
+
+    def test_workdir_and_mount_mapping(self, runtime, spec, tmp_path):
+        (tmp_path / "data.txt").write_text("hello")
+        pool = SandboxPool(runtime)
+        result = pool.run(spec, ["sh", "-c", "cat data.txt && cat /workspace/data.txt"])
+        assert result.stdout == "hellohello"
+
+    def test_stdin_and_env(self, runtime, spec):
+        pool = SandboxPool(runtime)
+        result = pool.run(spec, ["sh", "-c", 'cat; echo "$GREETING"'], stdin="in\n", env={"GREETING": "hi"})
+        assert result.stdout == "in\nhi\n"
+
+    def test_specs_do_not_share_containers(self, runtime, spec, tmp_path):
+        other = tmp_path / "other"
+        other.mkdir()
+        pool = SandboxPool(runtime)
+        pool.run(spec, ["true"])
+        pool.run(ContainerSpec(image=spec.image, mounts=((str(other), "/workspace", "rw"),)), ["true"])
+        assert runtime.starts == 2
+        assert pool.stats()["warm"] == 2
+
+
+class TestHygiene:
+    def test_reset_clears_tmp_between_commands(self, runtime, spec):
+        pool = SandboxPool(runtime)
+        pool.run(spec, ["sh", "-c", "echo secret > /tmp/leftover"])
+        result = pool.run(spec, ["sh", "-c", "ls -A /tmp"])
+        assert result.reused
+        assert result.stdout == ""
+
+    def test_reset_clears_home_and_runs_reset_command(self, runtime, spec, tmp_path):
+        spec = ContainerSpec(image=spec.image, mounts=spec.mounts, workdir=spec.workdir,
+                             reset_command="echo reset >> /workspace/log")
+        pool = SandboxPool(runtime)
+        pool.run(spec, ["sh", "-c", 'echo secret > "$HOME/.netrc" && echo x > /dev/shm/seg'])
+        assert (tmp_path / "log").read_text() == "reset\n"
+        result = pool.run(spec, ["sh", "-c", 'ls -A "$HOME"; ls -A /dev/shm'])
+        assert result.reused
+        assert result.stdout == ""
+
+    def test_background_process_does_not_survive(self, runtime, spec):
+        pool = SandboxPool(runtime)
+        first = pool.run(spec, ["sh", "-c", "sleep 30 >/dev/null 2>&1 & echo $!"])
+        pid = int(first.stdout)
+        result = pool.run(spec, ["true"])
+        assert result.reused
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                state = f.read().rsplit(")", 1)[1].split()[0]
+        except FileNotFoundError:
+            state = None
+        assert state in (None, "Z")  # gone, or killed and awaiting reaping
+
+    def test_recycle_after_max_commands(self, runtime, spec):
+        pool = SandboxPool(runtime, max_commands=2)
+        for _ in range(5):
+            pool.run(spec, ["true"])
+        assert runtime.starts == 3
+        assert pool.stats()["recycled"] == 2
+
+    def test_timeout_discards_container(self, runtime, spec):
+        pool = SandboxPool(runtime)
+        result = pool.run(spec, ["sleep", "5"], timeout_s=0.2)
+        assert result.timed_out and result.exit_code == 124
+        assert pool.stats()["warm"] == 0
+        assert not pool.run(spec, ["true"]).reused
+
+    def test_dead_container_replaced_on_health_check(self, runtime, spec):
+        pool = SandboxPool(runtime, health_check_interval_s=0)
+        pool.run(spec, ["true"])
+        container_id = pool._idle[spec][0].container_id
+        runtime.kill(container_id)
+        result = pool.run(spec, ["sh", "-c", "echo ok"])
+        assert result.stdout == "ok\n" and not result.reused
+        assert pool.stats()["unhealthy"] == 1
+
+    def test_idle_eviction(self, runtime, spec):
+        pool = SandboxPool(runtime, idle_ttl_s=0.05)
+        pool.run(spec, ["true"])
+        time.sleep(0.1)
+        assert pool.evict_idle() == 1
+        assert pool.stats()["warm"] == 0
+        assert len(runtime.removed) == 1
+
+
+class TestBounds:
+    def test_full_pool_evicts_oldest_idle(self, runtime, spec, tmp_path):
+        pool = SandboxPool(runtime, max_containers=1)
+        pool.run(spec, ["true"])
+        other = ContainerSpec(image=spec.image, mounts=((str(tmp_path), "/other", "rw"),))
+        pool.run(other, ["true"])
+        assert pool.stats()["warm"] == 1
+        assert other in pool._idle
+
+    def test_overflow_runs_one_off_container(self, runtime, spec):
+        pool = SandboxPool(runtime, max_containers=1)
+        held, _ = pool._acquire(spec)
+        result = pool.run(spec, ["sh", "-c", "echo extra"])
+        assert result.stdout == "extra\n"
+        assert pool.stats()["overflow"] == 1
+        pool._release(held, healthy=True)
+        assert pool.stats()["warm"] == 1 and pool.stats()["busy"] == 0
+
+    def test_start_failure_propagates(self, spec):
+        class Broken(ProcessRuntime):
+            def start(self, spec):
+                raise SandboxStartError("no docker")
+
+        pool = SandboxPool(Broken())
+        with pytest.raises(SandboxStartError):
+            pool.run(spec, ["true"])
+        assert pool.stats()["busy"] == 0
+
+    def test_close_removes_warm_containers(self, runtime, spec):
+        pool = SandboxPool(runtime)
+        pool.run(spec, ["true"])
+        pool.close()
+        assert pool.stats()["warm"] == 0
+        assert len(runtime.removed) == 1
+
+
+class TestDockerCLIRuntime:
+    def test_start_command_passes_validator(self, spec):
+        cmd = DockerCLIRuntime().build_start_command(spec)
+        assert DockerRunValidator.validate(cmd) is None
+        assert DockerRunValidator._extract_image(cmd) == "python:3.11-slim"
+        assert "--network=none" in cmd
+        assert "--read-only" in cmd
+        assert "--tmpfs=/home/sandbox:rw,exec,size=64m" in cmd
+        assert "--env=HOME=/home/sandbox" in cmd
+        assert cmd[-2:] == ["sleep", "infinity"]
+
+
+class TestIntegration:
+    def test_local_sandbox_runs_through_pool(self, tmp_path):
+        pool = SandboxPool(ProcessRuntime())
+        provider = LocalSandboxProvider(config=SandboxConfig(), pool=pool)
+        provider._docker_available = True
+        first = provider.run("echo $NAME > out.txt && cat out.txt", str(tmp_path), env={"NAME": "lancelot"})
+        second = provider.run("cat out.txt", str(tmp_path))
+        assert first.exit_code == 0 and first.stdout == "lancelot\n"
+        assert second.stdout == "lancelot\n"
+        assert pool.stats()["started"] == 1
+
+    def test_local_sandbox_pool_disabled(self):
+        provider = LocalSandboxProvider(config=SandboxConfig(warm_pool_size=0))
+        assert provider._pool is None
+
+    def test_skill_executor_reuses_container(self, tmp_path):
+        skill_dir = tmp_path / "echo_skill"
+        skill_dir.mkdir()
+        (skill_dir / "skill.yaml").write_text("name: echo_skill\n")
+        (skill_dir / "execute.py").write_text(
+            "def execute(context, inputs):\n"
+            "    return {'echo': inputs['text'], 'skill': context.skill_name}\n"
+        )
+        entry = SkillEntry(
+            name="echo_skill",
+            version="1.0.0",
+            enabled=True,
+            ownership=SkillOwnership.USER,
+            manifest_path=str(skill_dir / "skill.yaml"),
+        )
+        pool = SandboxPool(ProcessRuntime())
+        executor = SkillExecutor(registry=None, sandbox_pool=pool)
+        for text in ("a", "b"):
+            result = executor._run_skill_in_sandbox(entry, SkillContext(skill_name="echo_skill"), {"text": text})
+            assert result.success, result.error
+            assert result.outputs == {"echo": text, "skill": "echo_skill"}
+        assert pool.stats()["started"] == 1
+        assert pool.stats()["reused"] == 1
@@ -2,12 +2,18 @@
 Tests for src.core.scheduler.executor — Job execution pipeline (Prompt 13 / D4-D6).
 """
 
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
 import pytest
 import yaml
-from pathlib import Path
 
 from src.core.scheduler.service import SchedulerService
-from src.core.scheduler.executor import JobExecutor, Gate, JobExecutionResult
+from src.core.scheduler.executor import (
+    JobExecutor, Gate, JobExecutionResult, _cron_matches, _next_cron_fire,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -230,3 +236,124 @@ class TestJobNotFound:
         result = executor.execute_job("nonexistent")
         assert result.skipped is True
         assert "not found" in result.skip_reason.lower()
+
+
+# ===================================================================
+# Next-fire-time scheduling
+# ===================================================================
+
+def _utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+class TestNextCronFire:
+
+    def test_same_minute_is_included(self):
+        start = _utc(2025, 3, 3, 9, 0)
+        assert _next_cron_fire("0 9 * * *", start, timezone.utc) == start
+
+    def test_seconds_round_up(self):
+        assert _next_cron_fire("* * * * *", _utc(2025, 1, 1, 0, 0, 5), timezone.utc) == _utc(2025, 1, 1, 0, 1)
+
+    def test_rolls_to_matching_weekday(self):
+        # 2025-03-01 is a Saturday; "1-5" is Mon-Fri
+        fire = _next_cron_fire("30 8 * * 1-5", _utc(2025, 3, 1, 12, 0), timezone.utc)
+        assert fire == _utc(2025, 3, 3, 8, 30)
+
+    def test_timezone_aware(self):
+        tz = ZoneInfo("America/New_York")
+        fire = _next_cron_fire("0 9 * * *", _utc(2025, 1, 15, 0, 0), tz)
+        assert fire == _utc(2025, 1, 15, 14, 0)
+
+    def test_spring_forward_gap_is_skipped(self):
+        tz = ZoneInfo("America/New_York")
+        # 02:30 does not exist on 2025-03-09
+        fire = _next_cron_fire("30 2 * * *", _utc(2025, 3, 9, 5, 0), tz)
+        assert fire.astimezone(tz).date().day == 10
+
+    def test_agrees_with_matcher(self):
+        start = _utc(2025, 6, 1, 23, 59)
+        for expr in ("15,45 * * * *", "0 0 1 * *", "5 4 * * 0", "0-10 12 * 6 *"):
+            fire = _next_cron_fire(expr, start, timezone.utc)
+            if fire is None:
+                continue
+            assert _cron_matches(expr, fire)
+            probe = start
+            while probe < fire:
+                assert not _cron_matches(expr, probe)
+                probe += timedelta(minutes=1)
+
+    def test_impossible_date_gives_none(self):
+        assert _next_cron_fire("0 0 31 2 *", _utc(2025, 1, 1), timezone.utc) is None
+
+
+class TestSchedule:
+
+    def _executor(self, service, calls, **kwargs):
+        return JobExecutor(
+            service, skill_execute_fn=lambda name, inputs: calls.append(name), **kwargs,
+        )
+
+    def test_never_run_interval_job_is_due_now(self, service):
+        executor = self._executor(service, [])
+        executor._resync()
+        fire_at = executor.next_fire_times["test_job"]
+        assert fire_at <= datetime.now(timezone.utc)
+
+    def test_tick_runs_due_job_and_books_next(self, service):
+        calls = []
+        executor = self._executor(service, calls)
+        executor._resync()
+        executor._tick()
+        assert calls == ["echo"]
+        # run_now notified the executor: next fire is last run + interval
+        last = datetime.fromisoformat(service.get_job("test_job").last_run_at)
+        assert executor.next_fire_times["test_job"] == last + timedelta(seconds=60)
+        executor._tick()
+        assert calls == ["echo"]
+
+    def test_changes_recompute_only_that_job(self, service):
+        executor = self._executor(service, [])
+        executor._resync()
+        service.create_job("nightly", "Nightly", "echo", "cron", "0 3 * * *")
+        assert "nightly" in executor.next_fire_times
+        assert executor.next_fire_times["nightly"].minute == 0
+
+        service.update_job_timezone("nightly", "Asia/Tokyo")
+        assert executor.next_fire_times["nightly"].hour == 18  # 03:00 JST
+
+        service.disable_job("nightly")
+        assert "nightly" not in executor.next_fire_times
+        service.enable_job("nightly")
+        assert "nightly" in executor.next_fire_times
+        service.delete_job("nightly")
+        assert "nightly" not in executor.next_fire_times
+
+    def test_slow_job_does_not_block_others(self, tmp_path):
+        config_dir = _write_config(tmp_path, jobs=[
+            {"id": f"job_{i}", "name": f"Job {i}", "skill": "slow" if i == 0 else "fast",
+             "trigger": {"type": "interval", "seconds": 3600}, "requires_ready": False}
+            for i in range(3)
+        ])
+        svc = SchedulerService(data_dir=str(tmp_path / "data"), config_dir=config_dir)
+        svc.register_from_config()
+
+        release = threading.Event()
+        fast_done = threading.Event()
+        finished = []
+
+        def skill(name, inputs):
+            if name == "slow":
+                release.wait(5)
+            finished.append(name)
+            if finished.count("fast") == 2:
+                fast_done.set()
+
+        executor = JobExecutor(svc, skill_execute_fn=skill, max_concurrent_jobs=3)
+        executor.start_tick_loop()
+        try:
+            assert fast_done.wait(5)
+            assert "slow" not in finished
+        finally:
+            release.set()
+            executor.stop()
@@ -217,3 +217,43 @@ class TestPersistenceFile:
         (Path(data_dir) / "skills_registry.json").write_text("not json!", encoding="utf-8")
         reg = SkillRegistry(data_dir)
         assert reg.list_skills() == []
+
+
+# ===================================================================
+# Revision counter + change listeners
+# ===================================================================
+
+class TestRevisionAndListeners:
+
+    def test_revision_bumps_on_each_mutation(self, tmp_path):
+        reg = SkillRegistry(str(tmp_path / "data"))
+        assert reg.revision == 0
+        reg.install_skill(_write_skill_manifest(tmp_path))
+        reg.disable_skill("classify_intent")
+        reg.enable_skill("classify_intent")
+        reg.uninstall_skill("classify_intent")
+        assert reg.revision == 4
+
+    def test_listener_receives_events(self, tmp_path):
+        reg = SkillRegistry(str(tmp_path / "data"))
+        events = []
+        reg.add_change_listener(lambda event, name: events.append((event, name)))
+        reg.install_skill(_write_skill_manifest(tmp_path))
+        reg.enable_skill("classify_intent")
+        assert events == [("installed", "classify_intent"), ("enabled", "classify_intent")]
+
+    def test_failed_mutation_does_not_bump(self, tmp_path):
+        reg = SkillRegistry(str(tmp_path / "data"))
+        with pytest.raises(SkillError):
+            reg.enable_skill("nonexistent")
+        assert reg.revision == 0
+
+    def test_listener_error_is_swallowed(self, tmp_path):
+        reg = SkillRegistry(str(tmp_path / "data"))
+
+        def _boom(event, name):
+            raise RuntimeError("listener bug")
+
+        reg.add_change_listener(_boom)
+        reg.install_skill(_write_skill_manifest(tmp_path))
+        assert reg.get_skill("classify_intent") is not None
@@ -13,7 +13,9 @@ from src.core.soul.store import (
     list_versions,
     get_active_version,
     set_active_version,
+    add_change_listener,
 )
+import src.core.soul.store as soul_store
 
 
 # ---------------------------------------------------------------------------
@@ -107,6 +109,28 @@ class TestSetActiveVersion:
         # Versions list should be unchanged
         assert list_versions(soul_dir) == ["v1", "v2"]
 
+    def test_change_listener_notified(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(soul_store, "_change_listeners", [])
+        versions = {"v1": _soul_dict("v1"), "v2": _soul_dict("v2")}
+        soul_dir = _write_soul_dir(tmp_path, versions=versions, active="v1")
+        seen = []
+        add_change_listener(seen.append)
+        add_change_listener(seen.append)  # duplicate registration is ignored
+        set_active_version("v2", soul_dir)
+        assert seen == ["v2"]
+
+    def test_failing_listener_does_not_block_activation(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(soul_store, "_change_listeners", [])
+        versions = {"v1": _soul_dict("v1"), "v2": _soul_dict("v2")}
+        soul_dir = _write_soul_dir(tmp_path, versions=versions, active="v1")
+
+        def _boom(version):
+            raise RuntimeError("listener bug")
+
+        add_change_listener(_boom)
+        set_active_version("v2", soul_dir)
+        assert get_active_version(soul_dir) == "v2"
+
 
 # ===================================================================
 # Switching ACTIVE changes loaded soul
@@ -410,3 +410,129 @@ class TestReceiptServiceIntegration:
         # Check receipts were persisted
         all_receipts = receipt_svc.list()
         assert len(all_receipts) >= 2  # STEP_STARTED + STEP_COMPLETED
+
+
+# =========================================================================
+# Parallel Execution Tests
+# =========================================================================
+
+
+class _BarrierSkillExecutor(_FakeSkillExecutor):
+    """Skills block on a barrier, so the test only finishes if they overlap."""
+    def __init__(self, parties, results=None):
+        super().__init__(results)
+        import threading
+        self.barrier = threading.Barrier(parties, timeout=5)
+        self.lock = threading.Lock()
+
+    def run(self, skill_name, inputs):
+        with self.lock:
+            self.calls.append((skill_name, inputs))
+        if inputs.get("wait"):
+            self.barrier.wait()
+        return self.results.get(skill_name) or _FakeSkillResult(outputs={"echo": inputs})
+
+
+def _skill_step(step_id, skill="echo", deps=None, **inputs):
+    return TaskStep(step_id=step_id, type=StepType.SKILL_CALL.value,
+                    inputs={"skill_name": skill, **inputs}, dependencies=deps or [])
+
+
+class TestParallelExecution:
+    def test_independent_steps_run_concurrently(self, task_store):
+        """Ready steps overlap; the barrier would time out if run one at a time."""
+        executor = _BarrierSkillExecutor(parties=3)
+        runner = TaskRunner(task_store=task_store, skill_executor=executor, max_parallel=3)
+        steps = [_skill_step(f"s{i}", wait=True) for i in range(3)]
+        steps.append(_skill_step("join", deps=["s0", "s1", "s2"]))
+        graph, run = _make_graph_and_run(task_store, steps)
+
+        result = runner.run(run.id)
+        assert result.status == RunStatus.SUCCEEDED.value
+        assert result.step_results[-1].step_id == "join"
+        assert len(task_store.get_run(run.id).receipts_index) == 8
+
+    def test_max_parallel_one_is_sequential(self, task_store):
+        executor = _FakeSkillExecutor()
+        runner = TaskRunner(task_store=task_store, skill_executor=executor, max_parallel=1)
+        steps = [_skill_step("a", n=1), _skill_step("b", n=2), _skill_step("c", n=3)]
+        graph, run = _make_graph_and_run(task_store, steps)
+
+        result = runner.run(run.id)
+        assert [sr.step_id for sr in result.step_results] == ["a", "b", "c"]
+        assert [c[1]["n"] for c in executor.calls] == [1, 2, 3]
+
+    def test_failure_stops_scheduling(self, task_store):
+        """After a failure no new step starts; the run reports the failed step."""
+        executor = _FakeSkillExecutor(
+            results={"bad": _FakeSkillResult(success=False, error="Boom")}
+        )
+        runner = TaskRunner(task_store=task_store, skill_executor=executor, max_parallel=1)
+        steps = [
+            _skill_step("s1", skill="bad"),
+            _skill_step("s2", deps=["s1"]),
+            _skill_step("s3"),
+        ]
+        graph, run = _make_graph_and_run(task_store, steps)
+
+        result = runner.run(run.id)
+        assert result.status == RunStatus.FAILED.value
+        assert [sr.step_id for sr in result.step_results] == ["s1"]
+        persisted = task_store.get_run(run.id)
+        assert persisted.current_step_id == "s1"
+        assert "Boom" in persisted.last_error
+
+    def test_verifier_gates_dependents(self, task_store, token_store, minter):
+        """A step that fails verification never releases its dependents."""
+        class _RejectingVerifier:
+            def verify_step(self, goal, context):
+                class _R:
+                    success = False
+                    reason = "no"
+                return _R()
+
+        token = minter.mint_from_approval(scope="test", requires_verifier=True)
+        runner = TaskRunner(task_store=task_store, token_store=token_store, minter=minter,
+                            skill_executor=_FakeSkillExecutor(), verifier=_RejectingVerifier())
+        steps = [
+            TaskStep(step_id="s1", type=StepType.SKILL_CALL.value,
+                     inputs={"skill_name": "echo"}, acceptance_check="looks right"),
+            _skill_step("s2", deps=["s1"]),
+        ]
+        graph, run = _make_graph_and_run(task_store, steps, token_id=token.id)
+
+        result = runner.run(run.id)
+        assert result.status == RunStatus.FAILED.value
+        assert [sr.step_id for sr in result.step_results] == ["s1"]
+        assert "Verification failed" in task_store.get_run(run.id).last_error
+
+
+class TestResume:
+    def test_completed_steps_persisted(self, runner, task_store):
+        steps = [
+            TaskStep(step_id="s1", type=StepType.FILE_EDIT.value),
+            TaskStep(step_id="s2", type=StepType.COMMAND.value, dependencies=["s1"]),
+        ]
+        graph, run = _make_graph_and_run(task_store, steps)
+
+        runner.run(run.id)
+        assert task_store.get_run(run.id).completed_steps == ["s1", "s2"]
+
+    def test_interrupted_run_skips_completed_steps(self, task_store):
+        executor = _FakeSkillExecutor()
+        runner = TaskRunner(task_store=task_store, skill_executor=executor)
+        steps = [
+            _skill_step("s1", n=1),
+            _skill_step("s2", deps=["s1"], n=2),
+            _skill_step("s3", deps=["s2"], n=3),
+        ]
+        graph, run = _make_graph_and_run(task_store, steps)
+        # Simulate a crash after s1 completed
+        task_store.record_progress(run.id, RunStatus.RUNNING.value,
+                                   current_step="s2", completed_steps=["s1"])
+
+        result = runner.run(run.id)
+        assert result.status == RunStatus.SUCCEEDED.value
+        assert result.resumed_steps == ["s1"]
+        assert [c[1]["n"] for c in executor.calls] == [2, 3]
+        assert task_store.get_run(run.id).completed_steps == ["s1", "s2", "s3"]
@@ -8,6 +8,7 @@ All HTTP calls are mocked -- no real Telegram API requests are made.
 """
 
 import asyncio
+import threading
 import time
 import json
 import pytest
@@ -80,7 +81,7 @@ def _make_callback_update(data="ac:abcdef12:approve", chat_id="999888",
 class TestSendMessageWithKeyboard:
     """Tests for the send_message_with_keyboard method."""
 
-    @patch("telegram_bot.requests.post")
+    @patch("telegram_bot.requests.Session.post")
     def test_sends_with_keyboard_returns_message_id(self, mock_post, bot):
         """Should POST to sendMessage with reply_markup and return message_id."""
         mock_post.return_value = MagicMock(
@@ -98,7 +99,7 @@ class TestSendMessageWithKeyboard:
         assert payload["reply_markup"] == keyboard
         assert payload["text"] == "Test text"
 
-    @patch("telegram_bot.requests.post")
+    @patch("telegram_bot.requests.Session.post")
     def test_sends_without_keyboard(self, mock_post, bot):
         """Should work without a keyboard (for progress messages)."""
         mock_post.return_value = MagicMock(
@@ -111,7 +112,7 @@ class TestSendMessageWithKeyboard:
         payload = mock_post.call_args.kwargs.get("json") or mock_post.call_args[1].get("json")
         assert "reply_markup" not in payload
 
-    @patch("telegram_bot.requests.post")
+    @patch("telegram_bot.requests.Session.post")
     def test_returns_none_on_failure(self, mock_post, bot):
         """Should return None when both attempts fail."""
         mock_post.return_value = MagicMock(ok=False)
@@ -133,7 +134,7 @@ class TestSendMessageWithKeyboard:
 class TestEditMessage:
     """Tests for the edit_message method."""
 
-    @patch("telegram_bot.requests.post")
+    @patch("telegram_bot.requests.Session.post")
     def test_edits_message_successfully(self, mock_post, bot):
         """Should POST to editMessageText and return True."""
         mock_post.return_value = MagicMock(ok=True)
@@ -145,7 +146,7 @@ class TestEditMessage:
         assert payload["message_id"] == 42
         assert payload["text"] == "Updated text"
 
-    @patch("telegram_bot.requests.post")
+    @patch("telegram_bot.requests.Session.post")
     def test_edit_with_empty_keyboard(self, mock_post, bot):
         """Should include reply_markup when keyboard is provided (even empty)."""
         mock_post.return_value = MagicMock(ok=True)
@@ -154,7 +155,7 @@ class TestEditMessage:
         payload = mock_post.call_args.kwargs.get("json") or mock_post.call_args[1].get("json")
         assert payload["reply_markup"] == {"inline_keyboard": []}
 
-    @patch("telegram_bot.requests.post")
+    @patch("telegram_bot.requests.Session.post")
     def test_edit_not_modified_is_ok(self, mock_post, bot):
         """Telegram returns 400 when content is unchanged -- treat as success."""
         mock_post.return_value = MagicMock(
@@ -166,7 +167,7 @@ class TestEditMessage:
         result = bot.edit_message(42, "Same text")
         assert result is True
 
-    @patch("telegram_bot.requests.post")
+    @patch("telegram_bot.requests.Session.post")
     def test_edit_returns_false_on_error(self, mock_post, bot):
         """Should return False on actual errors."""
         mock_post.return_value = MagicMock(
@@ -185,7 +186,7 @@ class TestEditMessage:
 class TestAnswerCallbackQuery:
     """Tests for the answer_callback_query method."""
 
-    @patch("telegram_bot.requests.post")
+    @patch("telegram_bot.requests.Session.post")
     def test_answers_callback(self, mock_post, bot):
         """Should POST to answerCallbackQuery."""
         mock_post.return_value = MagicMock(ok=True)
@@ -196,7 +197,7 @@ class TestAnswerCallbackQuery:
         assert payload["callback_query_id"] == "cb-123"
         assert payload["text"] == "Approved!"
 
-    @patch("telegram_bot.requests.post")
+    @patch("telegram_bot.requests.Session.post")
     def test_answer_truncates_long_text(self, mock_post, bot):
         """Text should be truncated to 200 chars."""
         mock_post.return_value = MagicMock(ok=True)
@@ -213,7 +214,7 @@ class TestAnswerCallbackQuery:
 class TestHandleCallbackQuery:
     """Tests for ActionCard callback_query routing."""
 
-    @patch("telegram_bot.requests.post")
+    @patch("telegram_bot.requests.Session.post")
     def test_routes_to_resolver(self, mock_post, bot_with_resolver):
         """Should call resolver.resolve() with correct args."""
         mock_post.return_value = MagicMock(ok=True)
@@ -225,7 +226,7 @@ class TestHandleCallbackQuery:
             "abcdef12", "approve", channel="telegram"
         )
 
-    @patch("telegram_bot.requests.post")
+    @patch("telegram_bot.requests.Session.post")
     def test_answers_callback_after_resolve(self, mock_post, bot_with_resolver):
         """Should call answerCallbackQuery to stop the loading spinner."""
         mock_post.return_value = MagicMock(ok=True)
@@ -242,7 +243,7 @@ class TestHandleCallbackQuery:
         ]
         assert "cb-111" in methods_called
 
-    @patch("telegram_bot.requests.post")
+    @patch("telegram_bot.requests.Session.post")
     def test_edits_message_after_resolve(self, mock_post, bot_with_resolver):
         """Should edit the original message to show resolution status."""
         mock_post.return_value = MagicMock(ok=True)
@@ -257,7 +258,7 @@ class TestHandleCallbackQuery:
         ]
         assert len(edit_calls) >= 1
 
-    @patch("telegram_bot.requests.post")
+    @patch("telegram_bot.requests.Session.post")
     def test_security_gate_rejects_wrong_chat(self, mock_post, bot_with_resolver):
         """Should reject callbacks from unauthorized chats."""
         mock_post.return_value = MagicMock(ok=True)
@@ -269,7 +270,7 @@ class TestHandleCallbackQuery:
         # Resolver should NOT be called
         bot_with_resolver._action_card_resolver.resolve.assert_not_called()
 
-    @patch("telegram_bot.requests.post")
+    @patch("telegram_bot.requests.Session.post")
     def test_ignores_non_actioncard_callbacks(self, mock_post, bot_with_resolver):
         """Should skip callbacks not starting with 'ac:'."""
         mock_post.return_value = MagicMock(ok=True)
@@ -280,7 +281,7 @@ class TestHandleCallbackQuery:
 
         bot_with_resolver._action_card_resolver.resolve.assert_not_called()
 
-    @patch("telegram_bot.requests.post")
+    @patch("telegram_bot.requests.Session.post")
     def test_handles_malformed_callback_data(self, mock_post, bot_with_resolver):
         """Should handle callback_data with wrong number of parts."""
         mock_post.return_value = MagicMock(ok=True)
@@ -291,7 +292,7 @@ class TestHandleCallbackQuery:
 
         bot_with_resolver._action_card_resolver.resolve.assert_not_called()
 
-    @patch("telegram_bot.requests.post")
+    @patch("telegram_bot.requests.Session.post")
     def test_no_resolver_available(self, mock_post, bot):
         """Should handle missing resolver gracefully."""
         mock_post.return_value = MagicMock(ok=True)
@@ -309,7 +310,7 @@ class TestHandleCallbackQuery:
 class TestHandleUpdateRouting:
     """Tests that _handle_update correctly routes callback_query updates."""
 
-    @patch("telegram_bot.requests.post")
+    @patch("telegram_bot.requests.Session.post")
     def test_callback_query_routed(self, mock_post, bot_with_resolver):
         """callback_query updates should be routed to _handle_callback_query."""
         mock_post.return_value = MagicMock(ok=True)
@@ -320,7 +321,7 @@ class TestHandleUpdateRouting:
         # Resolver should have been called (proving callback was routed)
         bot_with_resolver._action_card_resolver.resolve.assert_called_once()
 
-    @patch("telegram_bot.requests.post")
+    @patch("telegram_bot.requests.Session.post")
     def test_callback_query_updates_offset(self, mock_post, bot_with_resolver):
         """callback_query should still advance the polling offset."""
         mock_post.return_value = MagicMock(ok=True)
@@ -331,6 +332,82 @@ class TestHandleUpdateRouting:
         assert bot_with_resolver._offset == 101  # update_id(100) + 1
 
 
+# ---------------------------------------------------------------------------
+# Dispatcher tests (fast callback lane, ordered chat lanes, offset tracking)
+# ---------------------------------------------------------------------------
+
+def _make_text_update(update_id, text, chat_id="999888"):
+    return {
+        "update_id": update_id,
+        "message": {
+            "chat": {"id": int(chat_id)},
+            "from": {"first_name": "Owner"},
+            "text": text,
+        },
+    }
+
+
+class TestDispatcher:
+    """Tests for _dispatch: lanes and the persisted offset low-water mark."""
+
+    @pytest.fixture
+    def dispatch_bot(self, bot_with_resolver, tmp_path, monkeypatch):
+        monkeypatch.setattr(TelegramBot, "_OFFSET_FILE", str(tmp_path / "offset.txt"))
+        bot_with_resolver.send_message = MagicMock()
+        bot_with_resolver.running = True
+        yield bot_with_resolver
+        bot_with_resolver.stop_polling()
+
+    @patch("telegram_bot.requests.Session.post")
+    def test_callback_not_blocked_by_chat_turn(self, mock_post, dispatch_bot, tmp_path):
+        """A button click resolves while a chat turn is still running."""
+        mock_post.return_value = MagicMock(ok=True)
+        release = threading.Event()
+        resolved = threading.Event()
+        dispatch_bot.orchestrator = MagicMock()
+        dispatch_bot.orchestrator.chat.side_effect = lambda *a, **kw: release.wait(5) and "done"
+        dispatch_bot.orchestrator._telegram_already_sent = False
+        dispatch_bot._action_card_resolver.resolve.side_effect = (
+            lambda *a, **kw: resolved.set() or {"status": "approved", "message": "ok"}
+        )
+
+        dispatch_bot._dispatch(_make_text_update(99, "research something"))
+        dispatch_bot._dispatch(_make_callback_update())
+
+        assert resolved.wait(5)
+        time.sleep(0.05)
+        # The callback (100) is handled but the chat turn (99) is not
+        assert dispatch_bot._offset == 99
+
+        release.set()
+        deadline = time.time() + 5
+        while dispatch_bot._offset != 101 and time.time() < deadline:
+            time.sleep(0.01)
+        assert dispatch_bot._offset == 101
+        time.sleep(0.05)
+        assert (tmp_path / "offset.txt").read_text() == "101"
+
+    def test_chat_messages_handled_in_order(self, dispatch_bot):
+        seen = []
+        dispatch_bot.orchestrator = MagicMock()
+        dispatch_bot.orchestrator.chat.side_effect = (
+            lambda text, **kw: time.sleep(0.01 if text == "first" else 0) or seen.append(text)
+        )
+
+        for i, text in enumerate(["first", "second", "third"]):
+            dispatch_bot._dispatch(_make_text_update(10 + i, text))
+
+        deadline = time.time() + 5
+        while len(seen) < 3 and time.time() < deadline:
+            time.sleep(0.01)
+        assert seen == ["first", "second", "third"]
+
+    def test_unauthorized_message_acked_inline(self, dispatch_bot):
+        dispatch_bot._dispatch(_make_text_update(7, "hi", chat_id="111"))
+        assert dispatch_bot._offset == 8
+        assert dispatch_bot._chat_lanes == {}
+
+
 # ---------------------------------------------------------------------------
 # _on_actioncard_event tests
 # ---------------------------------------------------------------------------
@@ -338,7 +415,7 @@ class TestHandleUpdateRouting:
 class TestOnActioncardEvent:
     """Tests for event-driven ActionCard presentation to Telegram."""
 
-    @patch("telegram_bot.requests.post")
+    @patch("telegram_bot.requests.Session.post")
     def test_sends_card_with_keyboard(self, mock_post, bot_with_resolver):
         """Should send a message with inline keyboard from event payload."""
         mock_post.return_value = MagicMock(
@@ -371,7 +448,7 @@ class TestOnActioncardEvent:
             "abcdef12-3456-7890-abcd-ef1234567890", 77
         )
 
-    @patch("telegram_bot.requests.post")
+    @patch("telegram_bot.requests.Session.post")
     def test_handles_send_failure(self, mock_post, bot_with_resolver):
         """Should handle failure to send without raising."""
         mock_post.return_value = MagicMock(ok=False)
@@ -400,7 +477,7 @@ class TestOnActioncardEvent:
 class TestOnActioncardResolvedEvent:
     """Tests for cross-channel resolution sync."""
 
-    @patch("telegram_bot.requests.post")
+    @patch("telegram_bot.requests.Session.post")
     def test_edits_message_on_warroom_resolve(self, mock_post, bot):
         """Should edit Telegram message when card is resolved from War Room."""
         mock_post.return_value = MagicMock(ok=True)
@@ -0,0 +1,111 @@
+"""Tests for orch_helpers.tool_dispatch — concurrent read-only tool calls."""
+
+import threading
+import time
+
+import pytest
+
+from orch_helpers.tool_dispatch import ParallelToolDispatcher, is_parallel_safe_tool_call
+
+
+class TestParallelSafety:
+
+    @pytest.mark.parametrize("name,inputs", [
+        ("network_client", {"method": "GET", "url": "https://example.com"}),
+        ("network_client", {"method": "head", "url": "https://example.com"}),
+        ("github_search", {"action": "search_repos", "query": "x"}),
+        ("command_runner", {"command": "ls -la"}),
+        ("skill_manager", {"action": "list_skills"}),
+    ])
+    def test_read_only_calls_are_parallel_safe(self, name, inputs):
+        assert is_parallel_safe_tool_call(name, inputs)
+
+    @pytest.mark.parametrize("name,inputs", [
+        ("network_client", {"method": "POST", "url": "https://example.com"}),
+        ("command_runner", {"command": "rm -rf /tmp/x"}),
+        ("command_runner", {"command": "echo hi > notes.txt"}),
+        ("command_runner", {"command": "ls; rm x"}),
+        ("command_runner", {"command": "ls\nrm x"}),
+        ("repo_writer", {"action": "create", "path": "a.txt"}),
+        ("document_creator", {"title": "x"}),
+        ("schedule_job", {"action": "create"}),
+        ("skill_manager", {"action": "propose"}),
+        ("service_runner", {}),
+    ])
+    def test_writes_and_escalations_stay_serial(self, name, inputs):
+        assert not is_parallel_safe_tool_call(name, inputs)
+
+
+class TestParallelToolDispatcher:
+
+    def _gets(self, n):
+        return [("network_client", {"method": "GET", "url": f"https://e/{i}"}) for i in range(n)]
+
+    def test_consecutive_reads_run_concurrently(self):
+        barrier = threading.Barrier(3, timeout=2)
+
+        def run_fn(name, inputs):
+            barrier.wait()  # only passes if all three run at once
+            return inputs["url"]
+
+        calls = self._gets(3)
+        with ParallelToolDispatcher(run_fn, calls, max_workers=4) as dispatch:
+            assert dispatch.parallel_indices == [0, 1, 2]
+            results = [dispatch.run(i) for i in range(3)]
+        assert results == ["https://e/0", "https://e/1", "https://e/2"]
+
+    def test_results_returned_in_call_order(self):
+        delays = [0.15, 0.0, 0.05]
+
+        def run_fn(name, inputs):
+            idx = int(inputs["url"].rsplit("/", 1)[1])
+            time.sleep(delays[idx])
+            return idx
+
+        with ParallelToolDispatcher(run_fn, self._gets(3)) as dispatch:
+            assert [dispatch.run(i) for i in range(3)] == [0, 1, 2]
+
+    def test_write_splits_segments_and_runs_inline(self):
+        log = []
+        lock = threading.Lock()
+
+        def run_fn(name, inputs):
+            with lock:
+                log.append(("start", name))
+            time.sleep(0.02)
+            with lock:
+                log.append(("end", name))
+            return name
+
+        calls = [
+            ("network_client", {"method": "GET", "url": "a"}),
+            ("repo_writer", {"action": "create", "path": "x.txt"}),
+            ("network_client", {"method": "GET", "url": "b"}),
+        ]
+        with ParallelToolDispatcher(run_fn, calls) as dispatch:
+            assert dispatch.parallel_indices == []
+            for i in range(3):
+                dispatch.run(i)
+        # Strictly serial: each call ends before the next starts
+        assert [e for e, _ in log] == ["start", "end"] * 3
+
+    def test_undeclared_tools_not_prefetched(self):
+        calls = self._gets(2)
+        dispatch = ParallelToolDispatcher(lambda n, i: None, calls, declared={"github_search"})
+        assert dispatch.parallel_indices == []
+
+    def test_max_workers_one_disables_fanout(self):
+        dispatch = ParallelToolDispatcher(lambda n, i: None, self._gets(3), max_workers=1)
+        assert dispatch.parallel_indices == []
+
+    def test_exception_raised_at_its_index(self):
+        def run_fn(name, inputs):
+            if inputs["url"].endswith("/1"):
+                raise RuntimeError("boom")
+            return "ok"
+
+        with ParallelToolDispatcher(run_fn, self._gets(3)) as dispatch:
+            assert dispatch.run(0) == "ok"
+            with pytest.raises(RuntimeError, match="boom"):
+                dispatch.run(1)
+            assert dispatch.run(2) == "ok"
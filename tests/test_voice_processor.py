@@ -299,7 +299,7 @@ class TestTelegramBotVoice:
         mock_dl_resp = MagicMock()
         mock_dl_resp.ok = True
         mock_dl_resp.content = b"\x00\x01\x02\x03"
-        mock_requests.get.side_effect = [mock_get_resp, mock_dl_resp]
+        mock_requests.Session.return_value.get.side_effect = [mock_get_resp, mock_dl_resp]
 
         # Mock voice processor
         vp = MagicMock()
@@ -351,8 +351,8 @@ class TestTelegramBotVoice:
         mock_send_resp = MagicMock()
         mock_send_resp.ok = True
 
-        mock_requests.get.side_effect = [mock_get_resp, mock_dl_resp]
-        mock_requests.post.return_value = mock_send_resp
+        mock_requests.Session.return_value.get.side_effect = [mock_get_resp, mock_dl_resp]
+        mock_requests.Session.return_value.post.return_value = mock_send_resp
 
         # Mock voice processor with TTS
         vp = MagicMock()
@@ -421,7 +421,7 @@ class TestTelegramBotVoice:
         mock_dl_resp = MagicMock()
         mock_dl_resp.ok = True
         mock_dl_resp.content = b"\x00\x01\x02\x03"
-        mock_requests.get.side_effect = [mock_get_resp, mock_dl_resp]
+        mock_requests.Session.return_value.get.side_effect = [mock_get_resp, mock_dl_resp]
 
         vp = MagicMock()
         vp.available = False
@@ -0,0 +1,300 @@
+"""
+Lancelot — War Room WebSocket Fan-out Tests
+============================================
+Tests for the per-connection send queues in warroom_ws: non-blocking
+broadcast, progress coalescing, chat.delta merging, overflow handling,
+stats, and concurrent EventBus delivery. Sockets are fakes.
+"""
+
+import asyncio
+import json
+import pytest
+
+from fastapi import WebSocketDisconnect
+
+import warroom_ws
+from event_bus import EventBus, Event, event_bus
+from event_journal import EventJournal
+from warroom_ws import ConnectionManager
+
+
+class FakeSocket:
+    """Records sent frames; sends block until ``gate`` is set."""
+
+    def __init__(self, blocked=False):
+        self.sent = []
+        self.closed_with = None
+        self.gate = asyncio.Event()
+        if not blocked:
+            self.gate.set()
+
+    async def send_text(self, data):
+        await self.gate.wait()
+        self.sent.append(json.loads(data))
+
+    async def close(self, code=1000, reason=""):
+        self.closed_with = code
+
+
+def _event(event_type, **payload):
+    return {"type": event_type, "payload": payload, "timestamp": 0}
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestBroadcast:
+
+    def test_all_clients_receive_in_order(self):
+        async def scenario():
+            manager = ConnectionManager()
+            a, b = FakeSocket(), FakeSocket()
+            manager.register(a)
+            manager.register(b)
+            for i in range(3):
+                await manager.broadcast(_event("toolflow.tool_call_started", n=i))
+            await _settle()
+            return a, b
+
+        a, b = asyncio.run(scenario())
+        assert [m["payload"]["n"] for m in a.sent] == [0, 1, 2]
+        assert a.sent == b.sent
+
+    def test_slow_client_does_not_delay_others(self):
+        async def scenario():
+            manager = ConnectionManager()
+            slow, fast = FakeSocket(blocked=True), FakeSocket()
+            manager.register(slow)
+            manager.register(fast)
+            await asyncio.wait_for(
+                manager.broadcast(_event("toolflow.quest_started", quest_id="q")), timeout=1,
+            )
+            await _settle()
+            stats = manager.stats()
+            return slow, fast, stats
+
+        slow, fast, stats = asyncio.run(scenario())
+        assert len(fast.sent) == 1
+        assert slow.sent == []
+        assert sorted(c["sent"] for c in stats["clients"]) == [0, 1]
+
+
+class TestCoalescing:
+
+    def test_iteration_progress_replaced(self):
+        async def scenario():
+            manager = ConnectionManager()
+            ws = FakeSocket(blocked=True)
+            manager.register(ws)
+            await manager.broadcast(_event("toolflow.quest_started", quest_id="q"))
+            for i in range(1, 6):
+                await manager.broadcast(_event("toolflow.iteration_started", quest_id="q", iteration=i))
+            stats = manager.stats()["clients"][0]
+            ws.gate.set()
+            await _settle()
+            return ws, stats
+
+        ws, stats = asyncio.run(scenario())
+        assert stats["queue_depth"] == 2
+        assert stats["coalesced"] == 4
+        assert [m["type"] for m in ws.sent] == ["toolflow.quest_started", "toolflow.iteration_started"]
+        assert ws.sent[-1]["payload"]["iteration"] == 5
+
+    def test_consecutive_deltas_merged(self):
+        async def scenario():
+            manager = ConnectionManager()
+            ws = FakeSocket(blocked=True)
+            manager.register(ws)
+            await manager.broadcast(_event("chat.delta", stream_id="s", seq=1, text="Hel"))
+            await manager.broadcast(_event("chat.delta", stream_id="s", seq=2, text="lo"))
+            await manager.broadcast(_event("chat.stream_reset", stream_id="s", seq=3))
+            await manager.broadcast(_event("chat.delta", stream_id="s", seq=4, text="New"))
+            ws.gate.set()
+            await _settle()
+            return ws
+
+        ws = asyncio.run(scenario())
+        assert [m["type"] for m in ws.sent] == ["chat.delta", "chat.stream_reset", "chat.delta"]
+        assert ws.sent[0]["payload"] == {"stream_id": "s", "seq": 2, "text": "Hello"}
+        assert ws.sent[2]["payload"]["text"] == "New"
+
+
+class TestOverflow:
+
+    def test_droppable_events_shed_first(self):
+        async def scenario():
+            manager = ConnectionManager(max_queue=2)
+            ws = FakeSocket(blocked=True)
+            manager.register(ws)
+            await manager.broadcast(_event("warroom_notification", message="hi"))
+            await manager.broadcast(_event("toolflow.tool_call_started", n=1))
+            await manager.broadcast(_event("toolflow.tool_call_started", n=2))
+            stats = manager.stats()["clients"][0]
+            ws.gate.set()
+            await _settle()
+            return ws, stats, manager
+
+        ws, stats, manager = asyncio.run(scenario())
+        assert stats["dropped"] == 1
+        assert [m["payload"].get("n") for m in ws.sent] == [1, 2]
+        assert manager.active_count == 1
+
+    def test_client_disconnected_when_full_of_essential_events(self):
+        async def scenario():
+            manager = ConnectionManager(max_queue=2)
+            ws = FakeSocket(blocked=True)
+            manager.register(ws)
+            for i in range(3):
+                await manager.broadcast(_event("toolflow.tool_call_started", n=i))
+            await _settle()
+            return ws, manager
+
+        ws, manager = asyncio.run(scenario())
+        assert manager.active_count == 0
+        assert ws.closed_with == 1013
+        assert manager.stats()["disconnected_slow"] == 1
+
+    def test_failed_send_drops_client(self):
+        class BrokenSocket(FakeSocket):
+            async def send_text(self, data):
+                raise RuntimeError("connection reset")
+
+        async def scenario():
+            manager = ConnectionManager()
+            manager.register(BrokenSocket())
+            await manager.broadcast(_event("toolflow.quest_started", quest_id="q"))
+            await _settle()
+            return manager
+
+        assert asyncio.run(scenario()).active_count == 0
+
+
+class ClientSocket(FakeSocket):
+    """Fake client for the full handler: sends ``auth`` then idles until hung up."""
+
+    def __init__(self, auth):
+        super().__init__()
+        self.query_params = {}
+        self._auth = json.dumps(auth)
+        self.hangup = asyncio.Event()
+
+    async def accept(self):
+        pass
+
+    async def receive_text(self):
+        if self._auth:
+            auth, self._auth = self._auth, None
+            return auth
+        await self.hangup.wait()
+        raise WebSocketDisconnect()
+
+
+class TestResume:
+
+    def _session(self, monkeypatch, make_auth):
+        """Publish 3 events, connect with ``make_auth(journal)``, publish 1 more."""
+        monkeypatch.setattr(warroom_ws, "_verify_ws_token", lambda token: True)
+        journal = EventJournal(capacity=10)
+
+        async def scenario():
+            event_bus.set_journal(journal)
+            try:
+                for i in range(3):
+                    await event_bus.publish(Event(type="toolflow.tool_call_started", payload={"n": i}))
+                ws = ClientSocket(make_auth(journal))
+                handler = asyncio.ensure_future(warroom_ws.warroom_websocket(ws))
+                await _settle()
+                await event_bus.publish(Event(type="toolflow.tool_call_started", payload={"n": 3}))
+                await _settle()
+                ws.hangup.set()
+                await handler
+                return ws
+            finally:
+                event_bus.set_journal(None)
+
+        return journal, asyncio.run(scenario())
+
+    def test_replay_then_live_without_gap(self, monkeypatch):
+        journal, ws = self._session(
+            monkeypatch, lambda j: {"type": "auth", "token": "t", "since": 1, "epoch": j.epoch},
+        )
+        auth_ok, replay, live = ws.sent
+        assert auth_ok == {"type": "auth_ok", "epoch": journal.epoch, "seq": 3}
+        assert replay["type"] == "replay"
+        assert replay["complete"] is True
+        assert [e["seq"] for e in replay["events"]] == [2, 3]
+        assert replay["seq"] == 3
+        assert live["seq"] == 4
+
+    def test_epoch_mismatch_replays_everything(self, monkeypatch):
+        _, ws = self._session(
+            monkeypatch, lambda j: {"type": "auth", "token": "t", "since": 2, "epoch": "stale"},
+        )
+        assert [e["seq"] for e in ws.sent[1]["events"]] == [1, 2, 3]
+
+    def test_event_broadcast_during_replay_sent_once(self, monkeypatch):
+        monkeypatch.setattr(warroom_ws, "_verify_ws_token", lambda token: True)
+        journal = EventJournal(capacity=10)
+
+        async def scenario():
+            event_bus.set_journal(journal)
+            try:
+                # publish() journals first and broadcasts later: connect in between
+                delta = Event(type="chat.delta", payload={"stream_id": "s", "text": "hi"})
+                journal.record(delta)
+                ws = ClientSocket({"type": "auth", "token": "t", "since": 0, "epoch": journal.epoch})
+                handler = asyncio.ensure_future(warroom_ws.warroom_websocket(ws))
+                await _settle()
+                await warroom_ws._on_event(delta)
+                await event_bus.publish(Event(type="chat.delta", payload={"stream_id": "s", "text": "!"}))
+                await _settle()
+                ws.hangup.set()
+                await handler
+                return ws
+            finally:
+                event_bus.set_journal(None)
+
+        ws = asyncio.run(scenario())
+        _, replay, *live = ws.sent
+        assert [e["seq"] for e in replay["events"]] == [1]
+        assert [m["seq"] for m in live] == [2]
+
+    def test_no_since_means_live_only(self, monkeypatch):
+        _, ws = self._session(monkeypatch, lambda j: {"type": "auth", "token": "t"})
+        assert [m["type"] for m in ws.sent] == ["auth_ok", "toolflow.tool_call_started"]
+        assert ws.sent[1]["seq"] == 4
+
+
+class TestEventBusConcurrency:
+
+    def test_slow_subscriber_does_not_block_others(self):
+        bus = EventBus()
+        received = []
+        release = None
+
+        async def slow(event):
+            await release.wait()
+
+        async def fast(event):
+            received.append(event.type)
+
+        async def failing(event):
+            raise RuntimeError("subscriber bug")
+
+        bus.subscribe_all(slow)
+        bus.subscribe_all(failing)
+        bus.subscribe("ping", fast)
+
+        async def scenario():
+            nonlocal release
+            release = asyncio.Event()
+            task = asyncio.ensure_future(bus.publish(Event(type="ping")))
+            await _settle()
+            seen = list(received)
+            release.set()
+            await task
+            return seen
+
+        assert asyncio.run(scenario()) == ["ping"]